@@ -1,7 +1,6 @@
-from sys import stdin
-from math import prod
+from collections import Counter
 
-lines = [line.strip() for line in stdin.readlines()]
+from aoc.inputs import Input
 
 PAIRS = {
     '{': '}',
@@ -49,15 +48,98 @@ def incomplete_score(chars):
         score += INCOMPLETE_POINTS[c]
     return score
 
-def median(xs):
-    return sorted(xs)[len(xs) // 2]
+def completions(lines):
+    """ Yields how many characters each incomplete line is missing, with its completion score. """
+    for line in lines:
+        line = line.strip().decode()
+        if not line:
+            continue
 
-all_matches = list(map(matches, lines))
-errors = [remaining for (matched, remaining, missing) in all_matches if matched == False]
-incomplete = [missing for (matched, remaining, missing) in all_matches if matched == None]
+        matched, _, missing = matches(line)
+        if matched == None:
+            yield len(missing), incomplete_score(missing)
 
-total_error_points = sum(map(error_score, errors))
-print(total_error_points)
+# Candidates are sorted directly once there are at most this many of them,
+# otherwise each pass narrows them down by this many more of their digits
+SELECT_LIMIT = 1 << 16
+DIGITS_PER_PASS = 8
 
-total_incomplete_scores = list(map(incomplete_score, incomplete))
-print(median(total_incomplete_scores))
+def median_score(scores, lengths):
+    """ The median of the scores `scores()` yields as (length, score) pairs, counted by length in `lengths`.
+
+    Each missing character is a nonzero base-5 digit of its score, so longer completions always score
+    higher, and among the same length the scores sort by their leading digits. That picks out the
+    median's length, then each pass over the scores counts the next few digits of the candidates,
+    keeping memory bounded however many lines there are.
+    """
+    rank = sum(lengths.values()) // 2
+    for length in sorted(lengths):
+        if rank < lengths[length]:
+            break
+        rank -= lengths[length]
+    else:
+        return None
+
+    # The median's leading digits found so far, and how many scores share them
+    prefix, known, count = 0, 0, lengths[length]
+    while known < length:
+        remaining = length - known
+        candidates = (score for n, score in scores() if n == length and score // 5**remaining == prefix)
+        if count <= SELECT_LIMIT:
+            return sorted(candidates)[rank]
+
+        step = min(DIGITS_PER_PASS, remaining)
+        shift, digits = 5**(remaining - step), 5**step
+        counts = Counter(score // shift % digits for score in candidates)
+        for bucket in sorted(counts):
+            if rank < counts[bucket]:
+                break
+            rank -= counts[bucket]
+
+        prefix, known, count = prefix * digits + bucket, known + step, counts[bucket]
+
+    return prefix
+
+class Checker:
+    """ The error total and how many completions there are of each length, from one pass over the lines.
+
+    A running median needs every score seen so far, so this day isn't streamed: the completion scores'
+    median is found by a few more passes over the lines instead (see `median_score`).
+    """
+
+    def __init__(self, lines):
+        # Returns a fresh iterator over the lines for each pass
+        self.lines = lines
+        self.error_total = 0
+        self.lengths = Counter()
+
+        for line in lines():
+            line = line.strip().decode()
+            if not line:
+                continue
+
+            matched, remaining, missing = matches(line)
+            if matched == False:
+                self.error_total += error_score(remaining)
+            elif matched == None:
+                self.lengths[len(missing)] += 1
+
+    def part1(self):
+        return self.error_total
+
+    def part2(self):
+        return median_score(lambda: completions(self.lines()), self.lengths)
+
+def parse(puzzle):
+    return Checker(puzzle.byte_lines)
+
+def part1(checker):
+    return checker.part1()
+
+def part2(checker):
+    return checker.part2()
+
+if __name__ == '__main__':
+    checker = parse(Input.from_stdin())
+    print(part1(checker))
+    print(part2(checker))
@@ -1,7 +1,6 @@
-from sys import stdin
 from collections import defaultdict, Counter
 
-pairs = [line.strip().split('-') for line in stdin.readlines()]
+from aoc.inputs import Input
 
 def make_graph(pairs):
     adjaceny_list = defaultdict(list)
@@ -67,6 +66,17 @@ def small_caves_twice_filter(path):
 
     return True
 
-graph = make_graph(pairs)
-print(sum(1 for _ in all_paths(graph, small_caves_once_filter)))
-print(sum(1 for _ in all_paths(graph, small_caves_twice_filter)))
+def parse(puzzle):
+    pairs = [line.strip().split('-') for line in puzzle.lines()]
+    return make_graph(pairs)
+
+def part1(graph):
+    return sum(1 for _ in all_paths(graph, small_caves_once_filter))
+
+def part2(graph):
+    return sum(1 for _ in all_paths(graph, small_caves_twice_filter))
+
+if __name__ == '__main__':
+    graph = parse(Input.from_stdin())
+    print(part1(graph))
+    print(part2(graph))
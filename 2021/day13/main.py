@@ -1,9 +1,8 @@
-from sys import stdin
 from collections import defaultdict, Counter
 
-lines = [line.strip() for line in stdin.readlines()]
+from aoc.inputs import Input
 
-def parse(lines):
+def parse_manual(lines):
     dots = set()
     folds = []
     for line in lines:
@@ -61,10 +60,21 @@ def process_folds(folds, dots):
             dots = vertical_fold(fold_point, dots)
     return dots
 
-(dots, folds) = parse(lines)
+def parse(puzzle):
+    lines = [line.strip() for line in puzzle.lines()]
+    return parse_manual(lines)
 
-one_fold = process_folds(folds[:1], dots)
-print(len(one_fold))
+def part1(manual):
+    (dots, folds) = manual
+    one_fold = process_folds(folds[:1], dots)
+    return len(one_fold)
 
-dots = process_folds(folds, dots)
-print(dots_string(dots))
+def part2(manual):
+    (dots, folds) = manual
+    dots = process_folds(folds, dots)
+    return dots_string(dots)
+
+if __name__ == '__main__':
+    manual = parse(Input.from_stdin())
+    print(part1(manual))
+    print(part2(manual))
@@ -1,10 +1,6 @@
-from sys import stdin
 from collections import Counter
 
-lines = [line.strip() for line in stdin.readlines()]
-
-template = lines[0]
-substitutions = {(key[0], key[1]): val for key, val in (line.split(' -> ') for line in lines[2:])}
+from aoc.inputs import Input
 
 def pairs(polymer):
     polymer = [None] + list(polymer) + [None]
@@ -57,12 +53,27 @@ def least_common_element(polymer):
     return counts.most_common()[-1]
 
 def max_delta(polymer):
-    most_common = most_common_element(substituted)[1]
-    least_common = least_common_element(substituted)[1]
+    most_common = most_common_element(polymer)[1]
+    least_common = least_common_element(polymer)[1]
     return most_common - least_common
 
-polymer = to_counted_polymer(template)
-for count in [10, 40]:
-    substituted = repeated_substitution(polymer, substitutions, count)
-    delta = max_delta(substituted)
-    print(delta)
+def parse(puzzle):
+    lines = [line.strip() for line in puzzle.lines()]
+
+    template = lines[0]
+    substitutions = {(key[0], key[1]): val for key, val in (line.split(' -> ') for line in lines[2:])}
+
+    return (to_counted_polymer(template), substitutions)
+
+def part1(instructions):
+    (polymer, substitutions) = instructions
+    return max_delta(repeated_substitution(polymer, substitutions, 10))
+
+def part2(instructions):
+    (polymer, substitutions) = instructions
+    return max_delta(repeated_substitution(polymer, substitutions, 40))
+
+if __name__ == '__main__':
+    instructions = parse(Input.from_stdin())
+    print(part1(instructions))
+    print(part2(instructions))
@@ -1,67 +1,38 @@
-from sys import stdin
-from heapq import heappush, heappop
-
-lines = [line.strip() for line in stdin.readlines()]
-grid = [list(map(int, line)) for line in lines]
-
-def neighbors(grid, node, scale=1):
-    x, y = node
-    w = width(grid, scale)
-    h = height(grid, scale)
-
-    if x > 0:
-        yield (x - 1, y)
-    if x < w - 1:
-        yield (x + 1, y)
-    if y > 0:
-         yield (x, y - 1)
-    if y < h - 1:
-        yield (x, y + 1)
-
-def risk(grid, node):
-    w, h = width(grid), height(grid)
-    x, y = node
-
-    origin_x, origin_y = x % w, y % h
-    delta_x, delta_y = abs(origin_x - x) , abs(origin_y - y)
-
-    origin_risk = grid[origin_y][origin_x]
-    shifted_risk = origin_risk + (delta_x // w) + (delta_y // h)
-
-    return shifted_risk % 10
-
-def width(grid, scale=1):
-    return len(grid[0]) * scale
-
-def height(grid, scale=1):
-    return len(grid) * scale
+from aoc.grid import DIGITS, Grid
+from aoc.inputs import Input
+from aoc.search import dial
+
+def tile(grid, scale=1):
+    """ Repeats the grid `scale` times in each direction, with risk rising by one per tile away from the original. """
+    tiled = bytearray()
+    for tile_y in range(scale):
+        for row in grid.rows():
+            for tile_x in range(scale):
+                # Risk wraps from 9 back round to 1, never to 0
+                shift = tile_x + tile_y
+                tiled += bytes((risk + shift - 1) % 9 + 1 for risk in row)
+
+    return Grid(grid.width * scale, grid.height * scale, tiled)
 
 def least_risk(grid, scale=1):
-    w = width(grid, scale)
-    h = height(grid, scale)
-
-    start = (0,0)
-    end = (w - 1, h - 1)
-
-    exploring = [(risk(grid, start), start)]
-    visited = set(start)
-
-    while len(exploring) > 0:
-        (current_risk, current_node) = heappop(exploring)
-
-        if current_node == end:
-            return current_risk - risk(grid, start)
+    grid = tile(grid, scale)
+    risks, neighbors = grid.cells, grid.neighbors()
+    end = grid.size - 1
 
-        for neighbor in neighbors(grid, current_node, scale):
+    # Risks are single digits, so a bucket queue beats a heap
+    edges = lambda node: ((neighbor, risks[neighbor]) for neighbor in neighbors[node])
+    return dial([0], edges, end.__eq__, max_weight=9, size=grid.size)
 
-            if neighbor in visited:
-                continue
-            visited.add(neighbor)
+def parse(puzzle):
+    return Grid.parse(puzzle, DIGITS)
 
-            new_risk = current_risk + risk(grid, neighbor)
-            heappush(exploring, (new_risk, neighbor))
+def part1(grid):
+    return least_risk(grid)
 
-    return None
+def part2(grid):
+    return least_risk(grid, scale=5)
 
-print(least_risk(grid))
-print(least_risk(grid, scale=5))
+if __name__ == '__main__':
+    grid = parse(Input.from_stdin())
+    print(part1(grid))
+    print(part2(grid))
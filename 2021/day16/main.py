@@ -1,9 +1,7 @@
-from sys import stdin
 from math import prod
 from operator import gt, lt, eq
 
-lines = [line.strip() for line in stdin.readlines()]
-transmission = lines[0]
+from aoc.inputs import Input
 
 def hex_to_bin(hex_string):
     value = int(hex_string, 16)
@@ -111,6 +109,17 @@ def evaluate(tree):
     children = map(evaluate, tree['children'])
     return operator(children)
 
-tree = parse_packet(hex_to_bin(transmission))
-print(version_sum(tree))
-print(evaluate(tree))
+def parse(puzzle):
+    transmission = next(puzzle.lines()).strip()
+    return parse_packet(hex_to_bin(transmission))
+
+def part1(tree):
+    return version_sum(tree)
+
+def part2(tree):
+    return evaluate(tree)
+
+if __name__ == '__main__':
+    tree = parse(Input.from_stdin())
+    print(part1(tree))
+    print(part2(tree))
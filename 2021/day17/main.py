@@ -1,7 +1,7 @@
-from sys import stdin
 import re
 
-lines = [line.strip() for line in stdin.readlines()]
+from aoc.inputs import Input
+from aoc.progress import track
 
 def parse_target_area(line):
     regex = r'x=(?P<x1>-?\d+)..(?P<x2>-?\d+), y=(?P<y1>-?\d+)..(?P<y2>-?\d+)'
@@ -99,7 +99,9 @@ def hits_target(velocity, target_area):
 
 def grid_search(target_area):
     test_velocities = ((dx, dy) for dx in range(-200, 200) for dy in range(-200, 200))
+    simulated = track('velocities simulated', 400 * 400)
     for velocity in test_velocities:
+        simulated.done += 1
         hits, highest_point = hits_target(velocity, target_area)
         if hits:
             yield velocity, highest_point
@@ -108,7 +110,16 @@ def find_max_altitude_velocity(target_area):
     hit_velocities = grid_search(target_area)
     return max(hit_velocities, key=lambda v: v[1][1])
 
-for line in lines:
-    target_area = parse_target_area(line)
-    print(find_max_altitude_velocity(target_area)[1][1])
-    print(len(set(grid_search(target_area))))
+def parse(puzzle):
+    return parse_target_area(puzzle.text.strip())
+
+def part1(target_area):
+    return find_max_altitude_velocity(target_area)[1][1]
+
+def part2(target_area):
+    return len(set(grid_search(target_area)))
+
+if __name__ == '__main__':
+    target_area = parse(Input.from_stdin())
+    print(part1(target_area))
+    print(part2(target_area))
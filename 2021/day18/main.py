@@ -1,6 +1,7 @@
-from sys import stdin
 from math import floor, ceil
 
+from aoc.inputs import Input
+
 class Box:
     def __init__(self, value):
         self.value = value
@@ -104,11 +105,21 @@ def total_sum(trees):
             total = add(total, tree)
     return total
 
-lines = [line.strip() for line in stdin.readlines()]
-snailfish_numbers = [box(eval(line)) for line in lines] # Forgive me for using `eval` on arbitrary input
+def parse(puzzle):
+    lines = [line.strip() for line in puzzle.lines()]
+    return [eval(line) for line in lines] # Forgive me for using `eval` on arbitrary input
+
+# Boxes are mutated by `add`, so each part boxes its own copies of the numbers
+def part1(numbers):
+    snailfish_numbers = [box(number) for number in numbers]
+    total = total_sum(snailfish_numbers)
+    return magnitude(total)
 
-total = total_sum(snailfish_numbers)
-print(magnitude(total))
+def part2(numbers):
+    cross_product = (add(box(a), box(b)) for i, a in enumerate(numbers) for j, b in enumerate(numbers) if i != j)
+    return magnitude(max(cross_product, key=magnitude))
 
-cross_product = (add(box(eval(line1)), box(eval(line2))) for i, line1 in enumerate(lines) for j, line2 in enumerate(lines) if i != j)
-print(magnitude(max(cross_product, key=magnitude)))
+if __name__ == '__main__':
+    numbers = parse(Input.from_stdin())
+    print(part1(numbers))
+    print(part2(numbers))
@@ -1,7 +1,6 @@
-from sys import stdin
 from itertools import permutations, product
 
-lines = [line.strip() for line in stdin.readlines()]
+from aoc.inputs import Input
 
 MINIMUM_OVERLAP = 12
 DIMENSIONS = 3
@@ -101,14 +100,21 @@ def align_reports(unaligned_reports):
 def distance(a, b):
     return sum(n - m for n, m in zip(a, b))
 
-reports = parse_scan_report(lines)
+def parse(puzzle):
+    lines = [line.strip() for line in puzzle.lines()]
+    reports = parse_scan_report(lines)
+    return align_reports(reports)
 
-aligned_reports = align_reports(reports)
-aligned_beacons = [report['beacons'] for report in aligned_reports]
-aligned_scanners = [report['scanner'] for report in aligned_reports]
+def part1(aligned_reports):
+    aligned_beacons = [report['beacons'] for report in aligned_reports]
+    all_beacons = set.union(*aligned_beacons)
+    return len(all_beacons)
 
-all_beacons = set.union(*aligned_beacons)
-print(len(all_beacons))
+def part2(aligned_reports):
+    aligned_scanners = [report['scanner'] for report in aligned_reports]
+    return max(distance(s1, s2) for s1, s2 in product(aligned_scanners, aligned_scanners))
 
-max_distance = max(distance(s1, s2) for s1, s2 in product(aligned_scanners, aligned_scanners))
-print(max_distance)
+if __name__ == '__main__':
+    aligned_reports = parse(Input.from_stdin())
+    print(part1(aligned_reports))
+    print(part2(aligned_reports))
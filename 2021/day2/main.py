@@ -1,44 +1,180 @@
-from sys import stdin
+import sys
+from functools import reduce
+from importlib.util import find_spec
 
-lines = [line.strip().split() for line in stdin.readlines()]
-commands = [(command, int(distance)) for (command, distance) in lines]
+from aoc.inputs import Input
+from aoc.lazy import lazy
+from aoc.parsing import records
 
-def explore(commands):
-    depth = 0
-    horizontal = 0
+futures = lazy('concurrent.futures')
 
-    for (command, distance) in commands:
-        if command == 'forward':
-            horizontal += distance
-        elif command == 'down':
-            depth += distance
-        elif command == 'up':
-            depth -= distance
+FORWARD, DOWN, UP = b'forward', b'down', b'up'
+
+# Bytes of commands reduced at a time. Small enough that NumPy's 64-bit sums
+# can't overflow within a chunk unless distances are in the tens of thousands.
+CHUNK_SIZE = 1 << 20
+
+# Inputs from which NumPy's quicker chunks make up for the time it takes to import
+VECTORIZE_SIZE = 1 << 22
+
+class Submarine:
+    """ Follows the commands as they arrive, both the way part 1 reads them and with part 2's aim.
+
+    Part 1's depth changes exactly like part 2's aim, so it's the same number.
+    A run of commands moves the submarine the same way wherever it starts, apart
+    from the aim it starts with, so separate runs can be followed independently
+    and combined in order with `then`.
+    """
+
+    def __init__(self, horizontal=0, aim=0, aimed_depth=0):
+        self.horizontal = horizontal
+        self.aim = aim
+        # Part 2's depth, steered by the aim
+        self.aimed_depth = aimed_depth
+
+    def feed(self, line):
+        if not line.strip():
+            return
+
+        command, distance = line.split()
+        self.move(command, int(distance))
+
+    def move(self, command, distance):
+        if command == FORWARD:
+            self.horizontal += distance
+            self.aimed_depth += (self.aim * distance)
+        elif command == DOWN:
+            self.aim += distance
+        elif command == UP:
+            self.aim -= distance
         else:
-            raise Exception("Unknown command: " + command)
+            raise Exception("Unknown command: " + command.decode())
 
-    return (horizontal, depth)
+    def then(self, other):
+        """ Where following these commands and then `other`'s ends up. """
+        # Every step forward in `other` dives deeper by the aim these commands left it with
+        return Submarine(self.horizontal + other.horizontal, self.aim + other.aim, self.aimed_depth + other.aimed_depth + self.aim * other.horizontal)
 
-def explore_and_aim(commands):
-    depth = 0
-    horizontal = 0
-    aim = 0
+    def part1(self):
+        return self.horizontal * self.aim
 
-    for (command, distance) in commands:
-        if command == 'forward':
+    def part2(self):
+        return self.horizontal * self.aimed_depth
+
+def follow(data):
+    """ The submarine after the commands in `data`, from a standing start. """
+    horizontal = aim = aimed_depth = 0
+    tokens = iter(bytes(data).split())
+    for command, distance in zip(tokens, tokens):
+        distance = int(distance)
+        if command == FORWARD:
             horizontal += distance
-            depth += (aim * distance)
-        elif command == 'down':
+            aimed_depth += aim * distance
+        elif command == DOWN:
             aim += distance
-        elif command == 'up':
+        elif command == UP:
             aim -= distance
         else:
-            raise Exception("Unknown command: " + command)
+            raise Exception("Unknown command: " + command.decode())
+
+    return Submarine(horizontal, aim, aimed_depth)
+
+def follow_array(data):
+    """ The same as `follow`, with NumPy doing the arithmetic. """
+    import numpy
+
+    buffer = numpy.frombuffer(data, dtype=numpy.uint8)
+    starts = numpy.concatenate(([0], numpy.flatnonzero(buffer == ord('\n')) + 1))
+    starts = starts[starts < len(buffer)]
+    starts = starts[~numpy.isin(buffer[starts], list(b' \t\r\n'))]
+
+    # The commands start with different letters, so each line's first letter says which it should be, and the rest has to match
+    commands = buffer[starts]
+    known = numpy.zeros(len(starts), dtype=bool)
+    padded = numpy.concatenate((buffer, numpy.zeros(len(FORWARD) + 1, dtype=numpy.uint8)))
+    for word in (FORWARD, DOWN, UP):
+        rows = numpy.flatnonzero(commands == word[0])
+        matches = numpy.ones(len(rows), dtype=bool)
+        for offset, letter in enumerate(word + b' '):
+            matches &= padded[starts[rows] + offset] == letter
+        known[rows[matches]] = True
+
+    if not known.all():
+        start = starts[~known][0]
+        raise Exception("Unknown command: " + bytes(data[start:start + 16]).split()[0].decode())
+
+    distances = records(data, 1, signed=False)[:, 0]
+    if len(distances) != len(commands):
+        raise ValueError(f'{len(commands)} commands but {len(distances)} distances')
+
+    forward = commands == FORWARD[0]
+    steered = numpy.where(commands == DOWN[0], distances, 0) - numpy.where(commands == UP[0], distances, 0)
+    # The aim during each command is every steer up to it
+    aims = numpy.cumsum(steered)
+    return Submarine(int(distances[forward].sum()), int(aims[-1]) if len(aims) else 0, int((aims[forward] * distances[forward]).sum()))
+
+def worth_vectorizing(size):
+    return size >= VECTORIZE_SIZE and find_spec('numpy') is not None
+
+def boundaries(data, size=CHUNK_SIZE):
+    """ Offsets splitting `data` into chunks of about `size` bytes, each ending at the end of a line. """
+    offsets = [0]
+    while offsets[-1] + size < len(data):
+        end = offsets[-1] + size
+        # Lines are short, so this is a few steps at most
+        while end < len(data) and data[end] != ord('\n'):
+            end += 1
+        offsets.append(min(end + 1, len(data)))
+
+    if offsets[-1] < len(data):
+        offsets.append(len(data))
+    return offsets
+
+def explore(data, vectorized=None, size=CHUNK_SIZE):
+    """ The submarine after every command in `data`, reduced a chunk at a time in flat memory (with NumPy if `vectorized`, by default for large inputs when it's installed). """
+    if vectorized is None:
+        vectorized = worth_vectorizing(len(data))
+
+    offsets = boundaries(data, size)
+    follower = follow_array if vectorized else follow
+    chunks = (follower(data[start:end]) for start, end in zip(offsets, offsets[1:]))
+    return reduce(Submarine.then, chunks, Submarine())
+
+def explore_chunk(path, start, end, vectorized):
+    with Input.open(path) as puzzle:
+        follower = follow_array if vectorized else follow
+        return follower(puzzle.view[start:end])
+
+def explore_file(path, jobs=None, vectorized=None, size=CHUNK_SIZE):
+    """ The submarine after every command in the file at `path`, with chunks spread across a pool of `jobs` processes.
+
+    Workers map the file themselves, so only offsets and three numbers per
+    chunk cross between processes.
+    """
+    with Input.open(path) as puzzle:
+        offsets = boundaries(puzzle.view, size)
+        if vectorized is None:
+            vectorized = worth_vectorizing(len(puzzle))
+
+    count = len(offsets) - 1
+    with futures.ProcessPoolExecutor(max_workers=jobs) as executor:
+        chunks = executor.map(explore_chunk, [path] * count, offsets, offsets[1:], [vectorized] * count, chunksize=max(1, count // 64))
+        return reduce(Submarine.then, chunks, Submarine())
+
+def consumer():
+    return Submarine()
+
+def parse(puzzle):
+    return explore(puzzle.view)
 
-    return (horizontal, depth, aim)
+def part1(submarine):
+    return submarine.part1()
 
-(horizontal, depth) = explore(commands)
-print(horizontal * depth)
+def part2(submarine):
+    return submarine.part2()
 
-(horizontal, depth, _) = explore_and_aim(commands)
-print(horizontal * depth)
+if __name__ == '__main__':
+    # Given the path of a (huge) command log, spread its chunks across a process per CPU
+    submarine = explore_file(sys.argv[1]) if len(sys.argv) > 1 else parse(Input.from_stdin())
+    print(part1(submarine))
+    print(part2(submarine))
@@ -1,70 +1,51 @@
-from sys import stdin
-from itertools import product
-from dataclasses import dataclass
+from aoc.grid import Grid
+from aoc.inputs import Input
 
-lines = [line.strip() for line in stdin.readlines()]
+PIXELS = bytes.maketrans(b'.#', b'\x00\x01')
 
-enhancement_key = lines[0]
-pixels = lines[2:]
+def window(width):
+    """ Offsets of the 3x3 square around a cell, most significant bit first. """
+    return tuple(dy * width + dx for dy in (-1, 0, 1) for dx in (-1, 0, 1))
 
-@dataclass(frozen=True)
-class Grid:
-    default: str
-    pixels: list[str]
-    width: int
-    height: int
+def enhance(enhancement_key, grid, default=0, times=1):
+    for _ in range(times):
+        # Two cells of background around the image keep every window that touches it in bounds
+        padded = grid.pad(2, default)
+        cells, offsets = padded.cells, window(padded.width)
 
-grid = Grid('.', pixels, len(pixels[0]), len(pixels))
+        enhanced = bytearray()
+        for y in range(1, padded.height - 1):
+            for index in range(y * padded.width + 1, (y + 1) * padded.width - 1):
+                key = 0
+                for offset in offsets:
+                    key = key * 2 + cells[index + offset]
+                enhanced.append(enhancement_key[key])
 
-def neighbors(x, y, grid):
-    shifts = product([-1,0,1], [-1,0,1])
+        grid = Grid(padded.width - 2, padded.height - 2, enhanced)
+        default = enhancement_key[0] if default == 0 else enhancement_key[-1]
 
-    for yd, xd in shifts:
-        x_, y_ = x + xd, y + yd
+    return grid
 
-        if (x_ < 0) or (y_ < 0):
-            yield grid.default
-
-        elif (x_ > grid.width - 1) or (y_ > grid.height - 1):
-            yield grid.default
-
-        else:
-            yield grid.pixels[y_][x_]
-
-def pixel_to_key(x, y, grid):
-    bits = (0 if pixel == '.' else 1 for pixel in neighbors(x, y, grid))
-
-    value = 0
-    for bit in bits:
-        value *= 2
-        value += bit
-
-    return value
-
-def pad_grid(grid):
-    default_row = [grid.default * (grid.width + 2)]
-    padded = default_row + [grid.default + row + grid.default for row in grid.pixels] + default_row
-
-    return Grid(grid.default, padded, grid.width + 2, grid.height + 2)
-
-def enhance(enhancement_key, grid, times=1):
-    if times == 0:
-        return grid
+def count_lit_pixels(grid):
+    return grid.cells.count(1)
 
-    grid = pad_grid(grid)
-    keys = [[pixel_to_key(x, y, grid) for x in range(grid.width)] for y in range(grid.height)]
-    enhanced = [''.join(enhancement_key[key] for key in row) for row in keys]
+def parse(puzzle):
+    lines = [line.strip() for line in puzzle.byte_lines()]
 
-    default = enhancement_key[0] if grid.default == '.' else enhancement_key[-1]
-    grid = Grid(default, enhanced, grid.width, grid.height)
+    enhancement_key = lines[0].translate(PIXELS)
+    pixels = Grid.from_rows(lines[2:], PIXELS)
 
-    return enhance(enhancement_key, grid, times - 1)
+    return (enhancement_key, pixels)
 
-def count_lit_pixels(grid):
-    return ''.join(grid.pixels).count('#')
+def part1(image):
+    (enhancement_key, grid) = image
+    return count_lit_pixels(enhance(enhancement_key, grid, times=2))
 
-enhanced = enhance(enhancement_key, grid, 2)
-print(count_lit_pixels(enhanced))
+def part2(image):
+    (enhancement_key, grid) = image
+    return count_lit_pixels(enhance(enhancement_key, grid, times=50))
 
-enhanced = enhance(enhancement_key, grid, 50)
-print(count_lit_pixels(enhanced))
+if __name__ == '__main__':
+    image = parse(Input.from_stdin())
+    print(part1(image))
+    print(part2(image))
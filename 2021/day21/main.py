@@ -1,16 +1,15 @@
-from sys import stdin
 from itertools import product
-from functools import cache, reduce
+from functools import reduce
 from collections import namedtuple
 
+from aoc.inputs import Input
+from aoc.memo import memoize
+
 Player = namedtuple('Player', ['position', 'score'])
 Rules = namedtuple('Rules', ['die', 'winning_score', 'board_size', 'rolls_per_turn'], defaults=[10, 3])
 GameState = namedtuple('GameState', ['players', 'turn', 'winner'], defaults=[0,None])
 Game = namedtuple('Game', ['rules', 'state'])
 
-lines = [line.strip() for line in stdin.readlines()]
-players = tuple(Player(position=int(line.split(': ')[1]),score=0) for line in lines)
-
 def roll(die, rolls):
     for combination in product(*(next(die) for _ in range(rolls))):
         yield sum(combination)
@@ -42,7 +41,13 @@ def next_turns(game):
         state = game.state._replace(players=players, turn=game.state.turn + 1)
         yield Game(rules=game.rules, state=state)
 
-@cache
+def play_key(game, mapper, reducer):
+    # The die is a generator, so it's left out: every game played with the same mapper uses the same kind of die.
+    # Beyond whose move it is, the turn count only feeds the deterministic score, where states never repeat anyway.
+    players = game.state.players
+    return (players, game.state.turn % len(players), game.rules.winning_score, game.rules.board_size, mapper, reducer)
+
+@memoize(key=play_key, maxsize=1 << 17)
 def play(game, mapper, reducer):
     winner = find_winner(game)
     if winner is not None:
@@ -67,15 +72,22 @@ def score(game):
     min_score = min(player.score for player in game.state.players)
     return min_score * turn * rolls
 
-def identity(_, score):
-    return score
+def play_out(game, mapper):
+    # A deterministic game is a few hundred turns long, too deep to recurse a turn at a time like play, but it only ever goes one way
+    winner = find_winner(game)
+    while winner is None:
+        (game,) = next_turns(game)
+        winner = find_winner(game)
+
+    state = game.state._replace(winner=winner)
+    return mapper(game._replace(state=state))
 
-die = deterministic_die(100)
-rules = Rules(die=deterministic_die(100), winning_score=1000)
-state = GameState(players=players)
-game = Game(rules=rules, state=state)
+def part1(players):
+    rules = Rules(die=deterministic_die(100), winning_score=1000)
+    state = GameState(players=players)
+    game = Game(rules=rules, state=state)
 
-print(play(game, score, identity))
+    return play_out(game, score)
 
 # ####################
 # Quantum
@@ -92,8 +104,18 @@ def wins(game):
 def vector_addition(a, b):
     return [sum(pair) for pair in zip(a, b)]
 
-rules = Rules(die=quantum_die(3), winning_score=21)
-state = GameState(players=players)
-game = Game(rules=rules, state=state)
+def part2(players):
+    rules = Rules(die=quantum_die(3), winning_score=21)
+    state = GameState(players=players)
+    game = Game(rules=rules, state=state)
+
+    return max(play(game, wins, vector_addition))
+
+def parse(puzzle):
+    lines = [line.strip() for line in puzzle.lines()]
+    return tuple(Player(position=int(line.split(': ')[1]),score=0) for line in lines)
 
-print(max(play(game, wins, vector_addition)))
+if __name__ == '__main__':
+    players = parse(Input.from_stdin())
+    print(part1(players))
+    print(part2(players))
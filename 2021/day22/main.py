@@ -1,76 +1,49 @@
-from sys import stdin
-from re import search
-from bisect import bisect_left, bisect_right
-from itertools import product
+from aoc.inputs import Input
+from aoc.intervals import BoxSet, Interval, box_intersection
+from aoc.parsing import fields
 
-def line_to_range(line):
-    line_pattern = r'(?P<command>on|off) x=(?P<x1>-?\d+)..(?P<x2>-?\d+),y=(?P<y1>-?\d+)..(?P<y2>-?\d+),z=(?P<z1>-?\d+)..(?P<z2>-?\d+)'
-    match = search(line_pattern, line)
+def to_cuboid(numbers):
+    """ Turns inclusive `x1..x2, y1..y2, z1..z2` bounds into a box. """
+    x1, x2, y1, y2, z1, z2 = numbers
+    return (Interval(x1, x2 + 1), Interval(y1, y2 + 1), Interval(z1, z2 + 1))
 
-    if match is None:
-        raise ValueError('Invalid line: {}'.format(line))
-
-    command = match.group('command')
-    x1 = int(match.group('x1'))
-    x2 = int(match.group('x2')) + 1
-    y1 = int(match.group('y1'))
-    y2 = int(match.group('y2')) + 1
-    z1 = int(match.group('z1'))
-    z2 = int(match.group('z2')) + 1
-
-    return (command, ((x1, x2), (y1, y2), (z1, z2)))
-
-def all_coordinates(cuboids):
-    all_xs = sorted(set(x for (xs, _, _) in cuboids for x in xs))
-    all_ys = sorted(set(y for (_, ys, _) in cuboids for y in ys))
-    all_zs = sorted(set(z for (_, _, zs) in cuboids for z in zs))
-    return (all_xs, all_ys, all_zs)
-
-def slice(cube, all_coords):
-    all_xs, all_ys, all_zs = all_coords
-    (x1, x2), (y1, y2), (z1, z2) = cube
-
-    unioned = set()
-    xs = all_xs[bisect_left(all_xs, x1):bisect_right(all_xs, x2)]
-    ys = all_ys[bisect_left(all_ys, y1):bisect_right(all_ys, y2)]
-    zs = all_zs[bisect_left(all_zs, z1):bisect_right(all_zs, z2)]
+def process_commands(commands, bound=None):
+    """ Counts the cubes left on, keeping them as disjoint cuboids rather than slicing space at every coordinate. """
+    lit = BoxSet()
 
-    unioned.update(product(zip(xs, xs[1:]), zip(ys, ys[1:]), zip(zs, zs[1:])))
-    return unioned
+    for command, cuboid in commands:
+        if bound is not None:
+            cuboid = box_intersection(bound, cuboid)
+            if cuboid is None:
+                continue
 
-def volume(cube):
-    (x1, x2), (y1, y2), (z1, z2) = cube
-    return (x2 - x1) * (y2 - y1) * (z2 - z1)
+        if command == 'on':
+            lit.add(cuboid)
+        elif command == 'off':
+            lit.discard(cuboid)
 
-def intersect(cube1, cube2):
-    (x1, x2), (y1, y2), (z1, z2) = cube1
-    (x3, x4), (y3, y4), (z3, z4) = cube2
+    return lit.volume()
 
-    return ((max(x1, x3), min(x2, x4)), (max(y1, y3), min(y2, y4)), (max(z1, z3), min(z2, z4)))
+intialization_area = (Interval(-50, 51), Interval(-50, 51), Interval(-50, 51))
 
-def is_empty(cube):
-    (x1, x2), (y1, y2), (z1, z2) = cube
-    return x1 >= x2 or y1 >= y2 or z1 >= z2
+def parse(puzzle):
+    commands = [line.split(b' ', 1)[0].decode() for line in puzzle.byte_lines() if line]
+    if any(command not in ('on', 'off') for command in commands):
+        raise ValueError('Every line must turn cubes on or off')
 
-def process_commands(commands, bound=None):
-    command_regions = [cuboid for (_, cuboid) in commands]
-    if bound is not None:
-        command_regions = [intersect(bound, region) for region in command_regions]
-        command_regions = [region for region in command_regions if is_empty(region) == False]
+    cuboids = fields(puzzle.view, 6)
+    if len(cuboids) != len(commands):
+        raise ValueError('Every line must have a cuboid')
 
-    all_cubes = set()
-    all_coords = all_coordinates(command_regions)
+    return list(zip(commands, map(to_cuboid, cuboids)))
 
-    for command, cuboid in commands:
-        cubes = slice(cuboid, all_coords)
-        if command == 'on':
-            all_cubes.update(cubes)
-        elif command == 'off':
-            all_cubes.difference_update(cubes)
+def part1(commands):
+    return process_commands(commands, intialization_area)
 
-    return sum(map(volume, all_cubes))
+def part2(commands):
+    return process_commands(commands)
 
-commands = [line_to_range(line.strip()) for line in stdin.readlines()]
-intialization_area = ((-50, 50), (-50, 50), (-50, 50))
-print(process_commands(commands, intialization_area))
-print(process_commands(commands))
+if __name__ == '__main__':
+    commands = parse(Input.from_stdin())
+    print(part1(commands))
+    print(part2(commands))
@@ -1,8 +1,9 @@
-from sys import stdin
 from itertools import zip_longest
-from heapq import heappush, heappop
 from collections import defaultdict
 
+from aoc.inputs import Input
+from aoc.search import astar
+
 ENERGEY_PER_MOVE = {
     'A': 1,
     'B': 10,
@@ -168,28 +169,18 @@ def minimum_energy_for_position(initial_position, positions):
 def minimum_energy_for_positions(positions):
     return sum(minimum_energy_for_position(position, positions) for position in positions.keys())
 
-def search(positions, rooms, world):
-    count = 0
-    queue = [(0, 0, 0, positions)]
-    visited = set()
-    while len(queue) > 0:
-        _, cost, _, positions = heappop(queue)
-
-        if is_complete(positions, world):
-            return cost, positions
-
-        for additional_cost, next_position, _ in next_positions(positions, rooms, world):
-            items = tuple(sorted(next_position.items()))
-            if items in visited:
-                continue
-            visited.add(items)
+def state_of(positions):
+    """ A hashable search node for a set of amphipod positions. """
+    return tuple(sorted(positions.items()))
 
-            count += 1
-            new_cost = cost + additional_cost
-            heuristic = new_cost + minimum_energy_for_positions(next_position)
+def search(positions, rooms, world):
+    def moves(state):
+        for additional_cost, next_position, _ in next_positions(dict(state), rooms, world):
+            yield state_of(next_position), additional_cost
 
-            heappush(queue, (heuristic, new_cost, count, next_position))
-    return (None, None, None)
+    is_done = lambda state: is_complete(dict(state), world)
+    heuristic = lambda state: minimum_energy_for_positions(dict(state))
+    return astar([state_of(positions)], moves, is_done, heuristic)
 
 def print_world(positions, world):
     for y, row in enumerate(world):
@@ -197,14 +188,19 @@ def print_world(positions, world):
         amphipods = ''.join(positions[(x,y)] if (x, y) in positions else ('.' if c in 'ABCD' else c) for x, c in enumerate(row))
         print(layout + ' ' + amphipods)
 
-# Part 1
-lines = stdin.read().splitlines()
-positions, rooms, world = parse_world(lines)
-cost, _ = search(positions, rooms, world)
-print(cost)
-
-# Part 2
-lines = lines[:3] + ['  #D#C#B#A#  ', '  #D#B#A#C#  '] + lines[3:]
-positions, rooms, world = parse_world(lines)
-cost, _ = search(positions, rooms, world)
-print(cost)
+def parse(puzzle):
+    return list(puzzle.lines())
+
+def part1(lines):
+    positions, rooms, world = parse_world(lines)
+    return search(positions, rooms, world)
+
+def part2(lines):
+    lines = lines[:3] + ['  #D#C#B#A#  ', '  #D#B#A#C#  '] + lines[3:]
+    positions, rooms, world = parse_world(lines)
+    return search(positions, rooms, world)
+
+if __name__ == '__main__':
+    lines = parse(Input.from_stdin())
+    print(part1(lines))
+    print(part2(lines))
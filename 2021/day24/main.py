@@ -1,9 +1,4 @@
-from sys import stdin
-
-commands = [line.strip().split() for line in stdin.readlines()]
-for command in commands:
-    if len(command) == 2:
-        command.append('')
+from aoc.inputs import Input
 
 # Key values, from provided input, for reference
 # X = [ 13, 11, 15, -6, 15, -8, -4, 15, 10, 11, -11,  0, -8, -7]
@@ -36,7 +31,24 @@ def find_all(xs, ys, ws=[], stack=[0]):
         elif x <= 0 and x + head == w:
             yield from find_all(xs, ys, ws + [w], tail)
 
-xs, ys, _ = commands_to_key_values(commands)
+def parse(puzzle):
+    commands = [line.strip().split() for line in puzzle.lines()]
+    for command in commands:
+        if len(command) == 2:
+            command.append('')
+
+    xs, ys, _ = commands_to_key_values(commands)
+    return (xs, ys)
+
+def part1(key_values):
+    (xs, ys) = key_values
+    return max(find_all(xs, ys))
+
+def part2(key_values):
+    (xs, ys) = key_values
+    return min(find_all(xs, ys))
 
-print(max(find_all(xs, ys)))
-print(min(find_all(xs, ys)))
+if __name__ == '__main__':
+    key_values = parse(Input.from_stdin())
+    print(part1(key_values))
+    print(part2(key_values))
@@ -1,51 +1,48 @@
-from sys import stdin
+from aoc.grid import EAST, SOUTH, Grid
+from aoc.inputs import Input
 
-grid = [list(line.strip()) for line in stdin.readlines()]
+EMPTY, EAST_FACING, SOUTH_FACING = b'.>v'
 
-def step(grid):
-    return step_south(step_east(grid))
+def step(grid, herds):
+    """ Moves both herds in place, east first, returning how many sea cucumbers moved. """
+    east, south = herds
+    return step_herd(grid, east, EAST_FACING, grid.shifted(EAST, wrap=True)) + step_herd(grid, south, SOUTH_FACING, grid.shifted(SOUTH, wrap=True))
 
-def step_east(grid):
-    width = len(grid[0])
-    new_grid = [row[:] for row in grid]
+def step_herd(grid, herd, symbol, targets):
+    cells = grid.cells
 
-    for y, row in enumerate(grid):
-        for x, cell in enumerate(row):
-            if cell == '>':
-                neighbor = (x+1) % width
-                if grid[y][neighbor] == '.':
-                    new_grid[y][x] = '.'
-                    new_grid[y][neighbor] = '>'
+    # Everyone in the herd looks before anyone moves
+    moving = [i for i, index in enumerate(herd) if cells[targets[index]] == EMPTY]
 
-    return new_grid
+    for i in moving:
+        index = herd[i]
+        cells[index] = EMPTY
+        cells[targets[index]] = symbol
+        herd[i] = targets[index]
 
-def step_south(grid):
-    height = len(grid)
-    new_grid = [row[:] for row in grid]
-
-    for y, row in enumerate(grid):
-        for x, cell in enumerate(row):
-            if cell == 'v':
-                neighbor = (y+1) % height
-                if grid[neighbor][x] == '.':
-                    new_grid[y][x] = '.'
-                    new_grid[neighbor][x] = 'v'
-
-    return new_grid
+    return len(moving)
 
 def converge(grid):
+    grid = grid.copy()
+    herds = (list(grid.find_all(EAST_FACING)), list(grid.find_all(SOUTH_FACING)))
     steps = 0
 
     while True:
-        new_grid = step(grid)
+        moved = step(grid, herds)
         steps += 1
-        if new_grid == grid:
-            return steps, new_grid
-        grid = new_grid
+        if moved == 0:
+            return steps, grid
 
 def print_grid(grid):
-    for row in grid:
-        print(''.join(row))
+    print(grid.render())
+
+def parse(puzzle):
+    return Grid.parse(puzzle)
+
+def part1(grid):
+    steps, _ = converge(grid)
+    return steps
 
-steps, _ = converge(grid)
-print(steps)
+if __name__ == '__main__':
+    grid = parse(Input.from_stdin())
+    print(part1(grid))
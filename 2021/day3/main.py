@@ -1,60 +1,144 @@
-from sys import stdin
+from bisect import bisect_left
+from functools import reduce
+from importlib.util import find_spec
 from operator import ge, lt
 
-lines = [line.strip() for line in stdin.readlines()]
+from aoc.inputs import Input
 
-def rotate(lists):
-    return list(zip(*lists))
+# Inputs from which NumPy makes up for the time it takes to import
+VECTORIZE_SIZE = 1 << 20
 
-def gamma_and_epsilon(lines):
+class Report:
+    """ The diagnostic report's numbers, sorted so that those sharing their top bits are next to each other. """
+
+    def __init__(self, width, numbers, ones):
+        self.width = width
+        self.numbers = numbers
+        # How many numbers have each bit set, most significant first
+        self.ones = ones
+
+    def __len__(self):
+        return len(self.numbers)
+
+    def bit(self, row, i):
+        """ Bit `i` (counting from the most significant) of the `row`th smallest number. """
+        return self.numbers[row] >> (self.width - 1 - i) & 1
+
+    def number(self, row):
+        return self.numbers[row]
+
+class PackedReport(Report):
+    """ The same, with each number packed into 64-bit words (most significant first) in a NumPy array, rather than a Python int each. """
+
+    def bit(self, row, i):
+        position = self.width - 1 - i
+        return int(self.numbers[row, -1 - position // 64]) >> (position % 64) & 1
+
+    def number(self, row):
+        return reduce(lambda number, word: number << 64 | int(word), self.numbers[row], 0)
+
+def gamma_and_epsilon(report):
     gamma = 0
     epsilon = 0
 
-    for row in rotate(lines):
+    for ones in report.ones:
         # Shift existing values
         gamma *= 2
         epsilon *= 2
 
-        if row.count('1') > row.count('0'):
+        if ones > len(report) - ones:
             gamma += 1
         else:
             epsilon += 1
 
     return (gamma, epsilon)
 
-def rating_filter(candidates, cmp):
-    if len(candidates) == 0:
+def rating_filter(report, cmp):
+    if len(report) == 0:
         raise Exception("There weren't any candidates provided")
 
-    for i in range(len(candidates[0])):
-        row = rotate(candidates)[i]
-
-        one_count = row.count('1')
-        zero_count = row.count('0')
-        keeper = '0' if one_count == 0 else \
-                 '1' if zero_count == 0 else \
-                 '1' if cmp(one_count, zero_count) else \
-                 '0'
+    # The candidates left are always a run of the sorted numbers, and share every bit before the one being filtered on
+    low, high = 0, len(report)
+    for i in range(report.width):
+        if high - low == 1:
+            break
 
-        candidates = [candidate for candidate in candidates if candidate[i] == keeper]
-
-    if len(candidates) > 1:
-        raise Exception("Too many candidates")
+        # So within the run, those with a 0 there all come before those with a 1
+        split = bisect_left(range(len(report)), 1, low, high, key=lambda row: report.bit(row, i))
 
-    if len(candidates) == 0:
-        raise Exception("No candidates were found")
+        one_count = high - split
+        zero_count = split - low
+        keep_ones = one_count != 0 and (zero_count == 0 or cmp(one_count, zero_count))
 
-    return int(candidates[0], 2)
+        low, high = (split, high) if keep_ones else (low, split)
 
-def oxygen_rating(candidates):
-    return rating_filter(candidates, ge)
-
-def co2_rating(candidates):
-    return rating_filter(candidates, lt)
-
-(gamma, epsilon) = gamma_and_epsilon(lines)
-print(gamma * epsilon)
+    if high - low > 1:
+        raise Exception("Too many candidates")
 
-oxygen = oxygen_rating(lines)
-co2 = co2_rating(lines)
-print(oxygen * co2)
+    return report.number(low)
+
+def oxygen_rating(report):
+    return rating_filter(report, ge)
+
+def co2_rating(report):
+    return rating_filter(report, lt)
+
+def parse(puzzle):
+    if len(puzzle) >= VECTORIZE_SIZE and find_spec('numpy') is not None:
+        return parse_packed(puzzle)
+    return parse_ints(puzzle)
+
+def parse_ints(puzzle):
+    """ The report as one Python int per number. """
+    lines = bytes(puzzle.view).split()
+    width = len(lines[0]) if lines else 0
+    if any(len(line) != width for line in lines):
+        raise Exception("Every number in the report needs the same number of bits")
+
+    # Every width-th digit of the whole report is one column, which read in binary has a bit per number to count
+    packed = b''.join(lines)
+    ones = [int(packed[i::width], 2).bit_count() for i in range(width)]
+
+    return Report(width, sorted(int(line, 2) for line in lines), ones)
+
+def parse_packed(puzzle):
+    """ The report packed into NumPy words, with NumPy parsing and sorting the numbers, for reports with millions of them. """
+    import numpy
+
+    data = numpy.frombuffer(puzzle.view, dtype=numpy.uint8)
+    newlines = numpy.flatnonzero(data == ord('\n'))
+    width = int(newlines[0]) if len(newlines) else len(data)
+    if width > 0 and data[width - 1] == ord('\r'):
+        width -= 1
+
+    digits = data[(data == ord('0')) | (data == ord('1'))]
+    if width == 0 or len(digits) % width != 0:
+        raise Exception("Every number in the report needs the same number of bits")
+
+    bits = (digits - ord('0')).reshape(-1, width)
+    # Each column packed into bytes (a bit per number), whose set bits are counted
+    ones = [int(count) for count in numpy.bitwise_count(numpy.packbits(bits, axis=0)).sum(axis=0, dtype=numpy.int64)]
+
+    # Padding the most significant word with leading zeros gives whole big-endian words
+    words = -(-width // 64)
+    padded = numpy.zeros((len(bits), words * 64), dtype=numpy.uint8)
+    padded[:, words * 64 - width:] = bits
+    numbers = numpy.packbits(padded, axis=1).view('>u8').astype(numpy.uint64)
+
+    # `lexsort` sorts by its last key first
+    numbers = numbers[numpy.lexsort(numbers.T[::-1])]
+    return PackedReport(width, numbers, ones)
+
+def part1(report):
+    (gamma, epsilon) = gamma_and_epsilon(report)
+    return gamma * epsilon
+
+def part2(report):
+    oxygen = oxygen_rating(report)
+    co2 = co2_rating(report)
+    return oxygen * co2
+
+if __name__ == '__main__':
+    report = parse(Input.from_stdin())
+    print(part1(report))
+    print(part2(report))
@@ -1,32 +1,88 @@
-from sys import stdin
+from importlib.util import find_spec
 from itertools import chain
 
-lines = [line.strip() for line in stdin.readlines()]
+from aoc.inputs import Input
+from aoc.parsing import records
 
 to_ints = lambda xs: [int(x) for x in xs]
-drawn_numbers = to_ints(lines[0].split(','))
-boards = []
 
-for line in lines[1:]:
-    if line == '':
-        boards.append([])
-    else:
-        boards[-1].append(to_ints(line.split()))
-
-def rotate(lists):
-    return list(zip(*lists))
-
-def is_winner(choices, board):
-    choices = set(choices)
-    rows = map(set, board)
-    cols = map(set, rotate(board))
-    candidates = chain(rows, cols)
-
-    for candidate in candidates:
-        if candidate.issubset(choices):
-            return True
-
-    return False
+# Inputs from which NumPy makes up for the time it takes to import
+VECTORIZE_SIZE = 1 << 20
+
+def parse(puzzle):
+    if len(puzzle) >= VECTORIZE_SIZE and find_spec('numpy') is not None:
+        return parse_array(puzzle)
+    return parse_lists(puzzle)
+
+def parse_lists(puzzle):
+    """ The numbers drawn, each board as a list of rows, and the turn each board wins on. """
+    lines = [line.strip() for line in puzzle.lines()]
+
+    drawn_numbers = to_ints(lines[0].split(','))
+    boards = []
+
+    for line in lines[1:]:
+        if line == '':
+            boards.append([])
+        else:
+            boards[-1].append(to_ints(line.split()))
+
+    boards = [board for board in boards if board]
+    return (drawn_numbers, boards, win_turns(drawn_numbers, boards))
+
+def parse_array(puzzle):
+    """ Like `parse_lists`, with the boards as a NumPy array of shape (boards, size, size), for tens of thousands of them. """
+    first_line, _, rest = bytes(puzzle.view).partition(b'\n')
+    size = len(rest.strip().split(b'\n', 1)[0].split())
+    drawn_numbers = to_ints(first_line.split(b','))
+    boards = records(rest, size, signed=False).reshape(-1, size, size)
+    return (drawn_numbers, boards, win_turns_array(drawn_numbers, boards))
+
+def draw_turns(drawn_numbers):
+    """ Maps each number to the turn (counting from 0) it's first drawn on. """
+    turns = {}
+    for turn, number in enumerate(drawn_numbers):
+        turns.setdefault(number, turn)
+    return turns
+
+def win_turns(drawn_numbers, boards):
+    """ The turn each board wins on, or len(drawn_numbers) for boards that never do. """
+    turns = draw_turns(drawn_numbers)
+    never = len(drawn_numbers)
+
+    # A row or column is complete once its last number is drawn, and the board wins with its first complete one
+    return [min(max(turns.get(number, never) for number in line) for line in chain(board, zip(*board))) for board in boards]
+
+def win_turns_array(drawn_numbers, boards):
+    """ The same for a NumPy array of boards, looking every number up at once. """
+    import numpy
+
+    never = len(drawn_numbers)
+
+    # `unique` sorts the numbers drawn, with the index of each one's first occurrence, i.e. the turn it's first drawn on
+    numbers, first = numpy.unique(numpy.array(drawn_numbers, dtype=numpy.int64), return_index=True)
+    if len(numbers) == 0:
+        return [never] * len(boards)
+
+    # Where each board number would go among them, which is only that number if it was drawn
+    found = numpy.minimum(numpy.searchsorted(numbers, boards), len(numbers) - 1)
+    marked = numpy.where(numbers[found] == boards, first[found], never)
+    rows, columns = marked.max(axis=2), marked.max(axis=1)
+    return numpy.minimum(rows.min(axis=1), columns.min(axis=1)).tolist()
+
+def winning_order(drawn_numbers, turns):
+    """ (turn, board index) for each board that wins, in the order they win (boards winning on the same turn in board order). """
+    never = len(drawn_numbers)
+    return sorted((turn, index) for index, turn in enumerate(turns) if turn < never)
+
+def nth_to_win(drawn_numbers, boards, n, turns=None):
+    """ The numbers drawn up to the `n`th board to win winning (counting from 0, or back from -1 for the last), and that board. """
+    order = winning_order(drawn_numbers, win_turns(drawn_numbers, boards) if turns is None else turns)
+    if not -len(order) <= n < len(order):
+        return (drawn_numbers, None)
+
+    turn, index = order[n]
+    return (drawn_numbers[:turn + 1], boards[index])
 
 def get_score(choices, board):
     numbers = set(chain(*board))
@@ -34,36 +90,25 @@ def get_score(choices, board):
     unmarked_numbers = numbers - set(choices)
     most_recent_choice = choices[-1]
 
-    return most_recent_choice * sum(unmarked_numbers)
-
-def first_to_win(drawn_numbers, boards):
-    choices = []
-    for choice in drawn_numbers:
-        choices.append(choice)
-
-        for board in boards:
-            if is_winner(choices, board):
-                return (choices, board)
-
-    return (choices, None)
-
-def last_to_win(drawn_numbers, boards):
-    choices = []
-    winners = []
-
-    for choice in drawn_numbers:
-        choices.append(choice)
+    return int(most_recent_choice * sum(unmarked_numbers))
 
-        current_winners = [board for board in boards if is_winner(choices, board)]
-        current_losers = [board for board in boards if not is_winner(choices, board)]
+def first_to_win(drawn_numbers, boards, turns=None):
+    return nth_to_win(drawn_numbers, boards, 0, turns)
 
-        winners.extend((choices[:], winner) for winner in current_winners)
-        boards = current_losers
+def last_to_win(drawn_numbers, boards, turns=None):
+    return nth_to_win(drawn_numbers, boards, -1, turns)
 
-    return winners[-1]
+def part1(bingo):
+    (drawn_numbers, boards, turns) = bingo
+    (choices, first_winner) = first_to_win(drawn_numbers, boards, turns)
+    return get_score(choices, first_winner)
 
-(choices, first_winner) = first_to_win(drawn_numbers, boards)
-print(get_score(choices, first_winner))
+def part2(bingo):
+    (drawn_numbers, boards, turns) = bingo
+    (choices, last_winner) = last_to_win(drawn_numbers, boards, turns)
+    return get_score(choices, last_winner)
 
-(choices, last_winner) = last_to_win(drawn_numbers, boards)
-print(get_score(choices, last_winner))
+if __name__ == '__main__':
+    bingo = parse(Input.from_stdin())
+    print(part1(bingo))
+    print(part2(bingo))
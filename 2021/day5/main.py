@@ -1,40 +1,180 @@
-from sys import stdin
-from collections import Counter
-from itertools import chain
-
-lines = [line.strip() for line in stdin.readlines()]
-pairs = [line.split(' -> ') for line in lines]
-
-to_ints = lambda xs: [int(x) for x in xs]
-segments = [(to_ints(a.split(',')), to_ints(b.split(','))) for (a, b) in pairs]
-
-def isLateral(segment):
-    ((x1, y1), (x2, y2)) = segment
-    return x1 == x2 or y1 == y2
-
-def cmp(a, b):
-    return (a > b) - (a < b)
-
-def points(segment):
-    (start, end) = segment
-    (x1, y1) = start
-    (x2, y2) = end
-
-    x_inc = -1 * cmp(x1, x2)
-    y_inc = -1 * cmp(y1, y2)
-
-    (x, y) = (x1, y1)
-    while x != x2 + x_inc or y != y2 + y_inc:
-        yield (x, y)
-        (x, y) = (x + x_inc, y + y_inc)
-
-laterals = filter(isLateral, segments)
-lateral_points = chain(*map(points, laterals))
-lateral_counts = Counter(lateral_points)
-lateral_dangerous = sum(1 for (_, count) in lateral_counts.items() if count >= 2)
-print(lateral_dangerous)
-
-all_points = chain(*map(points, segments))
-all_counts = Counter(all_points)
-all_dangerous = sum(1 for (_, count) in all_counts.items() if count >= 2)
-print(all_dangerous)
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+from importlib.util import find_spec
+from itertools import combinations
+
+from aoc.inputs import Input
+from aoc.parsing import fields
+
+# Every vent runs along a line in one of these orientations. A point's key is
+# the same all along the line through it, and its parameter says where along
+# that line it is. The second function turns a key and parameter back into a point.
+LINES = {
+    'horizontal': (lambda x, y: (y, x), lambda key, t: (t, key)),
+    'vertical': (lambda x, y: (x, y), lambda key, t: (key, t)),
+    'diagonal': (lambda x, y: (x - y, x), lambda key, t: (t, t - key)),
+    'antidiagonal': (lambda x, y: (x + y, x), lambda key, t: (t, key - t)),
+}
+
+LATERAL = ('horizontal', 'vertical')
+
+# Points in the bounding box beyond which `Raster` refuses to allocate a grid
+RASTER_LIMIT = 1 << 26
+
+def parse(puzzle):
+    """ Rasterizes the vents with NumPy while their bounding box is small enough (much quicker for many vents), and sweeps them otherwise. """
+    segments = fields(puzzle.view, 4)
+    if area(segments) <= RASTER_LIMIT and find_spec('numpy') is not None:
+        return Raster(segments)
+    return Sweep(segments)
+
+def parse_sweep(puzzle):
+    return Sweep(fields(puzzle.view, 4))
+
+def parse_raster(puzzle):
+    return Raster(fields(puzzle.view, 4))
+
+def area(segments):
+    """ The number of points in the vents' bounding box. """
+    if not segments:
+        return 0
+    xs = [x for segment in segments for x in segment[::2]]
+    ys = [y for segment in segments for y in segment[1::2]]
+    return (max(xs) - min(xs) + 1) * (max(ys) - min(ys) + 1)
+
+def orientation(segment):
+    (x1, y1, x2, y2) = segment
+    if y1 == y2:
+        return 'horizontal'
+    if x1 == x2:
+        return 'vertical'
+    if x2 - x1 == y2 - y1:
+        return 'diagonal'
+    if x2 - x1 == y1 - y2:
+        return 'antidiagonal'
+    raise ValueError(f'{x1},{y1} -> {x2},{y2} isn\'t horizontal, vertical or diagonal')
+
+def coverage(ends):
+    """ The stretches of a line covered by any vents, as (start, end, vents) in order, from +1/-1 at where each vent starts and after it ends. """
+    ends.sort()
+    stretches, covered = [], 0
+    for (position, change), (following, _) in zip(ends, ends[1:]):
+        covered += change
+        if covered > 0 and following > position:
+            stretches.append((position, following - 1, covered))
+    return stretches
+
+class Sweep:
+    """ How many vents cover each point, worked out a line at a time, so coordinates can be arbitrarily far apart.
+
+    Vents on the same line can only overlap along it, so each line's coverage
+    comes from sweeping along it over where its vents start and end. Vents on
+    different lines only ever meet at single points, which are found from each
+    covered stretch by looking up the other lines crossing it.
+    """
+
+    def __init__(self, segments):
+        ends = {name: defaultdict(list) for name in LINES}
+        for segment in segments:
+            name = orientation(segment)
+            to_line = LINES[name][0]
+            (key, start), (_, end) = to_line(*segment[:2]), to_line(*segment[2:])
+            ends[name][key] += [(min(start, end), 1), (max(start, end) + 1, -1)]
+
+        self.stretches = {name: {key: coverage(line) for key, line in lines.items()} for name, lines in ends.items()}
+        self.starts = {name: {key: [start for start, _, _ in line] for key, line in lines.items()} for name, lines in self.stretches.items()}
+        self.keys = {name: sorted(lines) for name, lines in self.stretches.items()}
+
+    def crossings(self, names):
+        """ How many vents in each of the orientations `names` cover each point covered by more than one of them. """
+        found = defaultdict(dict)
+        for first, second in combinations(names, 2):
+            at, to_line = LINES[first][1], LINES[second][0]
+            keys, starts, stretches = self.keys[second], self.starts[second], self.stretches[second]
+            for key, line in self.stretches[first].items():
+                for start, end, covered in line:
+                    # Each step along this line changes the other orientation's key (by 1 or 2) and parameter by the same amounts
+                    (low, t), (following, t_following) = to_line(*at(key, start)), to_line(*at(key, start + 1))
+                    step, t_step = following - low, t_following - t
+                    high = low + step * (end - start)
+
+                    for index in range(bisect_left(keys, min(low, high)), bisect_right(keys, max(low, high))):
+                        other = keys[index]
+                        steps, remainder = divmod(other - low, step)
+                        if remainder:
+                            continue
+
+                        crossing = t + steps * t_step
+                        i = bisect_right(starts[other], crossing) - 1
+                        if i >= 0 and crossing <= stretches[other][i][1]:
+                            coverages = found[at(key, start + steps)]
+                            coverages[first] = covered
+                            coverages[second] = stretches[other][i][2]
+
+        return found
+
+    def overlaps(self, threshold=2, diagonals=True):
+        """ How many points are covered by at least `threshold` vents (only counting horizontal and vertical ones unless `diagonals`). """
+        if threshold < 1:
+            raise ValueError(f'Thresholds start at 1, not {threshold}')
+
+        names = list(LINES) if diagonals else LATERAL
+        count = sum(end - start + 1 for name in names for line in self.stretches[name].values() for start, end, covered in line if covered >= threshold)
+
+        # Lines counted their crossing points by their own vents alone, rather than by every vent there
+        for coverages in self.crossings(names).values():
+            count += (sum(coverages.values()) >= threshold) - sum(covered >= threshold for covered in coverages.values())
+
+        return count
+
+class Raster:
+    """ How many vents cover each point of their bounding box, as a NumPy grid with a layer for horizontal and vertical vents and one for diagonals. """
+
+    def __init__(self, segments):
+        import numpy
+
+        for segment in segments:
+            orientation(segment)
+
+        ends = numpy.array(segments, dtype=numpy.int64).reshape(-1, 4)
+        x1, y1, x2, y2 = ends.T
+        dx, dy = numpy.sign(x2 - x1), numpy.sign(y2 - y1)
+        lengths = numpy.maximum(abs(x2 - x1), abs(y2 - y1)) + 1
+
+        points = area(segments)
+        if points > RASTER_LIMIT:
+            raise ValueError(f'A bounding box of {points} points is too big to rasterize, use Sweep instead')
+
+        # Every point of every vent at once: which vent it's on, and how many steps along it
+        vents = numpy.repeat(numpy.arange(len(ends)), lengths)
+        steps = numpy.arange(len(vents)) - numpy.repeat(numpy.cumsum(lengths) - lengths, lengths)
+        xs, ys = x1[vents] + dx[vents] * steps, y1[vents] + dy[vents] * steps
+        layers = ((dx != 0) & (dy != 0))[vents].astype(numpy.intp)
+
+        if len(vents) == 0:
+            self.grid = numpy.zeros((2, 0, 0), dtype=numpy.int32)
+            return
+
+        xs, ys = xs - xs.min(), ys - ys.min()
+        self.grid = numpy.zeros((2, ys.max() + 1, xs.max() + 1), dtype=numpy.int32)
+        numpy.add.at(self.grid, (layers, ys, xs), 1)
+
+    def overlaps(self, threshold=2, diagonals=True):
+        import numpy
+
+        if threshold < 1:
+            raise ValueError(f'Thresholds start at 1, not {threshold}')
+
+        covered = self.grid.sum(axis=0) if diagonals else self.grid[0]
+        return int(numpy.count_nonzero(covered >= threshold))
+
+def part1(vents):
+    return vents.overlaps(2, diagonals=False)
+
+def part2(vents):
+    return vents.overlaps(2)
+
+if __name__ == '__main__':
+    vents = parse(Input.from_stdin())
+    print(part1(vents))
+    print(part2(vents))
@@ -1,7 +1,4 @@
-from sys import stdin
-
-lines = [line.strip().split(',') for line in stdin.readlines()]
-ages = [int(age) for age in lines[0]]
+from aoc.inputs import Input
 
 def summarize(ages):
     counts = [0] * 9
@@ -18,5 +15,16 @@ def simulate(days, ages):
         summary[8] += breeding_fish
     return summary
 
-print(sum(simulate(80, ages)))
-print(sum(simulate(256, ages)))
+def parse(puzzle):
+    return puzzle.ints()
+
+def part1(ages):
+    return sum(simulate(80, ages))
+
+def part2(ages):
+    return sum(simulate(256, ages))
+
+if __name__ == '__main__':
+    ages = parse(Input.from_stdin())
+    print(part1(ages))
+    print(part2(ages))
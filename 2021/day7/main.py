@@ -1,10 +1,7 @@
-from sys import stdin
+from aoc.inputs import Input
 
-lines = [line.strip().split(',') for line in stdin.readlines()]
-positions = [int(age) for age in lines[0]]
-
-min_pos = min(positions)
-max_pos = max(positions)
+def parse(puzzle):
+    return puzzle.ints()
 
 def fuel_for_distance(distance):
     distance = abs(distance)
@@ -13,6 +10,14 @@ def fuel_for_distance(distance):
 def required_fuel(pos, positions):
     return sum(fuel_for_distance(pos - p) for p in positions)
 
-fuel_at_positions = ((required_fuel(pos, positions), pos) for pos in range(min_pos, max_pos + 1))
-(cheapest_fuel, cheapest_position) = min(fuel_at_positions)
-print(cheapest_fuel)
+def part2(positions):
+    min_pos = min(positions)
+    max_pos = max(positions)
+
+    fuel_at_positions = ((required_fuel(pos, positions), pos) for pos in range(min_pos, max_pos + 1))
+    (cheapest_fuel, cheapest_position) = min(fuel_at_positions)
+    return cheapest_fuel
+
+if __name__ == '__main__':
+    positions = parse(Input.from_stdin())
+    print(part2(positions))
@@ -1,8 +1,6 @@
-from sys import stdin
 from itertools import permutations
 
-lines = [line.strip().split(' | ') for line in stdin.readlines()]
-readings = [(observation.split(' '), obfuscated_digits.split(' ')) for observation, obfuscated_digits in lines]
+from aoc.inputs import Input
 
 digits_to_segments = [
     'abcefg',
@@ -24,17 +22,24 @@ translations = [str.maketrans(permutation, connections) for permutation in conne
 def translate(observation, translation):
     return ''.join(sorted(observation.translate(translation)))
 
-def is_valid(observation, translation):
-    return translate(observation, translation) in digits_to_segments
-
 def observation_to_digit(observation, translation):
     translation = translate(observation, translation)
     return digits_to_segments.index(translation)
 
+def signature(signal):
+    # The ten patterns in a canonical order, so the same wiring always gives the same key
+    return ' '.join(sorted(''.join(sorted(observation)) for observation in signal))
+
+def scramble(permutation):
+    wiring = str.maketrans(connections, permutation)
+    return signature(digit.translate(wiring) for digit in digits_to_segments)
+
+# Every possible wiring, keyed by the ten patterns it scrambles the digits into. This is built once
+# at import, so every input solved in the same process (or a pool forked from it) shares it
+decoders = {scramble(permutation): translation for permutation, translation in zip(connection_permutations, translations)}
+
 def find_translation(signal):
-    for translation in translations:
-        if all(is_valid(observation, translation) for observation in signal):
-            return translation
+    return decoders.get(signature(signal))
 
 def to_number(digits):
     number, shift = 0, 1
@@ -52,13 +57,18 @@ def reading_to_digits(reading):
 
     return [observation_to_digit(digit, translation) for digit in obfuscated_digits]
 
-counts = 0
-total = 0
+def parse(puzzle):
+    lines = [line.strip().split(' | ') for line in puzzle.lines()]
+    readings = [(observation.split(' '), obfuscated_digits.split(' ')) for observation, obfuscated_digits in lines]
+    return [reading_to_digits(reading) for reading in readings]
+
+def part1(displays):
+    return sum(1 for digits in displays for digit in digits if digit in [1,4,7,8])
 
-for reading in readings:
-    digits = reading_to_digits(reading)
-    counts += sum(1 for digit in digits if digit in [1,4,7,8])
-    total += to_number(digits)
+def part2(displays):
+    return sum(to_number(digits) for digits in displays)
 
-print(counts)
-print(total)
+if __name__ == '__main__':
+    displays = parse(Input.from_stdin())
+    print(part1(displays))
+    print(part2(displays))
@@ -1,51 +1,48 @@
-from sys import stdin
 from math import prod
 
-lines = [line.strip() for line in stdin.readlines()]
-grid = [[int(cell) for cell in line] for line in lines]
+from aoc.grid import DIGITS, Grid
+from aoc.inputs import Input
 
-def find_neighbors(grid, x, y):
-    if x > 0:
-        yield (x - 1, y)
-    if y > 0:
-        yield (x, y - 1)
-    if x < len(grid) - 1:
-        yield (x + 1, y)
-    if y < len(grid[0]) - 1:
-        yield (x, y + 1)
-
-def risk(grid, x, y):
-    return 1 + grid[x][y]
+def risk(grid, index):
+    return 1 + grid.cells[index]
 
 def low_points(grid):
-    for x in range(len(grid)):
-        for y in range(len(grid[x])):
-            height = grid[x][y]
-            neighbors = find_neighbors(grid, x, y)
-            if all(height < grid[x1][y1] for  x1, y1 in neighbors):
-                yield (x, y)
-
-def find_basin(grid, x, y, visited = set()):
-    if (x, y) in visited:
-        return
+    cells, neighbors = grid.cells, grid.neighbors()
+    for index, height in enumerate(cells):
+        if all(height < cells[neighbor] for neighbor in neighbors[index]):
+            yield index
 
-    if grid[x][y] == 9:
-        return
+def find_basin(grid, index, visited):
+    cells, neighbors = grid.cells, grid.neighbors()
+    stack = [index]
 
-    visited.add((x, y))
-    yield (x, y)
+    while stack:
+        index = stack.pop()
+        if visited[index] or cells[index] == 9:
+            continue
 
-    for x1, y1 in find_neighbors(grid, x, y):
-        yield from find_basin(grid, x1, y1, visited)
+        visited[index] = 1
+        yield index
+        stack.extend(neighbors[index])
 
 def all_basins(grid):
-    for x, y in low_points(grid):
-        yield list(find_basin(grid, x, y))
-
-total_risk = sum(risk(grid, x, y) for x, y in low_points(grid))
-basins = list(all_basins(grid))
-basin_sizes = [len(basin) for basin in basins]
-ordered_basins = sorted(basin_sizes)
-
-print(total_risk)
-print(prod(ordered_basins[-3:]))
+    visited = bytearray(grid.size)
+    for index in low_points(grid):
+        yield list(find_basin(grid, index, visited))
+
+def parse(puzzle):
+    return Grid.parse(puzzle, DIGITS)
+
+def part1(grid):
+    return sum(risk(grid, index) for index in low_points(grid))
+
+def part2(grid):
+    basins = list(all_basins(grid))
+    basin_sizes = [len(basin) for basin in basins]
+    ordered_basins = sorted(basin_sizes)
+    return prod(ordered_basins[-3:])
+
+if __name__ == '__main__':
+    grid = parse(Input.from_stdin())
+    print(part1(grid))
+    print(part2(grid))
@@ -1,11 +1,55 @@
-from sys import stdin
-from itertools import groupby
+from heapq import heappush, heappushpop, nlargest
 
-lines = stdin.read().splitlines()
-groups = [list(group) for key, group in groupby(lines, bool) if key]
-elves = [sum(map(int, group)) for group in groups]
+from aoc.inputs import Input
+from aoc.streaming import consume
 
-elves = sorted(elves, reverse=True)
+class Elves:
+    """ Totals each elf's calories as the lines arrive, keeping only the three largest totals. """
 
-print(elves[0])
-print(sum(elves[:3]))
+    def __init__(self, keep=3):
+        self.keep = keep
+        # A min-heap, so the smallest of them is the one to push out
+        self.largest = []
+        # The elf currently being counted, if any lines have arrived since the last blank one
+        self.current = None
+
+    def feed(self, line):
+        if line.strip():
+            self.current = (self.current or 0) + int(line)
+        elif self.current is not None:
+            self.finish(self.current)
+            self.current = None
+
+    def finish(self, total):
+        if len(self.largest) < self.keep:
+            heappush(self.largest, total)
+        else:
+            heappushpop(self.largest, total)
+
+    def top(self):
+        """ The largest totals so far, largest first, including the elf still being counted. """
+        totals = self.largest if self.current is None else self.largest + [self.current]
+        return nlargest(self.keep, totals)
+
+    def part1(self):
+        return self.top()[0]
+
+    def part2(self):
+        return sum(self.top())
+
+def consumer():
+    return Elves()
+
+def parse(puzzle):
+    return consume(consumer(), puzzle.byte_lines())
+
+def part1(elves):
+    return elves.part1()
+
+def part2(elves):
+    return elves.part2()
+
+if __name__ == '__main__':
+    elves = parse(Input.from_stdin())
+    print(part1(elves))
+    print(part2(elves))
@@ -1,6 +1,7 @@
-from sys import stdin
 from typing import NamedTuple, Callable, Iterator
 
+from aoc.inputs import Input
+
 Registers = dict[str, int]
 
 class CPU(NamedTuple):
@@ -51,7 +52,7 @@ NOOP = OpCode('noop', 1, lambda cpu, _: cpu)
 ADDX = OpCode('addx', 2, lambda cpu, args: cpu.set('x', cpu.get('x') + args[0]))
 OP_CODES = {op.name:op for op in [NOOP, ADDX]}
 
-def parse(line: str) -> Instruction:
+def parse_instruction(line: str) -> Instruction:
     name, *args = line.split()
     operation = OP_CODES[name]
     return Instruction(operation, list(map(int, args)))
@@ -81,12 +82,18 @@ def render(cpus: Iterator[CPU], register: str, screen_width: int) -> str:
 
     return '\n'.join(''.join(row) for row in rows)
 
-
-cpu = CPU()
-operations = list(map(parse, stdin.read().splitlines()))
+def parse(puzzle: Input) -> list[Instruction]:
+    return list(map(parse_instruction, puzzle.lines()))
 
 # Part 1
-print(signal_strength(cpu.execute(operations), 'x', 20, 40))
+def part1(operations: list[Instruction]) -> int:
+    return signal_strength(CPU().execute(operations), 'x', 20, 40)
 
 # Part 2
-print(render(cpu.execute(operations), 'x', 40))
+def part2(operations: list[Instruction]) -> str:
+    return render(CPU().execute(operations), 'x', 40)
+
+if __name__ == '__main__':
+    operations = parse(Input.from_stdin())
+    print(part1(operations))
+    print(part2(operations))
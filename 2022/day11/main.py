@@ -1,8 +1,10 @@
 from enum import Enum, auto
 from functools import reduce
-from sys import stdin
 from typing import NamedTuple, Callable
 
+from aoc.cycles import CycleDetector
+from aoc.inputs import Input
+
 Item = int
 
 class Operator(Enum):
@@ -57,22 +59,16 @@ class Monkey:
     items: list[Item]
     operation: Operation
     test: MonkeyTest
-    inspections: int = 0
 
     def __init__(self, items, operation, test):
         self.items = items
         self.operation = operation
         self.test = test
 
-    def inspect(self: 'Monkey', monkies: list['Monkey'], worry_transform: WorryTransform):
-        item = self.items.pop(0)
-        self.inspections = self.inspections + 1
-
-        worry_level = self.operation.eval(item)
-        worry_level = worry_transform(worry_level)
-
-        next_monkey = self.test.eval(worry_level)
-        monkies[next_monkey].items.append(worry_level)
+    def inspect(self: 'Monkey', worry_level: int, worry_transform: WorryTransform) -> tuple[int, int]:
+        """ The new worry level of an item, and the monkey it's thrown to. """
+        worry_level = worry_transform(self.operation.eval(worry_level))
+        return worry_level, self.test.eval(worry_level)
 
     @staticmethod
     def parse(lines: list[str]) -> 'Monkey':
@@ -81,21 +77,47 @@ class Monkey:
         test = MonkeyTest.parse(lines[3:])
         return Monkey(items, operation, test)
 
-def eval_round(monkies: list[Monkey], worry_transform: WorryTransform) -> list[Monkey]:
-    monkies = monkies[:]
+def play_round(monkies: list[Monkey], monkey: int, worry_level: int, worry_transform: WorryTransform, inspections: list[int]) -> tuple[int, int]:
+    """ Follows one item through a round, counting its inspections, and returns where it ends up. """
+    while True:
+        inspections[monkey] += 1
+        worry_level, next_monkey = monkies[monkey].inspect(worry_level, worry_transform)
 
-    for monkey in monkies:
-        for _ in range(len(monkey.items)):
-            monkey.inspect(monkies, worry_transform)
+        # Monkeys take turns in order, so an item thrown forwards is inspected again this round
+        if next_monkey < monkey:
+            return next_monkey, worry_level
+        monkey = next_monkey
 
-    return monkies
+def item_inspections(monkies: list[Monkey], monkey: int, worry_level: int, rounds: int, worry_transform: WorryTransform) -> list[int]:
+    """ How many times each monkey inspects one item over `rounds` rounds.
 
-def eval(monkies: list[Monkey], rounds: int, worry_transform: WorryTransform) -> list[Monkey]:
-    for _ in range(rounds):
-        monkies = eval_round(monkies, worry_transform)
-    return monkies
+    An item's path only depends on where it is and its own worry level, which soon repeat,
+    so the inspections beyond the first cycle are extrapolated rather than played.
+    """
+    inspections = [0] * len(monkies)
+    detector = CycleDetector()
+    detector.observe((monkey, worry_level), tuple(inspections))
 
-def parse(input: list[str]) -> list[Monkey]:
+    for _ in range(rounds):
+        monkey, worry_level = play_round(monkies, monkey, worry_level, worry_transform, inspections)
+        found = detector.observe((monkey, worry_level), tuple(inspections))
+        if found is not None:
+            index, cycles = found.fold(rounds)
+            first, last = found.values[found.start], found.values[found.start + found.length]
+            return [count + cycles * (end - start) for count, start, end in zip(found.values[index], first, last)]
+
+    return inspections
+
+def eval(monkies: list[Monkey], rounds: int, worry_transform: WorryTransform) -> list[int]:
+    """ How many items each monkey inspects over `rounds` rounds. Items never affect each other, so each is followed alone. """
+    inspections = [0] * len(monkies)
+    for monkey, holder in enumerate(monkies):
+        for item in holder.items:
+            counts = item_inspections(monkies, monkey, item, rounds, worry_transform)
+            inspections = [total + count for total, count in zip(inspections, counts)]
+    return inspections
+
+def parse_monkies(input: list[str]) -> list[Monkey]:
     monkies = []
     for i in range(0, len(input), 7):
         monkies.append(Monkey.parse(input[i : i + 6]))
@@ -105,22 +127,25 @@ def product(xs: list[int]) -> int:
     multiply = lambda a, b: a * b
     return reduce(multiply, xs, 1)
 
-
-lines = stdin.read().splitlines()
+def parse(puzzle: Input) -> list[Monkey]:
+    return parse_monkies(list(puzzle.lines()))
 
 # Part 1
-transform = lambda worry_level: worry_level // 3
-monkies = parse(lines)
+def part1(monkies: list[Monkey]) -> int:
+    transform = lambda worry_level: worry_level // 3
 
-part1_monkies = eval(monkies, 20, transform)
-inspections = sorted([monkey.inspections for monkey in part1_monkies], reverse=True)
-print(inspections[0] * inspections[1])
+    inspections = sorted(eval(monkies, 20, transform), reverse=True)
+    return inspections[0] * inspections[1]
 
 # Part 2
-common_divisor = product([monkey.test.modulus for monkey in monkies])
-transform = lambda worry_level: worry_level % common_divisor
-monkies = parse(lines)
+def part2(monkies: list[Monkey]) -> int:
+    common_divisor = product([monkey.test.modulus for monkey in monkies])
+    transform = lambda worry_level: worry_level % common_divisor
+
+    inspections = sorted(eval(monkies, 10000, transform), reverse=True)
+    return inspections[0] * inspections[1]
 
-part2_monkies = eval(monkies, 10000, transform)
-inspections = sorted([monkey.inspections for monkey in part2_monkies], reverse=True)
-print(inspections[0] * inspections[1])
+if __name__ == '__main__':
+    monkies = parse(Input.from_stdin())
+    print(part1(monkies))
+    print(part2(monkies))
@@ -1,119 +1,62 @@
-from sys import stdin
-from heapq import heappop, heappush
-from typing import NamedTuple, Optional, Iterable
+from typing import Iterable, Iterator, NamedTuple, Optional
 from string import ascii_lowercase
 
-class Position(NamedTuple):
-    x: int
-    y: int
+from aoc.grid import Grid
+from aoc.inputs import Input
+from aoc.search import bfs
 
-    def neighbors(self, grid: 'Grid') -> Iterable['Position']:
-        x, y = self
+# Positions are cell indexes into the height grid
+Position = int
 
-        if self.x > 0:
-            yield Position(x - 1, y)
+HEIGHTS = bytes.maketrans(ascii_lowercase.encode(), bytes(range(26)))
 
-        if self.x < grid.width - 1:
-            yield Position(x + 1, y)
-
-        if self.y > 0:
-            yield Position(x, y - 1)
-
-        if self.y < grid.height - 1:
-            yield Position(x, y + 1)
-
-    def __str__(self: 'Position') -> str:
-        return f'({self.x}, {self.y})'
-
-Height = int
-
-def manhattan_distance(a: Position, b: Position) -> int:
-    return abs(a.x - b.x) + abs(a.y - b.y)
-
-class Grid(NamedTuple):
+class HeightMap(NamedTuple):
     start: Position
     end: Position
-    heights: list[list[Height]]
-    width: int
-    height: int
-
-    def find_shortest_path(self: 'Grid', start: Position) -> Optional[int]:
-        # Uses A* for search
-        heuristic = 0 + manhattan_distance(start, self.end)
-        positions = [(heuristic, start, 0)]
-        visited = set()
-
-        while len(positions) > 0:
-            _, position, traveled = heappop(positions)
-            if position in visited:
-                continue
-            visited.add(position)
-
-            if position == self.end:
-                return traveled
-
-            last_height = self.heights[position.y][position.x]
-            for neighbor in position.neighbors(self):
-                if neighbor in visited:
-                    continue
-
-                neighbor_height = self.heights[neighbor.y][neighbor.x]
-                if neighbor_height > last_height + 1:
-                    continue
-
-                distance = manhattan_distance(neighbor, self.end)
-                heuristic = traveled + distance
-                heappush(positions, (heuristic, neighbor, traveled + 1))
-
-        return None
-
-    def find_best_start(self: 'Grid') -> Optional[int]:
-        best = None
-        for row in range(self.height):
-            for col in range(self.width):
-                height = self.heights[row][col]
-                if height != 0:
-                    continue
-
-                distance = self.find_shortest_path(Position(col, row))
-                if best is None or (distance is not None and distance < best):
-                    best = distance
-        return best
+    heights: Grid
 
+    def climbable(self: 'HeightMap', position: Position) -> Iterator[Position]:
+        """ Neighbours at most one higher than `position`. """
+        limit = self.heights.cells[position] + 1
+        return (neighbor for neighbor in self.heights.neighbors()[position] if self.heights.cells[neighbor] <= limit)
+
+    def find_shortest_path(self: 'HeightMap', starts: Iterable[Position]) -> Optional[int]:
+        # Every step costs the same, so breadth-first search from all the starts at once finds the nearest
+        return bfs(starts, self.climbable, self.end.__eq__, size=self.heights.size)
+
+    def find_best_start(self: 'HeightMap') -> Optional[int]:
+        return self.find_shortest_path(self.heights.find_all(0))
 
     @staticmethod
-    def parse(lines: list[str]) -> 'Grid':
-        start: Optional[Position] = None
-        end: Optional[Position] = None
-        heights: list[list[Height]] = []
-
-        for y, line in enumerate(lines):
-            heights.append([])
-            for x, char in enumerate(line):
-                if char == 'S':
-                    start, char = Position(x, y), 'a'
-                elif char == 'E':
-                    end, char = Position(x, y), 'z'
-                elif char not in ascii_lowercase:
-                    raise Exception(f'Character {char} unknown how to parse.')
-
-                height = ascii_lowercase.index(char)
-                heights[-1].append(height)
-
-        if start is None:
+    def parse(puzzle: Input) -> 'HeightMap':
+        grid = Grid.parse(puzzle)
+
+        start, end = grid.find(ord('S')), grid.find(ord('E'))
+        if start == -1:
             raise Exception('Start is not specified')
 
-        if end is None:
+        if end == -1:
             raise Exception('end is not specified')
 
-        width, height = len(heights[0]), len(heights)
-        return Grid(start=start, end=end, width=width, height=height, heights=heights)
+        grid.cells[start], grid.cells[end] = ord('a'), ord('z')
+        unknown = grid.cells.translate(None, ascii_lowercase.encode())
+        if unknown:
+            raise Exception(f'Character {chr(unknown[0])} unknown how to parse.')
 
-lines = stdin.read().splitlines()
-grid = Grid.parse(lines)
+        return HeightMap(start=start, end=end, heights=Grid(grid.width, grid.height, grid.cells.translate(HEIGHTS)))
+
+def parse(puzzle: Input) -> HeightMap:
+    return HeightMap.parse(puzzle)
 
 # Part 1
-print(grid.find_shortest_path(grid.start))
+def part1(height_map: HeightMap) -> Optional[int]:
+    return height_map.find_shortest_path([height_map.start])
 
 # Part 2
-print(grid.find_best_start())
+def part2(height_map: HeightMap) -> Optional[int]:
+    return height_map.find_best_start()
+
+if __name__ == '__main__':
+    height_map = parse(Input.from_stdin())
+    print(part1(height_map))
+    print(part2(height_map))
@@ -1,6 +1,7 @@
-from sys import stdin
 from functools import cmp_to_key
 
+from aoc.inputs import Input
+
 def cmp_int(left, right):
     return -1 if left < right else 0 if left == right else 1
 
@@ -24,17 +25,25 @@ def cmp(left, right):
 
     return cmp(len(left), len(right))
 
-packets = [eval(line) for line in stdin.read().splitlines() if line != ""]
-pairs = list(zip(packets[0::2], packets[1::2]))
+def parse(puzzle):
+    return [eval(line) for line in puzzle.lines() if line != ""]
 
 # Part 1
-print(sum(i + 1 for i, (a, b) in enumerate(pairs) if cmp(a, b) <= 0))
+def part1(packets):
+    pairs = list(zip(packets[0::2], packets[1::2]))
+    return sum(i + 1 for i, (a, b) in enumerate(pairs) if cmp(a, b) <= 0)
 
 # Part 2
-dividers = [[[2]], [[6]]]
-packets = packets + dividers
+def part2(packets):
+    dividers = [[[2]], [[6]]]
+    packets = packets + dividers
+
+    ordered = sorted(packets, key=cmp_to_key(cmp))
+    indexes = [ordered.index(divider) + 1 for divider in dividers]
 
-ordered = sorted(packets, key=cmp_to_key(cmp))
-indexes = [ordered.index(divider) + 1 for divider in dividers]
+    return indexes[0] * indexes[1]
 
-print(indexes[0] * indexes[1])
+if __name__ == '__main__':
+    packets = parse(Input.from_stdin())
+    print(part1(packets))
+    print(part2(packets))
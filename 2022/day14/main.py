@@ -1,9 +1,10 @@
-from sys import stdin
 from collections import defaultdict
 from bisect import insort, bisect_left as search
 from enum import IntEnum, auto
 from typing import NamedTuple, Optional
 
+from aoc.inputs import Input
+
 class Content(IntEnum):
     SOURCE = auto()
     AIR = auto()
@@ -115,13 +116,22 @@ def parse_line(line: str) -> Line:
     points = [point.split(',') for point in line.split(' -> ')]
     return [Coordinate(int(x), int(y)) for x, y in points]
 
-lines = list(map(parse_line, stdin.read().splitlines()))
-start = Coordinate(500, 0)
+def parse(puzzle: Input) -> list[Line]:
+    return list(map(parse_line, puzzle.lines()))
+
+START = Coordinate(500, 0)
 
 # Part 1
-world = World.new(start, lines)
-print(world.count_grains())
+def part1(lines: list[Line]) -> int:
+    world = World.new(START, lines)
+    return world.count_grains()
 
 # Part 2
-world = World.new(start, lines, 2)
-print(world.count_grains() + 1)
+def part2(lines: list[Line]) -> int:
+    world = World.new(START, lines, 2)
+    return world.count_grains() + 1
+
+if __name__ == '__main__':
+    lines = parse(Input.from_stdin())
+    print(part1(lines))
+    print(part2(lines))
@@ -1,20 +1,43 @@
-from sys import stdin
-from typing import NamedTuple
+from typing import NamedTuple, Optional
+
+from aoc.inputs import Input
+from aoc.memo import memoize
+from aoc.search import UNREACHED, distances
 
 class Valve(NamedTuple):
     name: str
     rate: int
     neighbors: list['Valve']
+    # Sets of opened valves are ints, with bit `index` for each valve
+    index: int
 
 # The only state we care about for an actor is what valve they are at... so actors are just synonyms for valves
 Actor = Valve
 
 def max_pressure(actors: list[Actor], time: int) -> int:
-    # This is just a helper fn to initialize some the cache and whatnot for `recurse`
+    # This is just a helper fn to reset the cache for `recurse`
     # It makes the callsite a little cleaner
-    return recurse(actors, time, time, [], {})
-
-def recurse(actors: list[Actor], time: int, total_time: int, opened: list[str], cache: dict[str, int]) -> int:
+    recurse.cache_clear()
+    return recurse(actors, time, time, 0)
+
+def recurse_key(actors: list[Actor], time: int, total_time: int, opened: int) -> Optional[int]:
+    # The same positions at the same time with the same set of opened valves have the same outcome.
+    # Leaves (no actors left, or out of time) aren't worth keeping.
+    if len(actors) == 0 or time <= 1:
+        return None
+
+    # All of that packs into one int, which is cheaper to hash and store than a tuple. No time is past
+    # `total_time`, which is the same for every key until the cache is cleared, so it sets the time's width.
+    key = (opened << total_time.bit_length()) | time
+    for index in sorted(actor.index for actor in actors):
+        key = (key << 7) | index
+
+    # The number of actors goes last, so that it says how many position fields there are. Without it one
+    # actor with more opened valves could pack to the same int as two actors with fewer.
+    return (key << 2) | len(actors)
+
+@memoize(key=recurse_key, maxsize=1 << 21)
+def recurse(actors: list[Actor], time: int, total_time: int, opened: int) -> int:
     # If there are no actors remaining, we're done.
     if len(actors) == 0:
         return 0
@@ -22,33 +45,71 @@ def recurse(actors: list[Actor], time: int, total_time: int, opened: list[str],
     # We explore all the paths of whatever actor is at the head of the list
     valve = actors[0]
 
-    # Check if we've already seen these positions at this time with this set of opened valves
-    cache_key = f'{sorted([valve.name for valve in actors])} {time} {sorted(opened)}'
-    if cache_key in cache:
-         return cache[cache_key]
-
     # We've hit a leaf node for this valve. This leaf now becomes the root
     # of the depth-first search for the next actor, where we start the search
     # from the start, but with a shared cache and set of opened valves
     if time <= 1:
-        return recurse(actors[1:], total_time, total_time, opened, cache)
+        return recurse(actors[1:], total_time, total_time, opened)
 
     # Try moving to each neighbor without opening my valve
-    moving = max(recurse([neighbor] + actors[1:], time - 1, total_time, opened, cache) for neighbor in valve.neighbors)
+    moving = max(recurse([neighbor] + actors[1:], time - 1, total_time, opened) for neighbor in valve.neighbors)
 
     # If we haven't opened my valve and it has a rate, open it!
-    should_open = valve.rate > 0 and valve.name not in opened
+    bit = 1 << valve.index
+    should_open = valve.rate > 0 and not opened & bit
     pressure = valve.rate * (time - 1)
-    opening = (pressure + recurse(actors, time - 1, total_time, opened + [valve.name], cache)) if should_open else 0
-
-    most_pressure = max(moving, opening)
-    cache[cache_key] = most_pressure
-    return most_pressure
-
-def parse_valve(line: str) -> Valve:
+    opening = (pressure + recurse(actors, time - 1, total_time, opened | bit)) if should_open else 0
+
+    return max(moving, opening)
+
+def opened_pressures(valves: dict[str, Valve], time: int) -> tuple[list[Valve], dict[int, int]]:
+    """ The most pressure one actor starting at AA can release in `time`, for each set of valves it could open.
+
+    Only valves with a rate are worth heading for, so the search jumps straight
+    between them along shortest paths rather than a minute at a time. Sets are
+    ints with bit `i` for the `i`th valve of the returned list.
+    """
+    by_index = sorted(valves.values(), key=lambda valve: valve.index)
+    useful = [valve for valve in by_index if valve.rate > 0]
+    start = valves['AA']
+    steps = {valve.index: distances([valve.index], lambda index: [neighbor.index for neighbor in by_index[index].neighbors], len(by_index)) for valve in useful + [start]}
+
+    best: dict[int, int] = {}
+    pending = [(start, time, 0, 0)]
+    while pending:
+        valve, remaining, opened, pressure = pending.pop()
+        if best.get(opened, -1) < pressure:
+            best[opened] = pressure
+
+        for bit, target in enumerate(useful):
+            distance = steps[valve.index][target.index]
+            # Walking there and opening it leaves this many minutes of flow
+            left = remaining - distance - 1
+            if distance != UNREACHED and left > 0 and not opened >> bit & 1:
+                pending.append((target, left, opened | (1 << bit), pressure + target.rate * left))
+
+    return useful, best
+
+def paired_pressure(valves: dict[str, Valve], time: int) -> int:
+    """ The most pressure two actors starting at AA can release in `time`, each opening their own set of valves. """
+    useful, best = opened_pressures(valves, time)
+
+    # The most either actor can release opening any subset of each set
+    within = [0] * (1 << len(useful))
+    for opened, pressure in best.items():
+        within[opened] = pressure
+    for bit in range(len(useful)):
+        for opened in range(len(within)):
+            if opened >> bit & 1:
+                within[opened] = max(within[opened], within[opened ^ (1 << bit)])
+
+    everything = len(within) - 1
+    return max(pressure + within[everything ^ opened] for opened, pressure in best.items())
+
+def parse_valve(line: str, index: int) -> Valve:
     name = line[6:8]
     rate = int(line.split('=')[-1])
-    return Valve(name , rate, [])
+    return Valve(name , rate, [], index)
 
 def parse_tunnels(line: str) -> list[str]:
     divider = 'valves ' if 'tunnels' in line else 'valve '
@@ -59,10 +120,10 @@ def parse_lines(lines: list[str]) -> dict[str, Valve]:
     valves = {}
     mapping = {}
 
-    for line in lines:
+    for index, line in enumerate(lines):
         valve_line, tunnels_line = line.split('; ')
 
-        valve = parse_valve(valve_line)
+        valve = parse_valve(valve_line, index)
         tunnels = parse_tunnels(tunnels_line)
 
         valves[valve.name] = valve
@@ -75,10 +136,23 @@ def parse_lines(lines: list[str]) -> dict[str, Valve]:
 
     return valves
 
-valves = parse_lines(stdin.read().splitlines())
+def parse(puzzle: Input) -> dict[str, Valve]:
+    valves = parse_lines(puzzle.lines())
+    if len(valves) > 128:
+        # Each actor's position takes 7 bits of a cache key
+        raise ValueError('Too many valves to pack into cache keys')
+    return valves
 
 # Part 1
-print(max_pressure([valves['AA']], 30))
+def part1(valves: dict[str, Valve]) -> int:
+    return max_pressure([valves['AA']], 30)
 
 # Part 2
-print(max_pressure([valves['AA'], valves['AA']], 26))
+def part2(valves: dict[str, Valve]) -> int:
+    # The same as max_pressure([valves['AA'], valves['AA']], 26), which takes far too long on real inputs
+    return paired_pressure(valves, 26)
+
+if __name__ == '__main__':
+    valves = parse(Input.from_stdin())
+    print(part1(valves))
+    print(part2(valves))
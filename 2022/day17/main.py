@@ -1,9 +1,9 @@
-from sys import stdin
-from itertools import cycle
 from enum import Enum, auto
-from typing import Iterable
 from dataclasses import dataclass, field
 
+from aoc.cycles import CycleDetector
+from aoc.inputs import Input
+
 Point = tuple[int, int]
 Shape = set[Point]
 
@@ -24,30 +24,37 @@ class Command(Enum):
 @dataclass
 class Chamber:
     points: set[Point] = field(default_factory=set)
+    # A bitmask of the rock in each row, from the floor up
+    rows: list[int] = field(default_factory=list)
     height: int = 0
     width: int = 7
     total_shapes_added: int = 0
-    signatures: dict[str, tuple[int, int]] = field(default_factory=dict)
+    jets_used: int = 0
+
+    def add_shapes(self: 'Chamber', count: int, jets: list[Command], analyze_cycles: bool = True):
+        detector = CycleDetector()
+        detector.observe(self.get_signature(len(jets)), self.height)
 
-    def add_shapes(self: 'Chamber', count: int, shapes: Iterable[Shape], commands: Iterable[Command], analyze_cycles: bool = True):
-        for shape in take(count, shapes):
-            self.add_shape(shape, commands)
+        while self.total_shapes_added < count:
+            self.add_shape(SHAPES[self.total_shapes_added % len(SHAPES)], jets)
 
             if not analyze_cycles:
                 continue
 
-            signature = self.get_signature()
-            if signature in self.signatures:
-                adjustment, remainder = self.get_height_adjustment(signature, count)
-                self.add_shapes(remainder, shapes, commands, False)
-                self.height += adjustment
+            found = detector.observe(self.get_signature(len(jets)), self.height)
+            if found is not None:
+                # Every further trip around the cycle adds the same height
+                self.height = found.at(count)
+                self.total_shapes_added = count
                 return
-            self.signatures[signature] = (self.total_shapes_added, self.height)
 
-    def add_shape(self: 'Chamber', shape: Shape, commands: Iterable[Command], offset: Point = (3, 4)):
+    def add_shape(self: 'Chamber', shape: Shape, jets: list[Command], offset: Point = (3, 4)):
         shape = shift(shape, offset[0], self.height + offset[1])
 
-        for command in commands:
+        while True:
+            command = jets[self.jets_used % len(jets)]
+            self.jets_used += 1
+
             # Move left or right
             shape, finished = self.process_command(command, shape)
             if finished:
@@ -60,17 +67,6 @@ class Chamber:
 
         self.total_shapes_added += 1
 
-    def get_height_adjustment(self: 'Chamber', signature: str, total: int) -> tuple[int, int]:
-        previous_count, previous_height = self.signatures[signature]
-
-        remaining_shapes = total - self.total_shapes_added
-        shapes_in_cycle = self.total_shapes_added - previous_count
-        cycle_height = self.height - previous_height
-
-        quotient, remainder = divmod(remaining_shapes, shapes_in_cycle)
-        return (quotient * cycle_height, remainder)
-
-
     def intersects(self: 'Chamber', shape: Shape) -> bool:
         left, right = min(x for x, _ in shape), max(x for x, _ in shape)
 
@@ -80,12 +76,10 @@ class Chamber:
 
         return touched_wall or touched_floor or touched_rock
 
-    def get_signature(self: 'Chamber') -> str:
+    def get_signature(self: 'Chamber', jet_count: int) -> tuple[int, int, bytes]:
         # Assume that looking back 64 rows is sufficient for a distinct signature
-        coords = [(x, y) for x in range(1, self.width + 1) for y in range(self.height - 64, self.height + 1)]
-
-        # Convert cells to a binary string
-        return ''.join('1' if point in self.points else '0' for point in coords)
+        # Rows fit in a byte each (x runs from 1 to 7), so the top of the tower packs into bytes
+        return (self.total_shapes_added % len(SHAPES), self.jets_used % jet_count, bytes(self.rows[-64:]))
 
     def process_command(self: 'Chamber', command: Command, shape: Shape) -> tuple[Shape, bool]:
         moved_shape = command.apply(shape)
@@ -103,14 +97,16 @@ class Chamber:
             self.points.update(shape)
             self.height = height
 
+            # Row `y` is at index `y - 1`, as the floor is at 0
+            self.rows.extend(0 for _ in range(height - len(self.rows)))
+            for x, y in shape:
+                self.rows[y - 1] |= 1 << x
+
         return (new_shape, stop_processing)
 
 def shift(shape: Shape, xd: int, yd: int) -> Shape:
     return set((x + xd, y + yd) for x, y in shape)
 
-def take(n, iterator):
-    return (next(iterator) for _ in range(n))
-
 SHAPES = [
     {(1,0), (2,0), (3,0), (0,0)},        # –
     {(0,1), (1,2), (2,1), (1,1), (1,0)}, # +
@@ -119,18 +115,23 @@ SHAPES = [
     {(1,0), (0,1), (1,1), (0,0)},        # ■
 ]
 
-COMMANDS = [Command.parse(char) for char in stdin.read().strip()]
+def parse(puzzle: Input) -> list[Command]:
+    return [Command.parse(char) for char in puzzle.text.strip()]
+
+def tower_height(jets: list[Command], count: int) -> int:
+    chamber = Chamber()
+    chamber.add_shapes(count, jets)
+    return chamber.height
 
 # Part 1
-chamber = Chamber()
-shapes = cycle(SHAPES)
-commands = cycle(COMMANDS)
-chamber.add_shapes(2022, shapes, commands)
-print(chamber.height)
+def part1(jets: list[Command]) -> int:
+    return tower_height(jets, 2022)
 
 # Part 2
-chamber = Chamber()
-shapes = cycle(SHAPES)
-commands = cycle(COMMANDS)
-chamber.add_shapes(1000000000000, shapes, commands)
-print(chamber.height)
+def part2(jets: list[Command]) -> int:
+    return tower_height(jets, 1000000000000)
+
+if __name__ == '__main__':
+    jets = parse(Input.from_stdin())
+    print(part1(jets))
+    print(part2(jets))
@@ -1,6 +1,7 @@
-from sys import stdin
 from typing import NamedTuple, Iterable
 
+from aoc.inputs import Input
+
 Volume = set['Voxel']
 
 class Voxel(NamedTuple):
@@ -59,10 +60,18 @@ def perimeter(volume: Volume) -> Iterable['Voxel']:
 
         stack.extend(voxel.neighbors())
 
-voxels = set(map(Voxel.parse, stdin.read().splitlines()))
+def parse(puzzle: Input) -> Volume:
+    return set(map(Voxel.parse, puzzle.lines()))
 
 # Part 1
-print(sum(voxel.exposed_area(voxels) for voxel in voxels))
+def part1(voxels: Volume) -> int:
+    return sum(voxel.exposed_area(voxels) for voxel in voxels)
 
 # Part 2
-print(sum(voxel.covered_area(voxels) for voxel in perimeter(voxels)))
+def part2(voxels: Volume) -> int:
+    return sum(voxel.covered_area(voxels) for voxel in perimeter(voxels))
+
+if __name__ == '__main__':
+    voxels = parse(Input.from_stdin())
+    print(part1(voxels))
+    print(part2(voxels))
@@ -1,19 +1,30 @@
-from sys import stdin
-from enum import Enum, auto
+import os
+from enum import IntEnum, auto
 from collections import Counter, defaultdict
 from dataclasses import dataclass, field
-from typing import NamedTuple, Iterable
-from multiprocessing import Pool
-from time import time
+from typing import Callable, NamedTuple, Iterable
 from functools import reduce
 from operator import mul
 
-class Material(Enum):
+from aoc.inputs import Input
+from aoc.lazy import lazy
+from aoc.memo import memoize
+from aoc.parsing import fields
+
+# Only the solving stages use the pool, so parsing (or a cached run) doesn't pay for importing it
+multiprocessing = lazy('multiprocessing')
+
+# An IntEnum hashes like an int, in C, rather than through Enum's Python-level __hash__,
+# which otherwise dominates the time spent looking materials up in Counters
+class Material(IntEnum):
     ORE = auto()
     CLAY = auto()
     OBSIDIAN = auto()
     GEODE = auto()
 
+# Iterating over the enum itself goes through its metaclass every time
+MATERIALS = tuple(Material)
+
 Currency = Counter[Material]
 
 class Blueprint(NamedTuple):
@@ -22,20 +33,9 @@ class Blueprint(NamedTuple):
     maximums: Counter[Material]
 
     @staticmethod
-    def parse(line: str) -> 'Blueprint':
-        label, rest = line.split(': ')
-        identifier = int(label.split(' ')[1])
-        prices = rest.split('. ')
-
-        ore_robot_ore = int(prices[0].split(' ')[4])
-
-        clay_robot_ore = int(prices[1].split(' ')[4])
-
-        obsidian_robot_ore = int(prices[2].split(' ')[4])
-        obsidian_robot_clay = int(prices[2].split(' ')[7])
-
-        geode_robot_ore = int(prices[3].split(' ')[4])
-        geode_robot_obsidian = int(prices[3].split(' ')[7])
+    def from_numbers(numbers: tuple[int, ...]) -> 'Blueprint':
+        (identifier, ore_robot_ore, clay_robot_ore, obsidian_robot_ore, obsidian_robot_clay,
+            geode_robot_ore, geode_robot_obsidian) = numbers
 
         prices = {
             Material.ORE: Counter({Material.ORE: ore_robot_ore}),
@@ -93,17 +93,40 @@ class RobotFactory:
         return True
 
     def build_robots(self: 'RobotFactory', time: int, target: Material, best_so_far: int) -> Iterable['RobotFactory']:
-        absolute_maximum = self.resources[target] + (self.robots[target] * time) + (time * (time - 1) // 2)
-        if absolute_maximum <= best_so_far:
+        if self.most_possible(time, target) <= best_so_far:
             # Nothing we can build will beat our best, so build nothing
             return
 
-        yield self # no-op build
-        for material in Material:
+        # The most valuable robots first, so that good answers (and so pruning) turn up early
+        for material in reversed(MATERIALS):
             if self.should_build(material, time, target):
                 yield self.build_robot(material)
+        yield self # no-op build
 
-    def cache_key(self: 'RobotFactory', time: int, target: Material) -> str:
+    def most_possible(self: 'RobotFactory', time: int, target: Material) -> int:
+        """ An upper bound on how much of `target` there can be after `time` more minutes. """
+        # Building a robot for it every minute
+        most = self.resources[target] + (self.robots[target] * time) + (time * (time - 1) // 2)
+        if target != Material.GEODE:
+            return most
+
+        # Geode robots need obsidian. Even with a free obsidian robot every minute, they can
+        # only be built whenever there's enough obsidian, and building them then is best.
+        price = self.blueprint.prices[Material.GEODE][Material.OBSIDIAN]
+        obsidian, obsidian_robots = self.resources[Material.OBSIDIAN], self.robots[Material.OBSIDIAN]
+        geodes, geode_robots = self.resources[Material.GEODE], self.robots[Material.GEODE]
+        for _ in range(time):
+            built = obsidian >= price
+            if built:
+                obsidian -= price
+            obsidian += obsidian_robots
+            geodes += geode_robots
+            obsidian_robots += 1
+            geode_robots += built
+
+        return min(most, geodes)
+
+    def cache_key(self: 'RobotFactory', time: int, target: Material) -> tuple[int, ...]:
         max_resources = self.blueprint.maximums
 
         # These keys use the same short-circuiting logic found in `should_build`.
@@ -117,63 +140,71 @@ class RobotFactory:
         #    cache key: min(self.resources[m] + (self.robots[m] * (time - 1)), max_resources[m] * time)
         #       versus
         #    should build: expected_quantity >= maximum_needed
-        robots_key = [min(self.robots[m], max_resources[m]) if m != target else self.robots[m] for m in Material]
-        resources_key = [min(self.resources[m] + (self.robots[m] * (time - 1)), max_resources[m] * time) if m != target else self.resources[m] for m in Material]
+        robots_key = (min(self.robots[m], max_resources[m]) if m != target else self.robots[m] for m in MATERIALS)
+        resources_key = (min(self.resources[m] + (self.robots[m] * (time - 1)), max_resources[m] * time) if m != target else self.resources[m] for m in MATERIALS)
 
-        return f"{time} {target} {robots_key} {resources_key}"
+        return (time, target.value, *robots_key, *resources_key)
 
     def maximize_production(self: 'RobotFactory', time: int, target: Material = Material.GEODE) -> int:
-        return self._maximize_production(time, target, {}, 0)
+        # Each search starts with an empty cache, since the keys don't say which blueprint they're for
+        production.cache_clear()
+        return production(self, time, target, 0)
 
-    def _maximize_production(self: 'RobotFactory', time: int, target: Material, cache: dict[str, int], maximum: int) -> int:
-        if time == 0:
-            return self.resources[target]
+@memoize(key=lambda factory, time, target, maximum: None if time == 0 else factory.cache_key(time, target))
+def production(factory: RobotFactory, time: int, target: Material, maximum: int) -> int:
+    """ The most of `target` the factory can have after `time` more minutes, given that `maximum` is already possible. """
+    if time == 0:
+        return factory.resources[target]
 
-        cache_key = self.cache_key(time, target)
-        if cache_key in cache:
-            return cache[cache_key]
-
-        # Store the robots we have prior to building new ones
-        robots = self.robots.copy()
+    # Store the robots we have prior to building new ones
+    robots = factory.robots.copy()
 
-        # Build every combination of robots, including no-op, that we can with the current resources
-        factories = list(self.build_robots(time, target, maximum))
+    # Build every combination of robots, including no-op, that we can with the current resources
+    built = list(factory.build_robots(time, target, maximum))
 
-        for factory in factories:
-            # Collect the resources that we could have collected *prior* to building new robots
-            factory.resources += robots
+    for next_factory in built:
+        # Collect the resources that we could have collected *prior* to building new robots
+        next_factory.resources += robots
 
-            # Move to the next time step for each factory
-            maximum = max(maximum, factory._maximize_production(time - 1, target, cache, maximum))
+        # Move to the next time step for each factory
+        maximum = max(maximum, production(next_factory, time - 1, target, maximum))
 
-        cache[cache_key] = maximum
-        return maximum
+    return maximum
 
-blueprints = list(map(Blueprint.parse, stdin.read().splitlines()))
-factories = list(map(RobotFactory, blueprints))
+def parse(puzzle: Input) -> list[Blueprint]:
+    # Every blueprint lists its number and then six costs in the same order
+    return list(map(Blueprint.from_numbers, fields(puzzle.view, 7)))
 
 # Python multiprocessing requires the function that is passed to `pool.map`
 # to be picklable, which means we need these two explicit functions instead
 # lambdas or something else.
-def part1(factory: RobotFactory) -> int:
+def quality_level(factory: RobotFactory) -> int:
     production = factory.maximize_production(24)
     return factory.blueprint.identifier * production
 
-def part2(factory: RobotFactory) -> int:
+def geodes_opened(factory: RobotFactory) -> int:
     return factory.maximize_production(32)
 
-with Pool(32) as p:
-    # Part 1
-    now = time()
-
-    qualities = p.map(part1, factories)
-    print(sum(qualities))
-    print(time() - now)
-
-    # Part 2
-    now = time()
-
-    geodes = p.map(part2, factories[:3])
-    product = reduce(mul, geodes, 1)
-    print(product)
-    print(time() - now)
+def search_all(search: Callable[[RobotFactory], int], factories: list[RobotFactory]) -> list[int]:
+    """ `search` for every factory, across a process per CPU, or in this process (where `run --profile` can see the memo) given only one. """
+    processes = min(len(factories), os.cpu_count() or 1)
+    if processes <= 1:
+        return list(map(search, factories))
+
+    with multiprocessing.Pool(processes) as p:
+        return p.map(search, factories)
+
+# Part 1
+def part1(blueprints: list[Blueprint]) -> int:
+    factories = list(map(RobotFactory, blueprints))
+    return sum(search_all(quality_level, factories))
+
+# Part 2
+def part2(blueprints: list[Blueprint]) -> int:
+    factories = list(map(RobotFactory, blueprints[:3]))
+    return reduce(mul, search_all(geodes_opened, factories), 1)
+
+if __name__ == '__main__':
+    blueprints = parse(Input.from_stdin())
+    print(part1(blueprints))
+    print(part2(blueprints))
@@ -1,7 +1,7 @@
-from sys import stdin
 from enum import IntEnum
 
-ROUNDS = [line.split() for line in stdin.read().splitlines()]
+from aoc.inputs import Input
+from aoc.streaming import consume
 
 # Possible outcomes of a round, with their values being points awarded for each
 class Outcome(IntEnum):
@@ -55,10 +55,42 @@ def score_round(theirs, mine):
 
     return points + points_boost
 
+class Tournament:
+    """ Keeps both parts' running scores as the rounds arrive. """
+
+    def __init__(self):
+        self.static_score = 0
+        self.dynamic_score = 0
+
+    def feed(self, line):
+        if not line.strip():
+            return
+
+        theirs, mine = line.decode().split()
+        self.static_score += score_round(theirs, STATIC_MAP[mine])
+        self.dynamic_score += score_round(theirs, DYNAMIC_MAP[mine](theirs))
+
+    def part1(self):
+        return self.static_score
+
+    def part2(self):
+        return self.dynamic_score
+
+def consumer():
+    return Tournament()
+
+def parse(puzzle):
+    return consume(consumer(), puzzle.byte_lines())
+
 # Part 1
-total = sum(score_round(theirs, STATIC_MAP[mine]) for theirs, mine in ROUNDS)
-print(total)
+def part1(tournament):
+    return tournament.part1()
 
 # Part 2
-total = sum(score_round(theirs, DYNAMIC_MAP[mine](theirs)) for theirs, mine in ROUNDS)
-print(total)
+def part2(tournament):
+    return tournament.part2()
+
+if __name__ == '__main__':
+    tournament = parse(Input.from_stdin())
+    print(part1(tournament))
+    print(part2(tournament))
@@ -1,4 +1,4 @@
-from sys import stdin
+from aoc.inputs import Input
 
 def shift(x, xs):
     old_index = xs.index(x)
@@ -18,11 +18,19 @@ def key(numbers, indexes=[1000, 2000, 3000]):
     zero_index = next(i for i, n in enumerate(numbers) if n == 0)
     return sum(numbers[(zero_index + i) % len(numbers)] for i in indexes)
 
-numbers = list(map(int, stdin.read().splitlines()))
+def parse(puzzle):
+    return puzzle.ints()
 
 # Part 1
-print(key(decrypt(numbers)))
+def part1(numbers):
+    return key(decrypt(numbers))
 
 # Part 2
-multiplied = [n * 811589153 for n in numbers]
-print(key(decrypt(multiplied, 10)))
+def part2(numbers):
+    multiplied = [n * 811589153 for n in numbers]
+    return key(decrypt(multiplied, 10))
+
+if __name__ == '__main__':
+    numbers = parse(Input.from_stdin())
+    print(part1(numbers))
+    print(part2(numbers))
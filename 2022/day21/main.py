@@ -1,7 +1,8 @@
-from sys import stdin
 from typing import Callable
 from dataclasses import dataclass
 
+from aoc.inputs import Input
+
 @dataclass
 class Expressions(dict):
     definitions: dict[str, str]
@@ -24,14 +25,26 @@ def search(expressions, key, value, lower, upper):
             return mid
 
 helpers = { "compare": lambda a, b: -1 if a < b else 1 if a > b else 0 }
-mapping = dict(line.split(': ') for line in stdin.read().splitlines())
-expressions = Expressions(mapping, helpers)
+
+def parse(puzzle):
+    return dict(line.split(': ') for line in puzzle.lines())
 
 # Part 1
-print(expressions['root'])
+def part1(mapping):
+    expressions = Expressions(mapping, helpers)
+    return expressions['root']
 
 # Part 2
-root = expressions.definitions['root']
-a, b = root.split(' + ')
-expressions.definitions['root'] = f'compare({a}, {b})'
-print(search(expressions, 'humn', 'root', -2**64, 2**64))
+def part2(mapping):
+    # `search` rewrites definitions, so it works on a copy
+    expressions = Expressions(dict(mapping), helpers)
+
+    root = expressions.definitions['root']
+    a, b = root.split(' + ')
+    expressions.definitions['root'] = f'compare({a}, {b})'
+    return search(expressions, 'humn', 'root', -2**64, 2**64)
+
+if __name__ == '__main__':
+    mapping = parse(Input.from_stdin())
+    print(part1(mapping))
+    print(part2(mapping))
@@ -1,7 +1,8 @@
-from sys import stdin
 from string import ascii_lowercase, ascii_uppercase
 from functools import reduce
 
+from aoc.inputs import Input
+
 # Some type aliases to improve clarity
 Item = str
 Compartment = set[Item]
@@ -55,20 +56,27 @@ def intersect(rucksacks: list[Rucksack]) -> set[Item]:
     intersect = lambda a, b: a & b
     return reduce(intersect, unioned)
 
-lines = stdin.read().splitlines()
-rucksacks = [line_to_rucksack(line) for line in lines]
+def parse(puzzle: Input) -> list[Rucksack]:
+    return [line_to_rucksack(line) for line in puzzle.lines()]
 
 # Part 1
-common = map(common_items, rucksacks)
-priorities = (priority(item) for items in common for item in items)
+def part1(rucksacks: list[Rucksack]) -> int:
+    common = map(common_items, rucksacks)
+    priorities = (priority(item) for items in common for item in items)
 
-print(sum(priorities))
+    return sum(priorities)
 
 # Part 2
 ELVES_PER_GROUP = 3
 
-groups = group(rucksacks, ELVES_PER_GROUP)
-common = map(intersect, groups)
-priorities = (priority(item) for items in common for item in items)
+def part2(rucksacks: list[Rucksack]) -> int:
+    groups = group(rucksacks, ELVES_PER_GROUP)
+    common = map(intersect, groups)
+    priorities = (priority(item) for items in common for item in items)
+
+    return sum(priorities)
 
-print(sum(priorities))
+if __name__ == '__main__':
+    rucksacks = parse(Input.from_stdin())
+    print(part1(rucksacks))
+    print(part2(rucksacks))
@@ -1,31 +1,52 @@
-from sys import stdin
+from aoc.inputs import Input
+from aoc.intervals import Interval
+from aoc.streaming import consume
 
 def parse_range(text):
-    pair = text.split('-')
-    return tuple(map(int, pair))
-
-def is_subset(range1, range2):
-    """ Returns True if `range2` is subset of `range1`. """
-    lower1, upper1 = range1
-    lower2, upper2 = range2
-    return lower1 <= lower2 and upper1 >= upper2
+    """ Parses an inclusive `lower-upper` section range. """
+    lower, upper = map(int, text.split('-'))
+    return Interval(lower, upper + 1)
 
 def is_redundant(range1, range2):
     """ Returns True if either range is fully contained in the other. """
-    return is_subset(range1, range2) or is_subset(range2, range1)
+    return range1.contains(range2) or range2.contains(range1)
+
+class Assignments:
+    """ Counts the redundant and overlapping pairs as they arrive. """
+
+    def __init__(self):
+        self.redundant = 0
+        self.overlapping = 0
+
+    def feed(self, line):
+        if not line.strip():
+            return
 
-def is_overlapping(range1, range2):
-    """ Returns True if `range1` and `range2` have any overlap. """
-    lower1, upper1 = range1
-    lower2, upper2 = range2
-    return upper1 >= lower2 and upper2 >= lower1
+        elf1, elf2 = map(parse_range, line.decode().split(','))
+        self.redundant += is_redundant(elf1, elf2)
+        self.overlapping += elf1.overlaps(elf2)
 
-lines = stdin.read().splitlines()
-pairs = [line.split(',') for line in lines]
-assignments = [(parse_range(elf1), parse_range(elf2)) for elf1, elf2, in pairs]
+    def part1(self):
+        return self.redundant
+
+    def part2(self):
+        return self.overlapping
+
+def consumer():
+    return Assignments()
+
+def parse(puzzle):
+    return consume(consumer(), puzzle.byte_lines())
 
 # Part 1
-print(sum(1 for elf1, elf2 in assignments if is_redundant(elf1, elf2)))
+def part1(assignments):
+    return assignments.part1()
 
 # Part 2
-print(sum(1 for elf1, elf2 in assignments if is_overlapping(elf1, elf2)))
+def part2(assignments):
+    return assignments.part2()
+
+if __name__ == '__main__':
+    assignments = parse(Input.from_stdin())
+    print(part1(assignments))
+    print(part2(assignments))
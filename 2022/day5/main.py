@@ -1,6 +1,7 @@
-from sys import stdin
 from typing import NamedTuple
 
+from aoc.inputs import Input
+
 class MoveCommand(NamedTuple):
     quantity: int
     starting_stack: int
@@ -70,15 +71,24 @@ def evaluate_commands(commands, stacks, move_strategy):
 def read_tops(stacks):
     return ''.join(stack[-1] for stack in stacks)
 
-lines = stdin.read().splitlines()
-stacks, commands = parse_input(lines)
+def parse(puzzle):
+    return parse_input(list(puzzle.lines()))
 
 # Part 1
-move_strategy = lambda quantity, stack: [stack.pop() for _ in range(quantity)]
-new_stacks = evaluate_commands(commands, stacks, move_strategy)
-print(read_tops(new_stacks))
+def part1(puzzle):
+    stacks, commands = puzzle
+    move_strategy = lambda quantity, stack: [stack.pop() for _ in range(quantity)]
+    new_stacks = evaluate_commands(commands, stacks, move_strategy)
+    return read_tops(new_stacks)
 
 # Part 2
-move_strategy = lambda quantity, stack: reversed([stack.pop() for _ in range(quantity)])
-new_stacks = evaluate_commands(commands, stacks, move_strategy)
-print(read_tops(new_stacks))
+def part2(puzzle):
+    stacks, commands = puzzle
+    move_strategy = lambda quantity, stack: reversed([stack.pop() for _ in range(quantity)])
+    new_stacks = evaluate_commands(commands, stacks, move_strategy)
+    return read_tops(new_stacks)
+
+if __name__ == '__main__':
+    puzzle = parse(Input.from_stdin())
+    print(part1(puzzle))
+    print(part2(puzzle))
@@ -1,6 +1,7 @@
-from sys import stdin
 from itertools import islice
 
+from aoc.inputs import Input
+
 def sliding_windows(items, size):
     """ Generates sliding windows of length `size` from `items`.
 
@@ -27,12 +28,22 @@ def find_start_of_marker(datastream, marker_size):
     index = find_index(are_all_distinct, windows)
     return (index + marker_size) if index is not None else None
 
-datastream = stdin.read().strip()
+def parse(puzzle):
+    return puzzle.text.strip()
 
 # Part 1
 START_OF_PACKET_MARKER_SIZE = 4
-print(find_start_of_marker(datastream, START_OF_PACKET_MARKER_SIZE))
+
+def part1(datastream):
+    return find_start_of_marker(datastream, START_OF_PACKET_MARKER_SIZE)
 
 # Part 2
 START_OF_MESSAGE_MARKER_SIZE = 14
-print(find_start_of_marker(datastream, START_OF_MESSAGE_MARKER_SIZE))
+
+def part2(datastream):
+    return find_start_of_marker(datastream, START_OF_MESSAGE_MARKER_SIZE)
+
+if __name__ == '__main__':
+    datastream = parse(Input.from_stdin())
+    print(part1(datastream))
+    print(part2(datastream))
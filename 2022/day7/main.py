@@ -1,6 +1,7 @@
-from sys import stdin
 from typing import Optional, NamedTuple, Iterable
 
+from aoc.inputs import Input
+
 class File(NamedTuple):
     name: str
     size: int
@@ -146,19 +147,27 @@ def all_directories(root: Directory) -> Iterable[Directory]:
     for subdirectory in root.subdirectories:
         yield from all_directories(subdirectory)
 
-loglines = stdin.read().splitlines()
-root = parse_log(loglines)
+def parse(puzzle: Input) -> Directory:
+    return parse_log(puzzle.lines())
 
 # Part 1
 MAX_DIR_SIZE = 100000
-print(sum(directory.size for directory in all_directories(root) if directory.size <= MAX_DIR_SIZE))
+
+def part1(root: Directory) -> int:
+    return sum(directory.size for directory in all_directories(root) if directory.size <= MAX_DIR_SIZE)
 
 # Part 2
 TOTAL_DISK_CAPACITY = 70000000
 MINIMUM_REQUIRED_UPDATE_SPACE = 30000000
 
-available_disk_space = TOTAL_DISK_CAPACITY - root.size
-meets_space_requirements = lambda directory: directory.size + available_disk_space >= MINIMUM_REQUIRED_UPDATE_SPACE
-candidates = filter(meets_space_requirements, all_directories(root))
-winner = min(candidates, key=lambda directory: directory.size)
-print(winner.size)
+def part2(root: Directory) -> int:
+    available_disk_space = TOTAL_DISK_CAPACITY - root.size
+    meets_space_requirements = lambda directory: directory.size + available_disk_space >= MINIMUM_REQUIRED_UPDATE_SPACE
+    candidates = filter(meets_space_requirements, all_directories(root))
+    winner = min(candidates, key=lambda directory: directory.size)
+    return winner.size
+
+if __name__ == '__main__':
+    root = parse(Input.from_stdin())
+    print(part1(root))
+    print(part2(root))
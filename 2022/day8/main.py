@@ -1,85 +1,66 @@
-from sys import stdin
-from enum import Enum, auto
+from enum import Enum
 from math import prod
-from typing import NamedTuple, Iterator
+from typing import Iterator
 
-class Position(NamedTuple):
-    x: int
-    y: int
+from aoc.grid import DIGITS, EAST, NORTH, SOUTH, WEST, Grid
+from aoc.inputs import Input
 
-
-class Tree(NamedTuple):
-    position: Position
-    height: int
-
-TreeGrid = list[list[Tree]]
+# A tree is the index of its cell in the grid, and its height is the cell's value
+Tree = int
 
 class Direction(Enum):
-    NORTH = auto()
-    EAST = auto()
-    SOUTH = auto()
-    WEST = auto()
-
-DIRECTION_DELTA = {
-    Direction.NORTH: (0, -1),
-    Direction.EAST: (1, 0),
-    Direction.SOUTH: (0, 1),
-    Direction.WEST: (-1, 0),
-}
-
-lines: list[str] = stdin.read().splitlines()
-trees: TreeGrid = [[Tree(Position(x, y), int(height)) for x, height in enumerate(line)] for y, line in enumerate(lines)]
-
-def iter_tree_line(start: Tree, looking: Direction, trees: TreeGrid) -> Iterator[Tree]:
-    """ Iterates through the trees in a given line in the grid. """
-    if len(trees) == 0:
-        return
+    NORTH = NORTH
+    EAST = EAST
+    SOUTH = SOUTH
+    WEST = WEST
 
-    dx, dy = DIRECTION_DELTA[looking]
-    width, height = len(trees[0]), len(trees)
-    x, y = start.position.x, start.position.y
-
-    while x >= 0 and x < width and y >= 0 and y < height:
-        yield trees[y][x]
-        x, y = x + dx, y + dy
-
-def visible_trees(start: Tree, looking: Direction, trees: TreeGrid) -> Iterator[Tree]:
+def visible_trees(start: Tree, looking: Direction, trees: Grid) -> Iterator[Tree]:
     """ Returns the set of visible trees from a given tree and direction. """
-    heighest = None
-    for tree in iter_tree_line(start, looking, trees):
-        if heighest is None or tree.height > heighest.height:
+    heighest = -1
+    for tree in trees.line(start, looking.value):
+        if trees.cells[tree] > heighest:
             yield tree
-            heighest = tree
+            heighest = trees.cells[tree]
 
-def externally_visible_trees(grid: TreeGrid) -> Iterator[Tree]:
+def externally_visible_trees(grid: Grid) -> Iterator[Tree]:
     """ Returns trees that are visible from positions outside of the grid.
 
     The same tree may be returned multiple times if visible from multiple positions.
     """
-    if len(grid) == 0:
-        return 0
+    if grid.size == 0:
+        return
 
-    top = (grid[0], Direction.SOUTH)
-    bottom = (grid[-1], Direction.NORTH)
-    left = ([row[0] for row in grid], Direction.EAST)
-    right = ([row[-1] for row in grid], Direction.WEST)
+    top = (range(grid.width), Direction.SOUTH)
+    bottom = (range(grid.size - grid.width, grid.size), Direction.NORTH)
+    left = (range(0, grid.size, grid.width), Direction.EAST)
+    right = (range(grid.width - 1, grid.size, grid.width), Direction.WEST)
 
     for trees, direction in [top, bottom, left, right]:
         for tree in trees:
             yield from visible_trees(tree, direction, grid)
 
-def viewing_distance(tree: Tree, looking: Direction, trees: TreeGrid) -> int:
-    dist = 0
-    for dist, candidate in enumerate(iter_tree_line(tree, looking, trees)):
-        if dist > 0 and candidate.height >= tree.height:
+def viewing_distance(tree: Tree, looking: Direction, trees: Grid) -> int:
+    dist, height = 0, trees.cells[tree]
+    for dist, candidate in enumerate(trees.line(tree, looking.value)):
+        if dist > 0 and trees.cells[candidate] >= height:
             break
     return dist
 
-def scenic_score(tree: Tree, grid: TreeGrid) -> int:
+def scenic_score(tree: Tree, grid: Grid) -> int:
     return prod(viewing_distance(tree, direction, grid) for direction in Direction)
 
+def parse(puzzle: Input) -> Grid:
+    return Grid.parse(puzzle, DIGITS)
+
 # Part 1
-print(len(set(externally_visible_trees(trees))))
+def part1(trees: Grid) -> int:
+    return len(set(externally_visible_trees(trees)))
 
 # Part 2
-print(max(scenic_score(tree, trees) for row in trees for tree in row))
+def part2(trees: Grid) -> int:
+    return max(scenic_score(tree, trees) for tree in range(trees.size))
+
+if __name__ == '__main__':
+    trees = parse(Input.from_stdin())
+    print(part1(trees))
+    print(part2(trees))
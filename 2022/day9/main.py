@@ -1,8 +1,9 @@
 from enum import Enum, auto
 from functools import reduce
-from sys import stdin
 from typing import Iterator, NamedTuple
 
+from aoc.inputs import Input
+
 class Position(NamedTuple):
     x: int
     y: int
@@ -97,12 +98,20 @@ def run_movements(rope: Rope, movements: list[Movement]) -> Iterator[Rope]:
         for rope in rope.move(movement):
             yield rope
 
-movements: list[Movement] = [Movement.parse(line) for line in stdin.read().splitlines()]
+def parse(puzzle: Input) -> list[Movement]:
+    return [Movement.parse(line) for line in puzzle.lines()]
 
 # Part 1
-rope = Rope.new(2)
-print(len(set(rope.knots[-1] for rope in run_movements(rope, movements))))
+def part1(movements: list[Movement]) -> int:
+    rope = Rope.new(2)
+    return len(set(rope.knots[-1] for rope in run_movements(rope, movements)))
 
 # Part 2
-rope = Rope.new(10)
-print(len(set(rope.knots[-1] for rope in run_movements(rope, movements))))
+def part2(movements: list[Movement]) -> int:
+    rope = Rope.new(10)
+    return len(set(rope.knots[-1] for rope in run_movements(rope, movements)))
+
+if __name__ == '__main__':
+    movements = parse(Input.from_stdin())
+    print(part1(movements))
+    print(part2(movements))
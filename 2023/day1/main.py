@@ -1,7 +1,7 @@
-from sys import stdin
 import re
 
-lines = stdin.readlines()
+from aoc.inputs import Input
+from aoc.streaming import consume
 
 NON_DIGIT_CHARS = r"[^0-9]"
 
@@ -32,9 +32,42 @@ def replace_words_with_numbers(line):
             output.append(number if is_word else c)
     return ''.join(output)
 
+class Calibration:
+    """ Sums both parts' calibration values as the lines arrive. """
+
+    def __init__(self):
+        self.digits_total = 0
+        self.words_total = 0
+
+    def feed(self, line):
+        line = line.strip().decode()
+        if not line:
+            return
+
+        self.digits_total += line_to_number(line)
+        self.words_total += line_to_number(replace_words_with_numbers(line))
+
+    def part1(self):
+        return self.digits_total
+
+    def part2(self):
+        return self.words_total
+
+def consumer():
+    return Calibration()
+
+def parse(puzzle):
+    return consume(consumer(), puzzle.byte_lines())
+
 # Part 1
-print(sum(map(line_to_number, lines)))
+def part1(calibration):
+    return calibration.part1()
 
 # Part 2
-deworded = map(replace_words_with_numbers, lines)
-print(sum(map(line_to_number, deworded)))
+def part2(calibration):
+    return calibration.part2()
+
+if __name__ == '__main__':
+    calibration = parse(Input.from_stdin())
+    print(part1(calibration))
+    print(part2(calibration))
@@ -1,15 +1,19 @@
-from sys import stdin
 from itertools import combinations
 
+from aoc.inputs import Input
+
 # Parsing input
-lines = stdin.read().splitlines()
-width, height = len(lines[0]), len(lines)
+def parse(puzzle):
+    lines = list(puzzle.lines())
+    width, height = len(lines[0]), len(lines)
+
+    marked_columns = [i for i in range(width) if all(line[i] == '.' for line in lines)]
+    marked_rows = [i for i in range(height) if all(c == '.' for c in lines[i])]
+    galaxy_locations = [(x, y) for y, row in enumerate(lines) for x, c in enumerate(row) if c == '#']
 
-marked_columns = [i for i in range(width) if all(line[i] == '.' for line in lines)]
-marked_rows = [i for i in range(height) if all(c == '.' for c in lines[i])]
-galaxy_locations = [(x, y) for y, row in enumerate(lines) for x, c in enumerate(row) if c == '#']
+    return galaxy_locations, marked_rows, marked_columns
 
-def manhattan_distance(a, b, expansion_factor):
+def manhattan_distance(a, b, expansion_factor, marked_rows, marked_columns):
     rows = list(range(min(a[1], b[1]), max(a[1], b[1]) + 1))
     cols = list(range(min(a[0], b[0]), max(a[0], b[0]) + 1))
 
@@ -20,8 +24,20 @@ def manhattan_distance(a, b, expansion_factor):
         total += expansion_factor if col in marked_columns else 1
     return total - 2
 
+def total_distance(image, expansion_factor):
+    galaxy_locations, marked_rows, marked_columns = image
+    pairs = combinations(galaxy_locations, 2)
+    return sum(manhattan_distance(a, b, expansion_factor, marked_rows, marked_columns) for a, b in pairs)
+
 # Part 1
-print(sum(manhattan_distance(a, b, 2) for a, b in combinations(galaxy_locations, 2)))
+def part1(image):
+    return total_distance(image, 2)
 
 # Part 2
-print(sum(manhattan_distance(a, b, 1000000) for a, b in combinations(galaxy_locations, 2)))
+def part2(image):
+    return total_distance(image, 1000000)
+
+if __name__ == '__main__':
+    image = parse(Input.from_stdin())
+    print(part1(image))
+    print(part2(image))
@@ -1,6 +1,8 @@
-from sys import stdin
 from functools import reduce
 
+from aoc.inputs import Input
+from aoc.streaming import consume
+
 def parse_round(round):
     parsed = [result.strip().split(' ') for result in round]
     return {color: int(count) for (count, color) in parsed}
@@ -39,14 +41,44 @@ INVENTORY = {
     'blue': 14,
 }
 
-lines = stdin.readlines()
-games = [parse_game(line) for line in lines]
+class Games:
+    """ Sums the viable games' ids and every game's power as the games arrive. """
+
+    def __init__(self):
+        self.viable_total = 0
+        self.power_total = 0
+
+    def feed(self, line):
+        line = line.strip().decode()
+        if not line:
+            return
+
+        id, rounds = parse_game(line)
+        if are_viable(rounds, INVENTORY):
+            self.viable_total += id
+        self.power_total += power(minimum_set(rounds))
+
+    def part1(self):
+        return self.viable_total
+
+    def part2(self):
+        return self.power_total
+
+def consumer():
+    return Games()
+
+def parse(puzzle):
+    return consume(consumer(), puzzle.byte_lines())
 
 # Part 1
-viable_games = [id for (id, rounds) in games if are_viable(rounds, INVENTORY)]
-print(sum(viable_games))
+def part1(games):
+    return games.part1()
 
 # Part 2
-minimum_sets = [minimum_set(rounds) for (id, rounds) in games]
-powers = [power(min_set) for min_set in minimum_sets]
-print(sum(powers))
+def part2(games):
+    return games.part2()
+
+if __name__ == '__main__':
+    games = parse(Input.from_stdin())
+    print(part1(games))
+    print(part2(games))
@@ -1,6 +1,9 @@
-from sys import stdin
-from re import split
-from typing import NamedTuple, Set
+from collections import deque
+from typing import NamedTuple, Optional, Sequence, Set
+
+from aoc.inputs import Input
+from aoc.parsing import ints
+from aoc.streaming import consume
 
 class ScratchCard(NamedTuple):
     id: int
@@ -18,41 +21,67 @@ class ScratchCard(NamedTuple):
         return self.winning_numbers.intersection(self.chosen_numbers)
 
     @staticmethod
-    def from_string(s: str) -> 'ScratchCard':
-        card_id_raw, numbers_raw = s.split(':')
-        winning_numbers_raw, chosen_numbers_raw = numbers_raw.split('|')
+    def from_numbers(numbers: Sequence[int], winning_count: int) -> 'ScratchCard':
+        card_id, winning_numbers = numbers[0], numbers[1:winning_count + 1]
+        chosen_numbers = numbers[winning_count + 1:]
+        return ScratchCard(card_id, set(winning_numbers), set(chosen_numbers))
 
-        card_id = int(card_id_raw.strip().split(' ')[-1])
-        winning_numbers = set(map(int, split(r'\s+', winning_numbers_raw.strip())))
-        chosen_numbers = set(map(int, split(r'\s+', chosen_numbers_raw.strip())))
+class ScratchCardCounter:
+    """ Scores the cards and counts their copies as they arrive.
 
-        return ScratchCard(card_id, winning_numbers, chosen_numbers)
+    A card only wins copies of the cards right after it, so all that needs remembering
+    is how many copies the next few cards have won so far (at most one per winning number).
+    """
 
-class ScratchCardGroup(NamedTuple):
-    cards: [ScratchCard]
+    def __init__(self) -> None:
+        self.winning_count: Optional[int] = None
+        self.points = 0
+        self.instances = 0
+        self.owed: deque[int] = deque()
 
-    def total_instances(self) -> int:
-        counts = {}
-        cards = list(reversed(self.cards))
+    def feed(self, line: bytes) -> None:
+        if not line.strip():
+            return
 
-        for card in cards:
-            size = len(card.matches())
-            copy_range = range(1, size + 1)
-            count = sum(counts.get(card.id + i, 0) for i in copy_range)
-            counts[card.id] = 1 + count
+        if self.winning_count is None:
+            # Every card has the same count of numbers before the `|`, so the first card gives the layout
+            self.winning_count = len(ints(line.partition(b'|')[0])) - 1
 
-        return sum(counts.values())
+        self.add(ScratchCard.from_numbers(ints(line), self.winning_count))
 
-    @staticmethod
-    def from_string(s: str) -> 'ScratchCardGroup':
-        cards = list(map(ScratchCard.from_string, s.splitlines()))
-        return ScratchCardGroup(cards)
+    def add(self, card: ScratchCard) -> None:
+        self.points += card.score()
+
+        copies = 1 + (self.owed.popleft() if self.owed else 0)
+        self.instances += copies
+
+        # Every copy of this card wins a copy of each of the next `matches` cards
+        matches = len(card.matches())
+        self.owed.extend(0 for _ in range(matches - len(self.owed)))
+        for i in range(matches):
+            self.owed[i] += copies
 
-lines = stdin.read()
-group = ScratchCardGroup.from_string(lines)
+    def part1(self) -> int:
+        return self.points
+
+    def part2(self) -> int:
+        return self.instances
+
+def consumer() -> ScratchCardCounter:
+    return ScratchCardCounter()
+
+def parse(puzzle: Input) -> ScratchCardCounter:
+    return consume(consumer(), puzzle.byte_lines())
 
 # Part 1
-print(sum(map(ScratchCard.score, group.cards)))
+def part1(counter: ScratchCardCounter) -> int:
+    return counter.part1()
 
 # Part 2
-print(group.total_instances())
+def part2(counter: ScratchCardCounter) -> int:
+    return counter.part2()
+
+if __name__ == '__main__':
+    counter = parse(Input.from_stdin())
+    print(part1(counter))
+    print(part2(counter))
@@ -1,121 +1,60 @@
-from sys import stdin
-from re import split
 from typing import NamedTuple
 
-class Range(NamedTuple):
-    start: int
-    end: int
+from aoc.inputs import Input
+from aoc.intervals import IntervalSet, RangeMap
 
-    def map_to(self, key, destination):
-        if (key.start >= self.end) or (key.end <= self.start):
-            return None, []
+def parse_singletons(raw: str) -> IntervalSet:
+    starts = map(int, raw.strip().split(' '))
+    return IntervalSet((start, start + 1) for start in starts)
 
-        remainder = []
-        if key.start < self.start:
-            remainder.append(Range(key.start, self.start))
+def parse_ranges(raw: str) -> IntervalSet:
+    numbers = [int(r) for r in raw.strip().split(' ')]
+    starts, sizes = numbers[::2], numbers[1::2]
+    return IntervalSet((start, start + size) for start, size in zip(starts, sizes))
 
-        if key.end > self.end:
-            remainder.append(Range(self.end, key.end))
-
-        overlap = Range(max(key.start, self.start), min(key.end, self.end))
-
-        new_start = destination.start + (overlap.start - self.start)
-        new_end = destination.start + (overlap.end - self.start)
-        return Range(new_start, new_end), remainder
-
-    @staticmethod
-    def parse_singletons(raw: str):
-        starts = map(int, raw.strip().split(' '))
-        return [Range(start, start + 1) for start in starts]
-
-    @staticmethod
-    def parse_ranges(raw: str):
-        numbers = [int(r) for r in raw.strip().split(' ')]
-        starts, sizes = numbers[::2], numbers[1::2]
-        return [Range(start, start + size) for start, size in zip(starts, sizes)]
-
-class SourceToDestinationRange(NamedTuple):
-    source: Range
-    destination: Range
-
-    def map_to(self, other: Range):
-        return self.source.map_to(other, self.destination)
-
-    @staticmethod
-    def parse(raw: str):
-        destination_start, source_start, size = map(int, raw.split(' '))
-        source = Range(source_start, source_start + size)
-        destination = Range(destination_start, destination_start + size)
-        return SourceToDestinationRange(source, destination)
-
-class SourceToDestinationMap(NamedTuple):
-    ranges: [SourceToDestinationRange]
-
-    def destination(self, sources):
-        sources, destinations = sources[:], []
-        for source in sources:
-            for range in self.ranges:
-                destination, remainder = range.map_to(source)
-                if destination is not None:
-                    destinations.append(destination)
-                    sources.extend(remainder)
-                    break
-            else:
-                destinations.append(source)
-        return sorted(destinations)
-
-    @staticmethod
-    def parse(raw: str):
-        lines = raw.strip().split('\n')
-        _label, *lines = lines
-        ranges = [SourceToDestinationRange.parse(line) for line in lines]
-        return SourceToDestinationMap(ranges)
+def parse_map(raw: str) -> RangeMap:
+    _label, *lines = raw.strip().split('\n')
+    # Each line is `destination source length`
+    triples = [tuple(map(int, line.split(' '))) for line in lines]
+    return RangeMap((source, destination, size) for destination, source, size in triples)
 
 class Almanac(NamedTuple):
-    seed_to_soil: SourceToDestinationMap
-    soil_to_fertilizer: SourceToDestinationMap
-    fertilizer_to_water: SourceToDestinationMap
-    water_to_light: SourceToDestinationMap
-    light_to_temperature: SourceToDestinationMap
-    temperature_to_humidity: SourceToDestinationMap
-    humidity_to_location: SourceToDestinationMap
-
-    def seed_to_location(self, seed):
-        soil = self.seed_to_soil.destination(seed)
-        fertilizer = self.soil_to_fertilizer.destination(soil)
-        water = self.fertilizer_to_water.destination(fertilizer)
-        light = self.water_to_light.destination(water)
-        temperature = self.light_to_temperature.destination(light)
-        humidity = self.temperature_to_humidity.destination(temperature)
-        location = self.humidity_to_location.destination(humidity)
-        return location
-
-    def locations(self, seeds):
-        return {seed: self.seed_to_location([seed]) for seed in seeds}
+    seed_to_soil: RangeMap
+    soil_to_fertilizer: RangeMap
+    fertilizer_to_water: RangeMap
+    water_to_light: RangeMap
+    light_to_temperature: RangeMap
+    temperature_to_humidity: RangeMap
+    humidity_to_location: RangeMap
+
+    def seed_to_location(self, seeds: IntervalSet) -> IntervalSet:
+        """ Maps whole ranges of seeds at once, splitting them wherever a map's pieces do. """
+        locations = seeds
+        for stage in self:
+            locations = stage.map_set(locations)
+        return locations
 
     @staticmethod
-    def parse(groups: [str]):
-        seed_to_soil = SourceToDestinationMap.parse(groups[0])
-        soil_to_fertilizer = SourceToDestinationMap.parse(groups[1])
-        fertilizer_to_water = SourceToDestinationMap.parse(groups[2])
-        water_to_light = SourceToDestinationMap.parse(groups[3])
-        light_to_temperature = SourceToDestinationMap.parse(groups[4])
-        temperature_to_humidity = SourceToDestinationMap.parse(groups[5])
-        humidity_to_location = SourceToDestinationMap.parse(groups[6])
-
-        return Almanac(seed_to_soil, soil_to_fertilizer, fertilizer_to_water, water_to_light, light_to_temperature, temperature_to_humidity, humidity_to_location)
-
-raw = stdin.read()
-groups = raw.split('\n\n')
-
-raw_seeds = groups[0].split(': ')[1]
-singletons = Range.parse_singletons(raw_seeds)
-ranges = Range.parse_ranges(raw_seeds)
+    def parse(groups: list[str]) -> 'Almanac':
+        return Almanac(*map(parse_map, groups[:7]))
 
-almanac = Almanac.parse(groups[1:])
+def parse(puzzle: Input):
+    groups = puzzle.text.split('\n\n')
+    raw_seeds = groups[0].split(': ')[1]
+    almanac = Almanac.parse(groups[1:])
+    return raw_seeds, almanac
 
 # Part 1
-print(min(almanac.locations(singletons).values())[0].start)
+def part1(puzzle) -> int:
+    raw_seeds, almanac = puzzle
+    return almanac.seed_to_location(parse_singletons(raw_seeds)).starts[0]
 
 # Part 2
-print(min(almanac.locations(ranges).values())[0].start)
+def part2(puzzle) -> int:
+    raw_seeds, almanac = puzzle
+    return almanac.seed_to_location(parse_ranges(raw_seeds)).starts[0]
+
+if __name__ == '__main__':
+    puzzle = parse(Input.from_stdin())
+    print(part1(puzzle))
+    print(part2(puzzle))
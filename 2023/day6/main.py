@@ -1,7 +1,8 @@
-from sys import stdin
 from math import sqrt, ceil, floor
 from functools import reduce
 
+from aoc.inputs import Input
+
 def winning_combinations(race):
     max_time, best_distance = race
 
@@ -15,21 +16,33 @@ def product(xs):
     return reduce(lambda x, y: x * y, xs)
 
 # Parsing input
-lines = stdin.readlines()
+def parse(puzzle):
+    lines = list(puzzle.lines())
+
+    raw_times = [time for time in lines[0].split(':')[1].strip().split(' ') if len(time.strip()) > 0]
+    raw_distances = [distance for distance in lines[1].split(':')[1].strip().split(' ') if len(distance.strip()) > 0]
 
-raw_times = [time for time in lines[0].split(':')[1].strip().split(' ') if len(time.strip()) > 0]
-raw_distances = [distance for distance in lines[1].split(':')[1].strip().split(' ') if len(distance.strip()) > 0]
+    return raw_times, raw_distances
 
 # Part 1
-times = [int(token) for token in raw_times]
-distances = [int(token) for token in raw_distances]
-races = zip(times, distances)
+def part1(sheet):
+    raw_times, raw_distances = sheet
+    times = [int(token) for token in raw_times]
+    distances = [int(token) for token in raw_distances]
+    races = zip(times, distances)
 
-print(product(winning_combinations(race) for race in races))
+    return product(winning_combinations(race) for race in races)
 
 # Part 2
-time = int(''.join(raw_times))
-distance = int(''.join(raw_distances))
-race = (time, distance)
-
-print(winning_combinations(race))
+def part2(sheet):
+    raw_times, raw_distances = sheet
+    time = int(''.join(raw_times))
+    distance = int(''.join(raw_distances))
+    race = (time, distance)
+
+    return winning_combinations(race)
+
+if __name__ == '__main__':
+    sheet = parse(Input.from_stdin())
+    print(part1(sheet))
+    print(part2(sheet))
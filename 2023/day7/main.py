@@ -1,7 +1,9 @@
-from sys import stdin
 from collections import Counter
 from typing import NamedTuple
 
+from aoc.inputs import Input
+from aoc.memo import memoize
+
 CHAR_TO_VAL = {
   'O': 0,
   '2': 2,
@@ -42,7 +44,10 @@ class Hand(NamedTuple):
     bid = int(bid_str)
     return Hand(cards, bid, Hand.score(cards))
 
+  # A hand's strength doesn't depend on the order of its cards, so it's shared by every hand (in every
+  # input solved by the same process) with the same cards, of which there are only C(17, 5) = 6188
   @staticmethod
+  @memoize(key=lambda hand: bytes(sorted(hand)))
   def score(hand: [int]) -> int:
     jokers_count = hand.count(0)
     no_jokers = [card for card in hand if card != 0]
@@ -52,15 +57,24 @@ class Hand(NamedTuple):
 
     return HAND_TO_RANK[tuple(counts)]
 
-# Parsing input
-lines = stdin.readlines()
-parsed = [
-    [Hand.parse(line) for line in lines], # Part 1
-    [Hand.parse(line, True) for line in lines], # Part 2
-]
-
-for hands in parsed:
+def winnings(hands: [Hand]) -> int:
     ordered = sorted(hands, key=lambda h: (h.strength, h.cards))
     ranked = [(rank + 1, hand) for rank, hand in enumerate(ordered)]
-    score = sum(rank * hand.bid for rank, hand in ranked)
-    print(score)
+    return sum(rank * hand.bid for rank, hand in ranked)
+
+# Parsing input
+def parse(puzzle: Input) -> [str]:
+    return list(puzzle.lines())
+
+# Part 1
+def part1(lines: [str]) -> int:
+    return winnings([Hand.parse(line) for line in lines])
+
+# Part 2
+def part2(lines: [str]) -> int:
+    return winnings([Hand.parse(line, True) for line in lines])
+
+if __name__ == '__main__':
+    lines = parse(Input.from_stdin())
+    print(part1(lines))
+    print(part2(lines))
@@ -1,25 +1,24 @@
-from sys import stdin
 from itertools import cycle
 from math import gcd
 
-# Parsing input
-lines = stdin.read().splitlines()
-instructions = lines[0]
-
-world = [line.split(' = ') for line in lines[2:]]
-world = {parent: children[1:-1].split(', ') for parent, children in world}
+from aoc.inputs import Input
 
 # Helpers
 lcm = lambda a, b: a * b // gcd(a, b)
 DIRECTION = {'L': 0, 'R': 1}
 
-# Both parts
-parts = [
-    {'AAA'}, # Part 1
-    {node for node in world if node.endswith('A')}, # Part 2
-]
+# Parsing input
+def parse(puzzle):
+    lines = list(puzzle.lines())
+    instructions = lines[0]
+
+    world = [line.split(' = ') for line in lines[2:]]
+    world = {parent: children[1:-1].split(', ') for parent, children in world}
 
-for nodes in parts:
+    return instructions, world
+
+# Both parts
+def distance(instructions, world, nodes):
     distance = 1
     for count, movement in enumerate(cycle(instructions)):
         direction = DIRECTION[movement]
@@ -33,4 +32,19 @@ for nodes in parts:
         if len(nodes) == 0:
             break
 
-    print(distance)
+    return distance
+
+# Part 1
+def part1(network):
+    instructions, world = network
+    return distance(instructions, world, {'AAA'})
+
+# Part 2
+def part2(network):
+    instructions, world = network
+    return distance(instructions, world, {node for node in world if node.endswith('A')})
+
+if __name__ == '__main__':
+    network = parse(Input.from_stdin())
+    print(part1(network))
+    print(part2(network))
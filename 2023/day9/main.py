@@ -1,7 +1,8 @@
-from sys import stdin
+from aoc.inputs import Input
 
 # Parsing input
-lines = [list(map(int, line.split(' '))) for line in stdin.read().splitlines()]
+def parse(puzzle):
+    return [list(map(int, line.split(b' '))) for line in puzzle.byte_lines()]
 
 def differences(xs):
     ds = [xs]
@@ -23,17 +24,24 @@ def extend(ds):
     return es
 
 # Part 1
-total = 0
-for line in lines:
-    diffs = differences(line)
-    extended = extend(diffs)
-    total += extended[0][-1]
-print(total)
+def part1(lines):
+    total = 0
+    for line in lines:
+        diffs = differences(line)
+        extended = extend(diffs)
+        total += extended[0][-1]
+    return total
 
 # Part 2
-total = 0
-for line in lines:
-    diffs = differences(line)
-    extended = extend(diffs)
-    total += extended[0][0]
-print(total)
+def part2(lines):
+    total = 0
+    for line in lines:
+        diffs = differences(line)
+        extended = extend(diffs)
+        total += extended[0][0]
+    return total
+
+if __name__ == '__main__':
+    lines = parse(Input.from_stdin())
+    print(part1(lines))
+    print(part2(lines))
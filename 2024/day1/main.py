@@ -1,39 +1,38 @@
-from sys import stdin
 from collections import Counter
 
-# Raw lines from input
-lines = stdin.readlines()
+from aoc.inputs import Input
 
-# Split each line into a pair of strings
-# (e.g. ["1 2", "3 4"] -> [["1", "2"], ["3", "4"]])
-pairs = [line.strip().split() for line in lines]
+def parse(puzzle):
+    # Every integer in the input, row by row
+    # (e.g. "1 2\n3 4" -> [1, 2, 3, 4])
+    numbers = puzzle.ints()
 
-# Transpose each row into columns
-# (e.g. [["1", "2"], ["3", "4"]] -> [["1", "3"], ["2", "4"]])
-columns = list(zip(*pairs))
+    # Split the integers into their two columns
+    # (e.g. [1, 2, 3, 4] -> [[1, 3], [2, 4]])
+    ints = [numbers[0::2], numbers[1::2]]
 
-# Convert each column into a list of integers
-# (e.g. [["1", "3"], ["2", "4"]] -> [[1, 3], [2, 4]])
-ints = [[int(x) for x in c] for c in columns]
-
-# Sort each list of integers
-# (e.g. [[1, 3], [2, 4]] -> [[1, 3], [2, 4]])
-ordered = [sorted(c) for c in ints]
-
-# Calculate the distance between each pair of integers
-# (e.g. [[1, 3], [2, 4]] -> [2, 2])
-distances = [abs(x - y) for x, y in zip(*ordered)]
+    # Sort each list of integers
+    # (e.g. [[1, 3], [2, 4]] -> [[1, 3], [2, 4]])
+    return [sorted(c) for c in ints]
 
 # PART 1
+def part1(ordered):
+    # Calculate the distance between each pair of integers
+    # (e.g. [[1, 3], [2, 4]] -> [2, 2])
+    distances = [abs(x - y) for x, y in zip(*ordered)]
 
-# Sum up all of the distances
-# (e.g. [2, 2] -> 4)
-print(sum(distances))
+    # Sum up all of the distances
+    # (e.g. [2, 2] -> 4)
+    return sum(distances)
 
 # PART 2
+def part2(ordered):
+    (xs, ys) = ordered
+    counts = Counter(ys)
 
-(xs, ys) = ordered
-counts = Counter(ys)
+    return sum(x * counts[x] for x in xs)
 
-similarity = sum(x * counts[x] for x in xs)
-print(similarity)
+if __name__ == '__main__':
+    ordered = parse(Input.from_stdin())
+    print(part1(ordered))
+    print(part2(ordered))
@@ -1,13 +1,5 @@
-from sys import stdin
-from collections import Counter
-
-# Raw lines from input
-lines = stdin.readlines()
-
-# Split each line into a list of strings
-# (e.g. ["1 2 3 4", "5 6 7 8"] -> [["1", "2", "3", "4"], ["5", "6", "7", "8"]])
-reports = [[int(x) for x in line.strip().split()] for line in lines]
-
+from aoc.inputs import Input
+from aoc.streaming import consume
 
 def is_safe(report):
     # Is monotonically increasing or decreasing
@@ -20,10 +12,6 @@ def is_safe(report):
 
     return True
 
-# PART 1
-print(sum(1 for report in reports if is_safe(report)))
-
-# Part 2
 def is_dampened_safe(report):
     if is_safe(report):
         return True
@@ -35,4 +23,47 @@ def is_dampened_safe(report):
 
     return False
 
-print(sum(1 for report in reports if is_dampened_safe(report)))
+class Tally:
+    """ Counts the safe reports, with and without the dampener, as they arrive. """
+
+    def __init__(self):
+        self.safe = 0
+        self.dampened_safe = 0
+
+    def feed(self, line):
+        # Split the line into a list of integers (e.g. b"1 2 3 4" -> [1, 2, 3, 4])
+        report = [int(x) for x in line.split()]
+        if not report:
+            return
+
+        # A safe report is still safe with the dampener
+        if is_safe(report):
+            self.safe += 1
+            self.dampened_safe += 1
+        elif is_dampened_safe(report):
+            self.dampened_safe += 1
+
+    def part1(self):
+        return self.safe
+
+    def part2(self):
+        return self.dampened_safe
+
+def consumer():
+    return Tally()
+
+def parse(puzzle):
+    return consume(consumer(), puzzle.byte_lines())
+
+# PART 1
+def part1(tally):
+    return tally.part1()
+
+# Part 2
+def part2(tally):
+    return tally.part2()
+
+if __name__ == '__main__':
+    tally = parse(Input.from_stdin())
+    print(part1(tally))
+    print(part2(tally))
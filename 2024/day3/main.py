@@ -1,8 +1,10 @@
-from sys import stdin
 import re
 
+from aoc.inputs import Input
+
 # Read the input as a single string, including all lines
-raw_input = stdin.read()
+def parse(puzzle):
+    return puzzle.text
 
 def evaluate_command(command):
     x, y = command
@@ -16,9 +18,10 @@ def extract_commands(raw_input):
     pattern = r"mul\((\d{1,3}),(\d{1,3})\)"
     return [(int(x), int(y)) for x, y in re.findall(pattern, raw_input)]
 
-commands = extract_commands(raw_input)
-evaluated = evaluate_commands(commands)
-print(sum(evaluated))
+def part1(raw_input):
+    commands = extract_commands(raw_input)
+    evaluated = evaluate_commands(commands)
+    return sum(evaluated)
 
 # PART 2
 
@@ -41,6 +44,12 @@ def extract_conditional_commands(raw_input):
 
     return commands
 
-commands = extract_conditional_commands(raw_input)
-evaluated = evaluate_commands(commands)
-print(sum(evaluated))
+def part2(raw_input):
+    commands = extract_conditional_commands(raw_input)
+    evaluated = evaluate_commands(commands)
+    return sum(evaluated)
+
+if __name__ == '__main__':
+    raw_input = parse(Input.from_stdin())
+    print(part1(raw_input))
+    print(part2(raw_input))
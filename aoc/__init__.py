@@ -0,0 +1,7 @@
+""" Shared tooling for running the Advent of Code solutions in this repository.
+
+Every `YEAR/dayN/main.py` exposes `parse(puzzle)`, `part1(data)` and `part2(data)`
+(a day without a second part simply omits `part2`), where `puzzle` is an
+`aoc.inputs.Input`. The modules in this package load those callables and run
+them in a single interpreter.
+"""
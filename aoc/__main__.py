@@ -0,0 +1,361 @@
+import sys
+from argparse import ArgumentParser, Namespace
+from pathlib import Path
+from time import perf_counter
+from typing import TYPE_CHECKING, Optional
+
+from aoc.inputs import Input
+from aoc.lazy import lazy
+from aoc.runner import format_report, run
+from aoc.solutions import discover, load
+from aoc.streaming import progress, read_chunks, split_lines
+
+# Each command only pays for importing the machinery it uses
+batch = lazy('aoc.batch')
+bench = lazy('aoc.bench')
+caching = lazy('aoc.cache')
+client = lazy('aoc.client')
+daemon = lazy('aoc.daemon')
+generators = lazy('aoc.generators')
+imports = lazy('aoc.imports')
+memory = lazy('aoc.memory')
+pool = lazy('aoc.pool')
+profiling = lazy('aoc.profiling')
+scaling = lazy('aoc.scaling')
+subprocess = lazy('subprocess')
+watchdog = lazy('aoc.watchdog')
+
+if TYPE_CHECKING:
+    from aoc.cache import Cache
+
+# Building the parser mustn't import the modules above, so defaults that live in them are filled in by the commands
+CACHE_LIMIT_HELP = 'Megabytes of cached results to keep (default: 256)'
+
+def parse_arguments(argv: Optional[list[str]] = None) -> Namespace:
+    parser = ArgumentParser(prog='python -m aoc', description='Run Advent of Code solutions in a single interpreter.')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    run_parser = commands.add_parser('run', help='Run one day, one year, or every solution, with per-stage timings.')
+    run_parser.add_argument('year', type=int, nargs='?', help='Year to run (default: every year)')
+    run_parser.add_argument('day', type=int, nargs='?', help='Day to run (default: every day)')
+    run_parser.add_argument('--part', type=int, choices=[1, 2], help='Only run this part')
+    run_parser.add_argument('--input', type=Path, help='Input file to use instead of the checked-in `input`')
+    run_parser.add_argument('--jobs', type=int, help='Run days across a pool of this many processes, longest first')
+    run_parser.add_argument('--no-cache', action='store_true', help='Always parse and solve, ignoring (and not updating) cached results')
+    run_parser.add_argument('--profile', type=Path, metavar='DIRECTORY', help='Profile each stage with cProfile and tracemalloc, writing .prof and collapsed-stack .folded files here (implies --no-cache)')
+    run_parser.add_argument('--memory', action='store_true', help='Record each stage\'s peak RSS and peak memory traced by tracemalloc (implies --no-cache)')
+    run_parser.add_argument('--max-memory', type=int, metavar='MB', help='Abort a day once its RSS goes over this many megabytes, listing where its memory was allocated (implies --memory)')
+    run_parser.add_argument('--time-limit', type=float, metavar='SECONDS', help='Interrupt a day once it has run for this long, reporting how far it got (implies --no-cache)')
+    run_parser.add_argument('--progress', type=float, metavar='SECONDS', help='Report the progress of a running stage every this many seconds (implies --no-cache)')
+    run_parser.add_argument('--cache-limit', type=int, help=CACHE_LIMIT_HELP)
+
+    bench_parser = commands.add_parser('bench', help='Benchmark `main.py` against its input and compare with the stored baseline.')
+    bench_parser.add_argument('year', type=int, nargs='?', help='Year to benchmark (default: every year)')
+    bench_parser.add_argument('day', type=int, nargs='?', help='Day to benchmark (default: every day)')
+    bench_parser.add_argument('--runs', type=int, default=5, help='Runs per day (default: 5)')
+    bench_parser.add_argument('--timeout', type=float, help='Seconds before a single run is considered failed')
+    bench_parser.add_argument('--baseline', type=Path, help='Baseline file (default: benchmarks/baseline.json)')
+    bench_parser.add_argument('--save', action='store_true', help='Record the results as the new baseline instead of comparing')
+    bench_parser.add_argument('--threshold', type=float, default=0.25, help='Allowed relative slowdown before failing (default: 0.25)')
+    bench_parser.add_argument('--min-delta', type=float, default=0.05, help='Ignore timing changes smaller than this many seconds (default: 0.05)')
+
+    generate_parser = commands.add_parser('generate', help='Write a synthetic input for a day, scaled relative to the official input.')
+    generate_parser.add_argument('year', type=int, nargs='?', help='Year to generate for (omit to list the days with generators)')
+    generate_parser.add_argument('day', type=int, nargs='?', help='Day to generate for')
+    generate_parser.add_argument('--scale', type=float, default=1, help='Size relative to the official input, e.g. 10, 100 or 1000 (default: 1)')
+    generate_parser.add_argument('--seed', type=int, default=0, help='Random seed, so inputs can be reproduced (default: 0)')
+    generate_parser.add_argument('--output', type=Path, help='File to write to (default: stdout)')
+
+    scale_parser = commands.add_parser('scale', help='Fit how running time grows with input size, using generated inputs.')
+    scale_parser.add_argument('year', type=int, nargs='?', help='Year to profile (default: every year)')
+    scale_parser.add_argument('day', type=int, nargs='?', help='Day to profile (default: every day with a generator)')
+    scale_parser.add_argument('--start', type=float, default=0.1, help='Smallest scale to run, relative to the official input (default: 0.1)')
+    scale_parser.add_argument('--factor', type=float, default=2, help='Growth between successive scales (default: 2)')
+    scale_parser.add_argument('--max-scale', type=float, default=1000, help='Largest scale to run (default: 1000)')
+    scale_parser.add_argument('--limit', type=float, default=10, help='Stop growing after a run slower than this many seconds (default: 10)')
+    scale_parser.add_argument('--budget', type=float, default=1, help='Report the largest scale predicted to solve within this many seconds (default: 1)')
+    scale_parser.add_argument('--seed', type=int, default=0, help='Random seed for the generated inputs (default: 0)')
+
+    batch_parser = commands.add_parser('batch', help='Solve one day against every input in a directory, in a single process or pool.')
+    batch_parser.add_argument('year', type=int, help='Year to solve')
+    batch_parser.add_argument('day', type=int, help='Day to solve')
+    batch_parser.add_argument('directory', type=Path, help='Directory of input files')
+    batch_parser.add_argument('--part', type=int, choices=[1, 2], help='Only run this part')
+    batch_parser.add_argument('--jobs', type=int, help='Spread the inputs across a pool of this many processes')
+    batch_parser.add_argument('--quiet', action='store_true', help='Only print failures and the summary')
+
+    stream_parser = commands.add_parser('stream', help='Feed a day its input a line at a time in flat memory, printing the answers as they evolve.')
+    stream_parser.add_argument('year', type=int, help='Year to solve')
+    stream_parser.add_argument('day', type=int, help='Day to solve')
+    stream_parser.add_argument('--input', type=Path, help='Input file to read (default: stdin)')
+    stream_parser.add_argument('--every', type=int, default=100000, help='Print the answers so far after this many lines (default: 100000)')
+
+    serve_parser = commands.add_parser('serve', help='Keep every solution imported and solve days sent by `python -m aoc.client` over a Unix socket.')
+    serve_parser.add_argument('--socket', type=Path, help='Socket to listen on (default: .aoc/daemon.sock)')
+    serve_parser.add_argument('--no-cache', action='store_true', help='Always parse and solve, ignoring (and not updating) cached results')
+    serve_parser.add_argument('--cache-limit', type=int, help=CACHE_LIMIT_HELP)
+
+    imports_parser = commands.add_parser('imports', help='Audit how long each day takes to import its dependencies, using `python -X importtime`.')
+    imports_parser.add_argument('year', type=int, nargs='?', help='Year to audit (default: every year)')
+    imports_parser.add_argument('day', type=int, nargs='?', help='Day to audit (default: every day)')
+    imports_parser.add_argument('--runs', type=int, default=3, help='Fresh interpreters per day, keeping the fastest (default: 3)')
+    imports_parser.add_argument('--top', type=int, default=3, help='Heaviest imports to list per day, and ten times as many modules overall (default: 3)')
+
+    return parser.parse_args(argv)
+
+def open_cache(limit: Optional[int]) -> 'Cache':
+    """ The shared result cache, holding at most `limit` megabytes (the cache's own default if None). """
+    return caching.Cache(caching.CACHE_PATH, caching.DEFAULT_LIMIT if limit is None else limit * 2**20)
+
+def run_command(args: Namespace) -> int:
+    days = discover(args.year, args.day)
+    if len(days) == 0:
+        print('No matching solutions found.')
+        return 1
+
+    parts = None if args.part is None else [f'part{args.part}']
+    measure_memory = args.memory or args.max_memory is not None
+    profiler = None if args.profile is None else profiling.Profiler(args.profile)
+    monitor = memory.MemoryMonitor(None if args.max_memory is None else args.max_memory * 2**20) if measure_memory else None
+    timer = watchdog.Watchdog(args.time_limit, args.progress) if (args.time_limit or args.progress) else None
+    hooks = [hook for hook in (profiler, monitor, timer) if hook is not None]
+    # Cached stages don't run, so there'd be nothing to profile, measure or watch
+    cache = None if (args.no_cache or hooks) else open_cache(args.cache_limit)
+
+    if args.jobs is not None:
+        if args.input is not None or hooks:
+            print('--input, --profile, --memory, --max-memory, --time-limit and --progress can not be combined with --jobs.')
+            return 1
+        return run_pool(days, args.jobs, parts, cache)
+
+    failures = 0
+    for year, day in days:
+        solution = load(year, day)
+        try:
+            if args.input is None:
+                print(format_report(run(solution, parts=parts, cache=cache, hooks=hooks)))
+            else:
+                with Input.open(args.input) as puzzle:
+                    print(format_report(run(solution, puzzle, parts, cache, hooks)))
+        except (memory.MemoryExceeded, watchdog.TimeExceeded) as error:
+            print(error)
+            failures += 1
+
+        if profiler is not None:
+            print('\n'.join(profiler.summaries))
+            profiler.summaries.clear()
+
+        if monitor is not None:
+            print(monitor.summary())
+            monitor.usages.clear()
+
+    return 1 if failures else 0
+
+def run_pool(days: list[tuple[int, int]], jobs: int, parts: Optional[list[str]], cache: Optional['Cache']) -> int:
+    start = perf_counter()
+    outcomes = pool.run_all(days, jobs, parts, cache)
+    elapsed = perf_counter() - start
+
+    failures = 0
+    for outcome in outcomes:
+        if outcome.report is None:
+            failures += 1
+            print(f'{outcome.year}/day{outcome.day} FAILED\n{outcome.error}')
+        else:
+            print(format_report(outcome.report))
+
+    total = sum(outcome.report.wall for outcome in outcomes if outcome.report is not None)
+    print(f'{len(outcomes)} days in {elapsed:.2f}s across {jobs} processes ({total:.2f}s of solving)')
+    return 1 if failures else 0
+
+def bench_command(args: Namespace) -> int:
+    days = discover(args.year, args.day)
+    args.baseline = args.baseline or bench.BASELINE_PATH
+    baseline = bench.load_baseline(args.baseline)
+    results, failures, found, unmeasured = [], [], [], []
+
+    # Timings depend on the machine, so no baseline is checked in; comparing without one mustn't look like a pass
+    if not baseline and not args.save:
+        print(f'No baseline at {args.baseline}: record one with `python -m aoc bench --save` to compare against.')
+
+    print(f'{"day":<12} {"median":>9} {"p95":>9} {"max rss":>10}  baseline')
+    for year, day in days:
+        name = f'{year}/day{day}'
+        try:
+            result = bench.benchmark(year, day, args.runs, args.timeout)
+        except (RuntimeError, subprocess.TimeoutExpired) as error:
+            print(f'{name:<12} FAILED: {error}')
+            failures.append(name)
+            continue
+
+        results.append(result)
+        previous = baseline.get(name)
+
+        if previous is None:
+            status = 'new'
+            unmeasured.append(name)
+        else:
+            regressed = bench.regressions(result, previous, args.threshold, args.min_delta)
+            found.extend(regressed)
+            status = ', '.join(f'{r.metric} x{r.ratio:.2f}' for r in regressed) or f'ok ({previous.median:.3f}s)'
+
+        print(f'{name:<12} {result.median:>8.3f}s {result.p95:>8.3f}s {result.max_rss:>8}KB  {status}')
+
+    if args.save:
+        bench.save_baseline(results, args.baseline)
+        print(f'Saved {len(results)} results to {args.baseline}')
+        return 1 if failures else 0
+
+    if found:
+        print(f'{len(found)} regression(s) beyond {args.threshold:.0%}:')
+        for regression in found:
+            unit = '{:.0f}KB' if regression.metric == 'max_rss' else '{:.3f}s'
+            print(f'  {regression.name} {regression.metric}: {unit.format(regression.baseline)} -> {unit.format(regression.current)}')
+
+    if not baseline:
+        print('Nothing compared, as there is no baseline.')
+        return 1
+
+    if unmeasured:
+        print(f'{len(unmeasured)} day(s) not in the baseline, so not compared: {" ".join(unmeasured)}')
+
+    return 1 if (found or failures) else 0
+
+def generate_command(args: Namespace) -> int:
+    if args.year is None or args.day is None:
+        print(' '.join(f'{year}/day{day}' for year, day in generators.available()))
+        return 0
+
+    try:
+        text = generators.generate(args.year, args.day, args.scale, args.seed)
+    except KeyError as error:
+        print(error.args[0])
+        return 1
+
+    if args.output is None:
+        print(text, end='')
+    else:
+        args.output.write_text(text)
+
+    return 0
+
+def scale_command(args: Namespace) -> int:
+    days = [day for day in discover(args.year, args.day) if day in generators.available()]
+    if len(days) == 0:
+        print('No matching solutions with input generators found.')
+        return 1
+
+    for year, day in days:
+        solution = load(year, day)
+        measurements = list(scaling.curve(solution, scaling.scales(args.start, args.factor, args.max_scale), args.limit, args.seed))
+        print(scaling.format_curve(solution, measurements, args.budget))
+
+    return 0
+
+def batch_command(args: Namespace) -> int:
+    paths = batch.inputs(args.directory)
+    if len(paths) == 0:
+        print(f'No inputs found in {args.directory}.')
+        return 1
+
+    # Imported before any pool forks, so the workers inherit the day's tables
+    solution = load(args.year, args.day)
+    parts = None if args.part is None else [f'part{args.part}']
+
+    start = perf_counter()
+    results = []
+    for result in batch.solve_all(solution, paths, parts, args.jobs):
+        results.append(result)
+        if not args.quiet or result.error is not None:
+            print(batch.format_result(result, args.directory), flush=True)
+
+    summary = batch.summarize(results, perf_counter() - start)
+    print(batch.format_summary(summary))
+    return 1 if summary.failures else 0
+
+def stream_command(args: Namespace) -> int:
+    solution = load(args.year, args.day)
+    if solution.consumer is None:
+        print(f'{solution.name} needs its whole input at once, so it can\'t be streamed.')
+        return 1
+
+    consumer = solution.consumer()
+    with (sys.stdin.buffer if args.input is None else open(args.input, 'rb')) as file:
+        for count in progress(consumer, split_lines(read_chunks(file)), args.every):
+            print(f'{count} lines: part1 {consumer.part1()}, part2 {consumer.part2()}', flush=True)
+
+    return 0
+
+def serve_command(args: Namespace) -> int:
+    args.socket = args.socket or Path(client.SOCKET_PATH)
+    server = daemon.Daemon(None if args.no_cache else open_cache(args.cache_limit))
+
+    start = perf_counter()
+    failures = server.preload()
+    for failure in failures:
+        print(failure)
+    print(f'Imported {len(server.solutions)} solutions in {perf_counter() - start:.2f}s, listening on {args.socket}', flush=True)
+
+    try:
+        server.serve(args.socket)
+    except RuntimeError as error:
+        print(error)
+        return 1
+
+    print(server.stats())
+    return 0
+
+def imports_command(args: Namespace) -> int:
+    days = discover(args.year, args.day)
+    if len(days) == 0:
+        print('No matching solutions found.')
+        return 1
+
+    preloaded = frozenset(imports.startup())
+    audits, failures = [], 0
+    print(f'{"day":<12} {"imports":>8} {"modules":>7}  heaviest')
+    for year, day in days:
+        try:
+            audit = imports.audit(year, day, args.runs, preloaded)
+        except RuntimeError as error:
+            print(f'{year}/day{day:<7} FAILED: {error}')
+            failures += 1
+            continue
+
+        audits.append(audit)
+        print(imports.format_audit(audit, args.top), flush=True)
+
+    print(imports.format_totals(audits, args.top * 10))
+    return 1 if failures else 0
+
+def main(argv: Optional[list[str]] = None) -> int:
+    args = parse_arguments(argv)
+
+    if args.command == 'run':
+        return run_command(args)
+
+    if args.command == 'bench':
+        return bench_command(args)
+
+    if args.command == 'generate':
+        return generate_command(args)
+
+    if args.command == 'scale':
+        return scale_command(args)
+
+    if args.command == 'batch':
+        return batch_command(args)
+
+    if args.command == 'stream':
+        return stream_command(args)
+
+    if args.command == 'serve':
+        return serve_command(args)
+
+    if args.command == 'imports':
+        return imports_command(args)
+
+    return 1
+
+if __name__ == '__main__':
+    raise SystemExit(main())
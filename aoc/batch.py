@@ -0,0 +1,86 @@
+""" Solving one day against a whole directory of inputs in a single process.
+
+The day is imported once, so module-level tables (e.g. 2021/day8's decoders)
+and `aoc.memo` caches are built once and shared by every input. With `jobs`,
+inputs are spread across a pool forked after the import, so the workers start
+with those tables already built.
+"""
+from pathlib import Path
+from time import perf_counter
+from traceback import format_exc
+from typing import Iterator, NamedTuple, Optional
+
+from aoc.bench import percentile
+from aoc.inputs import Input
+from aoc.lazy import lazy
+from aoc.runner import format_answer, run
+from aoc.solutions import Solution, load
+
+# Pulls in multiprocessing, which a single-process batch has no use for
+futures = lazy('concurrent.futures')
+
+class Result(NamedTuple):
+    path: Path
+    # Each part's answer as text, so results cross process boundaries whatever the answers are
+    answers: list[tuple[str, str]]
+    wall: float
+    error: Optional[str] = None
+
+class Summary(NamedTuple):
+    inputs: int
+    failures: int
+    elapsed: float
+    p50: float
+    p95: float
+    maximum: float
+
+    @property
+    def throughput(self: 'Summary') -> float:
+        return self.inputs / self.elapsed if self.elapsed else 0.0
+
+def inputs(directory: Path) -> list[Path]:
+    """ Every file in `directory` (skipping hidden ones), in name order. """
+    return sorted(path for path in directory.iterdir() if path.is_file() and not path.name.startswith('.'))
+
+def solve(solution: Solution, path: Path, parts: Optional[list[str]] = None) -> Result:
+    start = perf_counter()
+    try:
+        with Input.open(path) as puzzle:
+            report = run(solution, puzzle, parts)
+    except Exception:
+        return Result(path, [], perf_counter() - start, format_exc())
+
+    return Result(path, [(timing.stage, str(timing.result)) for timing in report.answers()], perf_counter() - start)
+
+def solve_in_worker(year: int, day: int, path: Path, parts: Optional[list[str]]) -> Result:
+    # The module was imported before the pool forked, so this is a lookup in `sys.modules`
+    return solve(load(year, day), path, parts)
+
+def solve_all(solution: Solution, paths: list[Path], parts: Optional[list[str]] = None, jobs: Optional[int] = None) -> Iterator[Result]:
+    """ Solves every input in order, across `jobs` processes if given. """
+    if jobs is None:
+        for path in paths:
+            yield solve(solution, path, parts)
+        return
+
+    # Handing each worker several inputs at a time keeps the per-task overhead down when inputs are quick to solve
+    chunksize = max(1, len(paths) // (jobs * 4))
+    count = len(paths)
+    with futures.ProcessPoolExecutor(max_workers=jobs) as executor:
+        yield from executor.map(solve_in_worker, [solution.year] * count, [solution.day] * count, paths, [parts] * count, chunksize=chunksize)
+
+def summarize(results: list[Result], elapsed: float) -> Summary:
+    walls = [result.wall for result in results] or [0.0]
+    failures = sum(1 for result in results if result.error is not None)
+    return Summary(len(results), failures, elapsed, percentile(walls, 50), percentile(walls, 95), max(walls))
+
+def format_result(result: Result, root: Path) -> str:
+    name = result.path.relative_to(root) if result.path.is_relative_to(root) else result.path
+    if result.error is not None:
+        return f'{name} FAILED ({result.wall:.4f}s)\n{result.error}'
+    answers = ', '.join(f'{stage}: {format_answer(answer)}' for stage, answer in result.answers)
+    return f'{name} {result.wall:.4f}s {answers}'
+
+def format_summary(summary: Summary) -> str:
+    return (f'{summary.inputs} inputs ({summary.failures} failed) in {summary.elapsed:.2f}s, {summary.throughput:.1f} inputs/s; '
+            f'latency p50 {summary.p50:.4f}s, p95 {summary.p95:.4f}s, max {summary.maximum:.4f}s')
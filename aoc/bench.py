@@ -0,0 +1,138 @@
+import os
+import sys
+from math import ceil
+from pathlib import Path
+from time import perf_counter, sleep
+from typing import Any, Iterable, NamedTuple, Optional
+
+from aoc.lazy import lazy
+from aoc.solutions import ROOT, day_directory
+
+# Other commands use the baseline and `percentile` without benchmarking anything
+json = lazy('json')
+statistics = lazy('statistics')
+subprocess = lazy('subprocess')
+tempfile = lazy('tempfile')
+
+BASELINE_PATH = ROOT / 'benchmarks' / 'baseline.json'
+
+# Solutions import shared helpers from `aoc`, which lives at the repository root
+ENVIRONMENT = {**os.environ, 'PYTHONPATH': str(ROOT)}
+
+class Sample(NamedTuple):
+    wall: float
+    max_rss: int # Kilobytes, as reported by `getrusage`
+    returncode: int
+
+class Benchmark(NamedTuple):
+    name: str
+    runs: int
+    median: float
+    p95: float
+    max_rss: int
+
+    @staticmethod
+    def from_samples(name: str, samples: list[Sample]) -> 'Benchmark':
+        walls = [sample.wall for sample in samples]
+        return Benchmark(name, len(samples), statistics.median(walls), percentile(walls, 95), max(sample.max_rss for sample in samples))
+
+class Regression(NamedTuple):
+    name: str
+    metric: str
+    baseline: float
+    current: float
+
+    @property
+    def ratio(self: 'Regression') -> float:
+        return self.current / self.baseline
+
+def percentile(values: list[float], percent: float) -> float:
+    """ Nearest-rank percentile, which is well defined for the small sample sizes we use. """
+    ordered = sorted(values)
+    rank = max(1, ceil(len(ordered) * percent / 100))
+    return ordered[rank - 1]
+
+def sample(year: int, day: int, timeout: Optional[float] = None) -> Sample:
+    """ Runs `main.py` in a fresh interpreter against the checked-in input, the same way the README does.
+
+    Peak RSS is for the solution's own process; workers it spawns (e.g. 2022/day19's pool) aren't included.
+    """
+    directory = day_directory(year, day)
+
+    with open(directory / 'input', 'rb') as stdin, tempfile.TemporaryFile() as stderr:
+        start = perf_counter()
+        process = subprocess.Popen([sys.executable, 'main.py'], cwd=directory, stdin=stdin, stdout=subprocess.DEVNULL, stderr=stderr, env=ENVIRONMENT)
+        try:
+            # `wait4` gives us the resource usage of this child alone, unlike RUSAGE_CHILDREN
+            _, status, usage = wait4(process, timeout)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            _, status, _ = os.wait4(process.pid, 0)
+            process.returncode = os.waitstatus_to_exitcode(status)
+            raise
+        wall = perf_counter() - start
+
+        returncode = process.returncode = os.waitstatus_to_exitcode(status)
+        if returncode != 0:
+            stderr.seek(0)
+            raise RuntimeError(f'{year}/day{day} exited with {returncode}:\n{stderr.read().decode()}')
+
+    return Sample(wall, usage.ru_maxrss, returncode)
+
+def wait4(process: 'subprocess.Popen', timeout: Optional[float]) -> tuple[int, int, Any]:
+    if timeout is None:
+        return os.wait4(process.pid, 0)
+
+    deadline = perf_counter() + timeout
+    while True:
+        pid, status, usage = os.wait4(process.pid, os.WNOHANG)
+        if pid != 0:
+            return pid, status, usage
+        if perf_counter() > deadline:
+            raise subprocess.TimeoutExpired(process.args, timeout)
+        sleep(0.005)
+
+def benchmark(year: int, day: int, runs: int, timeout: Optional[float] = None) -> Benchmark:
+    samples = [sample(year, day, timeout) for _ in range(runs)]
+    return Benchmark.from_samples(f'{year}/day{day}', samples)
+
+def load_baseline(path: Path = BASELINE_PATH) -> dict[str, Benchmark]:
+    if not path.exists():
+        return {}
+
+    entries = json.loads(path.read_text())
+    return {name: Benchmark(name=name, **entry) for name, entry in entries.items()}
+
+def save_baseline(benchmarks: Iterable[Benchmark], path: Path = BASELINE_PATH) -> None:
+    """ Merges `benchmarks` into the baseline file, keeping entries for days that weren't re-run. """
+    entries = {name: benchmark._asdict() for name, benchmark in load_baseline(path).items()}
+    for benchmark in benchmarks:
+        entries[benchmark.name] = benchmark._asdict()
+
+    for entry in entries.values():
+        del entry['name']
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(dict(sorted(entries.items(), key=lambda item: day_order(item[0]))), indent=2) + '\n')
+
+def day_order(name: str) -> tuple[int, int]:
+    year, day = name.split('/day')
+    return (int(year), int(day))
+
+def regressions(current: Benchmark, baseline: Benchmark, threshold: float, minimum: float = 0.0) -> list[Regression]:
+    """ Compares a benchmark against its baseline.
+
+    A metric regresses when it grows by more than `threshold` (e.g. 0.2 for 20%).
+    Timings that moved by less than `minimum` seconds are treated as noise.
+    """
+    found = []
+
+    for metric in ['median', 'p95']:
+        before, after = getattr(baseline, metric), getattr(current, metric)
+        if after - before > minimum and after > before * (1 + threshold):
+            found.append(Regression(current.name, metric, before, after))
+
+    if current.max_rss > baseline.max_rss * (1 + threshold):
+        found.append(Regression(current.name, 'max_rss', baseline.max_rss, current.max_rss))
+
+    return found
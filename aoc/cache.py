@@ -0,0 +1,232 @@
+import os
+import re
+import sys
+from pathlib import Path
+from types import CodeType, FunctionType, ModuleType
+from typing import Any, Callable, Iterator, Optional, Union
+
+from aoc.lazy import lazy
+from aoc.solutions import ROOT
+
+# Only needed once something is actually cached or looked up
+hashlib = lazy('hashlib')
+inspect = lazy('inspect')
+pickle = lazy('pickle')
+
+CACHE_PATH = ROOT / '.aoc' / 'cache'
+
+# Least recently used entries are evicted once the cache grows beyond this
+DEFAULT_LIMIT = 256 * 1024 * 1024
+
+# Evicting down to this fraction of the limit leaves room for a run's worth of stores before the next scan
+LOW_WATER = 0.75
+
+# Bumped whenever the layout of cached entries changes
+VERSION = b'1'
+
+ADDRESS = re.compile(r' at 0x[0-9a-f]+')
+
+# Each module's source digest, alongside the module object it was taken from
+DIGESTS: dict[str, tuple[ModuleType, str]] = {}
+
+class Cache:
+    """ A content-addressed store of pickled values on disk, evicted least recently used first.
+
+    Recency is tracked with file modification times, which are bumped on every hit.
+
+    Scanning every entry is slow for a big cache, so the size is measured once
+    (on the first store) and then estimated by adding what each store writes;
+    only when that estimate passes the limit is the cache scanned and evicted.
+    Entries written by other processes are counted at the next scan.
+    """
+
+    def __init__(self: 'Cache', path: Path = CACHE_PATH, limit: int = DEFAULT_LIMIT):
+        self.path = path
+        self.limit = limit
+        # Bytes stored as of the last scan plus everything written since (overwrites count twice), None until scanned
+        self.estimate: Optional[int] = None
+
+    def entry(self: 'Cache', key: str) -> Path:
+        return self.path / key[:2] / f'{key}.pickle'
+
+    def get(self: 'Cache', key: str) -> tuple[bool, Any]:
+        """ Returns `(True, value)` on a hit and `(False, None)` on a miss (or an unreadable entry). """
+        entry = self.entry(key)
+        try:
+            with open(entry, 'rb') as file:
+                value = pickle.load(file)
+        except FileNotFoundError:
+            return False, None
+        except Exception:
+            # Stale entries (e.g. classes that have since been renamed) are treated as misses
+            entry.unlink(missing_ok=True)
+            return False, None
+
+        os.utime(entry)
+        return True, value
+
+    def put(self: 'Cache', key: str, value: Any) -> bool:
+        """ Stores `value`, returning False if it can't be pickled (e.g. it holds a lambda). """
+        try:
+            data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, TypeError, AttributeError, RecursionError):
+            return False
+
+        if len(data) > self.limit:
+            return False
+
+        entry = self.entry(key)
+        entry.parent.mkdir(parents=True, exist_ok=True)
+
+        # Written under a temporary name first so that concurrent pool workers never read half an entry
+        temporary = entry.with_suffix(f'.{os.getpid()}.tmp')
+        temporary.write_bytes(data)
+        os.replace(temporary, entry)
+
+        if self.estimate is None:
+            self.estimate = self.size()
+        else:
+            self.estimate += len(data)
+
+        if self.estimate > self.limit:
+            self.evict()
+        return True
+
+    def entries(self: 'Cache') -> Iterator[tuple[Path, os.stat_result]]:
+        for entry in self.path.glob('*/*.pickle'):
+            try:
+                yield entry, entry.stat()
+            except FileNotFoundError:
+                continue
+
+    def size(self: 'Cache') -> int:
+        return sum(status.st_size for _, status in self.entries())
+
+    def evict(self: 'Cache') -> None:
+        """ Removes least recently used entries until the cache fits within its limit, with `LOW_WATER` headroom if any had to go. """
+        entries = sorted(self.entries(), key=lambda entry: entry[1].st_mtime)
+        total = sum(status.st_size for _, status in entries)
+        target = self.limit if total <= self.limit else self.limit * LOW_WATER
+
+        for entry, status in entries:
+            if total <= target:
+                break
+            entry.unlink(missing_ok=True)
+            total -= status.st_size
+
+        self.estimate = total
+
+    def clear(self: 'Cache') -> None:
+        for entry, _ in list(self.entries()):
+            entry.unlink(missing_ok=True)
+        self.estimate = 0
+
+def digest(*parts: Union[bytes, memoryview]) -> str:
+    hasher = hashlib.sha256(VERSION)
+    for part in parts:
+        hasher.update(hashlib.sha256(part).digest())
+    return hasher.hexdigest()
+
+def code_names(code: CodeType) -> Iterator[str]:
+    """ Every global name a function's code refers to, including from nested functions and lambdas. """
+    yield from code.co_names
+    for constant in code.co_consts:
+        if isinstance(constant, CodeType):
+            yield from code_names(constant)
+
+def source_digest(fn: Callable, module: ModuleType) -> str:
+    """ Hashes the source of `fn` and of everything in `module` it transitively refers to.
+
+    Functions and classes contribute their source and module-level constants their `repr`.
+    This is what lets a parsed input survive edits to code that only the parts use.
+    """
+    seen, pending, sources = set(), [fn], []
+
+    while pending:
+        value = pending.pop()
+        if id(value) in seen:
+            continue
+        seen.add(id(value))
+
+        if not isinstance(value, (FunctionType, type)):
+            # Object addresses (e.g. of lambdas inside a constant) change from run to run
+            sources.append(ADDRESS.sub('', repr(value)).encode())
+            continue
+
+        try:
+            sources.append(inspect.getsource(value).encode())
+        except (OSError, TypeError):
+            # e.g. classes made by `namedtuple`, which are fully described by their fields
+            sources.append(repr((value.__qualname__, getattr(value, '_fields', None), getattr(value, '_field_defaults', None))).encode())
+
+        if isinstance(value, FunctionType):
+            codes = [value.__code__]
+        else:
+            members = [getattr(member, '__func__', member) for member in vars(value).values()]
+            codes = [member.__code__ for member in members if isinstance(member, FunctionType)]
+
+        for code in codes:
+            for name in code_names(code):
+                if name in module.__dict__ and not isinstance(module.__dict__[name], ModuleType):
+                    found = module.__dict__[name]
+                    # Functions and classes imported from elsewhere (e.g. the standard library) don't change
+                    if isinstance(found, (FunctionType, type)) and found.__module__ != module.__name__:
+                        continue
+                    pending.append(found)
+
+    return digest(*sorted(sources))
+
+def module_digest(module: ModuleType) -> str:
+    """ Hashes the source of `module`, as of the first time it's hashed since being imported.
+
+    Sources are read from disk, so hashing them again after an edit would
+    describe code that isn't the code running (e.g. in a long-lived daemon).
+    """
+    remembered = DIGESTS.get(module.__name__)
+    if remembered is None or remembered[0] is not module:
+        remembered = DIGESTS[module.__name__] = (module, digest(inspect.getsource(module).encode()))
+    return remembered[1]
+
+def is_local(module: ModuleType) -> bool:
+    """ Whether `module` was imported from a file in this repository, rather than the standard library or site-packages. """
+    path = getattr(module, '__file__', None)
+    return path is not None and Path(path).resolve().is_relative_to(ROOT)
+
+def dependencies(module: ModuleType) -> list[ModuleType]:
+    """ Every module in this repository that `module` imports (directly or through the others), in name order.
+
+    Imports are found among the module-level names: modules themselves, and
+    the modules that functions, classes and other values were defined in.
+    """
+    seen, pending, found = {module.__name__}, [module], []
+
+    while pending:
+        for value in vars(pending.pop()).values():
+            # `aoc.lazy` modules turn back into plain modules once loaded, and
+            # any attribute access would load them, so unloaded ones are skipped
+            if type(value) is ModuleType:
+                imported = value
+            elif isinstance(value, ModuleType):
+                continue
+            else:
+                imported = sys.modules.get(getattr(value, '__module__', None) or '')
+
+            if imported is None or imported.__name__ in seen:
+                continue
+            seen.add(imported.__name__)
+
+            if is_local(imported):
+                found.append(imported)
+                pending.append(imported)
+
+    return sorted(found, key=lambda imported: imported.__name__)
+
+def dependencies_digest(module: ModuleType) -> str:
+    """ Hashes the source of every module in this repository that `module` imports, so that editing e.g. `aoc.grid` invalidates the days using it. """
+    return digest(*(f'{imported.__name__}:{module_digest(imported)}'.encode() for imported in dependencies(module)))
+
+def parse_key(input_digest: str, module: ModuleType) -> str:
+    return digest(b'parse', input_digest.encode(), source_digest(module.parse, module).encode(), dependencies_digest(module).encode())
+
+def answer_key(input_digest: str, module: ModuleType, part: str) -> str:
+    return digest(b'answer', input_digest.encode(), module_digest(module).encode(), dependencies_digest(module).encode(), part.encode())
@@ -0,0 +1,147 @@
+""" A thin client for the solve daemon (`python -m aoc serve`).
+
+This module only needs the standard library's socket and JSON support, so
+asking the daemon for an answer costs little more than the interpreter's own
+start-up, rather than importing the runner and a day's solution every time:
+
+    python3 -m aoc.client 2022 17 < 2022/day17/input
+    python3 -m aoc.client 2022 17 --input big.txt --part 2
+    python3 -m aoc.client --stats
+
+Every message is one line of JSON. A request whose input is sent inline says
+how many bytes of it follow the line in `size`. A connection can carry any
+number of requests, so pipelines can keep one open with `Client`.
+"""
+import json
+import os
+import socket
+import sys
+from typing import Any, BinaryIO, Optional
+
+# `aoc.solutions.ROOT`, without importing it
+SOCKET_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), '.aoc', 'daemon.sock')
+
+Message = dict[str, Any]
+
+def encode(message: Message, payload: Optional[bytes] = None) -> bytes:
+    if payload is not None:
+        message = {**message, 'size': len(payload)}
+    return json.dumps(message).encode() + b'\n' + (payload or b'')
+
+def send(stream: BinaryIO, message: Message, payload: Optional[bytes] = None) -> None:
+    stream.write(encode(message, payload))
+    stream.flush()
+
+def unpack(buffer: bytes) -> Optional[tuple[Message, Optional[bytes], int]]:
+    """ The first message in `buffer`, its inline payload and how many bytes they took, or None if it hasn't all arrived. """
+    newline = buffer.find(b'\n')
+    if newline == -1:
+        return None
+
+    message = json.loads(buffer[:newline])
+    if 'size' not in message:
+        return message, None, newline + 1
+
+    end = newline + 1 + message['size']
+    if len(buffer) < end:
+        return None
+    return message, bytes(buffer[newline + 1:end]), end
+
+def receive(stream: BinaryIO) -> Optional[tuple[Message, Optional[bytes]]]:
+    """ The next message and its inline payload (if any), or None once the other end has closed the connection. """
+    line = stream.readline()
+    if not line:
+        return None
+
+    message = json.loads(line)
+    if 'size' not in message:
+        return message, None
+
+    payload = stream.read(message['size'])
+    if len(payload) < message['size']:
+        raise ConnectionError(f'Expected {message["size"]} bytes of input, got {len(payload)}')
+    return message, payload
+
+class Client:
+    def __init__(self: 'Client', path: str = SOCKET_PATH):
+        self.socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.socket.connect(str(path))
+        self.stream = self.socket.makefile('rwb')
+
+    def request(self: 'Client', message: Message, payload: Optional[bytes] = None) -> Message:
+        send(self.stream, message, payload)
+        reply = receive(self.stream)
+        if reply is None:
+            raise ConnectionError('The daemon closed the connection')
+        return reply[0]
+
+    def solve(self: 'Client', year: int, day: int, path: Optional[str] = None, data: Optional[bytes] = None, parts: Optional[list[str]] = None) -> Message:
+        """ Solves a day against a file the daemon can read, inline `data`, or (with neither) the checked-in `input`. """
+        message: Message = {'command': 'solve', 'year': year, 'day': day, 'parts': parts}
+        if path is not None:
+            message['path'] = os.path.abspath(path)
+        return self.request(message, data)
+
+    def close(self: 'Client') -> None:
+        self.stream.close()
+        self.socket.close()
+
+    def __enter__(self: 'Client') -> 'Client':
+        return self
+
+    def __exit__(self: 'Client', *_) -> None:
+        self.close()
+
+def main(argv: Optional[list[str]] = None) -> int:
+    from argparse import ArgumentParser
+
+    parser = ArgumentParser(prog='python -m aoc.client', description='Ask a running `python -m aoc serve` to solve a day.')
+    parser.add_argument('year', type=int, nargs='?', help='Year to solve')
+    parser.add_argument('day', type=int, nargs='?', help='Day to solve')
+    parser.add_argument('--part', type=int, choices=[1, 2], help='Only solve this part')
+    parser.add_argument('--input', help='Input file for the daemon to read (default: stdin, or the checked-in `input` with --checked-in)')
+    parser.add_argument('--checked-in', action='store_true', help='Solve against the day\'s checked-in `input`')
+    parser.add_argument('--timings', action='store_true', help='Also print the daemon\'s per-stage timings')
+    parser.add_argument('--stats', action='store_true', help='Print the daemon\'s request latency histograms')
+    parser.add_argument('--shutdown', action='store_true', help='Stop the daemon')
+    parser.add_argument('--socket', default=SOCKET_PATH, help=f'Socket to connect to (default: {SOCKET_PATH})')
+    args = parser.parse_args(argv)
+
+    if not (args.stats or args.shutdown) and (args.year is None or args.day is None):
+        parser.error('a year and day are required to solve')
+
+    try:
+        client = Client(args.socket)
+    except (FileNotFoundError, ConnectionRefusedError):
+        print(f'No daemon is listening at {args.socket}; start one with `python -m aoc serve`.', file=sys.stderr)
+        return 1
+
+    with client:
+        if args.stats or args.shutdown:
+            reply = client.request({'command': 'shutdown' if args.shutdown else 'stats'})
+            print(reply['stats'])
+            return 0
+
+        parts = None if args.part is None else [f'part{args.part}']
+        if args.input is not None or args.checked_in:
+            reply = client.solve(args.year, args.day, args.input, parts=parts)
+        else:
+            reply = client.solve(args.year, args.day, data=sys.stdin.buffer.read(), parts=parts)
+
+    if 'error' in reply:
+        print(reply['error'], file=sys.stderr, end='')
+        return 1
+
+    # The same output as running the day's `main.py`
+    for _, answer in reply['answers']:
+        print(answer)
+
+    if args.timings:
+        for stage, wall, cpu in reply['timings']:
+            print(f'{stage:<8} {wall:>9.4f}s {cpu:>9.4f}s', file=sys.stderr)
+        print(f'{"request":<8} {reply["latency"]:>9.4f}s', file=sys.stderr)
+
+    return 0
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,128 @@
+""" Cycle detection, for simulations that settle into a loop long before the step count they're asked about.
+
+A simulation is a sequence of states, each reduced to a compact hashable key
+(a few ints, a tuple or some bytes rather than the whole state), with a value
+measured at every step (a height, a count, ...). Once a key repeats, the
+simulation is periodic from the first occurrence on, so the value at any later
+step follows from one pass through the loop:
+
+    value(n) = value(start + (n - start) % length) + (n - start) // length * delta
+
+There are two ways to find the loop:
+
+- `CycleDetector` (or `find_cycle`) remembers the step each key was first seen
+  at. It spots the loop as soon as it closes, and suits simulations that update
+  their state in place.
+- `floyd` and `brent` only keep a couple of states, for simulations written as
+  a pure `step(state) -> state` function whose states are too big to remember.
+"""
+from typing import Any, Callable, Hashable, Iterable, NamedTuple, Optional, TypeVar
+
+S = TypeVar('S')
+
+class Cycle(NamedTuple):
+    start: int
+    length: int
+    # The value after each step up to the one that closes the loop (`start + length`)
+    values: list[Any]
+
+    @property
+    def delta(self: 'Cycle') -> Any:
+        """ How much the value grows per trip around the loop. """
+        return self.values[self.start + self.length] - self.values[self.start]
+
+    def fold(self: 'Cycle', step: int) -> tuple[int, int]:
+        """ The step within the first trip around the loop that `step` matches, and how many whole trips lie between them. """
+        if step < self.start + self.length:
+            return step, 0
+        cycles, offset = divmod(step - self.start, self.length)
+        return self.start + offset, cycles
+
+    def at(self: 'Cycle', step: int) -> Any:
+        """ The value after `step` steps. Values must support `+`, `-` and multiplying by an int (e.g. ints, or NumPy arrays). """
+        index, cycles = self.fold(step)
+        return self.values[index] + cycles * self.delta if cycles else self.values[index]
+
+class CycleDetector:
+    """ Watches the states of a simulation one step at a time, remembering where each key was first seen. """
+
+    def __init__(self: 'CycleDetector'):
+        self.seen: dict[Hashable, int] = {}
+        self.values: list[Any] = []
+
+    def observe(self: 'CycleDetector', key: Hashable, value: Any = None) -> Optional[Cycle]:
+        """ Records the next step (starting from step 0, before the simulation moves), returning the cycle once a key repeats. """
+        step = len(self.values)
+        self.values.append(value)
+
+        first = self.seen.setdefault(key, step)
+        if first == step:
+            return None
+        return Cycle(first, step - first, self.values[:])
+
+def find_cycle(steps: Iterable[tuple[Hashable, Any]]) -> Optional[Cycle]:
+    """ The first cycle among `(key, value)` steps, or None if they run out first. """
+    detector = CycleDetector()
+    for key, value in steps:
+        found = detector.observe(key, value)
+        if found is not None:
+            return found
+    return None
+
+def identity(state: Any) -> Any:
+    return state
+
+def measure(step: Callable[[S], S], initial: S, start: int, length: int, value: Optional[Callable[[S], Any]]) -> Cycle:
+    """ Replays the simulation once up to the end of the loop to collect its values. """
+    values = []
+    if value is not None:
+        state = initial
+        values.append(value(state))
+        for _ in range(start + length):
+            state = step(state)
+            values.append(value(state))
+    return Cycle(start, length, values)
+
+def floyd(step: Callable[[S], S], initial: S, key: Callable[[S], Hashable] = identity, value: Optional[Callable[[S], Any]] = None) -> Cycle:
+    """ Floyd's tortoise and hare: finds the loop in `initial, step(initial), ...` keeping only two states.
+
+    `key` says when two states are the same, and `value` (if given) is measured at every step for `Cycle.at`.
+    """
+    # The hare moves twice as fast, so they meet somewhere in the loop after a multiple of its length
+    tortoise, hare = step(initial), step(step(initial))
+    while key(tortoise) != key(hare):
+        tortoise, hare = step(tortoise), step(step(hare))
+
+    # Starting one of them over, they meet again at the start of the loop
+    start, tortoise = 0, initial
+    while key(tortoise) != key(hare):
+        tortoise, hare = step(tortoise), step(hare)
+        start += 1
+
+    length, hare = 1, step(tortoise)
+    while key(tortoise) != key(hare):
+        hare = step(hare)
+        length += 1
+
+    return measure(step, initial, start, length, value)
+
+def brent(step: Callable[[S], S], initial: S, key: Callable[[S], Hashable] = identity, value: Optional[Callable[[S], Any]] = None) -> Cycle:
+    """ Brent's algorithm: like `floyd`, but usually with fewer steps, finding the length first. """
+    # The tortoise teleports to the hare at every power of two, until the hare comes back round to it
+    power = length = 1
+    tortoise, hare = initial, step(initial)
+    while key(tortoise) != key(hare):
+        if power == length:
+            tortoise, power, length = hare, power * 2, 0
+        hare = step(hare)
+        length += 1
+
+    # With the hare `length` steps ahead, they first meet at the start of the loop
+    start, tortoise, hare = 0, initial, initial
+    for _ in range(length):
+        hare = step(hare)
+    while key(tortoise) != key(hare):
+        tortoise, hare = step(tortoise), step(hare)
+        start += 1
+
+    return measure(step, initial, start, length, value)
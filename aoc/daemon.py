@@ -0,0 +1,273 @@
+""" A long-lived process that keeps every solution imported and solves days on request over a Unix socket.
+
+Running a day's `main.py` pays for interpreter start-up and every import
+(`typing`, `dataclasses`, `multiprocessing`, ...) before it reads a byte of
+input. The daemon pays for them once, up front, so repeated solves only cost the
+solving itself plus a round trip through the socket (see `aoc.client`).
+
+Requests are solved one at a time, as solving is CPU-bound and some days fork
+their own pools, but any number of clients can stay connected: a selector reads
+from all of them, and each connection with a whole request waiting gets one
+answered in turn, so a long-lived `Client` never holds up the others.
+
+A day whose `main.py` has changed since it was imported is reloaded before it's
+solved (changes to `aoc` itself need a restart). Cached answers are keyed by the
+sources as they were when imported, so they always describe the code the daemon
+is actually running.
+"""
+import os
+import selectors
+import signal
+import socket
+import sys
+from collections import deque
+from math import ceil, log2
+from pathlib import Path
+from time import perf_counter
+from traceback import format_exc
+from typing import Optional
+
+from aoc.cache import Cache, dependencies_digest, module_digest
+from aoc.client import Message, encode, unpack
+from aoc.inputs import Input
+from aoc.runner import run
+from aoc.solutions import Solution, day_directory, discover, load, module_name
+
+RECEIVE_SIZE = 1 << 16
+
+class Histogram:
+    """ Latencies counted in power-of-two buckets of microseconds, so any spread fits in a few dozen counters. """
+
+    def __init__(self: 'Histogram'):
+        # Bucket `b` counts latencies in (2^(b-1), 2^b] microseconds
+        self.buckets: dict[int, int] = {}
+        self.count = 0
+        self.total = 0.0
+        self.maximum = 0.0
+
+    def add(self: 'Histogram', seconds: float) -> None:
+        bucket = ceil(log2(max(seconds * 1e6, 1)))
+        self.buckets[bucket] = self.buckets.get(bucket, 0) + 1
+        self.count += 1
+        self.total += seconds
+        self.maximum = max(self.maximum, seconds)
+
+    def percentile(self: 'Histogram', percent: float) -> float:
+        """ The upper bound of the bucket holding the nearest-rank percentile, so within a factor of two of the real one. """
+        rank, seen = max(1, ceil(self.count * percent / 100)), 0
+        for bucket in sorted(self.buckets):
+            seen += self.buckets[bucket]
+            if seen >= rank:
+                return min(2 ** bucket / 1e6, self.maximum)
+        return self.maximum
+
+    def format(self: 'Histogram', name: str, width: int = 40) -> list[str]:
+        if self.count == 0:
+            return [f'{name}: no requests']
+
+        lines = [f'{name}: {self.count} requests, mean {format_seconds(self.total / self.count)}, '
+                 f'p50 {format_seconds(self.percentile(50))}, p90 {format_seconds(self.percentile(90))}, '
+                 f'p99 {format_seconds(self.percentile(99))}, max {format_seconds(self.maximum)}']
+
+        tallest = max(self.buckets.values())
+        for bucket in range(min(self.buckets), max(self.buckets) + 1):
+            count = self.buckets.get(bucket, 0)
+            bar = '#' * ceil(count / tallest * width)
+            lines.append(f'  <= {format_seconds(2 ** bucket / 1e6):>8} {count:>6} {bar}')
+        return lines
+
+def format_seconds(seconds: float) -> str:
+    if seconds < 1e-3:
+        return f'{seconds * 1e6:.0f}us'
+    if seconds < 1:
+        return f'{seconds * 1e3:.1f}ms'
+    return f'{seconds:.2f}s'
+
+class Daemon:
+    def __init__(self: 'Daemon', cache: Optional[Cache] = None):
+        self.cache = cache
+        self.solutions: dict[tuple[int, int], Solution] = {}
+        # When each solution's `main.py` was last modified as of importing it
+        self.modified: dict[tuple[int, int], int] = {}
+        # Latencies from receiving a request to sending its reply, per day and overall
+        self.latencies: dict[str, Histogram] = {'all': Histogram()}
+        self.running = True
+
+    def preload(self: 'Daemon') -> list[str]:
+        """ Imports every solution up front, returning the tracebacks of any that fail to import. """
+        failures = []
+        for year, day in discover():
+            try:
+                self.solution(year, day)
+            except Exception:
+                failures.append(format_exc())
+        return failures
+
+    def solution(self: 'Daemon', year: int, day: int) -> Solution:
+        modified = os.stat(day_directory(year, day) / 'main.py').st_mtime_ns
+
+        if self.modified.get((year, day)) != modified:
+            sys.modules.pop(module_name(year, day), None)
+            solution = self.solutions[(year, day)] = load(year, day)
+            self.modified[(year, day)] = modified
+
+            # Hashed now, while the files on disk still match what was just imported
+            module_digest(solution.module)
+            dependencies_digest(solution.module)
+
+        return self.solutions[(year, day)]
+
+    def solve(self: 'Daemon', request: Message, payload: Optional[bytes]) -> Message:
+        solution = self.solution(request['year'], request['day'])
+        parts = request.get('parts')
+
+        if payload is not None:
+            report = run(solution, Input(payload), parts, self.cache)
+        elif request.get('path') is not None:
+            with Input.open(request['path']) as puzzle:
+                report = run(solution, puzzle, parts, self.cache)
+        else:
+            report = run(solution, parts=parts, cache=self.cache)
+
+        return {
+            'answers': [[timing.stage, str(timing.result)] for timing in report.answers()],
+            'timings': [[timing.stage, timing.wall, timing.cpu] for timing in report.timings],
+        }
+
+    def handle(self: 'Daemon', request: Message, payload: Optional[bytes]) -> Message:
+        command = request.get('command')
+
+        if command == 'solve':
+            try:
+                return self.solve(request, payload)
+            except Exception:
+                return {'error': format_exc()}
+
+        if command in ('stats', 'shutdown'):
+            self.running = command != 'shutdown'
+            return {'stats': self.stats()}
+
+        return {'error': f'Unknown command {command!r}\n'}
+
+    def answer(self: 'Daemon', connection: 'Connection') -> None:
+        """ Handles the next whole request buffered from `connection`, if there is one, and sends its reply. """
+        try:
+            received = connection.next_request()
+        except ValueError:
+            connection.close()
+            return
+        if received is None:
+            return
+
+        start = perf_counter()
+        request, payload = received
+        reply = self.handle(request, payload)
+        latency = perf_counter() - start
+        reply['latency'] = latency
+
+        if request.get('command') == 'solve':
+            name = f'{request.get("year")}/day{request.get("day")}'
+            self.latencies.setdefault(name, Histogram()).add(latency)
+            self.latencies['all'].add(latency)
+
+        try:
+            connection.socket.sendall(encode(reply))
+        except OSError:
+            connection.close()
+
+    def stats(self: 'Daemon') -> str:
+        lines = []
+        for name, histogram in sorted(self.latencies.items(), key=lambda item: item[0] != 'all'):
+            lines.extend(histogram.format(name))
+        return '\n'.join(lines)
+
+    def serve(self: 'Daemon', path: Path) -> None:
+        """ Listens on `path` until asked to shut down (or sent SIGTERM or SIGINT), removing the socket afterwards. """
+        listener = bind(path)
+        selector = selectors.DefaultSelector()
+        selector.register(listener, selectors.EVENT_READ)
+        # Connections holding a whole request, answered one request each in turn so none can hold up the others
+        ready: deque[Connection] = deque()
+
+        # SIGTERM should clean up the socket like Ctrl-C does
+        previous = signal.signal(signal.SIGTERM, signal.default_int_handler)
+        try:
+            while self.running:
+                for key, _ in selector.select(0 if ready else None):
+                    if key.fileobj is listener:
+                        client, _ = listener.accept()
+                        selector.register(client, selectors.EVENT_READ, Connection(client, selector))
+                    elif key.data.receive() and key.data not in ready:
+                        ready.append(key.data)
+
+                if ready:
+                    connection = ready.popleft()
+                    self.answer(connection)
+                    if connection.open and connection.buffer:
+                        ready.append(connection)
+        except KeyboardInterrupt:
+            pass
+        finally:
+            signal.signal(signal.SIGTERM, previous)
+            for key in list(selector.get_map().values()):
+                key.fileobj.close()
+            selector.close()
+            path.unlink(missing_ok=True)
+
+class Connection:
+    """ A client's socket, and what it has sent that hasn't been answered yet. """
+
+    def __init__(self: 'Connection', socket: socket.socket, selector: selectors.BaseSelector):
+        self.socket = socket
+        self.selector = selector
+        self.buffer = bytearray()
+        self.open = True
+
+    def receive(self: 'Connection') -> bool:
+        """ Reads what the client has sent so far (without blocking, as the selector says it's readable), returning whether it's still connected. """
+        try:
+            data = self.socket.recv(RECEIVE_SIZE)
+        except OSError:
+            data = b''
+
+        if not data:
+            self.close()
+            return False
+
+        self.buffer += data
+        return True
+
+    def next_request(self: 'Connection') -> Optional[tuple[Message, Optional[bytes]]]:
+        """ Takes the next whole request off the buffer, or None if it hasn't all arrived. Raises ValueError for malformed JSON. """
+        unpacked = unpack(self.buffer)
+        if unpacked is None:
+            return None
+
+        message, payload, length = unpacked
+        del self.buffer[:length]
+        return message, payload
+
+    def close(self: 'Connection') -> None:
+        if self.open:
+            self.open = False
+            self.selector.unregister(self.socket)
+            self.socket.close()
+
+def bind(path: Path) -> socket.socket:
+    """ A socket listening at `path`, replacing a stale socket file left behind by a daemon that's no longer running. """
+    if path.exists():
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            probe.connect(str(path))
+        except ConnectionRefusedError:
+            path.unlink()
+        else:
+            raise RuntimeError(f'A daemon is already listening at {path}')
+        finally:
+            probe.close()
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    listener.bind(str(path))
+    listener.listen()
+    return listener
@@ -0,0 +1,506 @@
+""" Synthetic puzzle inputs at configurable sizes, for seeing how solutions scale.
+
+Each generator takes a seeded `Random` and a `scale` and returns the text of an
+input in the same format as the day's official `input`. A scale of 1 matches
+the official dimensions: list-like inputs get `scale` times as many entries and
+grids get `scale` times as many cells (so each side grows by `sqrt(scale)`).
+"""
+from random import Random
+from string import ascii_letters, ascii_lowercase
+from typing import Callable
+
+from aoc.grid import ADJACENT, neighbor_table
+
+Generator = Callable[[Random, float], str]
+
+GENERATORS: dict[tuple[int, int], Generator] = {}
+
+def generator(year: int, day: int) -> Callable[[Generator], Generator]:
+    def register(fn: Generator) -> Generator:
+        GENERATORS[(year, day)] = fn
+        return fn
+    return register
+
+def available() -> list[tuple[int, int]]:
+    return sorted(GENERATORS)
+
+def generate(year: int, day: int, scale: float = 1, seed: int = 0) -> str:
+    """ Generates an input for a day, identical for identical arguments. """
+    if (year, day) not in GENERATORS:
+        raise KeyError(f'No input generator for {year} day {day}')
+
+    return GENERATORS[(year, day)](Random(f'{year}/{day}/{seed}'), scale)
+
+def count(base: int, scale: float) -> int:
+    """ Scales a number of entries. """
+    return max(1, round(base * scale))
+
+def side(base: int, scale: float) -> int:
+    """ Scales one side of a square grid so that its area grows by `scale`. """
+    return max(2, round(base * scale ** 0.5))
+
+def lines(rows: list[str]) -> str:
+    return '\n'.join(rows) + '\n'
+
+def digit_grid(random: Random, width: int, height: int, digits: str = '0123456789') -> str:
+    return lines([''.join(random.choices(digits, k=width)) for _ in range(height)])
+
+def char_grid(random: Random, width: int, height: int, chars: str, weights: list[float]) -> str:
+    return lines([''.join(random.choices(chars, weights, k=width)) for _ in range(height)])
+
+# 2021
+@generator(2021, 1)
+def sonar_sweep(random: Random, scale: float) -> str:
+    depth, depths = 200, []
+    for _ in range(count(2000, scale)):
+        depth = max(0, depth + random.randint(-5, 10))
+        depths.append(str(depth))
+    return lines(depths)
+
+@generator(2021, 2)
+def dive(random: Random, scale: float) -> str:
+    commands = random.choices(['forward', 'down', 'up'], [2, 2, 1], k=count(1000, scale))
+    return lines([f'{command} {random.randint(1, 9)}' for command in commands])
+
+@generator(2021, 3)
+def binary_diagnostic(random: Random, scale: float) -> str:
+    # Distinct numbers keep the rating filters from ever emptying out
+    width = 12 + max(0, (count(1000, scale) - 1).bit_length() - 10)
+    numbers = random.sample(range(2 ** width), min(count(1000, scale), 2 ** width))
+    return lines([format(number, f'0{width}b') for number in numbers])
+
+@generator(2021, 4)
+def giant_squid(random: Random, scale: float) -> str:
+    draws = random.sample(range(100), 100)
+    boards = []
+    for _ in range(count(100, scale)):
+        numbers = random.sample(range(100), 25)
+        boards.append('\n'.join(' '.join(f'{n:>2}' for n in numbers[row * 5:row * 5 + 5]) for row in range(5)))
+    return ','.join(map(str, draws)) + '\n\n' + '\n\n'.join(boards) + '\n'
+
+def room(position: int, delta: int, size: int) -> int:
+    """ How many steps of `delta` fit between `position` and the edge of a `size` wide grid. """
+    if delta == 0:
+        return size
+    return size - 1 - position if delta > 0 else position
+
+@generator(2021, 5)
+def hydrothermal_venture(random: Random, scale: float) -> str:
+    size, vents = 1000, []
+    for _ in range(count(500, scale)):
+        x1, y1 = random.randrange(size), random.randrange(size)
+        dx, dy = random.choice([(1, 0), (-1, 0), (0, 1), (0, -1), (1, 1), (1, -1), (-1, 1), (-1, -1)])
+        length = min(random.randint(1, size // 2), room(x1, dx, size), room(y1, dy, size))
+        vents.append(f'{x1},{y1} -> {x1 + dx * length},{y1 + dy * length}')
+    return lines(vents)
+
+@generator(2021, 6)
+def lanternfish(random: Random, scale: float) -> str:
+    return ','.join(str(random.randint(1, 5)) for _ in range(count(300, scale))) + '\n'
+
+@generator(2021, 7)
+def treachery_of_whales(random: Random, scale: float) -> str:
+    return ','.join(str(int(random.expovariate(1 / 400))) for _ in range(count(1000, scale))) + '\n'
+
+DIGIT_SEGMENTS = ['abcefg', 'cf', 'acdeg', 'acdfg', 'bcdf', 'abdfg', 'abdefg', 'acf', 'abcdefg', 'abcdfg']
+
+@generator(2021, 8)
+def seven_segment_search(random: Random, scale: float) -> str:
+    entries = []
+    for _ in range(count(200, scale)):
+        wiring = dict(zip('abcdefg', random.sample('abcdefg', 7)))
+        digits = [''.join(random.sample([wiring[segment] for segment in segments], len(segments))) for segments in DIGIT_SEGMENTS]
+        patterns = random.sample(digits, 10)
+        output = [''.join(random.sample(digit, len(digit))) for digit in random.choices(digits, k=4)]
+        entries.append(f'{" ".join(patterns)} | {" ".join(output)}')
+    return lines(entries)
+
+@generator(2021, 9)
+def smoke_basin(random: Random, scale: float) -> str:
+    width = side(100, scale)
+    rows = []
+    for _ in range(width):
+        # Walls of 9s cover half the map so that basins stay small, as in the official input
+        rows.append(''.join('9' if random.random() < 0.5 else str(random.randint(0, 8)) for _ in range(width)))
+    return lines(rows)
+
+BRACKETS = {'(': ')', '[': ']', '{': '}', '<': '>'}
+
+@generator(2021, 10)
+def syntax_scoring(random: Random, scale: float) -> str:
+    rows = []
+    for _ in range(count(110, scale)):
+        stack, line = [], []
+        for _ in range(random.randint(80, 110)):
+            if stack and random.random() < 0.45:
+                line.append(BRACKETS[stack.pop()])
+            else:
+                stack.append(random.choice(list(BRACKETS)))
+                line.append(stack[-1])
+
+        if not stack:
+            stack.append(random.choice(list(BRACKETS)))
+            line.append(stack[-1])
+
+        # About half the lines are corrupted by a wrong closing character, the rest are left incomplete
+        if stack and random.random() < 0.5:
+            line.append(random.choice([closing for closing in BRACKETS.values() if closing != BRACKETS[stack[-1]]]))
+        rows.append(''.join(line))
+    return lines(rows)
+
+def synchronizes(energies: bytearray, width: int, limit: int = 1000) -> bool:
+    """ Whether every octopus flashes in the same step within `limit` steps, as the puzzle promises real inputs do. """
+    energies, neighbors = bytearray(energies), neighbor_table(width, len(energies) // width, ADJACENT, False)
+    for _ in range(limit):
+        flashing = [index for index in range(len(energies)) if energies[index] == 9]
+        for index in range(len(energies)):
+            energies[index] += 1
+
+        flashed = len(flashing)
+        while flashing:
+            for neighbor in neighbors[flashing.pop()]:
+                energies[neighbor] += 1
+                if energies[neighbor] == 10:
+                    flashing.append(neighbor)
+                    flashed += 1
+
+        if flashed == len(energies):
+            return True
+        energies = bytearray(energy if energy <= 9 else 0 for energy in energies)
+    return False
+
+@generator(2021, 11)
+def dumbo_octopus(random: Random, scale: float) -> str:
+    # Random energies mostly settle into loops that never flash all at once, and part 2 would never finish,
+    # so octopuses start level with a few stragglers, redrawn in the rare case they still don't synchronize
+    width = side(10, scale)
+    while True:
+        level = random.randrange(10)
+        energies = bytearray(random.randrange(10) if random.random() < 0.05 else level for _ in range(width * width))
+        if synchronizes(energies, width):
+            return lines([''.join(map(str, energies[row:row + width])) for row in range(0, width * width, width)])
+
+@generator(2021, 14)
+def extended_polymerization(random: Random, scale: float) -> str:
+    elements = 'BCFHKNOPSV'
+    template = ''.join(random.choices(elements, k=count(20, scale)))
+    rules = [f'{a}{b} -> {random.choice(elements)}' for a in elements for b in elements]
+    return template + '\n\n' + lines(rules)
+
+@generator(2021, 15)
+def chiton(random: Random, scale: float) -> str:
+    width = side(100, scale)
+    return digit_grid(random, width, width, '123456789')
+
+@generator(2021, 17)
+def trick_shot(random: Random, scale: float) -> str:
+    x1, y1 = round(80 * scale ** 0.5), -round(176 * scale ** 0.5)
+    x2, y2 = x1 + round(60 * scale ** 0.5), y1 + round(60 * scale ** 0.5)
+    return f'target area: x={x1}..{x2}, y={y1}..{y2}\n'
+
+def snailfish_number(random: Random, depth: int = 0) -> str:
+    # Already reduced: nothing nested inside four pairs and every regular number below 10
+    if depth == 4 or (depth > 1 and random.random() < 0.4):
+        return str(random.randint(0, 9))
+    return f'[{snailfish_number(random, depth + 1)},{snailfish_number(random, depth + 1)}]'
+
+@generator(2021, 18)
+def snailfish(random: Random, scale: float) -> str:
+    return lines([snailfish_number(random) for _ in range(count(100, scale))])
+
+@generator(2021, 20)
+def trench_map(random: Random, scale: float) -> str:
+    # A lit background must go dark again on the next step, or the infinite image never settles
+    key = ['#' if random.random() < 0.5 else '.' for _ in range(512)]
+    if key[0] == '#':
+        key[511] = '.'
+    width = side(100, scale)
+    return ''.join(key) + '\n\n' + char_grid(random, width, width, '#.', [1, 1])
+
+@generator(2021, 22)
+def reactor_reboot(random: Random, scale: float) -> str:
+    steps = []
+    for step in range(count(420, scale)):
+        # The first steps are the small initialization procedure, the rest cover the whole reactor
+        extent, size = (50, 50) if step < 20 else (100000, 50000)
+        ranges = []
+        for _ in range(3):
+            low = random.randint(-extent, extent - 1)
+            ranges.append((low, low + random.randint(1, size)))
+        command = 'on' if step < 10 or random.random() < 0.6 else 'off'
+        steps.append(f'{command} ' + ','.join(f'{axis}={low}..{high}' for axis, (low, high) in zip('xyz', ranges)))
+    return lines(steps)
+
+@generator(2021, 25)
+def sea_cucumber(random: Random, scale: float) -> str:
+    height = side(137, scale)
+    width = height + height // 2
+    rows = [random.choices('.>v', [2, 1, 1], k=width) for _ in range(height)]
+
+    # A row of east-facing and a column of south-facing sea cucumbers can never move, so every
+    # other one piles up against them eventually instead of circling the wrapping map forever
+    wall_x, wall_y = random.randrange(width), random.randrange(height)
+    for y in range(height):
+        rows[y][wall_x] = 'v'
+    rows[wall_y] = ['>'] * width
+    return lines([''.join(row) for row in rows])
+
+# 2022
+@generator(2022, 1)
+def calorie_counting(random: Random, scale: float) -> str:
+    elves = []
+    for _ in range(count(250, scale)):
+        elves.append('\n'.join(str(random.randint(1000, 60000)) for _ in range(random.randint(1, 15))))
+    return '\n\n'.join(elves) + '\n'
+
+@generator(2022, 2)
+def rock_paper_scissors(random: Random, scale: float) -> str:
+    return lines([f'{random.choice("ABC")} {random.choice("XYZ")}' for _ in range(count(2500, scale))])
+
+@generator(2022, 3)
+def rucksack_reorganization(random: Random, scale: float) -> str:
+    rucksacks = []
+    for _ in range(count(100, scale)):
+        # Apart from their shared badge the three rucksacks in a group use disjoint items, and
+        # each one's compartments only have their misplaced item in common
+        badge, *items = random.sample(ascii_letters, len(ascii_letters))
+        for elf in range(3):
+            misplaced, *others = items[elf * 17:elf * 17 + 16]
+            compartments = [[misplaced, badge] + others[:7], [misplaced] + others[7:]]
+            size = random.randint(9, 16)
+            for compartment in compartments:
+                compartment += random.choices(compartment, k=size - len(compartment))
+                random.shuffle(compartment)
+            rucksacks.append(''.join(compartments[0] + compartments[1]))
+    return lines(rucksacks)
+
+@generator(2022, 4)
+def camp_cleanup(random: Random, scale: float) -> str:
+    pairs = []
+    for _ in range(count(1000, scale)):
+        ranges = []
+        for _ in range(2):
+            low = random.randint(1, 99)
+            ranges.append(f'{low}-{random.randint(low, 99)}')
+        pairs.append(','.join(ranges))
+    return lines(pairs)
+
+@generator(2022, 6)
+def tuning_trouble(random: Random, scale: float) -> str:
+    # Few distinct letters up front push the first packet and message markers towards the end
+    noise = ''.join(random.choices(ascii_lowercase[:3], k=count(4096, scale) - 14))
+    return noise + ''.join(random.sample(ascii_lowercase, 14)) + '\n'
+
+@generator(2022, 7)
+def no_space_left_on_device(random: Random, scale: float) -> str:
+    # Each directory hangs off a random earlier one, which keeps the tree about as deep as the official one
+    directories = count(180, scale)
+    children: list[list[int]] = [[] for _ in range(directories)]
+    for directory in range(1, directories):
+        children[random.randrange(directory)].append(directory)
+
+    # About two files per directory averaging half of `largest` use around 45MB, so part 2 has to free some space
+    largest = 45000000 // directories
+    log = []
+
+    def explore(directory: int, name: str) -> None:
+        log.extend([f'$ cd {name}', '$ ls'])
+        names = random.sample(range(26 ** 3), len(children[directory]) + random.randint(0, 4))
+        names = [''.join(ascii_lowercase[n // 26 ** i % 26] for i in range(3)) for n in names]
+        subdirectories = names[:len(children[directory])]
+        log.extend(f'dir {subdirectory}' for subdirectory in subdirectories)
+        log.extend(f'{random.randint(1, largest)} {file}.{random.choice(["txt", "dat", "log"])}' for file in names[len(subdirectories):])
+
+        for child, subdirectory in zip(children[directory], subdirectories):
+            explore(child, subdirectory)
+        log.append('$ cd ..')
+
+    explore(0, '/')
+    return lines(log[:-1])
+
+@generator(2022, 8)
+def treetop_tree_house(random: Random, scale: float) -> str:
+    width = side(99, scale)
+    return digit_grid(random, width, width)
+
+@generator(2022, 9)
+def rope_bridge(random: Random, scale: float) -> str:
+    return lines([f'{random.choice("UDLR")} {random.randint(1, 20)}' for _ in range(count(2000, scale))])
+
+@generator(2022, 12)
+def hill_climbing(random: Random, scale: float) -> str:
+    height = side(41, scale)
+    width = max(26, height * 4)
+    # Elevation rises smoothly from west to east, with a little noise that never blocks the way
+    rows = []
+    for _ in range(height):
+        row = []
+        for x in range(width):
+            level = min(25, x * 26 // width + random.randint(-1, 0))
+            row.append(ascii_lowercase[max(0, level)])
+        rows.append(row)
+    rows[height // 2][0] = 'S'
+    rows[height // 2][width - 1] = 'E'
+    return lines([''.join(row) for row in rows])
+
+@generator(2022, 14)
+def regolith_reservoir(random: Random, scale: float) -> str:
+    paths = []
+    depth = round(160 * scale ** 0.5)
+    for _ in range(count(180, scale)):
+        x, y = 500 + random.randint(-depth // 2, depth // 2), random.randint(15, depth)
+        points = [(x, y)]
+        for step in range(random.randint(1, 6)):
+            if step % 2 == 0:
+                x += random.randint(-8, 8) or 1
+            else:
+                y = max(1, y + (random.randint(-6, 6) or 1))
+            points.append((x, y))
+        paths.append(' -> '.join(f'{x},{y}' for x, y in points))
+    return lines(paths)
+
+@generator(2022, 15)
+def beacon_exclusion_zone(random: Random, scale: float) -> str:
+    sensors = []
+    for _ in range(count(35, scale)):
+        sx, sy = random.randint(0, 4000000), random.randint(0, 4000000)
+        bx, by = sx + random.randint(-800000, 800000), sy + random.randint(-800000, 800000)
+        sensors.append(f'Sensor at x={sx}, y={sy}: closest beacon is at x={bx}, y={by}')
+    return lines(sensors)
+
+@generator(2022, 18)
+def boiling_boulders(random: Random, scale: float) -> str:
+    size = round(20 * scale ** (1 / 3))
+    cubes = {(random.randrange(size), random.randrange(size), random.randrange(size)) for _ in range(count(2145, scale))}
+    return lines([f'{x},{y},{z}' for x, y, z in cubes])
+
+@generator(2022, 19)
+def not_enough_minerals(random: Random, scale: float) -> str:
+    blueprints = []
+    for number in range(1, count(30, scale) + 1):
+        blueprints.append(
+            f'Blueprint {number}: Each ore robot costs {random.randint(2, 4)} ore. '
+            f'Each clay robot costs {random.randint(2, 4)} ore. '
+            f'Each obsidian robot costs {random.randint(2, 4)} ore and {random.randint(5, 20)} clay. '
+            f'Each geode robot costs {random.randint(2, 4)} ore and {random.randint(7, 20)} obsidian.')
+    return lines(blueprints)
+
+@generator(2022, 20)
+def grove_positioning_system(random: Random, scale: float) -> str:
+    numbers = [random.randint(-10000, 10000) or 1 for _ in range(count(5000, scale) - 1)]
+    numbers.insert(random.randrange(len(numbers) + 1), 0)
+    return lines(map(str, numbers))
+
+# 2023
+DIGIT_WORDS = ['one', 'two', 'three', 'four', 'five', 'six', 'seven', 'eight', 'nine']
+
+@generator(2023, 1)
+def trebuchet(random: Random, scale: float) -> str:
+    rows = []
+    for _ in range(count(1000, scale)):
+        pieces = [random.choice([random.choice('123456789'), random.choice(DIGIT_WORDS), ''.join(random.choices(ascii_lowercase, k=3))]) for _ in range(6)]
+        pieces.insert(random.randrange(7), random.choice('123456789'))
+        rows.append(''.join(pieces))
+    return lines(rows)
+
+@generator(2023, 2)
+def cube_conundrum(random: Random, scale: float) -> str:
+    games = []
+    for number in range(1, count(100, scale) + 1):
+        rounds = []
+        for _ in range(random.randint(1, 6)):
+            colours = random.sample(['red', 'green', 'blue'], random.randint(1, 3))
+            rounds.append(', '.join(f'{random.randint(1, 20)} {colour}' for colour in colours))
+        games.append(f'Game {number}: ' + '; '.join(rounds))
+    return lines(games)
+
+@generator(2023, 3)
+def gear_ratios(random: Random, scale: float) -> str:
+    width = side(140, scale)
+    rows = []
+    for _ in range(width):
+        row = ''
+        while len(row) < width:
+            roll = random.random()
+            if roll < 0.1:
+                row += str(random.randint(1, 999))
+            elif roll < 0.13:
+                row += random.choice('*#+$/=%@&-')
+            else:
+                row += '.'
+        rows.append(row[:width])
+    return lines(rows)
+
+@generator(2023, 4)
+def scratchcards(random: Random, scale: float) -> str:
+    cards, total = [], count(201, scale)
+    for number in range(1, total + 1):
+        numbers = random.sample(range(1, 100), 35)
+        winning, have = numbers[:10], random.sample(numbers[:10], random.randint(0, 4)) + numbers[10:]
+        random.shuffle(have)
+        have = have[:25]
+        # Copies never run past the end of the table, and every card has the same count of numbers
+        spare = [n for n in range(1, 100) if n not in winning and n not in have]
+        while sum(n in winning for n in have) > total - number:
+            have[next(i for i, n in enumerate(have) if n in winning)] = spare.pop()
+        cards.append(f'Card {number:>{len(str(total))}}: ' + ' '.join(f'{n:>2}' for n in winning) + ' | ' + ' '.join(f'{n:>2}' for n in have))
+    return lines(cards)
+
+@generator(2023, 7)
+def camel_cards(random: Random, scale: float) -> str:
+    return lines([f'{"".join(random.choices("AKQJT98765432", k=5))} {random.randint(1, 1000)}' for _ in range(count(1000, scale))])
+
+@generator(2023, 9)
+def mirage_maintenance(random: Random, scale: float) -> str:
+    histories = []
+    for _ in range(count(200, scale)):
+        # Polynomial sequences always reach a row of zeroes
+        coefficients = [random.randint(-5, 5) for _ in range(random.randint(2, 6))]
+        histories.append(' '.join(str(sum(c * x ** i for i, c in enumerate(coefficients))) for x in range(21)))
+    return lines(histories)
+
+@generator(2023, 11)
+def cosmic_expansion(random: Random, scale: float) -> str:
+    width = side(140, scale)
+    rows = [['.'] * width for _ in range(width)]
+    empty_rows = set(random.sample(range(width), width // 14))
+    empty_columns = set(random.sample(range(width), width // 14))
+
+    # The official image has around 440 galaxies in 140x140
+    for _ in range(count(440, scale)):
+        x, y = random.randrange(width), random.randrange(width)
+        if x not in empty_columns and y not in empty_rows:
+            rows[y][x] = '#'
+    return lines([''.join(row) for row in rows])
+
+# 2024
+@generator(2024, 1)
+def historian_hysteria(random: Random, scale: float) -> str:
+    return lines([f'{random.randint(10000, 99999)}   {random.randint(10000, 99999)}' for _ in range(count(1000, scale))])
+
+@generator(2024, 2)
+def red_nosed_reports(random: Random, scale: float) -> str:
+    reports = []
+    for _ in range(count(1000, scale)):
+        level, direction, levels = random.randint(1, 90), random.choice([1, -1]), []
+        for _ in range(random.randint(5, 8)):
+            levels.append(level)
+            level += direction * random.choice([1, 2, 3, 3, 4])
+        reports.append(' '.join(map(str, levels)))
+    return lines(reports)
+
+@generator(2024, 3)
+def mull_it_over(random: Random, scale: float) -> str:
+    noise = ['what()', 'do()', "don't()", 'mul(4*', ')', '%&', 'from()', ' ', 'mul[3,7]']
+    rows, row = [], ''
+    for _ in range(count(3200, scale)):
+        if random.random() < 0.4:
+            row += f'mul({random.randint(1, 999)},{random.randint(1, 999)})'
+        else:
+            row += random.choice(noise)
+
+        # Instructions are never split across lines, as in the official input
+        if len(row) > 3200:
+            rows.append(row)
+            row = ''
+    return lines(rows + [row] if row else rows)
@@ -0,0 +1,213 @@
+""" A rectangular grid of single-byte cells, stored row-major in one flat `bytearray`.
+
+Cells are addressed by a single integer index (`y * width + x`) rather than
+coordinate tuples. Neighbours come from a few index offsets per kind of cell
+(interior, or near a particular edge), worked out once per grid shape, so
+neither walking a grid nor preparing to allocates anything per cell.
+"""
+from array import array
+from functools import lru_cache
+from itertools import chain
+from typing import TYPE_CHECKING, Iterator, NamedTuple, Optional, Union
+
+from aoc.inputs import Input
+from aoc.memo import memoize
+
+if TYPE_CHECKING:
+    import numpy
+
+Delta = tuple[int, int]
+
+# (dx, dy) steps, with y growing downwards
+NORTH, EAST, SOUTH, WEST = (0, -1), (1, 0), (0, 1), (-1, 0)
+ORTHOGONAL: tuple[Delta, ...] = (NORTH, EAST, SOUTH, WEST)
+DIAGONAL: tuple[Delta, ...] = ((1, -1), (1, 1), (-1, 1), (-1, -1))
+ADJACENT: tuple[Delta, ...] = ORTHOGONAL + DIAGONAL
+
+# Maps ASCII digits to their values, for `Grid.parse(puzzle, DIGITS)`
+DIGITS = bytes.maketrans(b'0123456789', bytes(range(10)))
+
+# Shift tables take 8 bytes a cell, so their cache is bounded by memory rather than by count
+SHIFT_CACHE_BYTES = 64 * 1024 * 1024
+
+def kinds(length: int, steps: list[int], wrap: bool) -> tuple[list[int], list[tuple[Optional[int], ...]]]:
+    """ Sorts the positions along one axis by where each of `steps` takes them.
+
+    Returns each position's kind, and for each kind how far each step actually
+    moves (None where it would leave the grid). Only positions within a step of
+    an edge differ from the rest, so there are only a few kinds.
+    """
+    found: dict[tuple[Optional[int], ...], int] = {}
+    position_kinds = []
+    for position in range(length):
+        moves = []
+        for step in steps:
+            target = position + step
+            if wrap:
+                moves.append(target % length - position)
+            else:
+                moves.append(step if 0 <= target < length else None)
+        position_kinds.append(found.setdefault(tuple(moves), len(found)))
+    return position_kinds, list(found)
+
+class Neighbors:
+    """ For every index in a `width` x `height` grid, the indexes one step away along each of `deltas`.
+
+    Without wrapping, steps that would leave the grid are left out; with it they come back in on the opposite side.
+    Each cell's neighbours are its index plus the offsets for its column's and row's kinds (see `kinds`).
+    """
+
+    def __init__(self: 'Neighbors', width: int, height: int, deltas: tuple[Delta, ...] = ORTHOGONAL, wrap: bool = False):
+        self.width = width
+        self.columns, across = kinds(width, [dx for dx, _ in deltas], wrap)
+        self.rows, down = kinds(height, [dy for _, dy in deltas], wrap)
+        self.offsets = [
+            [tuple(dx + dy * width for dx, dy in zip(xs, ys) if dx is not None and dy is not None) for xs in across]
+            for ys in down
+        ]
+
+    def __len__(self: 'Neighbors') -> int:
+        return self.width * len(self.rows)
+
+    def __getitem__(self: 'Neighbors', index: int) -> Iterator[int]:
+        y, x = divmod(index, self.width)
+        return map(index.__add__, self.offsets[self.rows[y]][self.columns[x]])
+
+# Each table is only a few offsets per row and column, so keeping a handful of shapes costs little
+@lru_cache(maxsize=16)
+def neighbor_table(width: int, height: int, deltas: tuple[Delta, ...] = ORTHOGONAL, wrap: bool = False) -> Neighbors:
+    return Neighbors(width, height, deltas, wrap)
+
+@memoize(max_bytes=SHIFT_CACHE_BYTES)
+def shift_table(width: int, height: int, delta: Delta, wrap: bool = False) -> array:
+    """ For every index, the index one `delta` step away, or -1 if that leaves the (non-wrapping) grid, in one flat array. """
+    dx, dy = delta
+    table = array('q', [-1]) * (width * height)
+    for y in range(height):
+        ny = (y + dy) % height if wrap else y + dy
+        if not 0 <= ny < height:
+            continue
+
+        # Within a row the targets run consecutively (wrapping around once, at most)
+        row, target = y * width, ny * width
+        if wrap:
+            shift = dx % width
+            table[row:row + width] = array('q', chain(range(target + shift, target + width), range(target, target + shift)))
+        else:
+            start, end = max(0, -dx), min(width, width - dx)
+            if start < end:
+                table[row + start:row + end] = array('q', range(target + start + dx, target + end + dx))
+    return table
+
+class Grid(NamedTuple):
+    width: int
+    height: int
+    cells: bytearray
+
+    @staticmethod
+    def parse(puzzle: Union[Input, bytes], translate: Optional[bytes] = None) -> 'Grid':
+        """ Reads a block of equal-length lines in one go, optionally mapping each byte through a `bytes.maketrans` table. """
+        lines = puzzle.byte_lines() if isinstance(puzzle, Input) else puzzle.splitlines()
+        return Grid.from_rows([line for line in lines if line], translate)
+
+    @staticmethod
+    def from_rows(rows: list[bytes], translate: Optional[bytes] = None) -> 'Grid':
+        if len(rows) == 0:
+            return Grid(0, 0, bytearray())
+
+        width = len(rows[0])
+        if any(len(row) != width for row in rows):
+            raise ValueError('Every row of a grid must be the same width')
+
+        cells = bytearray().join(rows)
+        if translate is not None:
+            cells = cells.translate(translate)
+
+        return Grid(width, len(rows), cells)
+
+    @staticmethod
+    def filled(width: int, height: int, value: int = 0) -> 'Grid':
+        return Grid(width, height, bytearray([value]) * (width * height))
+
+    def copy(self: 'Grid') -> 'Grid':
+        return Grid(self.width, self.height, self.cells[:])
+
+    @property
+    def size(self: 'Grid') -> int:
+        return len(self.cells)
+
+    def index(self: 'Grid', x: int, y: int) -> int:
+        return y * self.width + x
+
+    def position(self: 'Grid', index: int) -> tuple[int, int]:
+        """ The (x, y) of an index. """
+        y, x = divmod(index, self.width)
+        return x, y
+
+    def contains(self: 'Grid', x: int, y: int) -> bool:
+        return 0 <= x < self.width and 0 <= y < self.height
+
+    def get(self: 'Grid', x: int, y: int, default: Optional[int] = None) -> Optional[int]:
+        return self.cells[y * self.width + x] if self.contains(x, y) else default
+
+    def find(self: 'Grid', value: int) -> int:
+        """ The index of the first cell holding `value`, or -1. """
+        return self.cells.find(value)
+
+    def find_all(self: 'Grid', value: int) -> Iterator[int]:
+        index = self.cells.find(value)
+        while index != -1:
+            yield index
+            index = self.cells.find(value, index + 1)
+
+    def row(self: 'Grid', y: int) -> memoryview:
+        """ A writable view of one row. """
+        return memoryview(self.cells)[y * self.width:(y + 1) * self.width]
+
+    def column(self: 'Grid', x: int) -> memoryview:
+        """ A writable (strided) view of one column. """
+        return memoryview(self.cells)[x::self.width]
+
+    def rows(self: 'Grid') -> Iterator[memoryview]:
+        for y in range(self.height):
+            yield self.row(y)
+
+    def columns(self: 'Grid') -> Iterator[memoryview]:
+        for x in range(self.width):
+            yield self.column(x)
+
+    def neighbors(self: 'Grid', deltas: tuple[Delta, ...] = ORTHOGONAL, wrap: bool = False) -> Neighbors:
+        """ The neighbours of each cell for this grid's shape, indexed by cell (see `Neighbors`). """
+        return neighbor_table(self.width, self.height, deltas, wrap)
+
+    def shifted(self: 'Grid', delta: Delta, wrap: bool = False) -> array:
+        """ The shift table for this grid's shape, indexed by cell (see `shift_table`). """
+        return shift_table(self.width, self.height, delta, wrap)
+
+    def line(self: 'Grid', index: int, delta: Delta) -> Iterator[int]:
+        """ Indexes from `index` (inclusive) stepping by `delta` until the edge of the grid. """
+        (x, y), (dx, dy) = self.position(index), delta
+        step = dy * self.width + dx
+        while 0 <= x < self.width and 0 <= y < self.height:
+            yield index
+            x, y, index = x + dx, y + dy, index + step
+
+    def pad(self: 'Grid', amount: int, value: int) -> 'Grid':
+        """ A copy with `amount` cells of `value` added on every side. """
+        width = self.width + 2 * amount
+        edge = bytearray([value]) * amount
+        cells = bytearray([value]) * (width * amount)
+        for row in self.rows():
+            cells += edge + row + edge
+        cells += bytearray([value]) * (width * amount)
+        return Grid(width, self.height + 2 * amount, cells)
+
+    def array(self: 'Grid') -> 'numpy.ndarray':
+        """ A (height, width) uint8 NumPy view sharing this grid's memory. Requires NumPy. """
+        import numpy
+        return numpy.frombuffer(self.cells, dtype=numpy.uint8).reshape(self.height, self.width)
+
+    def render(self: 'Grid', symbols: Optional[bytes] = None) -> str:
+        """ The grid as lines of text, optionally mapping each cell value through `symbols`. """
+        cells = self.cells if symbols is None else bytes(symbols[cell] for cell in self.cells)
+        return '\n'.join(cells[y * self.width:(y + 1) * self.width].decode() for y in range(self.height))
@@ -0,0 +1,106 @@
+""" What each day pays at startup to import its dependencies, from `python -X importtime`.
+
+Each day's `main.py` is executed in a fresh interpreter under a name other
+than `__main__`, so its imports run but its `__main__` block doesn't. Modules
+the bare interpreter already imports at startup are left out, so what's
+reported is what the day itself adds:
+
+- its total import time, and its heaviest direct imports (with everything
+  they pulled in),
+- across all the days audited, the modules costing the most in total, which
+  are the best candidates for `aoc.lazy`.
+
+Import times are noisy at this scale, so each day is run several times and
+the fastest run is kept.
+"""
+import subprocess
+import sys
+from collections import defaultdict
+from typing import NamedTuple
+
+from aoc.bench import ENVIRONMENT
+from aoc.solutions import day_directory
+
+# Runs `main.py` as a plain module, without importing anything itself
+LOADER = "path = 'main.py'; exec(compile(open(path).read(), path, 'exec'), {'__name__': 'audit', '__file__': path})"
+
+class Import(NamedTuple):
+    name: str
+    depth: int
+    # Microseconds, as reported by -X importtime
+    self_time: int
+    cumulative: int
+
+class Audit(NamedTuple):
+    name: str
+    imports: list[Import]
+
+    @property
+    def total(self: 'Audit') -> int:
+        return sum(module.cumulative for module in self.direct)
+
+    @property
+    def direct(self: 'Audit') -> list[Import]:
+        """ What `main.py` imports itself, heaviest first. """
+        return sorted((module for module in self.imports if module.depth == 0), key=lambda module: module.cumulative, reverse=True)
+
+def parse_importtime(text: str) -> list[Import]:
+    """ The modules listed by -X importtime, in the order they finished importing (dependencies before their importers). """
+    found = []
+    for line in text.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_time, cumulative, name = line[len('import time:'):].split('|')
+        stripped = name.lstrip(' ')
+        # The name is indented by two spaces for each level of nesting, after the one separating it from the bar
+        found.append(Import(stripped.rstrip(), (len(name) - len(stripped) - 1) // 2, int(self_time), int(cumulative)))
+    return found
+
+def importtime(code: str, cwd: str = '.') -> list[Import]:
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', code], cwd=cwd, env=ENVIRONMENT, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(f'exited with {result.returncode}:\n{result.stderr}')
+    return parse_importtime(result.stderr)
+
+def startup() -> set[str]:
+    """ The modules a bare interpreter imports before running any code. """
+    return {module.name for module in importtime('pass')}
+
+def audit(year: int, day: int, runs: int = 3, preloaded: frozenset[str] = frozenset()) -> Audit:
+    """ The imports of `main.py` beyond the `preloaded` ones, from its fastest of `runs` fresh interpreters. """
+    fastest = None
+    for _ in range(runs):
+        imports = [module for module in importtime(LOADER, str(day_directory(year, day))) if module.name not in preloaded]
+        candidate = Audit(f'{year}/day{day}', imports)
+        if fastest is None or candidate.total < fastest.total:
+            fastest = candidate
+
+    assert fastest is not None
+    return fastest
+
+def heaviest_modules(audits: list[Audit], top: int) -> list[tuple[str, int, int]]:
+    """ The modules with the most import time of their own summed across days, as (name, days importing it, total microseconds). """
+    days, totals = defaultdict(int), defaultdict(int)
+    for day in audits:
+        # Failed attempts (e.g. platform-specific modules) are listed every time they're tried
+        for name in {module.name for module in day.imports}:
+            days[name] += 1
+        for module in day.imports:
+            totals[module.name] += module.self_time
+
+    return sorted(((name, days[name], total) for name, total in totals.items()), key=lambda entry: entry[2], reverse=True)[:top]
+
+def format_milliseconds(microseconds: int) -> str:
+    return f'{microseconds / 1000:.1f}ms'
+
+def format_audit(audit: Audit, top: int) -> str:
+    heaviest = ', '.join(f'{module.name} {format_milliseconds(module.cumulative)}' for module in audit.direct[:top])
+    return f'{audit.name:<12} {format_milliseconds(audit.total):>8} {len(audit.imports):>7}  {heaviest}'
+
+def format_totals(audits: list[Audit], top: int) -> str:
+    total = sum(audit.total for audit in audits)
+    lines = [f'{len(audits)} days import for {format_milliseconds(total)} in total, {format_milliseconds(total // max(1, len(audits)))} on average']
+    lines.append(f'  {"module":<32} {"days":>5} {"self time":>10}')
+    for name, days, microseconds in heaviest_modules(audits, top):
+        lines.append(f'  {name:<32} {days:>5} {format_milliseconds(microseconds):>10}')
+    return '\n'.join(lines)
@@ -0,0 +1,94 @@
+import os
+import sys
+from mmap import ACCESS_READ, mmap
+from stat import S_ISREG
+from typing import TYPE_CHECKING, Iterator, Union
+
+from aoc import parsing
+
+# Every day imports this module, and pathlib pulls in urllib.parse and ipaddress at startup
+if TYPE_CHECKING:
+    from pathlib import Path
+
+Buffer = Union[bytes, mmap]
+
+class Input:
+    """ A puzzle input, memory-mapped when it comes from a regular file.
+
+    Solutions read from this instead of `stdin` so that large inputs aren't
+    materialised as one big string plus a list of per-line strings before
+    parsing starts.
+    """
+
+    def __init__(self: 'Input', buffer: Buffer):
+        self._buffer = buffer
+
+    @staticmethod
+    def open(path: Union[str, 'Path']) -> 'Input':
+        with open(path, 'rb') as file:
+            return Input.from_file(file.fileno())
+
+    @staticmethod
+    def from_stdin() -> 'Input':
+        """ Maps stdin when it's redirected from a file, otherwise reads it (e.g. from a pipe). """
+        return Input.from_file(sys.stdin.fileno())
+
+    @staticmethod
+    def from_file(fd: int) -> 'Input':
+        status = os.fstat(fd)
+
+        # Empty files can't be mapped, and pipes can't be mapped at all
+        if S_ISREG(status.st_mode) and status.st_size > 0:
+            return Input(mmap(fd, 0, access=ACCESS_READ))
+
+        with os.fdopen(os.dup(fd), 'rb') as file:
+            return Input(file.read())
+
+    @staticmethod
+    def from_text(text: str) -> 'Input':
+        return Input(text.encode())
+
+    def __len__(self: 'Input') -> int:
+        return len(self._buffer)
+
+    @property
+    def view(self: 'Input') -> memoryview:
+        """ A zero-copy view over the raw input bytes. """
+        return memoryview(self._buffer)
+
+    @property
+    def text(self: 'Input') -> str:
+        """ The whole input decoded, for solutions that genuinely need it as one string. """
+        return str(memoryview(self._buffer), 'utf-8')
+
+    def byte_lines(self: 'Input') -> Iterator[bytes]:
+        """ Lazily yields each line without its line ending, like `bytes.splitlines`. """
+        buffer, start, end = self._buffer, 0, len(self._buffer)
+
+        while start < end:
+            stop = buffer.find(b'\n', start)
+            if stop == -1:
+                stop = end
+
+            line = buffer[start:stop]
+            yield line[:-1] if line.endswith(b'\r') else line
+            start = stop + 1
+
+    def lines(self: 'Input') -> Iterator[str]:
+        """ Lazily yields each line decoded, like `str.splitlines`. """
+        for line in self.byte_lines():
+            yield line.decode()
+
+    def ints(self: 'Input') -> list[int]:
+        """ Every (optionally negative) integer in the input, in order, read straight from the bytes. """
+        return parsing.ints(self._buffer)
+
+    def close(self: 'Input') -> None:
+        if isinstance(self._buffer, mmap):
+            self._buffer.close()
+
+    def __enter__(self: 'Input') -> 'Input':
+        return self
+
+    def __exit__(self: 'Input', *_) -> None:
+        self.close()
@@ -0,0 +1,257 @@
+""" Integer intervals, sets of them, n-dimensional boxes and piecewise-linear range maps.
+
+Every interval is half-open, `[start, end)`, so adjacent intervals share an
+endpoint and lengths are `end - start` (an inclusive `lo..hi` is `Interval(lo, hi + 1)`).
+
+`IntervalSet` keeps its intervals sorted and disjoint as two parallel lists of
+endpoints rather than one object per interval, so adding or removing an interval
+is a binary search plus one splice.
+"""
+from bisect import bisect_left, bisect_right
+from typing import Iterable, Iterator, NamedTuple, Optional
+
+class Interval(NamedTuple):
+    start: int
+    end: int
+
+    def length(self: 'Interval') -> int:
+        return max(0, self.end - self.start)
+
+    def is_empty(self: 'Interval') -> bool:
+        return self.start >= self.end
+
+    def contains(self: 'Interval', other: 'Interval') -> bool:
+        """ Whether `other` lies entirely inside this interval. """
+        return self.start <= other.start and other.end <= self.end
+
+    def overlaps(self: 'Interval', other: 'Interval') -> bool:
+        return self.start < other.end and other.start < self.end
+
+    def intersection(self: 'Interval', other: 'Interval') -> Optional['Interval']:
+        start, end = max(self.start, other.start), min(self.end, other.end)
+        return Interval(start, end) if start < end else None
+
+class IntervalSet:
+    """ A set of integers stored as sorted, disjoint, non-touching intervals. """
+
+    def __init__(self: 'IntervalSet', intervals: Iterable[tuple[int, int]] = ()):
+        self.starts: list[int] = []
+        self.ends: list[int] = []
+
+        # Merging sorted intervals in one pass is cheaper than adding them one at a time
+        for start, end in sorted(intervals):
+            if start >= end:
+                continue
+            if self.ends and start <= self.ends[-1]:
+                if end > self.ends[-1]:
+                    self.ends[-1] = end
+            else:
+                self.starts.append(start)
+                self.ends.append(end)
+
+    def __len__(self: 'IntervalSet') -> int:
+        """ The number of disjoint intervals (see `total` for the number of integers). """
+        return len(self.starts)
+
+    def __iter__(self: 'IntervalSet') -> Iterator[Interval]:
+        return map(Interval, self.starts, self.ends)
+
+    def __contains__(self: 'IntervalSet', value: int) -> bool:
+        index = bisect_right(self.starts, value) - 1
+        return index >= 0 and value < self.ends[index]
+
+    def __eq__(self: 'IntervalSet', other: object) -> bool:
+        return isinstance(other, IntervalSet) and self.starts == other.starts and self.ends == other.ends
+
+    def __repr__(self: 'IntervalSet') -> str:
+        return f'IntervalSet({list(zip(self.starts, self.ends))})'
+
+    def copy(self: 'IntervalSet') -> 'IntervalSet':
+        copied = IntervalSet()
+        copied.starts, copied.ends = self.starts[:], self.ends[:]
+        return copied
+
+    def total(self: 'IntervalSet') -> int:
+        """ The number of integers in the set. """
+        return sum(self.ends) - sum(self.starts)
+
+    def add(self: 'IntervalSet', start: int, end: int) -> None:
+        if start >= end:
+            return
+
+        # Everything from the first interval ending at or after `start` to the last starting at or before `end` merges
+        first = bisect_left(self.ends, start)
+        last = bisect_right(self.starts, end, first)
+        if first < last:
+            start = min(start, self.starts[first])
+            end = max(end, self.ends[last - 1])
+
+        self.starts[first:last] = (start,)
+        self.ends[first:last] = (end,)
+
+    def discard(self: 'IntervalSet', start: int, end: int) -> None:
+        if start >= end:
+            return
+
+        first = bisect_right(self.ends, start)
+        last = bisect_left(self.starts, end, first)
+        if first >= last:
+            return
+
+        # Only the intervals at either end can stick out past the removed range
+        starts, ends = [], []
+        if self.starts[first] < start:
+            starts.append(self.starts[first])
+            ends.append(start)
+        if self.ends[last - 1] > end:
+            starts.append(end)
+            ends.append(self.ends[last - 1])
+
+        self.starts[first:last] = starts
+        self.ends[first:last] = ends
+
+    def union(self: 'IntervalSet', other: 'IntervalSet') -> 'IntervalSet':
+        return IntervalSet(zip(self.starts + other.starts, self.ends + other.ends))
+
+    def difference(self: 'IntervalSet', other: 'IntervalSet') -> 'IntervalSet':
+        result = self.copy()
+        for start, end in zip(other.starts, other.ends):
+            result.discard(start, end)
+        return result
+
+    def intersection(self: 'IntervalSet', other: 'IntervalSet') -> 'IntervalSet':
+        result = IntervalSet()
+        i = j = 0
+        while i < len(self.starts) and j < len(other.starts):
+            start = max(self.starts[i], other.starts[j])
+            end = min(self.ends[i], other.ends[j])
+            if start < end:
+                result.starts.append(start)
+                result.ends.append(end)
+
+            if self.ends[i] < other.ends[j]:
+                i += 1
+            else:
+                j += 1
+        return result
+
+    def clamp(self: 'IntervalSet', start: int, end: int) -> 'IntervalSet':
+        """ The part of the set inside `[start, end)`. """
+        return self.intersection(IntervalSet([(start, end)]))
+
+    def gaps(self: 'IntervalSet', start: int, end: int) -> Iterator[Interval]:
+        """ The intervals within `[start, end)` not in the set. """
+        index = max(0, bisect_right(self.starts, start) - 1)
+        position = start
+        while index < len(self.starts) and self.starts[index] < end:
+            if self.starts[index] > position:
+                yield Interval(position, self.starts[index])
+            position = max(position, self.ends[index])
+            index += 1
+
+        if position < end:
+            yield Interval(position, end)
+
+# A box is one interval per dimension
+Box = tuple[Interval, ...]
+
+def box_volume(box: Box) -> int:
+    volume = 1
+    for side in box:
+        volume *= side.length()
+    return volume
+
+def box_intersection(a: Box, b: Box) -> Optional[Box]:
+    sides = []
+    for side_a, side_b in zip(a, b):
+        side = side_a.intersection(side_b)
+        if side is None:
+            return None
+        sides.append(side)
+    return tuple(sides)
+
+def box_difference(a: Box, b: Box) -> list[Box]:
+    """ `a` without `b`, as at most `2n` disjoint boxes. """
+    overlap = box_intersection(a, b)
+    if overlap is None:
+        return [a]
+
+    # Peel off the slabs below and above the overlap one dimension at a time, narrowing what's left to the overlap
+    pieces, remaining = [], list(a)
+    for dimension, (side, middle) in enumerate(zip(a, overlap)):
+        for cut in (Interval(side.start, middle.start), Interval(middle.end, side.end)):
+            if not cut.is_empty():
+                remaining[dimension] = cut
+                pieces.append(tuple(remaining))
+        remaining[dimension] = middle
+
+    return pieces
+
+class BoxSet:
+    """ A union of n-dimensional boxes, kept as a list of disjoint boxes. """
+
+    def __init__(self: 'BoxSet'):
+        self.boxes: list[Box] = []
+
+    def __len__(self: 'BoxSet') -> int:
+        return len(self.boxes)
+
+    def __iter__(self: 'BoxSet') -> Iterator[Box]:
+        return iter(self.boxes)
+
+    def volume(self: 'BoxSet') -> int:
+        return sum(map(box_volume, self.boxes))
+
+    def discard(self: 'BoxSet', box: Box) -> None:
+        boxes = []
+        for existing in self.boxes:
+            boxes.extend(box_difference(existing, box))
+        self.boxes = boxes
+
+    def add(self: 'BoxSet', box: Box) -> None:
+        self.discard(box)
+        self.boxes.append(box)
+
+class RangeMap:
+    """ A piecewise-linear map on integers: each source interval is shifted by its own offset, and anything else maps to itself. """
+
+    def __init__(self: 'RangeMap', pieces: Iterable[tuple[int, int, int]]):
+        """ Takes `(source start, destination start, length)` triples, whose source intervals mustn't overlap. """
+        self.starts: list[int] = []
+        self.ends: list[int] = []
+        self.offsets: list[int] = []
+
+        for source, destination, length in sorted(pieces):
+            if self.ends and source < self.ends[-1]:
+                raise ValueError(f'Source ranges overlap at {source}')
+            self.starts.append(source)
+            self.ends.append(source + length)
+            self.offsets.append(destination - source)
+
+    def __getitem__(self: 'RangeMap', value: int) -> int:
+        index = bisect_right(self.starts, value) - 1
+        if index >= 0 and value < self.ends[index]:
+            return value + self.offsets[index]
+        return value
+
+    def map_interval(self: 'RangeMap', start: int, end: int) -> Iterator[tuple[int, int]]:
+        """ The image of `[start, end)`, as one interval per piece (or gap between pieces) that it crosses. """
+        index = max(0, bisect_right(self.starts, start) - 1)
+        while start < end:
+            if index >= len(self.starts) or end <= self.starts[index]:
+                yield start, end
+                return
+
+            if start < self.starts[index]:
+                yield start, self.starts[index]
+                start = self.starts[index]
+
+            if start < self.ends[index]:
+                stop = min(end, self.ends[index])
+                offset = self.offsets[index]
+                yield start + offset, stop + offset
+                start = stop
+            index += 1
+
+    def map_set(self: 'RangeMap', intervals: IntervalSet) -> IntervalSet:
+        return IntervalSet(image for start, end in zip(intervals.starts, intervals.ends) for image in self.map_interval(start, end))
@@ -0,0 +1,29 @@
+""" Deferring expensive imports until the code path that needs them runs.
+
+    multiprocessing = lazy('multiprocessing')
+    ...
+    with multiprocessing.Pool(32) as pool:   # imported here, on first use
+
+The module is registered in `sys.modules` straight away, but only executed
+when one of its attributes is first looked up, so a day (or command) that
+never reaches that code never pays for the import. `from x import y` can't be
+deferred this way, so callers keep the module and look names up on it.
+"""
+import sys
+from importlib.util import LazyLoader, find_spec, module_from_spec
+from types import ModuleType
+
+def lazy(name: str) -> ModuleType:
+    """ The module `name`, imported when it's first used rather than now (unless something has imported it already). """
+    if name in sys.modules:
+        return sys.modules[name]
+
+    spec = find_spec(name)
+    if spec is None or spec.loader is None:
+        raise ModuleNotFoundError(f'No module named {name!r}', name=name)
+
+    spec.loader = LazyLoader(spec.loader)
+    module = module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
@@ -0,0 +1,126 @@
+""" Memoization with compact keys, optional bounds and statistics.
+
+`memoize` works like `functools.lru_cache`, except that:
+
+- a `key` function turns the arguments into the cache key, so callers can key on a
+  few ints or a tuple rather than hashing whole objects (or can return None to
+  skip the cache for that call),
+- the cache can be bounded by entry count, by estimated memory, or both, and
+  evicts the least recently used entries first,
+- `cache_info()` also reports evictions and estimated memory.
+
+Every memo is registered in `MEMOS`, so `run --profile` can show whether each one
+is paying for itself.
+"""
+import sys
+from collections import OrderedDict
+from functools import update_wrapper
+from types import MethodType
+from typing import Any, Callable, Generic, Hashable, NamedTuple, Optional, TypeVar
+from weakref import WeakSet
+
+T = TypeVar('T')
+Key = Callable[..., Optional[Hashable]]
+
+class MemoInfo(NamedTuple):
+    name: str
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    maxsize: Optional[int]
+    bytes: int
+
+    @property
+    def hit_rate(self: 'MemoInfo') -> float:
+        calls = self.hits + self.misses
+        return self.hits / calls if calls else 0.0
+
+    def __str__(self: 'MemoInfo') -> str:
+        return (f'{self.name}: {self.hits} hits, {self.misses} misses ({self.hit_rate:.0%} hit rate), '
+                f'{self.entries} entries (~{self.bytes / 1024:.0f}KB), {self.evictions} evicted')
+
+def estimate(value: Any) -> int:
+    """ A rough size in bytes: the object itself plus, for tuples and frozensets, what they hold. """
+    size = sys.getsizeof(value)
+    if isinstance(value, (tuple, frozenset)):
+        size += sum(map(estimate, value))
+    return size
+
+def arguments_key(*args: Any, **kwargs: Any) -> Hashable:
+    return (args, tuple(sorted(kwargs.items()))) if kwargs else args
+
+MEMOS: 'WeakSet[Memo]' = WeakSet()
+
+# Cached values can be None, so a miss needs its own marker
+MISSING = object()
+
+class Memo(Generic[T]):
+    def __init__(self: 'Memo[T]', fn: Callable[..., T], key: Key = arguments_key, maxsize: Optional[int] = None, max_bytes: Optional[int] = None):
+        self.fn = fn
+        self.key = key
+        self.maxsize = maxsize
+        self.max_bytes = max_bytes
+        self.cache: dict[Hashable, T] = self.new_cache()
+        self.hits = self.misses = self.evictions = self.bytes = 0
+        update_wrapper(self, fn)
+        MEMOS.add(self)
+
+    @property
+    def bounded(self: 'Memo[T]') -> bool:
+        return self.maxsize is not None or self.max_bytes is not None
+
+    def __get__(self: 'Memo[T]', instance: Any, owner: Optional[type] = None) -> Any:
+        # Lets a memo decorate methods, binding the instance as the first argument like a plain function would
+        return self if instance is None else MethodType(self, instance)
+
+    def new_cache(self: 'Memo[T]') -> dict[Hashable, T]:
+        # Only a bounded cache needs to track recency
+        return OrderedDict() if self.bounded else {}
+
+    def __call__(self: 'Memo[T]', *args: Any, **kwargs: Any) -> T:
+        key = self.key(*args, **kwargs)
+        if key is None:
+            return self.fn(*args, **kwargs)
+
+        cache = self.cache
+        value = cache.get(key, MISSING)
+        if value is not MISSING:
+            self.hits += 1
+            if self.bounded:
+                cache.move_to_end(key)
+            return value
+
+        self.misses += 1
+        value = self.fn(*args, **kwargs)
+        cache[key] = value
+
+        if self.bounded:
+            if self.max_bytes is not None:
+                self.bytes += estimate(key) + estimate(value)
+            self.evict()
+
+        return value
+
+    def evict(self: 'Memo[T]') -> None:
+        while self.cache and ((self.maxsize is not None and len(self.cache) > self.maxsize) or (self.max_bytes is not None and self.bytes > self.max_bytes)):
+            key, value = self.cache.popitem(last=False)
+            if self.max_bytes is not None:
+                self.bytes -= estimate(key) + estimate(value)
+            self.evictions += 1
+
+    def cache_info(self: 'Memo[T]') -> MemoInfo:
+        # Without a memory bound the size isn't tracked as entries go in, so it's estimated now
+        size = self.bytes if self.max_bytes is not None else sum(estimate(key) + estimate(value) for key, value in self.cache.items())
+        return MemoInfo(self.__qualname__, self.hits, self.misses, self.evictions, len(self.cache), self.maxsize, size)
+
+    def cache_clear(self: 'Memo[T]') -> None:
+        """ Drops every entry, keeping the statistics. """
+        self.cache = self.new_cache()
+        self.bytes = 0
+
+def memoize(key: Key = arguments_key, maxsize: Optional[int] = None, max_bytes: Optional[int] = None) -> Callable[[Callable[..., T]], Memo[T]]:
+    """ Memoizes a function on `key(*args, **kwargs)`, keeping at most `maxsize` entries and about `max_bytes` of them. """
+    def decorate(fn: Callable[..., T]) -> Memo[T]:
+        return Memo(fn, key, maxsize, max_bytes)
+    return decorate
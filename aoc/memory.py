@@ -0,0 +1,162 @@
+""" Per-stage memory accounting, and a budget that stops a runaway day before it takes the machine down with it.
+
+`MemoryMonitor` is a runner hook that records, for every stage that runs:
+
+- the peak resident set size (RSS) of the process, which on Linux is reset at
+  the start of each stage (elsewhere it's the peak since the process started),
+- the peak of the memory traced by tracemalloc, i.e. allocated by Python.
+
+Given a limit, the RSS is checked after every few milliseconds of CPU time
+the stage uses (on a virtual interval timer, so it doesn't clash with the
+profiler's). Once the RSS goes over the limit, the stage is interrupted with
+`MemoryExceeded`, which reports the lines holding the most memory at that
+moment.
+
+Checking from a signal handler rather than a watcher thread means there's no
+thread holding a lock when a day forks a pool (e.g. 2022/day19), which could
+deadlock the pool's workers. Signal handlers only run on the main thread, so
+stages have to as well. Work done in child processes isn't counted.
+"""
+import os
+import re
+import resource
+import signal
+import sys
+import tracemalloc
+from contextlib import contextmanager
+from typing import ContextManager, Iterator, NamedTuple, Optional
+
+from aoc.profiling import IGNORED, location
+from aoc.solutions import Solution
+
+# Seconds of CPU time between checks of the RSS against the limit
+CHECK_INTERVAL = 0.01
+
+PEAK_RSS = re.compile(rb'VmHWM:\s*(\d+) kB')
+PAGE_SIZE = resource.getpagesize()
+
+class Usage(NamedTuple):
+    name: str
+    stage: str
+    peak_rss: int
+    traced_peak: int
+
+class MemoryExceeded(Exception):
+    def __init__(self: 'MemoryExceeded', name: str, stage: str, limit: int, rss: int, sites: list[str]):
+        super().__init__(name, stage, limit, rss, sites)
+        self.name = name
+        self.stage = stage
+        self.limit = limit
+        self.rss = rss
+        self.sites = sites
+
+    def __str__(self: 'MemoryExceeded') -> str:
+        lines = [f'{self.name} {self.stage} aborted: {format_bytes(self.rss)} resident, over the {format_bytes(self.limit)} limit']
+        lines.append(f'  {"size":>10} {"blocks":>10}  allocated at')
+        lines.extend(f'  {site}' for site in self.sites)
+        return '\n'.join(lines)
+
+def format_bytes(size: int) -> str:
+    return f'{size / 2**20:.1f}MB'
+
+def rss() -> int:
+    """ The resident set size of this process in bytes, or its peak where the current size isn't available. """
+    try:
+        with open('/proc/self/statm', 'rb') as statm:
+            return int(statm.read().split()[1]) * PAGE_SIZE
+    except OSError:
+        return peak_rss()
+
+def peak_rss() -> int:
+    try:
+        with open('/proc/self/status', 'rb') as status:
+            found = PEAK_RSS.search(status.read())
+        if found is not None:
+            return int(found.group(1)) * 1024
+    except OSError:
+        pass
+
+    # Kilobytes on Linux, but bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+def reset_peak_rss() -> bool:
+    """ Resets the peak RSS to the current RSS, returning False where that isn't supported (anything but Linux 4+). """
+    try:
+        with open('/proc/self/clear_refs', 'w') as clear_refs:
+            clear_refs.write('5')
+        return True
+    except OSError:
+        return False
+
+def forked() -> None:
+    # Work in child processes isn't counted, so a day's pool workers shouldn't pay for tracing it
+    if tracemalloc.is_tracing():
+        tracemalloc.stop()
+
+os.register_at_fork(after_in_child=forked)
+
+def top_sites(snapshot: tracemalloc.Snapshot, top: int) -> list[str]:
+    sites = []
+    for statistic in snapshot.filter_traces(IGNORED).statistics('lineno')[:top]:
+        frame = statistic.traceback[0]
+        sites.append(f'{statistic.size / 1024:>8.1f}KB {statistic.count:>10}  {location(frame.filename)}:{frame.lineno}')
+    return sites
+
+class MemoryMonitor:
+    """ A runner hook that records each stage's peak memory, and interrupts any stage whose RSS goes over `limit` bytes. """
+
+    def __init__(self: 'MemoryMonitor', limit: Optional[int] = None, top: int = 10, interval: float = CHECK_INTERVAL):
+        self.limit = limit
+        self.top = top
+        self.interval = interval
+        self.usages: list[Usage] = []
+
+    def __call__(self: 'MemoryMonitor', solution: Solution, stage: str) -> ContextManager[None]:
+        return self.monitor(solution, stage)
+
+    def check(self: 'MemoryMonitor', solution: Solution, stage: str) -> None:
+        assert self.limit is not None
+        current = rss()
+        if current <= self.limit:
+            return
+
+        # Taking the snapshot can outlast the interval, and the next check would interrupt it
+        signal.setitimer(signal.ITIMER_VIRTUAL, 0)
+        raise MemoryExceeded(solution.name, stage, self.limit, current, top_sites(tracemalloc.take_snapshot(), self.top))
+
+    @contextmanager
+    def checking(self: 'MemoryMonitor', solution: Solution, stage: str) -> Iterator[None]:
+        previous = signal.signal(signal.SIGVTALRM, lambda *_: self.check(solution, stage))
+        signal.setitimer(signal.ITIMER_VIRTUAL, self.interval, self.interval)
+        try:
+            yield
+        finally:
+            signal.setitimer(signal.ITIMER_VIRTUAL, 0)
+            signal.signal(signal.SIGVTALRM, previous)
+
+    @contextmanager
+    def monitor(self: 'MemoryMonitor', solution: Solution, stage: str) -> Iterator[None]:
+        tracing = tracemalloc.is_tracing()
+        if not tracing:
+            tracemalloc.start()
+        tracemalloc.reset_peak()
+        reset_peak_rss()
+
+        try:
+            if self.limit is None:
+                yield
+            else:
+                with self.checking(solution, stage):
+                    yield
+        finally:
+            _, traced_peak = tracemalloc.get_traced_memory()
+            if not tracing:
+                tracemalloc.stop()
+            self.usages.append(Usage(solution.name, stage, peak_rss(), traced_peak))
+
+    def summary(self: 'MemoryMonitor') -> str:
+        lines = [f'  {"stage":<8} {"peak rss":>10} {"traced":>10}']
+        for usage in self.usages:
+            lines.append(f'  {usage.stage:<8} {format_bytes(usage.peak_rss):>10} {format_bytes(usage.traced_peak):>10}')
+        return '\n'.join(lines)
@@ -0,0 +1,84 @@
+import json
+from pathlib import Path
+from traceback import format_exc
+from typing import Iterable, NamedTuple, Optional
+
+from aoc.bench import BASELINE_PATH, load_baseline
+from aoc.cache import Cache
+from aoc.lazy import lazy
+from aoc.runner import Report, run
+from aoc.solutions import ROOT, load
+
+futures = lazy('concurrent.futures')
+
+DURATIONS_PATH = ROOT / '.aoc' / 'durations.json'
+
+Day = tuple[int, int]
+
+class Outcome(NamedTuple):
+    year: int
+    day: int
+    report: Optional[Report]
+    error: Optional[str] = None
+
+def solve(year: int, day: int, parts: Optional[list[str]] = None, cache: Optional[Cache] = None) -> Outcome:
+    """ Runs a single day inside a pool worker. """
+    try:
+        report = run(load(year, day), parts=parts, cache=cache)
+    except Exception:
+        return Outcome(year, day, None, format_exc())
+
+    # Parsed structures can hold lambdas and other unpicklable values, and
+    # the parent only needs the answers and timings
+    timings = [timing._replace(result=None) if timing.stage == 'parse' else timing for timing in report.timings]
+    return Outcome(year, day, report._replace(timings=timings))
+
+def collect(future: 'futures.Future[Outcome]', year: int, day: int) -> Outcome:
+    """ A submitted day's outcome, recording a worker that died (e.g. killed for using too much memory) as that day failing. """
+    try:
+        return future.result()
+    except Exception:
+        # A dead worker breaks the whole pool, so every day still pending fails the same way
+        return Outcome(year, day, None, format_exc())
+
+def load_durations(path: Path = DURATIONS_PATH, baseline: Path = BASELINE_PATH) -> dict[str, float]:
+    """ Seconds each day took previously: recorded pool runs first, falling back to the benchmark baseline. """
+    durations = {name: benchmark.median for name, benchmark in load_baseline(baseline).items()}
+
+    if path.exists():
+        durations.update(json.loads(path.read_text()))
+
+    return durations
+
+def save_durations(outcomes: Iterable[Outcome], path: Path = DURATIONS_PATH) -> None:
+    durations = json.loads(path.read_text()) if path.exists() else {}
+
+    for outcome in outcomes:
+        # Cached answers say nothing about how long a day really takes
+        if outcome.report is not None and not outcome.report.cached:
+            durations[outcome.report.name] = outcome.report.wall
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(durations, indent=2, sort_keys=True) + '\n')
+
+def schedule(days: list[Day], durations: dict[str, float]) -> list[Day]:
+    """ Orders days longest-first so the expensive ones start immediately and cheap ones fill the gaps.
+
+    Days without any recorded duration might be expensive, so they go first.
+    """
+    unknown = float('inf')
+    return sorted(days, key=lambda day: durations.get(f'{day[0]}/day{day[1]}', unknown), reverse=True)
+
+def run_all(days: list[Day], jobs: Optional[int] = None, parts: Optional[list[str]] = None, cache: Optional[Cache] = None, durations_path: Path = DURATIONS_PATH) -> list[Outcome]:
+    """ Runs every day across a process pool, returning outcomes in year/day order. """
+    ordered = schedule(days, load_durations(durations_path))
+
+    with futures.ProcessPoolExecutor(max_workers=jobs) as executor:
+        submitted = {executor.submit(solve, year, day, parts, cache): (year, day) for year, day in ordered}
+        outcomes = [collect(future, *submitted[future]) for future in futures.as_completed(submitted)]
+
+    # Partial runs would understate a day's cost, so only full runs are recorded
+    if parts is None:
+        save_durations(outcomes, durations_path)
+
+    return sorted(outcomes, key=lambda outcome: (outcome.year, outcome.day))
@@ -0,0 +1,149 @@
+""" Per-stage profiling hooks for the runner.
+
+For every stage that runs, `Profiler` records:
+
+- a cProfile `.prof` file, for `python -m pstats` or snakeviz,
+- a `.folded` file of collapsed stacks sampled every millisecond of CPU time,
+  for flamegraph.pl, inferno or speedscope,
+- the peak memory traced by tracemalloc and the source lines holding the most
+  memory when the stage finishes,
+- how many nodes any `aoc.search` searches expanded and pushed,
+- the hits, misses and size of every `aoc.memo` cache the stage used.
+
+Work done in child processes (e.g. 2022/day19's pool) isn't seen by any of these.
+"""
+import contextlib
+import cProfile
+import pstats
+import signal
+import tracemalloc
+from collections import Counter
+from contextlib import contextmanager
+from pathlib import Path
+from types import CodeType, FrameType
+from typing import ContextManager, Iterator, Optional
+
+from aoc.runner import timed
+from aoc.memo import MEMOS, MemoInfo
+from aoc.search import TOTALS
+from aoc.solutions import ROOT, Solution
+
+SAMPLE_INTERVAL = 0.001
+
+# The profiling machinery itself, left out of the summaries
+OVERHEAD = [tracemalloc.__file__, contextlib.__file__, __file__]
+IGNORED = [tracemalloc.Filter(False, filename) for filename in OVERHEAD + ['<frozen importlib._bootstrap*>']]
+
+PREFIX = f'{ROOT}/'
+
+def location(filename: str) -> str:
+    return filename[len(PREFIX):] if filename.startswith(PREFIX) else Path(filename).name
+
+def code_label(code: CodeType) -> str:
+    # Semicolons separate frames in the collapsed format
+    return f'{code.co_name} ({location(code.co_filename)}:{code.co_firstlineno})'.replace(';', ',')
+
+class Sampler:
+    """ Collects collapsed stacks by interrupting the main thread on a CPU-time interval timer. """
+
+    def __init__(self: 'Sampler', interval: float = SAMPLE_INTERVAL):
+        self.interval = interval
+        self.stacks: Counter[tuple[CodeType, ...]] = Counter()
+        self.sampling = False
+
+    def sample(self: 'Sampler', _: int, frame: Optional[FrameType]) -> None:
+        # Walking a deep stack can outlast the interval, and the next signal would interrupt this one
+        if self.sampling:
+            return
+        self.sampling = True
+
+        # This runs every interval, so it only collects code objects and leaves formatting until the end
+        codes = []
+        # Frames above the stage (the runner and CLI) are the same in every sample, so they're dropped
+        while frame is not None and frame.f_code is not timed.__code__:
+            codes.append(frame.f_code)
+            frame = frame.f_back
+
+        if codes:
+            self.stacks[tuple(reversed(codes))] += 1
+        self.sampling = False
+
+    @contextmanager
+    def running(self: 'Sampler') -> Iterator[None]:
+        previous = signal.signal(signal.SIGPROF, self.sample)
+        signal.setitimer(signal.ITIMER_PROF, self.interval, self.interval)
+        try:
+            yield
+        finally:
+            signal.setitimer(signal.ITIMER_PROF, 0)
+            signal.signal(signal.SIGPROF, previous)
+
+    def write(self: 'Sampler', path: Path) -> None:
+        labels: dict[CodeType, str] = {}
+        with open(path, 'w') as file:
+            for stack, count in self.stacks.most_common():
+                file.write(';'.join(labels.get(code) or labels.setdefault(code, code_label(code)) for code in stack) + f' {count}\n')
+
+class Profiler:
+    """ A runner hook that profiles each stage into `directory` and keeps a printable summary of each. """
+
+    def __init__(self: 'Profiler', directory: Path, top: int = 10):
+        self.directory = directory
+        self.top = top
+        self.summaries: list[str] = []
+
+    def __call__(self: 'Profiler', solution: Solution, stage: str) -> ContextManager[None]:
+        return self.profile(solution, stage)
+
+    @contextmanager
+    def profile(self: 'Profiler', solution: Solution, stage: str) -> Iterator[None]:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        stem = self.directory / f'{solution.year}_day{solution.day}_{stage}'
+
+        tracing = tracemalloc.is_tracing()
+        if not tracing:
+            tracemalloc.start()
+        tracemalloc.reset_peak()
+
+        profile, sampler = cProfile.Profile(), Sampler()
+        expanded, pushed = TOTALS.expanded, TOTALS.pushed
+        calls = {memo: memo.hits + memo.misses for memo in MEMOS}
+        try:
+            with sampler.running():
+                profile.enable()
+                try:
+                    yield
+                finally:
+                    profile.disable()
+
+            _, peak = tracemalloc.get_traced_memory()
+            snapshot = tracemalloc.take_snapshot().filter_traces(IGNORED)
+        finally:
+            if not tracing:
+                tracemalloc.stop()
+
+        profile.dump_stats(stem.with_suffix('.prof'))
+        sampler.write(stem.with_suffix('.folded'))
+        searched = (TOTALS.expanded - expanded, TOTALS.pushed - pushed)
+        # Statistics are cumulative, so these cover every use of a memo so far rather than just this stage
+        memos = [memo.cache_info() for memo in MEMOS if memo.hits + memo.misses != calls.get(memo, 0)]
+        self.summaries.append(self.summarise(solution, stage, pstats.Stats(profile), snapshot, peak, searched, memos, stem))
+
+    def summarise(self: 'Profiler', solution: Solution, stage: str, stats: pstats.Stats, snapshot: tracemalloc.Snapshot, peak: int, searched: tuple[int, int], memos: list[MemoInfo], stem: Path) -> str:
+        lines = [f'{solution.name} {stage}: peak {peak / 1024:.1f}KB traced, profiles in {stem}.{{prof,folded}}']
+        if searched[0] > 0:
+            lines.append(f'  search expanded {searched[0]} nodes and pushed {searched[1]}')
+        lines.extend(f'  memo {info}' for info in memos)
+
+        lines.append(f'  {"own time":>10} {"total":>10} {"calls":>10}  function')
+        functions = [item for item in stats.stats.items() if item[0][0] not in OVERHEAD]
+        functions.sort(key=lambda item: item[1][2], reverse=True)
+        for (filename, line, name), (_, calls, own, total, _) in functions[:self.top]:
+            lines.append(f'  {own:>9.4f}s {total:>9.4f}s {calls:>10}  {name} ({location(filename)}:{line})')
+
+        lines.append(f'  {"size":>10} {"blocks":>10}  allocated at')
+        for statistic in snapshot.statistics('lineno')[:self.top]:
+            frame = statistic.traceback[0]
+            lines.append(f'  {statistic.size / 1024:>8.1f}KB {statistic.count:>10}  {location(frame.filename)}:{frame.lineno}')
+
+        return '\n'.join(lines)
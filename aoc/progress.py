@@ -0,0 +1,41 @@
+""" Progress counters for long-running loops, so a stage that's taking a while can say how far it's got.
+
+A loop creates a counter with `track` and bumps `done` as it goes, which is
+cheap enough for the innermost loop of a solution:
+
+    rows = track('rows scanned', 4000001)
+    for row in range(4000001):
+        rows.done += 1
+        ...
+
+Counters are only held weakly in `TRACKED`, so they disappear with the loop
+that made them. While it's running, `aoc.watchdog` reports them with their
+throughput, both periodically and when it interrupts a stage.
+"""
+from time import perf_counter
+from typing import Optional
+from weakref import WeakSet
+
+class Progress:
+    def __init__(self: 'Progress', unit: str, total: Optional[int] = None):
+        self.unit = unit
+        self.total = total
+        self.done = 0
+        self.started = perf_counter()
+
+    def rate(self: 'Progress') -> float:
+        """ How many were done per second since the counter was created. """
+        elapsed = perf_counter() - self.started
+        return self.done / elapsed if elapsed > 0 else 0.0
+
+    def __str__(self: 'Progress') -> str:
+        done = f'{self.done}/{self.total} ({self.done / self.total:.1%})' if self.total else f'{self.done}'
+        return f'{done} {self.unit} at {self.rate():.0f}/s'
+
+TRACKED: 'WeakSet[Progress]' = WeakSet()
+
+def track(unit: str, total: Optional[int] = None) -> Progress:
+    """ A new counter of `unit` (e.g. 'rows scanned'), out of `total` if that's known up front. """
+    progress = Progress(unit, total)
+    TRACKED.add(progress)
+    return progress
@@ -0,0 +1,142 @@
+from contextlib import ExitStack
+from time import perf_counter, process_time
+from typing import TYPE_CHECKING, Any, Callable, ContextManager, Iterable, NamedTuple, Optional, Sequence
+
+from aoc.inputs import Input
+from aoc.lazy import lazy
+from aoc.solutions import Solution
+
+# Only runs that use the cache need it
+caching = lazy('aoc.cache')
+
+if TYPE_CHECKING:
+    from aoc.cache import Cache
+
+# Called with the solution and stage name around each stage that actually runs (e.g. for profiling)
+Hook = Callable[[Solution, str], ContextManager[Any]]
+
+class Timing(NamedTuple):
+    stage: str
+    wall: float
+    cpu: float
+    result: Any = None
+    cached: bool = False
+
+class Report(NamedTuple):
+    name: str
+    timings: list[Timing]
+
+    @property
+    def wall(self: 'Report') -> float:
+        return sum(timing.wall for timing in self.timings)
+
+    @property
+    def cpu(self: 'Report') -> float:
+        return sum(timing.cpu for timing in self.timings)
+
+    @property
+    def cached(self: 'Report') -> bool:
+        return any(timing.cached for timing in self.timings)
+
+    def answers(self: 'Report') -> list[Timing]:
+        return [timing for timing in self.timings if timing.stage != 'parse']
+
+def timed(stage: str, fn: Callable, *args: Any) -> Timing:
+    """ Calls `fn(*args)`, measuring wall-clock and CPU time for this process.
+
+    CPU time excludes any child processes a solution may spawn (e.g. 2022/day19's pool).
+    """
+    wall, cpu = perf_counter(), process_time()
+    result = fn(*args)
+    return Timing(stage, perf_counter() - wall, process_time() - cpu, result)
+
+def staged(solution: Solution, hooks: Sequence[Hook], stage: str, fn: Callable, *args: Any) -> Timing:
+    """ Like `timed`, inside every hook's context. """
+    with ExitStack() as stack:
+        for hook in hooks:
+            stack.enter_context(hook(solution, stage))
+        return timed(stage, fn, *args)
+
+def lookup(stage: str, cache: 'Cache', key: str) -> Optional[Timing]:
+    """ Fetches a cached result, timing the lookup as `stage`, or returns None on a miss. """
+    fetched = timed(stage, cache.get, key)
+    hit, value = fetched.result
+    return fetched._replace(result=value, cached=True) if hit else None
+
+def run(solution: Solution, puzzle: Optional[Input] = None, parts: Optional[Iterable[str]] = None, cache: Optional['Cache'] = None, hooks: Sequence[Hook] = ()) -> Report:
+    """ Parses the input once, then runs each requested part against the parsed data.
+
+    Without an explicit `puzzle` the day's checked-in `input` is mapped, and unmapped again once parsed.
+    """
+    if puzzle is None:
+        with Input.open(solution.input_path) as puzzle:
+            return run(solution, puzzle, parts, cache, hooks)
+
+    parts = solution.parts() if parts is None else [part for part in parts if solution.part(part) is not None]
+
+    if cache is not None:
+        return run_cached(solution, puzzle, parts, cache, hooks)
+
+    parsed = staged(solution, hooks, 'parse', solution.parse, puzzle)
+    timings = [parsed]
+
+    for part in parts:
+        timings.append(staged(solution, hooks, part, solution.part(part), parsed.result))
+
+    return Report(solution.name, timings)
+
+def run_cached(solution: Solution, puzzle: Input, parts: list[str], cache: 'Cache', hooks: Sequence[Hook] = ()) -> Report:
+    """ Like `run`, but reuses answers and parsed inputs keyed by the input's contents and the solution's source.
+
+    Answers are keyed by the whole module, so any edit reruns the parts. The parsed input is keyed only by
+    the code `parse` reaches, so it survives edits to the parts. Both keys also cover every module in the
+    repository the day imports (e.g. `aoc.grid`). Inputs that can't be pickled are reparsed.
+
+    A streaming day's `parse` feeds it every line (see `aoc.streaming`), so its parsed "input" is the
+    finished computation. Only its answers are cached: a cached parse would hide the real work behind
+    an instant parse stage.
+    """
+    input_digest = caching.digest(puzzle.view)
+    answer_keys = {part: caching.answer_key(input_digest, solution.module, part) for part in parts}
+    answers = {part: lookup(part, cache, answer_keys[part]) for part in parts}
+
+    # Nothing to parse for if every answer is already known
+    if all(answers.values()):
+        return Report(solution.name, list(answers.values()))
+
+    streaming = solution.consumer is not None
+    key = caching.parse_key(input_digest, solution.module)
+    parsed = None if streaming else lookup('parse', cache, key)
+    if parsed is None:
+        parsed = staged(solution, hooks, 'parse', solution.parse, puzzle)
+        if not streaming:
+            cache.put(key, parsed.result)
+
+    timings = [parsed]
+    for part in parts:
+        timing = answers[part]
+        if timing is None:
+            timing = staged(solution, hooks, part, solution.part(part), parsed.result)
+            cache.put(answer_keys[part], timing.result)
+        timings.append(timing)
+
+    return Report(solution.name, timings)
+
+def format_answer(answer: Any) -> str:
+    text = str(answer)
+    # Multi-line answers (e.g. rendered letters) start on their own line
+    return ('\n' + text) if '\n' in text else text
+
+def format_report(report: Report) -> str:
+    lines = [f'{report.name}']
+
+    for timing in report.answers():
+        lines.append(f'  {timing.stage}: {format_answer(timing.result)}')
+
+    lines.append(f'  {"stage":<8} {"wall":>10} {"cpu":>10}')
+    for timing in report.timings:
+        suffix = ' (cached)' if timing.cached else ''
+        lines.append(f'  {timing.stage:<8} {timing.wall:>9.4f}s {timing.cpu:>9.4f}s{suffix}')
+    lines.append(f'  {"total":<8} {report.wall:>9.4f}s {report.cpu:>9.4f}s')
+
+    return '\n'.join(lines)
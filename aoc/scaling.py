@@ -0,0 +1,127 @@
+""" Empirical complexity curves: how a day's running time grows with its input.
+
+A day is run against generated inputs of increasing scale, and `log(time)` is
+fitted against `log(scale)` by least squares. The slope is the exponent `k` in
+`time ~ scale^k`, so roughly 1 is linear (n log n shows up a little above 1),
+2 quadratic, and so on.
+"""
+from math import exp, log
+from time import perf_counter
+from typing import Iterator, NamedTuple, Optional
+
+from aoc.generators import generate
+from aoc.inputs import Input
+from aoc.runner import run
+from aoc.solutions import Solution
+
+# Stage timings below this are mostly noise, so they're left out of the fit
+NOISE_FLOOR = 1e-4
+
+class Measurement(NamedTuple):
+    scale: float
+    size: int
+    seconds: dict[str, float]
+
+    @property
+    def total(self: 'Measurement') -> float:
+        return sum(self.seconds.values())
+
+class Fit(NamedTuple):
+    exponent: float
+    intercept: float
+    r_squared: float
+    points: int
+
+    def predict(self: 'Fit', scale: float) -> float:
+        return exp(self.intercept + self.exponent * log(scale))
+
+    def largest_scale(self: 'Fit', budget: float) -> Optional[float]:
+        """ The largest scale predicted to finish within `budget` seconds, or None if it never gets slower. """
+        if self.exponent <= 0:
+            return None
+        return exp((log(budget) - self.intercept) / self.exponent)
+
+def fit(points: list[tuple[float, float]]) -> Optional[Fit]:
+    """ Fits `seconds = a * scale^k` to `(scale, seconds)` points, ignoring timings too small to trust. """
+    points = [(log(scale), log(seconds)) for scale, seconds in points if seconds >= NOISE_FLOOR]
+    if len(points) < 2:
+        return None
+
+    xs, ys = [x for x, _ in points], [y for _, y in points]
+    mean_x, mean_y = sum(xs) / len(xs), sum(ys) / len(ys)
+    spread = sum((x - mean_x) ** 2 for x in xs)
+    if spread == 0:
+        return None
+
+    exponent = sum((x - mean_x) * (y - mean_y) for x, y in points) / spread
+    intercept = mean_y - exponent * mean_x
+
+    residual = sum((y - (intercept + exponent * x)) ** 2 for x, y in points)
+    total = sum((y - mean_y) ** 2 for y in ys)
+    r_squared = 1 - residual / total if total > 0 else 1.0
+
+    return Fit(exponent, intercept, r_squared, len(points))
+
+def measure(solution: Solution, text: str, minimum: float = 0.2, repeats: int = 3) -> dict[str, float]:
+    """ Times each stage on `text`, keeping the fastest of up to `repeats` runs while they're quicker than `minimum`. """
+    best: dict[str, float] = {}
+    start = perf_counter()
+
+    for _ in range(repeats):
+        with Input.from_text(text) as puzzle:
+            report = run(solution, puzzle)
+
+        for timing in report.timings:
+            best[timing.stage] = min(best.get(timing.stage, timing.wall), timing.wall)
+
+        if perf_counter() - start >= minimum:
+            break
+
+    return best
+
+def scales(start: float, factor: float, largest: float) -> Iterator[float]:
+    scale = start
+    while scale <= largest:
+        yield scale
+        scale *= factor
+
+def curve(solution: Solution, sizes: Iterator[float], limit: float, seed: int = 0) -> Iterator[Measurement]:
+    """ Measures a day at each scale in turn, stopping after the first run that takes longer than `limit` seconds. """
+    for scale in sizes:
+        text = generate(solution.year, solution.day, scale, seed)
+        measurement = Measurement(scale, len(text), measure(solution, text))
+        yield measurement
+
+        if measurement.total > limit:
+            break
+
+def fits(measurements: list[Measurement]) -> dict[str, Optional[Fit]]:
+    """ A fit per stage, plus one for the whole day. """
+    stages = list(measurements[0].seconds) if measurements else []
+    found = {stage: fit([(m.scale, m.seconds[stage]) for m in measurements]) for stage in stages}
+    found['total'] = fit([(m.scale, m.total) for m in measurements])
+    return found
+
+def describe(exponent: float) -> str:
+    """ The nearest familiar complexity class for an exponent. """
+    classes = [(0, 'O(1)'), (1, 'O(n)'), (1.5, 'O(n^1.5)'), (2, 'O(n^2)'), (3, 'O(n^3)')]
+    return min(classes, key=lambda entry: abs(entry[0] - exponent))[1]
+
+def format_curve(solution: Solution, measurements: list[Measurement], budget: float) -> str:
+    stages = list(measurements[0].seconds) if measurements else []
+    lines = [solution.name, f'  {"scale":>8} {"bytes":>11} ' + ' '.join(f'{stage:>9}' for stage in stages + ['total'])]
+
+    for m in measurements:
+        timings = ' '.join(f'{m.seconds[stage]:>8.4f}s' for stage in stages)
+        lines.append(f'  {m.scale:>7g}x {m.size:>11} {timings} {m.total:>8.4f}s')
+
+    for stage, found in fits(measurements).items():
+        if found is None:
+            lines.append(f'  {stage:<6} too fast to fit')
+            continue
+
+        largest = found.largest_scale(budget)
+        fits_within = 'any size' if largest is None else f'{largest:.3g}x'
+        lines.append(f'  {stage:<6} n^{found.exponent:.2f} ~{describe(found.exponent):<9} (r^2 {found.r_squared:.2f}), {budget:g}s budget fits {fits_within}')
+
+    return '\n'.join(lines)
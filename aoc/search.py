@@ -0,0 +1,170 @@
+""" Shortest-path searches shared by the solutions.
+
+Every search starts from any number of nodes at once (multi-source), and takes
+its graph as a function from a node to its neighbours. For BFS that function
+yields neighbour nodes; for the weighted searches it yields `(neighbour, weight)`
+pairs.
+
+Nodes are anything hashable. When they are instead the integers `0..size-1`
+(e.g. `aoc.grid.Grid` cell indexes), passing `size` keeps costs in a flat list
+rather than a dict.
+
+Each search counts the nodes it expands and pushes into a `Stats`, which
+defaults to the module-wide `TOTALS` (reported per stage by `run --profile`).
+"""
+from collections import defaultdict, deque
+from dataclasses import dataclass
+from heapq import heappop, heappush
+from itertools import count
+from typing import Callable, Hashable, Iterable, MutableMapping, Optional, Union
+
+Node = Hashable
+Neighbors = Callable[[Node], Iterable[Node]]
+Edges = Callable[[Node], Iterable[tuple[Node, int]]]
+Goal = Callable[[Node], bool]
+Costs = Union[list[int], MutableMapping[Node, int]]
+
+UNREACHED = -1
+
+@dataclass
+class Stats:
+    expanded: int = 0
+    pushed: int = 0
+
+TOTALS = Stats()
+
+def costs(size: Optional[int], missing: int) -> Costs:
+    """ A cost per node, `missing` until set: a flat list for integer nodes below `size`, otherwise a dict. """
+    if size is not None:
+        return [missing] * size
+    return defaultdict(lambda: missing)
+
+def distances(starts: Iterable[Node], neighbors: Neighbors, size: Optional[int] = None, stats: Stats = TOTALS) -> Costs:
+    """ Breadth-first step counts from the nearest start to every reachable node (`UNREACHED` elsewhere). """
+    found = costs(size, UNREACHED)
+    queue = deque()
+    for start in starts:
+        if found[start] == UNREACHED:
+            found[start] = 0
+            queue.append(start)
+    stats.pushed += len(queue)
+
+    while queue:
+        node = queue.popleft()
+        stats.expanded += 1
+        step = found[node] + 1
+        for neighbor in neighbors(node):
+            if found[neighbor] == UNREACHED:
+                found[neighbor] = step
+                queue.append(neighbor)
+                stats.pushed += 1
+
+    return found
+
+def bfs(starts: Iterable[Node], neighbors: Neighbors, goal: Goal, size: Optional[int] = None, stats: Stats = TOTALS) -> Optional[int]:
+    """ The fewest steps from any start to a node satisfying `goal`, or None if there is no such path. """
+    found = costs(size, UNREACHED)
+    queue = deque()
+    for start in starts:
+        if found[start] == UNREACHED:
+            found[start] = 0
+            queue.append(start)
+    stats.pushed += len(queue)
+
+    while queue:
+        node = queue.popleft()
+        stats.expanded += 1
+        if goal(node):
+            return found[node]
+
+        step = found[node] + 1
+        for neighbor in neighbors(node):
+            if found[neighbor] == UNREACHED:
+                found[neighbor] = step
+                queue.append(neighbor)
+                stats.pushed += 1
+
+    return None
+
+def astar(starts: Iterable[Node], edges: Edges, goal: Goal, heuristic: Callable[[Node], int], size: Optional[int] = None, stats: Stats = TOTALS) -> Optional[int]:
+    """ The cheapest cost from any start to a node satisfying `goal`, or None if there is no such path.
+
+    Uses a binary heap ordered by cost so far plus `heuristic`, which must never
+    overestimate the remaining cost.
+    """
+    best = costs(size, -1)
+    # Ties are broken by insertion order, so nodes themselves are never compared
+    order = count()
+    queue = []
+    for start in starts:
+        if best[start] != 0:
+            best[start] = 0
+            heappush(queue, (heuristic(start), next(order), 0, start))
+    stats.pushed += len(queue)
+
+    while queue:
+        _, _, cost, node = heappop(queue)
+        # Nodes are queued again whenever they get cheaper, so earlier entries go stale
+        if best[node] != cost:
+            continue
+
+        stats.expanded += 1
+        if goal(node):
+            return cost
+
+        for neighbor, weight in edges(node):
+            total = cost + weight
+            previous = best[neighbor]
+            if previous == -1 or total < previous:
+                best[neighbor] = total
+                heappush(queue, (total + heuristic(neighbor), next(order), total, neighbor))
+                stats.pushed += 1
+
+    return None
+
+def dijkstra(starts: Iterable[Node], edges: Edges, goal: Goal, size: Optional[int] = None, stats: Stats = TOTALS) -> Optional[int]:
+    """ The cheapest cost from any start to a node satisfying `goal` (A* without a heuristic). """
+    return astar(starts, edges, goal, lambda _: 0, size, stats)
+
+def dial(starts: Iterable[Node], edges: Edges, goal: Goal, max_weight: int, size: Optional[int] = None, stats: Stats = TOTALS) -> Optional[int]:
+    """ Dijkstra over a bucket queue, for small non-negative integer weights of at most `max_weight`.
+
+    Every queued node costs between the current cost and `max_weight` more, so a
+    ring of `max_weight + 1` buckets indexed by cost replaces the heap.
+    """
+    best = costs(size, -1)
+    buckets: list[list[Node]] = [[] for _ in range(max_weight + 1)]
+    for start in starts:
+        if best[start] != 0:
+            best[start] = 0
+            buckets[0].append(start)
+    pending = len(buckets[0])
+    stats.pushed += pending
+
+    cost = 0
+    while pending:
+        bucket = buckets[cost % len(buckets)]
+        while bucket:
+            node = bucket.pop()
+            pending -= 1
+            # Nodes are queued again whenever they get cheaper, so earlier entries go stale
+            if best[node] != cost:
+                continue
+
+            stats.expanded += 1
+            if goal(node):
+                return cost
+
+            for neighbor, weight in edges(node):
+                if weight > max_weight:
+                    raise ValueError(f'Edge weight {weight} is above the bucket queue\'s maximum of {max_weight}')
+                total = cost + weight
+                previous = best[neighbor]
+                if previous == -1 or total < previous:
+                    best[neighbor] = total
+                    buckets[total % len(buckets)].append(neighbor)
+                    pending += 1
+                    stats.pushed += 1
+        cost += 1
+
+    return None
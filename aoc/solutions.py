@@ -0,0 +1,85 @@
+import sys
+from importlib.util import module_from_spec, spec_from_file_location
+from pathlib import Path
+from types import ModuleType
+from typing import Callable, NamedTuple, Optional
+
+ROOT = Path(__file__).resolve().parent.parent
+
+PARTS = ('part1', 'part2')
+
+class Solution(NamedTuple):
+    year: int
+    day: int
+    module: ModuleType
+
+    @property
+    def name(self: 'Solution') -> str:
+        return f'{self.year}/day{self.day}'
+
+    @property
+    def directory(self: 'Solution') -> Path:
+        return day_directory(self.year, self.day)
+
+    @property
+    def input_path(self: 'Solution') -> Path:
+        return self.directory / 'input'
+
+    @property
+    def parse(self: 'Solution') -> Callable:
+        return self.module.parse
+
+    @property
+    def consumer(self: 'Solution') -> Optional[Callable]:
+        """ The day's `consumer` factory for feeding it lines as they arrive (see `aoc.streaming`), or None if it needs its whole input. """
+        return getattr(self.module, 'consumer', None)
+
+    def part(self: 'Solution', name: str) -> Optional[Callable]:
+        """ Returns the callable for `name` (e.g. 'part1'), or None if the day doesn't have that part. """
+        return getattr(self.module, name, None)
+
+    def parts(self: 'Solution') -> list[str]:
+        return [name for name in PARTS if self.part(name) is not None]
+
+def day_directory(year: int, day: int) -> Path:
+    return ROOT / str(year) / f'day{day}'
+
+def module_name(year: int, day: int) -> str:
+    return f'aoc_{year}_day{day}'
+
+def discover(year: Optional[int] = None, day: Optional[int] = None) -> list[tuple[int, int]]:
+    """ Lists every (year, day) with a `main.py`, in year/day order. """
+    found = []
+    for year_directory in ROOT.glob('[0-9][0-9][0-9][0-9]'):
+        for main in year_directory.glob('day*/main.py'):
+            found.append((int(year_directory.name), int(main.parent.name[3:])))
+
+    found = [(y, d) for y, d in found if year in (None, y) and day in (None, d)]
+    return sorted(found)
+
+def load(year: int, day: int) -> Solution:
+    """ Imports a day's `main.py` as a module without running its `__main__` block. """
+    name = module_name(year, day)
+
+    if name in sys.modules:
+        return Solution(year, day, sys.modules[name])
+
+    path = day_directory(year, day) / 'main.py'
+    if not path.exists():
+        raise FileNotFoundError(f'No solution found for {year} day {day} at {path}')
+
+    spec = spec_from_file_location(name, path)
+    if spec is None or spec.loader is None:
+        raise ImportError(f'Unable to load {path}')
+
+    # The module has to be registered before it executes so that dataclasses
+    # and pickling (e.g. `multiprocessing`) can find it by name.
+    module = module_from_spec(spec)
+    sys.modules[name] = module
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        del sys.modules[name]
+        raise
+
+    return Solution(year, day, module)
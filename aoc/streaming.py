@@ -0,0 +1,65 @@
+""" Feeding a day its input a line at a time, as it arrives, with bounded memory.
+
+Days that only need one pass over their lines expose `consumer()`, which
+returns a fresh state object with:
+
+- `feed(line)`, taking one line as bytes (without its line ending),
+- `part1()` and `part2()`, the answers for the lines fed so far.
+
+The state only keeps running totals (or a few recent lines), so a
+multi-gigabyte input is answered in flat memory, and the answers can be read
+at any point to report progress. Those days' `parse` feeds the whole input
+through `consume`, so the runner and `main.py` work as before:
+
+    sonar = consume(consumer(), puzzle.byte_lines())
+    sonar.part1()
+
+A caller reading from a socket or a pipe can feed chunks of any size through
+`split_lines`.
+"""
+from typing import BinaryIO, Iterable, Iterator, Protocol, TypeVar
+
+CHUNK_SIZE = 1 << 16
+
+class Consumer(Protocol):
+    def feed(self, line: bytes) -> None: ...
+    def part1(self) -> object: ...
+    def part2(self) -> object: ...
+
+C = TypeVar('C', bound=Consumer)
+
+def read_chunks(file: BinaryIO, size: int = CHUNK_SIZE) -> Iterator[bytes]:
+    while chunk := file.read(size):
+        yield chunk
+
+def split_lines(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    """ Reassembles lines (without their line endings) from chunks that can split them anywhere. """
+    partial = b''
+    for chunk in chunks:
+        lines = (partial + chunk).split(b'\n')
+        partial = lines.pop()
+        for line in lines:
+            yield line[:-1] if line.endswith(b'\r') else line
+
+    if partial:
+        yield partial[:-1] if partial.endswith(b'\r') else partial
+
+def consume(consumer: C, lines: Iterable[bytes]) -> C:
+    """ Feeds every line to `consumer`, returning it. """
+    feed = consumer.feed
+    for line in lines:
+        feed(line)
+    return consumer
+
+def progress(consumer: Consumer, lines: Iterable[bytes], every: int) -> Iterator[int]:
+    """ Feeds every line to `consumer`, yielding how many have been fed after every `every` lines and at the end. """
+    count = 0
+    feed = consumer.feed
+    for line in lines:
+        feed(line)
+        count += 1
+        if count % every == 0:
+            yield count
+
+    if count % every != 0 or count == 0:
+        yield count
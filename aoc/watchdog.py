@@ -0,0 +1,94 @@
+""" A wall-clock budget for each day, with progress reports while it runs.
+
+`Watchdog` is a runner hook. The budget covers every stage of a day together,
+from when its first stage starts. A real-time interval timer wakes the main
+thread whenever a report is due or the budget runs out. If the budget has run
+out, the stage is interrupted with `TimeExceeded`. That exception is raised
+in the stage itself, so `finally` and `with` blocks (e.g. 2022/day19's pool)
+clean up as usual. It reports how far the stage got, from the:
+
+- `aoc.progress` counters its loops are bumping, with their throughput,
+- nodes expanded by `aoc.search` searches.
+
+Signal handlers only run on the main thread, so stages have to as well.
+"""
+import signal
+import sys
+from contextlib import contextmanager
+from time import perf_counter
+from typing import ContextManager, Iterator, Optional, TextIO
+
+from aoc.progress import TRACKED
+from aoc.search import TOTALS
+from aoc.solutions import Solution
+
+class TimeExceeded(Exception):
+    def __init__(self: 'TimeExceeded', name: str, stage: str, budget: float, elapsed: float, progress: list[str]):
+        super().__init__(name, stage, budget, elapsed, progress)
+        self.name = name
+        self.stage = stage
+        self.budget = budget
+        self.elapsed = elapsed
+        self.progress = progress
+
+    def __str__(self: 'TimeExceeded') -> str:
+        lines = [f'{self.name} {self.stage} aborted after {self.elapsed:.1f}s, over the {self.budget:g}s budget']
+        lines.extend(f'  {line}' for line in self.progress or ['no progress reported'])
+        return '\n'.join(lines)
+
+class Watchdog:
+    """ A runner hook that interrupts a day once it has run for `budget` seconds, and reports its progress every `every` seconds. """
+
+    def __init__(self: 'Watchdog', budget: Optional[float] = None, every: Optional[float] = None, output: TextIO = sys.stderr):
+        self.budget = budget
+        self.every = every
+        self.output = output
+        self.day: Optional[str] = None
+        self.started = 0.0
+        # Search totals are cumulative, so each stage reports what it added to them
+        self.expanded = 0
+        self.stage_started = 0.0
+
+    def __call__(self: 'Watchdog', solution: Solution, stage: str) -> ContextManager[None]:
+        return self.watch(solution, stage)
+
+    def elapsed(self: 'Watchdog') -> float:
+        return perf_counter() - self.started
+
+    def progress(self: 'Watchdog') -> list[str]:
+        lines = [str(progress) for progress in sorted(TRACKED, key=lambda progress: progress.started)]
+        expanded = TOTALS.expanded - self.expanded
+        if expanded > 0:
+            lines.append(f'{expanded} search nodes expanded at {expanded / (perf_counter() - self.stage_started):.0f}/s')
+        return lines
+
+    def arm(self: 'Watchdog') -> None:
+        """ Sets the timer for whichever comes first: the next report or the end of the budget. """
+        delays = [delay for delay in (self.every, None if self.budget is None else self.budget - self.elapsed()) if delay is not None]
+        if delays:
+            signal.setitimer(signal.ITIMER_REAL, max(min(delays), 0.001))
+
+    def wake(self: 'Watchdog', solution: Solution, stage: str) -> None:
+        elapsed = self.elapsed()
+        if self.budget is not None and elapsed >= self.budget:
+            raise TimeExceeded(solution.name, stage, self.budget, elapsed, self.progress())
+
+        print(f'{solution.name} {stage} after {elapsed:.1f}s: {"; ".join(self.progress()) or "no progress reported"}', file=self.output, flush=True)
+        self.arm()
+
+    @contextmanager
+    def watch(self: 'Watchdog', solution: Solution, stage: str) -> Iterator[None]:
+        if solution.name != self.day:
+            self.day, self.started = solution.name, perf_counter()
+        self.expanded, self.stage_started = TOTALS.expanded, perf_counter()
+
+        if self.budget is not None and self.elapsed() >= self.budget:
+            raise TimeExceeded(solution.name, stage, self.budget, self.elapsed(), [])
+
+        previous = signal.signal(signal.SIGALRM, lambda *_: self.wake(solution, stage))
+        self.arm()
+        try:
+            yield
+        finally:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+            signal.signal(signal.SIGALRM, previous)
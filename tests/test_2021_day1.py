@@ -0,0 +1,59 @@
+from random import Random
+
+import pytest
+
+from aoc.inputs import Input
+from aoc.solutions import load
+
+day = load(2021, 1).module
+
+EXAMPLE = b'199\n200\n208\n210\n200\n207\n240\n269\n260\n263\n'
+
+def window_increases(depths: list[int], k: int) -> int:
+    """ Straight from the definition: sum every window, then compare neighbouring sums. """
+    sums = [sum(depths[i:i + k]) for i in range(len(depths) - k + 1)]
+    return sum(later > earlier for earlier, later in zip(sums, sums[1:]))
+
+def test_example():
+    sonar = day.parse(Input(EXAMPLE))
+    assert (day.part1(sonar), day.part2(sonar)) == (7, 5)
+
+@pytest.mark.parametrize('k', [1, 2, 3, 4, 7, 20])
+def test_increases_match_window_sums(k: int):
+    random = Random(k)
+    for length in (0, 1, k - 1, k, k + 1, 50, 300):
+        depths = [random.randint(0, 30) for _ in range(length)]
+        assert day.increases(depths, k) == window_increases(depths, k)
+
+@pytest.mark.parametrize('k', [1, 2, 3, 4, 7, 20])
+def test_array_increases_match_window_sums(k: int):
+    numpy = pytest.importorskip('numpy')
+    random = Random(k)
+    for length in (0, 1, k, k + 1, 300):
+        depths = [random.randint(0, 30) for _ in range(length)]
+        assert day.array_increases(numpy.array(depths, dtype=numpy.int64), k) == window_increases(depths, k)
+
+def test_sonar_counts_several_windows_at_once():
+    random = Random(5)
+    depths = [random.randint(0, 100) for _ in range(200)]
+    sonar = day.Sonar((1, 3, 5))
+    for depth in depths:
+        sonar.add(depth)
+    assert sonar.increases == {k: window_increases(depths, k) for k in (1, 3, 5)}
+
+def test_windows_must_hold_a_depth():
+    with pytest.raises(ValueError):
+        day.Sonar((0, 3))
+
+def test_large_inputs_are_vectorized(monkeypatch: pytest.MonkeyPatch):
+    pytest.importorskip('numpy')
+    random = Random(6)
+    depths = [random.randint(0, 1000) for _ in range(1000)]
+    data = Input(''.join(f'{depth}\n' for depth in depths).encode())
+
+    streamed = day.parse(data)
+    monkeypatch.setattr(day, 'VECTORIZE_SIZE', 0)
+    vectorized = day.parse(data)
+
+    assert isinstance(streamed, day.Sonar) and isinstance(vectorized, day.Depths)
+    assert (vectorized.part1(), vectorized.part2()) == (streamed.part1(), streamed.part2()) == (window_increases(depths, 1), window_increases(depths, 3))
@@ -0,0 +1,58 @@
+from random import Random
+
+import pytest
+
+from aoc.inputs import Input
+from aoc.solutions import load
+
+day = load(2021, 10).module
+
+EXAMPLE = b'''[({(<(())[]>[[{[]{<()<>>
+[(()[<>])]({[<{<<[]>>(
+{([(<{}[<>[]}>{[]{[(<()>
+(((({<>}<{<{<>}{[]{[]{}
+[[<[([]))<([[{}[[()]]]
+[{[{({}]{}}([{[{{{}}([]
+{<[[]]>}<{[{[{[]{()[[[]
+[<(<(<(<{}))><([]]
+<{([([[(<>()){}]>(<<{{
+<{([{{}}[<[[[<>{}]]]>[]]
+'''
+
+def random_lines(random: Random, count: int, length: int) -> list[bytes]:
+    """ Random bracket lines, mostly incomplete with a few corrupted. """
+    opening, lines = list(day.PAIRS), []
+    for _ in range(count):
+        line = ''.join(random.choice(opening) for _ in range(random.randint(1, length)))
+        if random.random() < 0.2:
+            line += '>' if line[-1] != '<' else ')'
+        lines.append(line.encode())
+    return lines
+
+def expected_median(lines: list[bytes]):
+    scores = sorted(score for _, score in day.completions(lines))
+    return scores[len(scores) // 2] if scores else None
+
+def test_example():
+    checker = day.parse(Input(EXAMPLE))
+    assert (day.part1(checker), day.part2(checker)) == (26397, 288957)
+
+def test_no_incomplete_lines():
+    assert day.part2(day.parse(Input(b'()\n{)\n'))) is None
+
+@pytest.mark.parametrize('limit, digits', [(1 << 16, 8), (1, 1), (1, 3), (4, 2)])
+def test_median_matches_sorting(monkeypatch: pytest.MonkeyPatch, limit: int, digits: int):
+    # A tiny limit forces the digit-by-digit passes rather than the final sort
+    monkeypatch.setattr(day, 'SELECT_LIMIT', limit)
+    monkeypatch.setattr(day, 'DIGITS_PER_PASS', digits)
+    random = Random(limit * 10 + digits)
+    for count, length in ((1, 5), (2, 3), (51, 4), (201, 12), (301, 2)):
+        lines = random_lines(random, count, length)
+        checker = day.parse(Input(b'\n'.join(lines) + b'\n'))
+        assert day.part2(checker) == expected_median(lines)
+
+def test_checker_keeps_counts_not_scores():
+    lines = [b'(((('] * 1000 + [b'['] * 1001
+    checker = day.parse(Input(b'\n'.join(lines)))
+    assert checker.lengths == {4: 1000, 1: 1001}
+    assert day.part2(checker) == 2
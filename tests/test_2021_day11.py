@@ -0,0 +1,25 @@
+from aoc.inputs import Input
+from aoc.solutions import load
+
+day = load(2021, 11).module
+
+EXAMPLE = b'''5483143223
+2745854711
+5264556173
+6141336146
+6357385478
+4167524645
+2176841721
+6882881134
+4846848554
+5283751526
+'''
+
+def test_example():
+    assert day.part1(day.parse(Input(EXAMPLE))) == 1656
+    assert day.part2(day.parse(Input(EXAMPLE))) == 195
+
+def test_flashes_spread_diagonally():
+    grid = day.parse(Input(b'11111\n19991\n19191\n19991\n11111\n'))
+    assert day.step(grid) == 9
+    assert bytes(grid.cells) == bytes([3, 4, 5, 4, 3, 4, 0, 0, 0, 4, 5, 0, 0, 0, 5, 4, 0, 0, 0, 4, 3, 4, 5, 4, 3])
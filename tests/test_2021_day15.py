@@ -0,0 +1,50 @@
+from heapq import heappop, heappush
+
+import pytest
+
+from aoc.inputs import Input
+from aoc.solutions import load
+
+day = load(2021, 15).module
+
+EXAMPLE = b'''1163751742
+1381373672
+2136511328
+3694931569
+7463417111
+1319128137
+1359912421
+3125421639
+1293138521
+2311944581
+'''
+
+def dijkstra(grid) -> int:
+    """ A plain heap-based search, to check the bucket queue against. """
+    risks, neighbors = grid.cells, grid.neighbors()
+    best, queue = {0: 0}, [(0, 0)]
+    while queue:
+        risk, node = heappop(queue)
+        if node == grid.size - 1:
+            return risk
+        if risk > best[node]:
+            continue
+        for neighbor in neighbors[node]:
+            total = risk + risks[neighbor]
+            if total < best.get(neighbor, total + 1):
+                best[neighbor] = total
+                heappush(queue, (total, neighbor))
+
+def test_example():
+    grid = day.parse(Input(EXAMPLE))
+    assert day.part1(grid) == 40
+    assert day.part2(grid) == 315
+
+def test_tiles_wrap_back_to_one():
+    tiled = day.tile(day.parse(Input(b'8\n')), scale=3)
+    assert list(tiled.cells) == [8, 9, 1, 9, 1, 2, 1, 2, 3]
+
+@pytest.mark.parametrize('scale', [1, 2, 5])
+def test_matches_dijkstra(scale: int):
+    grid = day.parse(Input.open(load(2021, 15).input_path))
+    assert day.least_risk(grid, scale) == dijkstra(day.tile(grid, scale))
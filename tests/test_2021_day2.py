@@ -0,0 +1,73 @@
+from random import Random
+
+import pytest
+
+from aoc.inputs import Input
+from aoc.solutions import load
+
+day = load(2021, 2).module
+
+EXAMPLE = b"""forward 5
+down 5
+forward 8
+up 3
+down 8
+forward 2
+"""
+
+def random_commands(random: Random, count: int) -> bytes:
+    return ''.join(f'{random.choice(["forward", "down", "up"])} {random.randint(1, 9)}\n' for _ in range(count)).encode()
+
+def state(submarine) -> tuple[int, int, int]:
+    return (submarine.horizontal, submarine.aim, submarine.aimed_depth)
+
+def test_example():
+    submarine = day.parse(Input(EXAMPLE))
+    assert (day.part1(submarine), day.part2(submarine)) == (150, 900)
+
+def test_feeding_lines():
+    submarine = day.consumer()
+    for line in EXAMPLE.splitlines():
+        submarine.feed(line)
+    assert state(submarine) == state(day.follow(EXAMPLE))
+
+def test_chunks_and_backends_agree(tmp_path):
+    data = random_commands(Random(2), 500)
+    expected = state(day.follow(data))
+
+    # Down to a line per chunk, so that plenty of them get combined
+    for size in (1, 17, 100, len(data)):
+        assert state(day.explore(data, vectorized=False, size=size)) == expected
+
+    path = tmp_path / 'commands'
+    path.write_bytes(data)
+    assert state(day.explore_file(path, jobs=2, vectorized=False, size=100)) == expected
+
+def test_vectorized_chunks_agree(tmp_path):
+    pytest.importorskip('numpy')
+    data = random_commands(Random(4), 500)
+    expected = state(day.follow(data))
+
+    assert state(day.follow_array(data)) == expected
+    assert state(day.explore(data, vectorized=True, size=100)) == expected
+
+    path = tmp_path / 'commands'
+    path.write_bytes(data)
+    assert state(day.explore_file(path, jobs=2, vectorized=True, size=100)) == expected
+
+def test_then_is_associative():
+    random = Random(3)
+    for _ in range(100):
+        a, b, c = (day.Submarine(random.randint(0, 50), random.randint(-50, 50), random.randint(-500, 500)) for _ in range(3))
+        assert state(a.then(b).then(c)) == state(a.then(b.then(c)))
+        assert state(day.Submarine().then(a)) == state(a) == state(a.then(day.Submarine()))
+
+@pytest.mark.parametrize('data', [b'forward 3\nfly 3\n', b'down 1\ndive 2\n', b'up 2\nupward 2\n'])
+def test_unknown_commands_raise(data: bytes):
+    with pytest.raises(Exception, match='Unknown command'):
+        day.follow(data)
+    with pytest.raises(Exception, match='Unknown command'):
+        day.consumer().feed(data.splitlines()[1])
+    pytest.importorskip('numpy')
+    with pytest.raises(Exception, match='Unknown command'):
+        day.follow_array(data)
@@ -0,0 +1,18 @@
+from aoc.inputs import Input
+from aoc.solutions import load
+
+day = load(2021, 20).module
+
+EXAMPLE = b'''..#.#..#####.#.#.#.###.##.....###.##.#..###.####..#####..#....#..#..##..###..######.###...####..#..#####..##..#.#####...##.#.#..#.##..#.#......#.###.######.###.####...#.##.##..#..#..#####.....#.#....###..#.##......#.....#..#..#..##..#...##.######.####.####.#.#...#.......#..#.#.#...####.##.#......#..#...##.#.##..#...##.#.##..###.#......#.#.......#.#.#.####.###.##...#.....####.#..#..#.##.#....##..#.####....##...##..#...#......#.#.......#.......##..####..#...#.#.#...##..#.#..###..#####........#..####......#..#
+
+#..#.
+#....
+##..#
+..#..
+..###
+'''
+
+def test_example():
+    image = day.parse(Input(EXAMPLE))
+    assert day.part1(image) == 35
+    assert day.part2(image) == 3351
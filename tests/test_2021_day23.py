@@ -0,0 +1,15 @@
+from aoc.inputs import Input
+from aoc.solutions import load
+
+day = load(2021, 23).module
+
+EXAMPLE = b'''#############
+#...........#
+###B#C#B#D###
+  #A#D#C#A#
+  #########
+'''
+
+# Part 2 of the example (44169) takes tens of seconds, too slow for a unit test
+def test_example():
+    assert day.part1(day.parse(Input(EXAMPLE))) == 12521
@@ -0,0 +1,18 @@
+from aoc.inputs import Input
+from aoc.solutions import load
+
+day = load(2021, 25).module
+
+EXAMPLE = b'''v...>>.vv>
+.vv>>.vv..
+>>.>v>...v
+>>v>>.>.v.
+v>v.vv.v..
+>.>>..v...
+.vv..>.>v.
+v.v..>>v.v
+....v..v.>
+'''
+
+def test_example():
+    assert day.part1(day.parse(Input(EXAMPLE))) == 58
@@ -0,0 +1,61 @@
+from random import Random
+
+import pytest
+
+from aoc.inputs import Input
+from aoc.solutions import load
+
+day = load(2021, 3).module
+
+EXAMPLE = b'00100\n11110\n10110\n10111\n10101\n01111\n00111\n11100\n10000\n11001\n00010\n01010\n'
+
+def rating(lines: list[str], keep_most_common: bool) -> int:
+    """ The puzzle's filtering, a bit at a time over the strings themselves. """
+    for i in range(len(lines[0])):
+        if len(lines) == 1:
+            break
+        ones = sum(line[i] == '1' for line in lines)
+        zeros = len(lines) - ones
+        keep = ('1' if ones >= zeros else '0') if keep_most_common else ('0' if zeros <= ones else '1')
+        # When every candidate has the same bit there, none of them are filtered out
+        lines = [line for line in lines if line[i] == keep] or lines
+    return int(lines[0], 2)
+
+def random_report(random: Random, count: int, width: int) -> list[str]:
+    # Distinct numbers, so that filtering always ends with one
+    numbers = random.sample(range(1 << width), min(count, 1 << width)) if width < 20 else [random.getrandbits(width) for _ in range(count)]
+    return [format(number, f'0{width}b') for number in numbers]
+
+def test_example():
+    report = day.parse(Input(EXAMPLE))
+    assert (day.part1(report), day.part2(report)) == (198, 230)
+
+@pytest.mark.parametrize('width', [5, 12, 64, 65, 130])
+def test_ratings_match_filtering_strings(width: int):
+    lines = random_report(Random(width), 300, width)
+    report = day.parse_ints(Input('\n'.join(lines).encode()))
+
+    assert day.oxygen_rating(report) == rating(lines, True)
+    assert day.co2_rating(report) == rating(lines, False)
+    assert report.ones == [sum(line[i] == '1' for line in lines) for i in range(width)]
+
+@pytest.mark.parametrize('width', [5, 12, 64, 65, 130])
+def test_packed_report_agrees(width: int):
+    pytest.importorskip('numpy')
+    data = Input(('\n'.join(random_report(Random(width), 300, width)) + '\n').encode())
+    ints, packed = day.parse_ints(data), day.parse_packed(data)
+
+    assert isinstance(packed, day.PackedReport)
+    assert packed.ones == ints.ones
+    assert [packed.number(row) for row in range(len(packed))] == ints.numbers
+    assert (day.part1(packed), day.part2(packed)) == (day.part1(ints), day.part2(ints))
+
+def test_ragged_reports_are_rejected():
+    with pytest.raises(Exception):
+        day.parse_ints(Input(b'0101\n011\n'))
+
+def test_large_reports_are_packed(monkeypatch: pytest.MonkeyPatch):
+    pytest.importorskip('numpy')
+    assert type(day.parse(Input(EXAMPLE))) is day.Report
+    monkeypatch.setattr(day, 'VECTORIZE_SIZE', 0)
+    assert type(day.parse(Input(EXAMPLE))) is day.PackedReport
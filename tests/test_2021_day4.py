@@ -0,0 +1,97 @@
+from random import Random
+
+import pytest
+
+from aoc.inputs import Input
+from aoc.solutions import load
+
+day = load(2021, 4).module
+
+EXAMPLE = b"""7,4,9,5,11,17,23,2,0,14,21,24,10,16,13,6,15,25,12,22,18,20,8,19,3,26,1
+
+22 13 17 11  0
+ 8  2 23  4 24
+21  9 14 16  7
+ 6 10  3 18  5
+ 1 12 20 15 19
+
+ 3 15  0  2 22
+ 9 18 13 17  5
+19  8  7 25 23
+20 11 10 24  4
+14 21 16 12  6
+
+14 21 17 24  4
+10 16 15  9 19
+18  8 23 26 20
+22 11 13  6  5
+ 2  0 12  3  7
+"""
+
+def simulate(drawn: list[int], boards: list[list[list[int]]]) -> list[int]:
+    """ Marks numbers one draw at a time, checking every line of every board after each. """
+    turns = [len(drawn)] * len(boards)
+    marked = set()
+    for turn, number in enumerate(drawn):
+        marked.add(number)
+        for index, board in enumerate(boards):
+            lines = board + [list(column) for column in zip(*board)]
+            if turns[index] == len(drawn) and any(all(n in marked for n in line) for line in lines):
+                turns[index] = turn
+    return turns
+
+def random_bingo(random: Random, boards: int, largest: int) -> tuple[list[int], list[list[list[int]]]]:
+    drawn = random.sample(range(largest), 40) + random.sample(range(largest), 5)
+    return drawn, [[random.sample(range(largest), 5) for _ in range(5)] for _ in range(boards)]
+
+def text(drawn: list[int], boards: list[list[list[int]]]) -> bytes:
+    blocks = ['\n'.join(' '.join(map(str, row)) for row in board) for board in boards]
+    return (','.join(map(str, drawn)) + '\n\n' + '\n\n'.join(blocks) + '\n').encode()
+
+@pytest.mark.parametrize('parse', ['parse_lists', 'parse_array'])
+def test_example(parse: str):
+    if parse == 'parse_array':
+        pytest.importorskip('numpy')
+    bingo = getattr(day, parse)(Input(EXAMPLE))
+    assert (day.part1(bingo), day.part2(bingo)) == (4512, 1924)
+
+@pytest.mark.parametrize('seed', range(5))
+def test_win_turns_match_simulation(seed: int):
+    drawn, boards = random_bingo(Random(seed), 60, 60)
+    expected = simulate(drawn, boards)
+    assert day.win_turns(drawn, boards) == expected
+
+    numpy = pytest.importorskip('numpy')
+    assert day.win_turns_array(drawn, numpy.array(boards)) == expected
+    assert day.parse_array(Input(text(drawn, boards)))[2] == expected
+
+def test_huge_numbers_dont_need_huge_tables():
+    numpy = pytest.importorskip('numpy')
+    drawn = [10 ** 15, 3, 10 ** 12, 7, 5, 10 ** 15 + 1]
+    board = [[10 ** 15, 3, 10 ** 12, 7, 5]] + [[10 ** 14 + i * 5 + j for j in range(5)] for i in range(4)]
+    assert day.win_turns_array(drawn, numpy.array([board])) == day.win_turns(drawn, [board]) == [4]
+
+def test_first_last_and_tied_winners():
+    drawn = [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
+    # Boards 0 and 2 win together on the fifth draw, board 1 on the last, and board 3 never
+    first = [[1, 2, 3, 4, 5], *[[100 + i * 5 + j for j in range(5)] for i in range(4)]]
+    last = [[6, 7, 8, 9, 10], *[[200 + i * 5 + j for j in range(5)] for i in range(4)]]
+    tied = [[5, 300, 301, 302, 303], [4, 304, 305, 306, 307], [3, 308, 309, 310, 311], [2, 312, 313, 314, 315], [1, 316, 317, 318, 319]]
+    never = [[400 + i * 5 + j for j in range(5)] for i in range(5)]
+    boards = [first, last, tied, never]
+
+    turns = day.win_turns(drawn, boards)
+    assert turns == [4, 9, 4, 10]
+    assert day.winning_order(drawn, turns) == [(4, 0), (4, 2), (9, 1)]
+
+    # Ties go to the earlier board
+    assert day.first_to_win(drawn, boards, turns) == (drawn[:5], first)
+    assert day.nth_to_win(drawn, boards, 1, turns) == (drawn[:5], tied)
+    assert day.last_to_win(drawn, boards, turns) == (drawn, last)
+    assert day.nth_to_win(drawn, boards, 3, turns) == (drawn, None)
+
+def test_large_inputs_use_arrays(monkeypatch: pytest.MonkeyPatch):
+    pytest.importorskip('numpy')
+    assert isinstance(day.parse(Input(EXAMPLE))[1], list)
+    monkeypatch.setattr(day, 'VECTORIZE_SIZE', 0)
+    assert not isinstance(day.parse(Input(EXAMPLE))[1], list)
@@ -0,0 +1,75 @@
+from collections import Counter
+from random import Random
+
+import pytest
+
+from aoc.inputs import Input
+from aoc.solutions import load
+
+day = load(2021, 5).module
+
+EXAMPLE = b"""0,9 -> 5,9
+8,0 -> 0,8
+9,4 -> 3,4
+2,2 -> 2,1
+7,0 -> 7,4
+6,4 -> 2,0
+0,9 -> 2,9
+3,4 -> 1,4
+0,0 -> 8,8
+5,5 -> 8,2
+"""
+
+def random_vents(random: Random, count: int, size: int) -> bytes:
+    lines = []
+    for _ in range(count):
+        x, y = random.randrange(size), random.randrange(size)
+        dx, dy = random.choice([(1, 0), (-1, 0), (0, 1), (0, -1), (1, 1), (1, -1), (-1, 1), (-1, -1)])
+        # Including single points (a length of 0)
+        length = random.randrange(size // 2)
+        lines.append(f'{x},{y} -> {x + dx * length},{y + dy * length}')
+    return '\n'.join(lines).encode()
+
+def brute_force(segments: list[tuple[int, ...]], threshold: int, diagonals: bool) -> int:
+    covered = Counter()
+    for x1, y1, x2, y2 in segments:
+        if not diagonals and x1 != x2 and y1 != y2:
+            continue
+        dx, dy = (x2 > x1) - (x2 < x1), (y2 > y1) - (y2 < y1)
+        for step in range(max(abs(x2 - x1), abs(y2 - y1)) + 1):
+            covered[x1 + dx * step, y1 + dy * step] += 1
+    return sum(count >= threshold for count in covered.values())
+
+@pytest.mark.parametrize('parse', ['parse_sweep', 'parse_raster'])
+def test_example(parse: str):
+    vents = getattr(day, parse)(Input(EXAMPLE))
+    assert (day.part1(vents), day.part2(vents)) == (5, 12)
+
+@pytest.mark.parametrize('parse', ['parse_sweep', 'parse_raster'])
+@pytest.mark.parametrize('seed', range(10))
+def test_matches_brute_force(parse: str, seed: int):
+    if parse == 'parse_raster':
+        pytest.importorskip('numpy')
+
+    data = random_vents(Random(seed), 40, 30)
+    segments = day.fields(data, 4)
+    vents = getattr(day, parse)(Input(data))
+    for threshold in (1, 2, 3):
+        for diagonals in (False, True):
+            assert vents.overlaps(threshold, diagonals) == brute_force(segments, threshold, diagonals)
+
+def test_single_points_count():
+    vents = day.parse_sweep(Input(b'3,3 -> 3,3\n1,3 -> 5,3\n'))
+    assert vents.overlaps(1) == 5
+    assert vents.overlaps(2) == 1
+
+def test_parse_picks_a_backend():
+    pytest.importorskip('numpy')
+    assert isinstance(day.parse(Input(EXAMPLE)), day.Raster)
+
+    # Far too big a bounding box to rasterize
+    far = day.parse(Input(b'0,0 -> 5,5\n100000000,100000000 -> 100000000,100000005\n'))
+    assert isinstance(far, day.Sweep)
+    assert far.overlaps(1) == 12
+    with pytest.raises(ValueError):
+        day.parse_raster(Input(b'0,0 -> 5,5\n100000000,100000000 -> 100000000,100000005\n'))
@@ -0,0 +1,16 @@
+from aoc.inputs import Input
+from aoc.solutions import load
+
+day = load(2021, 9).module
+
+EXAMPLE = b'''2199943210
+3987894921
+9856789892
+8767896789
+9899965678
+'''
+
+def test_example():
+    grid = day.parse(Input(EXAMPLE))
+    assert day.part1(grid) == 15
+    assert day.part2(grid) == 1134
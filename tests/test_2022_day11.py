@@ -0,0 +1,68 @@
+import pytest
+
+from aoc.inputs import Input
+from aoc.solutions import load
+
+day = load(2022, 11).module
+
+EXAMPLE = b'''Monkey 0:
+  Starting items: 79, 98
+  Operation: new = old * 19
+  Test: divisible by 23
+    If true: throw to monkey 2
+    If false: throw to monkey 3
+
+Monkey 1:
+  Starting items: 54, 65, 75, 74
+  Operation: new = old + 6
+  Test: divisible by 19
+    If true: throw to monkey 2
+    If false: throw to monkey 0
+
+Monkey 2:
+  Starting items: 79, 60, 97
+  Operation: new = old * old
+  Test: divisible by 13
+    If true: throw to monkey 1
+    If false: throw to monkey 3
+
+Monkey 3:
+  Starting items: 74
+  Operation: new = old + 3
+  Test: divisible by 17
+    If true: throw to monkey 0
+    If false: throw to monkey 1
+'''
+
+def played(monkies, rounds: int, transform) -> list[int]:
+    """ Inspection counts from playing every round with every item, as the puzzle describes. """
+    items = [list(monkey.items) for monkey in monkies]
+    inspections = [0] * len(monkies)
+    for _ in range(rounds):
+        for index, monkey in enumerate(monkies):
+            for item in items[index]:
+                inspections[index] += 1
+                worry_level, target = monkey.inspect(item, transform)
+                items[target].append(worry_level)
+            items[index] = []
+    return inspections
+
+def test_example():
+    monkies = day.parse(Input(EXAMPLE))
+    assert day.part1(monkies) == 10605
+    assert day.part2(monkies) == 2713310158
+
+@pytest.mark.parametrize('data', [EXAMPLE, None], ids=['example', 'input'])
+@pytest.mark.parametrize('rounds', [1, 20, 1000, 2500])
+def test_cycles_match_playing_every_round(data: bytes | None, rounds: int):
+    puzzle = Input(data) if data is not None else Input.open(load(2022, 11).input_path)
+    monkies = day.parse(puzzle)
+    modulus = day.product([monkey.test.modulus for monkey in monkies])
+    transform = lambda worry_level: worry_level % modulus
+
+    assert day.eval(monkies, rounds, transform) == played(monkies, rounds, transform)
+
+def test_relief_matches_playing_every_round():
+    monkies = day.parse(Input(EXAMPLE))
+    transform = lambda worry_level: worry_level // 3
+    assert day.eval(monkies, 20, transform) == played(monkies, 20, transform) == [101, 95, 7, 105]
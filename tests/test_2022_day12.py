@@ -0,0 +1,19 @@
+from aoc.inputs import Input
+from aoc.solutions import load
+
+day = load(2022, 12).module
+
+EXAMPLE = b'''Sabqponm
+abcryxxl
+accszExk
+acctuvwj
+abdefghi
+'''
+
+def test_example():
+    height_map = day.parse(Input(EXAMPLE))
+    assert day.part1(height_map) == 31
+    assert day.part2(height_map) == 29
+
+def test_unreachable_summit():
+    assert day.part1(day.parse(Input(b'SazE\n'))) is None
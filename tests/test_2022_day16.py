@@ -0,0 +1,88 @@
+from functools import cache
+from random import Random
+
+import pytest
+
+from aoc.inputs import Input
+from aoc.solutions import load
+
+day = load(2022, 16).module
+
+def random_valves(random: Random, count: int) -> bytes:
+    names = ['AA'] + [f'{chr(65 + i // 26)}{chr(65 + i % 26)}' for i in range(1, count)]
+    tunnels = {name: set() for name in names}
+    # A random spanning tree keeps every valve reachable, and a few extra tunnels add cycles
+    for i in range(1, count):
+        other = names[random.randrange(i)]
+        tunnels[names[i]].add(other)
+        tunnels[other].add(names[i])
+    for _ in range(count // 2):
+        a, b = random.sample(names, 2)
+        tunnels[a].add(b)
+        tunnels[b].add(a)
+
+    lines = []
+    for name in names:
+        rate = random.choice([0, 0, random.randrange(1, 25)])
+        lines.append(f'Valve {name} has flow rate={rate}; tunnels lead to valves {", ".join(sorted(tunnels[name]))}')
+    return '\n'.join(lines).encode()
+
+def reference(valves: dict, actors: int, total_time: int) -> int:
+    """ The original search, keyed on plain tuples. """
+    @cache
+    def recurse(positions: tuple[str, ...], time: int, opened: frozenset) -> int:
+        if not positions:
+            return 0
+        if time <= 1:
+            return recurse(positions[1:], total_time, opened)
+
+        valve = valves[positions[0]]
+        best = max(recurse((neighbor.name,) + positions[1:], time - 1, opened) for neighbor in valve.neighbors)
+        if valve.rate > 0 and valve.name not in opened:
+            best = max(best, valve.rate * (time - 1) + recurse(positions, time - 1, opened | {valve.name}))
+        return best
+
+    return recurse(('AA',) * actors, total_time, frozenset())
+
+@pytest.mark.parametrize('seed', range(6))
+def test_matches_reference_search(seed: int):
+    valves = day.parse(Input(random_valves(Random(seed), 12)))
+    expected_one, expected_two = reference(valves, 1, 10), reference(valves, 2, 10)
+
+    assert day.max_pressure([valves['AA']], 10) == expected_one
+    assert day.max_pressure([valves['AA'], valves['AA']], 10) == expected_two
+    assert max(day.opened_pressures(valves, 10)[1].values()) == expected_one
+    assert day.paired_pressure(valves, 10) == expected_two
+
+def test_keys_count_the_actors():
+    # Without the number of actors, both of these packed to the same int
+    valve = day.Valve('XX', 0, [], 34)
+    assert day.recurse_key([valve, valve], 16, 26, 0) != day.recurse_key([valve], 2, 26, 0b1000001)
+
+def test_keys_are_distinct():
+    random = Random(1)
+    valves = [day.Valve(str(index), 0, [], index) for index in range(40)]
+    # Small sets are the ones an unaccounted-for position field could shift into
+    masks = list(range(256)) + [random.getrandbits(40) for _ in range(30)]
+
+    states = set()
+    for _ in range(50000):
+        actors = tuple(sorted(random.sample(range(40), random.randint(1, 2))))
+        states.add((actors, random.randint(2, 26), random.choice(masks)))
+
+    keys = {day.recurse_key([valves[index] for index in actors], time, 26, opened) for actors, time, opened in states}
+    assert len(keys) == len(states)
+
+def test_example():
+    valves = day.parse(Input(b"""Valve AA has flow rate=0; tunnels lead to valves DD, II, BB
+Valve BB has flow rate=13; tunnels lead to valves CC, AA
+Valve CC has flow rate=2; tunnels lead to valves DD, BB
+Valve DD has flow rate=20; tunnels lead to valves CC, AA, EE
+Valve EE has flow rate=3; tunnels lead to valves FF, DD
+Valve FF has flow rate=0; tunnels lead to valves EE, GG
+Valve GG has flow rate=0; tunnels lead to valves FF, HH
+Valve HH has flow rate=22; tunnel leads to valve GG
+Valve II has flow rate=0; tunnels lead to valves AA, JJ
+Valve JJ has flow rate=21; tunnel leads to valve II"""))
+    assert day.part1(valves) == 1651
+    assert day.part2(valves) == 1707
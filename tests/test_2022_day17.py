@@ -0,0 +1,28 @@
+import pytest
+
+from aoc.inputs import Input
+from aoc.solutions import load
+
+day = load(2022, 17).module
+
+EXAMPLE = b'>>><<><>><<<>><>>><<<>>><<<><<<>><>><<>>\n'
+
+def simulated_height(jets, count: int) -> int:
+    chamber = day.Chamber()
+    chamber.add_shapes(count, jets, analyze_cycles=False)
+    return chamber.height
+
+def test_example():
+    jets = day.parse(Input(EXAMPLE))
+    assert day.part1(jets) == 3068
+    assert day.part2(jets) == 1514285714288
+
+@pytest.mark.parametrize('count', [1, 5, 100, 2022, 3001, 4567])
+def test_cycles_match_simulation_on_example(count: int):
+    jets = day.parse(Input(EXAMPLE))
+    assert day.tower_height(jets, count) == simulated_height(jets, count)
+
+@pytest.mark.parametrize('count', [2022, 5000, 7777])
+def test_cycles_match_simulation_on_input(count: int):
+    jets = day.parse(Input.open(load(2022, 17).input_path))
+    assert day.tower_height(jets, count) == simulated_height(jets, count)
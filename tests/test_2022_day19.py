@@ -0,0 +1,55 @@
+from functools import cache
+from random import Random
+
+import pytest
+
+from aoc.inputs import Input
+from aoc.solutions import load
+
+day = load(2022, 19).module
+
+EXAMPLE = b"""Blueprint 1: Each ore robot costs 4 ore. Each clay robot costs 2 ore. Each obsidian robot costs 3 ore and 14 clay. Each geode robot costs 2 ore and 7 obsidian.
+Blueprint 2: Each ore robot costs 2 ore. Each clay robot costs 3 ore. Each obsidian robot costs 3 ore and 8 clay. Each geode robot costs 3 ore and 12 obsidian.
+"""
+
+def reference(numbers: tuple[int, ...], total_time: int) -> int:
+    """ Every choice every minute, without any pruning. """
+    _, ore_ore, clay_ore, obsidian_ore, obsidian_clay, geode_ore, geode_obsidian = numbers
+    prices = [(ore_ore, 0, 0), (clay_ore, 0, 0), (obsidian_ore, obsidian_clay, 0), (geode_ore, 0, geode_obsidian)]
+
+    @cache
+    def search(time: int, robots: tuple[int, ...], resources: tuple[int, ...]) -> int:
+        if time == 0:
+            return resources[3]
+
+        mined = tuple(amount + count for amount, count in zip(resources, robots))
+        best = search(time - 1, robots, mined)
+        for robot, price in enumerate(prices):
+            if all(resources[i] >= price[i] for i in range(3)):
+                built = tuple(count + (i == robot) for i, count in enumerate(robots))
+                left = tuple(mined[i] - (price[i] if i < 3 else 0) for i in range(4))
+                best = max(best, search(time - 1, built, left))
+        return best
+
+    return search(total_time, (1, 0, 0, 0), (0, 0, 0, 0))
+
+def test_example():
+    blueprints = day.parse(Input(EXAMPLE))
+    assert [day.RobotFactory(blueprint).maximize_production(24) for blueprint in blueprints] == [9, 12]
+    assert day.part1(blueprints) == 33
+
+@pytest.mark.parametrize('seed', range(8))
+def test_matches_unpruned_search(seed: int):
+    random = Random(seed)
+    numbers = (1, random.randint(1, 3), random.randint(1, 3), random.randint(1, 3), random.randint(2, 6), random.randint(1, 3), random.randint(2, 5))
+    blueprint = day.Blueprint.from_numbers(numbers)
+    assert day.RobotFactory(blueprint).maximize_production(12) == reference(numbers, 12)
+
+def test_one_cpu_searches_in_process(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(day.os, 'cpu_count', lambda: 1)
+    blueprints = day.parse(Input(EXAMPLE))
+
+    before = day.production.cache_info()
+    assert day.search_all(day.quality_level, list(map(day.RobotFactory, blueprints))) == [9, 24]
+    # The memo lives in this process, so its statistics (which `run --profile` reports) moved
+    assert day.production.cache_info().misses > before.misses
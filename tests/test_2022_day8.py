@@ -0,0 +1,16 @@
+from aoc.inputs import Input
+from aoc.solutions import load
+
+day = load(2022, 8).module
+
+EXAMPLE = b'''30373
+25512
+65332
+33549
+35390
+'''
+
+def test_example():
+    trees = day.parse(Input(EXAMPLE))
+    assert day.part1(trees) == 21
+    assert day.part2(trees) == 8
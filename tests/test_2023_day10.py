@@ -0,0 +1,20 @@
+import pytest
+
+from aoc.inputs import Input
+from aoc.solutions import load
+
+day = load(2023, 10).module
+
+@pytest.mark.parametrize('data, steps', [
+    (b'-L|F7\n7S-7|\nL|7||\n-L-J|\nL|-JF\n', 4),
+    (b'7-F7-\n.FJ|7\nSJLL7\n|F--J\nLJ.LJ\n', 8),
+])
+def test_farthest_point(data: bytes, steps: int):
+    assert day.part1(day.parse(Input(data))) == steps
+
+@pytest.mark.parametrize('data, enclosed', [
+    (b'...........\n.S-------7.\n.|F-----7|.\n.||.....||.\n.||.....||.\n.|L-7.F-J|.\n.|..|.|..|.\n.L--J.L--J.\n...........\n', 4),
+    (b'..........\n.S------7.\n.|F----7|.\n.||OOOO||.\n.||OOOO||.\n.|L-7F-J|.\n.|II||II|.\n.L--JL--J.\n..........\n', 4),
+])
+def test_enclosed_tiles(data: bytes, enclosed: int):
+    assert day.part2(day.parse(Input(data))) == enclosed
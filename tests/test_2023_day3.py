@@ -0,0 +1,21 @@
+from aoc.inputs import Input
+from aoc.solutions import load
+
+day = load(2023, 3).module
+
+EXAMPLE = b'''467..114..
+...*......
+..35..633.
+......#...
+617*......
+.....+.58.
+..592.....
+......755.
+...$.*....
+.664.598..
+'''
+
+def test_example():
+    schematic = day.parse(Input(EXAMPLE))
+    assert day.part1(schematic) == 4361
+    assert day.part2(schematic) == 467835
@@ -0,0 +1,58 @@
+from pathlib import Path
+
+import pytest
+
+from aoc.__main__ import main
+from aoc.batch import Result, format_result, format_summary, inputs, solve_all, summarize
+from aoc.generators import generate
+from aoc.inputs import Input
+from aoc.runner import run
+from aoc.solutions import load
+
+@pytest.fixture
+def directory(tmp_path: Path) -> Path:
+    for seed in range(6):
+        (tmp_path / f'input{seed}.txt').write_text(generate(2021, 1, 0.1, seed))
+    (tmp_path / 'broken.txt').write_text('not a depth\n')
+    (tmp_path / '.hidden').write_text('skipped\n')
+    (tmp_path / 'nested').mkdir()
+    return tmp_path
+
+def test_inputs_skip_hidden_files_and_directories(directory: Path):
+    assert [path.name for path in inputs(directory)] == ['broken.txt'] + [f'input{seed}.txt' for seed in range(6)]
+
+@pytest.mark.parametrize('jobs', [None, 2])
+def test_answers_match_running_each_input(directory: Path, jobs):
+    solution = load(2021, 1)
+    results = list(solve_all(solution, inputs(directory), jobs=jobs))
+    assert [result.path for result in results] == inputs(directory)
+
+    broken, *solved = results
+    assert broken.error is not None and broken.answers == []
+    for result in solved:
+        with Input.open(result.path) as puzzle:
+            expected = [(timing.stage, str(timing.result)) for timing in run(solution, puzzle).answers()]
+        assert result.error is None and result.answers == expected
+
+def test_only_requested_parts(directory: Path):
+    [result] = solve_all(load(2021, 1), [directory / 'input0.txt'], ['part2'])
+    assert [stage for stage, _ in result.answers] == ['part2']
+
+def test_summary():
+    results = [Result(Path(f'{n}'), [], wall) for n, wall in enumerate([0.1, 0.2, 0.3, 0.4])] + [Result(Path('x'), [], 0.5, 'boom')]
+    summary = summarize(results, 2.0)
+    assert (summary.inputs, summary.failures, summary.p50, summary.p95, summary.maximum) == (5, 1, 0.3, 0.5, 0.5)
+    assert summary.throughput == 2.5
+    assert format_summary(summary).startswith('5 inputs (1 failed) in 2.00s, 2.5 inputs/s')
+    assert summarize([], 0).throughput == 0.0
+
+def test_format_result(tmp_path: Path):
+    assert format_result(Result(tmp_path / 'a', [('part1', '7'), ('part2', 'x\ny')], 0.5), tmp_path) == 'a 0.5000s part1: 7, part2: \nx\ny'
+    assert format_result(Result(tmp_path / 'a', [], 0.5, 'Traceback'), tmp_path) == 'a FAILED (0.5000s)\nTraceback'
+
+def test_cli_fails_when_any_input_does(directory: Path, capsys: pytest.CaptureFixture):
+    assert main(['batch', '2021', '1', str(directory), '--quiet']) == 1
+    output = capsys.readouterr().out
+    assert 'broken.txt FAILED' in output and 'input0.txt' not in output and '7 inputs (1 failed)' in output
+    (directory / 'broken.txt').unlink()
+    assert main(['batch', '2021', '1', str(directory), '--quiet']) == 0
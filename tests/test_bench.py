@@ -0,0 +1,51 @@
+from pathlib import Path
+
+import pytest
+
+from aoc.__main__ import main
+from aoc.bench import Benchmark, Sample, day_order, load_baseline, percentile, regressions, sample, save_baseline
+
+def test_percentile_is_nearest_rank():
+    values = [5.0, 1.0, 4.0, 2.0, 3.0]
+    assert [percentile(values, p) for p in (0, 20, 50, 95, 100)] == [1.0, 1.0, 3.0, 5.0, 5.0]
+
+def test_benchmark_from_samples():
+    samples = [Sample(0.3, 100, 0), Sample(0.1, 300, 0), Sample(0.2, 200, 0)]
+    assert Benchmark.from_samples('2021/day1', samples) == Benchmark('2021/day1', 3, 0.2, 0.3, 300)
+
+def test_regressions():
+    baseline = Benchmark('2021/day1', 5, 1.0, 1.2, 1000)
+    assert regressions(Benchmark('2021/day1', 5, 1.1, 1.3, 1100), baseline, 0.2) == []
+    slower = regressions(Benchmark('2021/day1', 5, 1.5, 1.2, 1500), baseline, 0.2)
+    assert [(r.metric, r.ratio) for r in slower] == [('median', 1.5), ('max_rss', 1.5)]
+    # Relatively large changes to tiny timings are noise
+    tiny = Benchmark('2021/day1', 5, 0.01, 0.01, 1000)
+    assert regressions(tiny._replace(median=0.03, p95=0.03), tiny, 0.2, minimum=0.05) == []
+
+def test_baseline_round_trip_merges_and_orders(tmp_path: Path):
+    path = tmp_path / 'benchmarks' / 'baseline.json'
+    assert load_baseline(path) == {}
+    save_baseline([Benchmark('2022/day1', 3, 0.2, 0.3, 10), Benchmark('2021/day10', 3, 0.1, 0.1, 20)], path)
+    save_baseline([Benchmark('2021/day2', 3, 0.5, 0.6, 30), Benchmark('2022/day1', 3, 0.4, 0.4, 40)], path)
+    baseline = load_baseline(path)
+    assert list(baseline) == ['2021/day2', '2021/day10', '2022/day1']
+    assert baseline['2022/day1'] == Benchmark('2022/day1', 3, 0.4, 0.4, 40)
+    assert sorted(['2021/day10', '2021/day9', '2020/day25'], key=day_order) == ['2020/day25', '2021/day9', '2021/day10']
+
+def test_sample_runs_main_in_a_fresh_interpreter():
+    measured = sample(2021, 1, timeout=60)
+    assert measured.returncode == 0 and measured.wall > 0 and measured.max_rss > 0
+
+def test_missing_baseline_is_reported_and_fails(tmp_path: Path, capsys: pytest.CaptureFixture):
+    path = tmp_path / 'baseline.json'
+    assert main(['bench', '2021', '1', '--runs', '1', '--baseline', str(path)]) == 1
+    output = capsys.readouterr().out
+    assert 'No baseline at' in output and 'Nothing compared' in output
+
+    assert main(['bench', '2021', '1', '--runs', '1', '--baseline', str(path), '--save']) == 0
+    assert list(load_baseline(path)) == ['2021/day1']
+    capsys.readouterr()
+
+    # Generous limits, so only a missing entry could fail
+    assert main(['bench', '2021', '1', '--runs', '1', '--baseline', str(path), '--threshold', '100', '--min-delta', '10']) == 0
+    assert 'ok (' in capsys.readouterr().out
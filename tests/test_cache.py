@@ -0,0 +1,136 @@
+import importlib
+import sys
+from pathlib import Path
+from types import ModuleType
+
+import pytest
+
+from aoc import cache as cache_module
+from aoc.cache import Cache, answer_key, dependencies, digest, parse_key
+from aoc.inputs import Input
+from aoc.runner import run_cached
+from aoc.solutions import Solution
+
+HELPER = '''
+def scale(n):
+    return n * {factor}
+'''
+
+DAY = '''
+from cache_test_helper import scale
+
+def parse(puzzle):
+    return int(bytes(puzzle.view))
+
+def part1(n):
+    return scale(n)
+'''
+
+@pytest.fixture
+def repository(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    """ A helper module and a day using it, both counting as part of the repository. """
+    monkeypatch.setattr(cache_module, 'ROOT', tmp_path)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    (tmp_path / 'cache_test_day.py').write_text(DAY)
+
+    def write_helper(factor: int) -> ModuleType:
+        (tmp_path / 'cache_test_helper.py').write_text(HELPER.format(factor=factor))
+        for name in ('cache_test_helper', 'cache_test_day'):
+            sys.modules.pop(name, None)
+        importlib.invalidate_caches()
+        return importlib.import_module('cache_test_day')
+
+    yield write_helper
+
+    for name in ('cache_test_helper', 'cache_test_day'):
+        sys.modules.pop(name, None)
+
+def test_dependencies_are_imported_local_modules(repository):
+    day = repository(2)
+    assert [module.__name__ for module in dependencies(day)] == ['cache_test_helper']
+
+def test_editing_a_shared_helper_invalidates_the_answer(repository, tmp_path: Path):
+    cache = Cache(tmp_path / 'cache')
+    puzzle = Input(b'21')
+
+    day = repository(2)
+    first = run_cached(Solution(2000, 1, day), puzzle, ['part1'], cache)
+    again = run_cached(Solution(2000, 1, day), puzzle, ['part1'], cache)
+    assert [timing.result for timing in first.answers()] == [42]
+    assert again.cached
+
+    key = answer_key(digest(puzzle.view), day, 'part1')
+    parsed = parse_key(digest(puzzle.view), day)
+
+    day = repository(3)
+    assert answer_key(digest(puzzle.view), day, 'part1') != key
+    assert parse_key(digest(puzzle.view), day) != parsed
+
+    edited = run_cached(Solution(2000, 1, day), puzzle, ['part1'], cache)
+    assert not edited.answers()[0].cached
+    assert [timing.result for timing in edited.answers()] == [63]
+
+def test_puts_only_scan_once_the_estimate_passes_the_limit(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    cache = Cache(tmp_path / 'cache', limit=2000)
+    scans = []
+    entries = Cache.entries
+    monkeypatch.setattr(Cache, 'entries', lambda self: scans.append(1) or entries(self))
+
+    for n in range(5):
+        assert cache.put(f'{n:02x}' * 32, bytes(100))
+    # Measured once on the first store, then estimated
+    assert len(scans) == 1
+
+    for n in range(5, 40):
+        cache.put(f'{n:02x}' * 32, bytes(100))
+        assert sum(entry.stat().st_size for entry in cache.path.glob('*/*.pickle')) <= 2000
+    # Each eviction leaves a quarter of the limit free, so several stores go by between scans
+    assert len(scans) <= 8
+    assert cache.estimate == cache.size()
+
+    # The most recently stored entries survive
+    assert cache.get(f'{39:02x}' * 32)[0] and not cache.get(f'{0:02x}' * 32)[0]
+
+def test_first_put_counts_entries_already_on_disk(tmp_path: Path):
+    Cache(tmp_path / 'cache').put('aa' * 32, bytes(1000))
+    cache = Cache(tmp_path / 'cache', limit=1500)
+    cache.put('bb' * 32, bytes(1000))
+    assert cache.size() <= 1500 and cache.get('bb' * 32)[0]
+
+STREAMING_DAY = '''
+class Counter:
+    def __init__(self):
+        self.lines = 0
+
+    def feed(self, line):
+        self.lines += 1
+
+    def part1(self):
+        return self.lines
+
+def consumer():
+    return Counter()
+
+def parse(puzzle):
+    counter = consumer()
+    for line in puzzle.byte_lines():
+        counter.feed(line)
+    return counter
+
+def part1(counter):
+    return counter.part1()
+'''
+
+def test_streaming_days_only_cache_answers(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.syspath_prepend(str(tmp_path))
+    (tmp_path / 'cache_test_streaming.py').write_text(STREAMING_DAY)
+    importlib.invalidate_caches()
+    day = importlib.import_module('cache_test_streaming')
+    try:
+        cache, puzzle = Cache(tmp_path / 'cache'), Input(b'a\nb\nc\n')
+        first = run_cached(Solution(2000, 2, day), puzzle, ['part1'], cache)
+        assert [timing.result for timing in first.answers()] == [3]
+        assert cache.get(parse_key(digest(puzzle.view), day)) == (False, None)
+        assert run_cached(Solution(2000, 2, day), puzzle, ['part1'], cache).cached
+    finally:
+        sys.modules.pop('cache_test_streaming', None)
@@ -0,0 +1,80 @@
+from random import Random
+
+import pytest
+
+from aoc.cycles import Cycle, CycleDetector, brent, find_cycle, floyd
+
+def functional_graphs(seed: int):
+    """ Random maps from nodes to nodes with a weight per node, so the running total grows by a fixed amount per loop. """
+    random = Random(seed)
+    for _ in range(60):
+        size = random.randint(1, 30)
+        successors = [random.randrange(size) for _ in range(size)]
+        weights = [random.randint(-3, 9) for _ in range(size)]
+        yield successors, weights, random.randrange(size)
+
+def brute_cycle(successors: list[int], initial: int) -> tuple[int, int]:
+    seen, node, step = {}, initial, 0
+    while node not in seen:
+        seen[node] = step
+        node, step = successors[node], step + 1
+    return seen[node], step - seen[node]
+
+def simulate(successors: list[int], weights: list[int], initial: int, steps: int) -> int:
+    node, total = initial, 0
+    for _ in range(steps):
+        node, total = successors[node], total + weights[node]
+    return total
+
+def stepper(successors: list[int], weights: list[int]):
+    # States carry a running total that the key ignores, so values keep growing around the loop
+    return lambda state: (successors[state[0]], state[1] + weights[state[0]])
+
+@pytest.mark.parametrize('search', [floyd, brent])
+def test_pure_searches_match_brute_force(search):
+    for successors, weights, initial in functional_graphs(1):
+        start, length = brute_cycle(successors, initial)
+        cycle = search(stepper(successors, weights), (initial, 0), key=lambda state: state[0], value=lambda state: state[1])
+        assert (cycle.start, cycle.length) == (start, length)
+        for n in range(start + 3 * length + 5):
+            assert cycle.at(n) == simulate(successors, weights, initial, n)
+
+@pytest.mark.parametrize('search', [floyd, brent])
+def test_without_a_value(search):
+    cycle = search(lambda n: (n * n + 1) % 255, 3)
+    assert (cycle.start, cycle.length) == brute_cycle([(n * n + 1) % 255 for n in range(255)], 3)
+    assert cycle.values == []
+
+def test_detector_matches_brute_force():
+    for successors, weights, initial in functional_graphs(2):
+        start, length = brute_cycle(successors, initial)
+        detector, node, total, cycle = CycleDetector(), initial, 0, None
+        while cycle is None:
+            cycle = detector.observe(node, total)
+            node, total = successors[node], total + weights[node]
+
+        assert (cycle.start, cycle.length) == (start, length)
+        assert len(cycle.values) == start + length + 1
+        for n in range(start + 4 * length + 3):
+            assert cycle.at(n) == simulate(successors, weights, initial, n)
+        # Far beyond the loop, compare against stepping only through the remainder of the trips
+        n = 10**12 + 7
+        trips, offset = divmod(n - start, length)
+        expected = simulate(successors, weights, initial, start + offset) + trips * (simulate(successors, weights, initial, start + length) - simulate(successors, weights, initial, start))
+        assert cycle.at(n) == expected
+
+def test_find_cycle():
+    steps = [('a', 0), ('b', 1), ('c', 3), ('b', 6), ('c', 8)]
+    assert find_cycle(steps) == Cycle(1, 2, [0, 1, 3, 6])
+    assert find_cycle(steps[:3]) is None
+
+def test_at_before_and_within_the_first_loop():
+    cycle = Cycle(2, 3, [10, 11, 20, 25, 27, 30])
+    assert cycle.delta == 10
+    assert [cycle.at(n) for n in range(11)] == [10, 11, 20, 25, 27, 30, 35, 37, 40, 45, 47]
+    assert cycle.fold(4) == (4, 0) and cycle.fold(8) == (2, 2)
+
+def test_at_with_arrays():
+    numpy = pytest.importorskip('numpy')
+    cycle = Cycle(0, 1, [numpy.array([0, 1]), numpy.array([2, 4])])
+    assert list(cycle.at(5)) == [10, 16]
@@ -0,0 +1,96 @@
+import socket
+from pathlib import Path
+from threading import Thread
+from time import sleep
+
+import pytest
+
+from aoc.client import Client, encode, unpack
+from aoc.daemon import Daemon, Histogram
+
+EXAMPLE = b'199\n200\n208\n210\n200\n207\n240\n269\n260\n263\n'
+
+def connect(path: Path) -> Client:
+    for _ in range(500):
+        if path.exists():
+            return Client(str(path))
+        sleep(0.01)
+    raise TimeoutError(f'Nothing listening at {path}')
+
+def serve_while(path: Path, conversation) -> list:
+    """ Runs the daemon in this thread (it handles signals) while `conversation` talks to it from another, then shuts it down. """
+    results, errors = [], []
+
+    def talk():
+        try:
+            results.append(conversation(path))
+        except BaseException as error:
+            errors.append(error)
+        finally:
+            with connect(path) as client:
+                client.request({'command': 'shutdown'})
+
+    thread = Thread(target=talk)
+    thread.start()
+    Daemon().serve(path)
+    thread.join()
+    if errors:
+        raise errors[0]
+    assert not path.exists()
+    return results[0]
+
+def test_unpack_waits_for_whole_messages():
+    data = encode({'command': 'solve'}, b'abc') + encode({'command': 'stats'})
+    assert unpack(data[:5]) is None
+    assert unpack(data[:data.index(b'\n') + 2]) is None
+    message, payload, length = unpack(data)
+    assert (message['size'], payload) == (3, b'abc')
+    assert unpack(data[length:]) == ({'command': 'stats'}, None, len(data) - length)
+
+def test_an_idle_client_does_not_block_others(tmp_path: Path):
+    def conversation(path: Path):
+        with connect(path) as idle, connect(path) as busy:
+            # `idle` stays connected with half a request sent, which once held up everyone
+            idle.socket.sendall(b'{"command": "sol')
+            first = busy.solve(2021, 1, data=EXAMPLE)
+            second = busy.solve(2021, 1, data=EXAMPLE, parts=['part1'])
+            idle.socket.sendall(b've", "year": 2021, "day": 1}\n')
+            finished = unpack(idle.stream.readline())[0]
+            unknown = idle.request({'command': 'dance'})
+            return first, second, finished, unknown
+
+    first, second, finished, unknown = serve_while(tmp_path / 'daemon.sock', conversation)
+    assert [answer for _, answer in first['answers']] == ['7', '5']
+    assert [answer for _, answer in second['answers']] == ['7']
+    # Without inline input the daemon solves the checked-in one
+    assert [stage for stage, _ in finished['answers']] == ['part1', 'part2']
+    assert 'Unknown command' in unknown['error']
+
+def test_pipelined_requests_are_all_answered(tmp_path: Path):
+    def conversation(path: Path):
+        with connect(path) as client:
+            client.socket.sendall(encode({'command': 'solve', 'year': 2021, 'day': 1}, EXAMPLE) * 3)
+            return [client.stream.readline() for _ in range(3)], client.request({'command': 'stats'})
+
+    lines, stats = serve_while(tmp_path / 'daemon.sock', conversation)
+    assert all(b'"answers"' in line for line in lines)
+    assert '2021/day1: 3 requests' in stats['stats']
+
+def test_malformed_requests_drop_only_that_connection(tmp_path: Path):
+    def conversation(path: Path):
+        with connect(path) as broken, connect(path) as client:
+            broken.socket.sendall(b'not json\n')
+            assert broken.stream.readline() == b''
+            return client.solve(2021, 1, data=EXAMPLE)
+
+    reply = serve_while(tmp_path / 'daemon.sock', conversation)
+    assert [answer for _, answer in reply['answers']] == ['7', '5']
+
+def test_histogram_percentiles():
+    histogram = Histogram()
+    for seconds in (1e-6, 3e-6, 1e-3, 0.5):
+        histogram.add(seconds)
+    assert histogram.count == 4 and histogram.maximum == 0.5
+    assert histogram.percentile(50) == 4e-6
+    assert histogram.percentile(100) == 0.5
+    assert Histogram().format('none') == ['none: no requests']
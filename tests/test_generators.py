@@ -0,0 +1,45 @@
+import pytest
+
+from aoc.generators import available, count, generate, side, synchronizes
+from aoc.inputs import Input
+from aoc.runner import run
+from aoc.solutions import load
+
+# Days too slow to solve even a tiny generated input in a unit test, so only their parsing is checked
+PARSE_ONLY = {(2022, 19)}
+
+@pytest.mark.parametrize('year, day', available())
+def test_generated_inputs_are_reproducible_and_solvable(year: int, day: int):
+    text = generate(year, day, 0.05, seed=3)
+    assert text == generate(year, day, 0.05, seed=3)
+    assert text.endswith('\n')
+
+    solution = load(year, day)
+    if (year, day) in PARSE_ONLY:
+        solution.parse(Input.from_text(text))
+    else:
+        report = run(solution, Input.from_text(text))
+        assert all(timing.result is not None for timing in report.answers())
+
+@pytest.mark.parametrize('year, day', available())
+def test_inputs_grow_with_scale(year: int, day: int):
+    assert len(generate(year, day, 4)) > len(generate(year, day, 0.25))
+
+def test_unknown_days_have_no_generator():
+    with pytest.raises(KeyError):
+        generate(1999, 1)
+
+def test_scaling_helpers():
+    assert [count(100, scale) for scale in (0.001, 0.5, 3)] == [1, 50, 300]
+    assert [side(100, scale) for scale in (0.0001, 1, 4)] == [2, 100, 200]
+
+@pytest.mark.parametrize('scale', [0.05, 1, 10])
+def test_octopuses_always_synchronize(scale: float):
+    solution = load(2021, 11)
+    for seed in range(5):
+        assert isinstance(run(solution, Input.from_text(generate(2021, 11, scale, seed)), parts=['part2']).answers()[0].result, int)
+
+def test_synchronizes():
+    assert synchronizes(bytearray([5] * 4), 2)
+    # Every octopus flashes on its own turn, forever
+    assert not synchronizes(bytearray([0, 5]), 2, limit=100)
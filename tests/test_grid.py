@@ -0,0 +1,81 @@
+import pytest
+
+from aoc.grid import ADJACENT, DIAGONAL, DIGITS, EAST, NORTH, ORTHOGONAL, SOUTH, WEST, Grid, Neighbors, neighbor_table, shift_table
+from aoc.inputs import Input
+
+SHAPES = [(1, 1), (1, 5), (5, 1), (2, 2), (5, 4), (7, 3)]
+DELTAS = [ORTHOGONAL, DIAGONAL, ADJACENT, ((2, 1), (-3, 0))]
+
+def expected_neighbors(width: int, height: int, deltas, wrap: bool) -> list[list[int]]:
+    table = []
+    for y in range(height):
+        for x in range(width):
+            neighbors = []
+            for dx, dy in deltas:
+                nx, ny = x + dx, y + dy
+                if wrap:
+                    nx, ny = nx % width, ny % height
+                elif not (0 <= nx < width and 0 <= ny < height):
+                    continue
+                neighbors.append(ny * width + nx)
+            table.append(neighbors)
+    return table
+
+@pytest.mark.parametrize('width, height', SHAPES)
+@pytest.mark.parametrize('deltas', DELTAS)
+@pytest.mark.parametrize('wrap', [False, True])
+def test_neighbors_match_brute_force(width: int, height: int, deltas, wrap: bool):
+    neighbors = Neighbors(width, height, deltas, wrap)
+    assert len(neighbors) == width * height
+    assert [list(neighbors[index]) for index in range(width * height)] == expected_neighbors(width, height, deltas, wrap)
+
+@pytest.mark.parametrize('width, height', SHAPES)
+@pytest.mark.parametrize('delta', [NORTH, EAST, SOUTH, WEST, (1, 1), (-2, 3)])
+@pytest.mark.parametrize('wrap', [False, True])
+def test_shift_table_matches_brute_force(width: int, height: int, delta, wrap: bool):
+    expected = [row[0] if row else -1 for row in expected_neighbors(width, height, (delta,), wrap)]
+    assert list(shift_table(width, height, delta, wrap)) == expected
+
+def test_neighbors_are_stored_per_kind_not_per_cell():
+    neighbors = Neighbors(1000, 1000, ADJACENT)
+    # Three kinds of column and row (first, inner, last) for single steps
+    assert len(neighbors.offsets) == 3 and all(len(row) == 3 for row in neighbors.offsets)
+    assert sorted(neighbors[1001]) == [0, 1, 2, 1000, 1002, 2000, 2001, 2002]
+    assert sorted(neighbors[0]) == [1, 1000, 1001]
+
+def test_neighbor_tables_are_shared_per_shape():
+    assert neighbor_table(5, 4) is neighbor_table(5, 4)
+    assert Grid.filled(5, 4).neighbors() is neighbor_table(5, 4, ORTHOGONAL, False)
+
+def test_shift_cache_is_bounded_by_memory(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(shift_table, 'max_bytes', 100_000)
+    shift_table.cache_clear()
+    for size in range(100, 110):
+        shift_table(size, size, EAST)
+    assert shift_table.cache_info().bytes <= 100_000
+    assert shift_table.cache_info().evictions > 0
+    shift_table.cache_clear()
+
+def test_parse_and_access():
+    grid = Grid.parse(Input(b'123\n456\n'), DIGITS)
+    assert (grid.width, grid.height, grid.size) == (3, 2, 6)
+    assert grid.get(2, 1) == 6 and grid.get(3, 0) is None and grid.get(0, 0, -1) == 1
+    assert grid.position(grid.index(1, 1)) == (1, 1)
+    assert bytes(grid.row(1)) == bytes([4, 5, 6]) and bytes(grid.column(2)) == bytes([3, 6])
+    assert list(grid.line(0, (1, 1))) == [0, 4]
+    assert grid.find(5) == 4 and grid.find(9) == -1
+
+def test_ragged_rows_are_rejected():
+    with pytest.raises(ValueError):
+        Grid.parse(b'123\n45\n')
+
+def test_pad_and_render():
+    grid = Grid.parse(b'ab\ncd\n').pad(1, ord('.'))
+    assert grid.render() == '....\n.ab.\n.cd.\n....'
+    assert list(Grid.parse(b'#.#\n').find_all(ord('#'))) == [0, 2]
+
+def test_array_shares_memory():
+    pytest.importorskip('numpy')
+    grid = Grid.filled(3, 2)
+    grid.array()[1, 2] = 7
+    assert grid.get(2, 1) == 7
@@ -0,0 +1,57 @@
+import subprocess
+import sys
+
+import pytest
+
+from aoc.imports import Audit, Import, audit, format_audit, format_totals, heaviest_modules, parse_importtime, startup
+from aoc.lazy import lazy
+from aoc.solutions import ROOT
+
+IMPORTTIME = '''import time: self [us] | cumulative | imported package
+import time:       100 |        100 |     _json
+import time:       300 |        400 |   json.decoder
+import time:       200 |        600 | json
+import time:        50 |         50 | heapq
+'''
+
+def test_parse_importtime():
+    assert parse_importtime(IMPORTTIME) == [
+        Import('_json', 2, 100, 100),
+        Import('json.decoder', 1, 300, 400),
+        Import('json', 0, 200, 600),
+        Import('heapq', 0, 50, 50),
+    ]
+
+def test_audits_and_totals():
+    day = Audit('2000/day1', parse_importtime(IMPORTTIME))
+    other = Audit('2000/day2', [Import('heapq', 0, 70, 70)])
+    assert day.total == 650 and [module.name for module in day.direct] == ['json', 'heapq']
+    assert heaviest_modules([day, other], 2) == [('json.decoder', 1, 300), ('json', 1, 200)]
+    assert heaviest_modules([day, other], 10)[-2:] == [('heapq', 2, 120), ('_json', 1, 100)]
+    assert format_audit(day, 1).split() == ['2000/day1', '0.7ms', '4', 'json', '0.6ms']
+    assert format_totals([day, other], 1).startswith('2 days import for 0.7ms in total')
+
+def test_audit_leaves_out_startup_modules():
+    preloaded = frozenset(startup())
+    found = audit(2021, 1, runs=1, preloaded=preloaded)
+    names = {module.name for module in found.imports}
+    assert 'aoc.inputs' in names and not names & preloaded
+
+LAZY = '''
+import sys
+from aoc.lazy import lazy
+statistics = lazy('statistics')
+before = type(sys.modules['statistics']).__name__
+statistics.median([1, 2, 3])
+print(before, type(sys.modules['statistics']).__name__)
+'''
+
+def test_lazy_modules_load_on_first_use():
+    # A fresh interpreter, so nothing has imported the module already
+    result = subprocess.run([sys.executable, '-c', LAZY], cwd=ROOT, capture_output=True, text=True, check=True)
+    assert result.stdout.split() == ['_LazyModule', 'module']
+
+def test_lazy_returns_modules_already_imported():
+    assert lazy('sys') is sys
+    with pytest.raises(ModuleNotFoundError):
+        lazy('no_such_module_anywhere')
@@ -0,0 +1,47 @@
+import os
+from mmap import mmap
+from pathlib import Path
+
+import pytest
+
+from aoc.inputs import Input
+
+CASES = [b'', b'\n', b'a', b'a\n', b'a\nb', b'a\r\nb\r\n', b'\n\nx\n\n', b'-12 x3\n4,-5\n']
+
+@pytest.mark.parametrize('data', CASES)
+def test_lines_match_splitlines(data: bytes):
+    puzzle = Input(data)
+    assert list(puzzle.byte_lines()) == data.splitlines()
+    assert list(puzzle.lines()) == data.decode().splitlines()
+    assert puzzle.text == data.decode() and len(puzzle) == len(data)
+
+def test_regular_files_are_mapped(tmp_path: Path):
+    path = tmp_path / 'input'
+    path.write_bytes(b'1 -2\n3\n')
+    with Input.open(path) as puzzle:
+        assert isinstance(puzzle._buffer, mmap)
+        assert puzzle.ints() == [1, -2, 3]
+        # The view reads the mapping itself rather than a copy
+        view = puzzle.view
+        assert view.obj is puzzle._buffer and bytes(view) == b'1 -2\n3\n'
+        view.release()
+    assert puzzle._buffer.closed
+
+def test_empty_files_are_read(tmp_path: Path):
+    path = tmp_path / 'input'
+    path.write_bytes(b'')
+    with Input.open(path) as puzzle:
+        assert puzzle._buffer == b'' and list(puzzle.byte_lines()) == []
+
+def test_pipes_are_read():
+    read, write = os.pipe()
+    os.write(write, b'x\ny\n')
+    os.close(write)
+    try:
+        puzzle = Input.from_file(read)
+    finally:
+        os.close(read)
+    assert puzzle._buffer == b'x\ny\n' and list(puzzle.lines()) == ['x', 'y']
+
+def test_from_text():
+    assert list(Input.from_text('é\n').lines()) == ['é']
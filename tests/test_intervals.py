@@ -0,0 +1,153 @@
+from itertools import product
+from random import Random
+
+import pytest
+
+from aoc.intervals import BoxSet, Interval, IntervalSet, RangeMap, box_difference, box_volume
+
+def members(intervals: IntervalSet) -> set[int]:
+    return {value for start, end in intervals for value in range(start, end)}
+
+def random_intervals(random: Random, count: int) -> list[tuple[int, int]]:
+    intervals = []
+    for _ in range(count):
+        start = random.randrange(-20, 20)
+        intervals.append((start, start + random.randrange(0, 8)))
+    return intervals
+
+def test_add_merges_overlapping_and_adjacent():
+    intervals = IntervalSet()
+    intervals.add(0, 3)
+    intervals.add(5, 8)
+    assert list(intervals) == [Interval(0, 3), Interval(5, 8)]
+
+    # [3, 5) touches both neighbours, so all three become one
+    intervals.add(3, 5)
+    assert list(intervals) == [Interval(0, 8)]
+    assert intervals.total() == 8
+
+def test_empty_intervals_are_ignored():
+    intervals = IntervalSet([(4, 4), (6, 2)])
+    assert len(intervals) == 0
+
+    intervals.add(1, 3)
+    intervals.add(2, 2)
+    intervals.discard(2, 2)
+    assert list(intervals) == [Interval(1, 3)]
+    assert Interval(5, 5).is_empty() and Interval(5, 5).length() == 0
+
+def test_constructor_merges_adjacent():
+    assert list(IntervalSet([(3, 5), (0, 3), (7, 9)])) == [Interval(0, 5), Interval(7, 9)]
+
+def test_discard_splits():
+    intervals = IntervalSet([(0, 10)])
+    intervals.discard(3, 6)
+    assert list(intervals) == [Interval(0, 3), Interval(6, 10)]
+
+    # Removing exactly up to an endpoint leaves nothing empty behind
+    intervals.discard(0, 3)
+    intervals.discard(10, 12)
+    assert list(intervals) == [Interval(6, 10)]
+
+def test_set_operations_against_brute_force():
+    random = Random(11)
+    for _ in range(200):
+        a, b = random_intervals(random, 5), random_intervals(random, 5)
+        left, right = IntervalSet(a), IntervalSet(b)
+
+        added, discarded = IntervalSet(), IntervalSet(a)
+        for start, end in b:
+            added.add(start, end)
+            discarded.discard(start, end)
+
+        assert members(added) == members(right)
+        assert members(discarded) == members(left) - members(right)
+        assert members(left.union(right)) == members(left) | members(right)
+        assert members(left.difference(right)) == members(left) - members(right)
+        assert members(left.intersection(right)) == members(left) & members(right)
+
+        # The representation stays sorted, disjoint and non-touching
+        for result in (added, discarded, left.union(right), left.difference(right)):
+            assert all(start < end for start, end in result)
+            assert all(end < start for end, start in zip(result.ends, result.starts[1:]))
+
+def test_gaps():
+    intervals = IntervalSet([(2, 4), (6, 8)])
+    assert list(intervals.gaps(0, 10)) == [Interval(0, 2), Interval(4, 6), Interval(8, 10)]
+    assert list(intervals.gaps(3, 7)) == [Interval(4, 6)]
+    assert list(intervals.gaps(2, 4)) == []
+    assert list(IntervalSet().gaps(0, 3)) == [Interval(0, 3)]
+
+def test_gaps_against_brute_force():
+    random = Random(12)
+    for _ in range(200):
+        intervals = IntervalSet(random_intervals(random, 4))
+        start = random.randrange(-25, 25)
+        end = start + random.randrange(0, 20)
+
+        gaps = list(intervals.gaps(start, end))
+        assert {value for gap in gaps for value in range(*gap)} == set(range(start, end)) - members(intervals)
+        assert all(not gap.is_empty() for gap in gaps)
+
+def random_box(random: Random, dimensions: int) -> tuple[Interval, ...]:
+    sides = []
+    for _ in range(dimensions):
+        start = random.randrange(0, 6)
+        sides.append(Interval(start, start + random.randrange(0, 4)))
+    return tuple(sides)
+
+def points(box: tuple[Interval, ...]) -> set[tuple[int, ...]]:
+    return set(product(*(range(side.start, side.end) for side in box)))
+
+@pytest.mark.parametrize('dimensions', [1, 2, 3])
+def test_box_difference_against_brute_force(dimensions: int):
+    random = Random(dimensions)
+    for _ in range(200):
+        a, b = random_box(random, dimensions), random_box(random, dimensions)
+        pieces = box_difference(a, b)
+
+        covered = [points(piece) for piece in pieces]
+        assert set().union(*covered) == points(a) - points(b)
+        # Disjoint, so their volumes add up
+        assert sum(map(box_volume, pieces)) == len(points(a) - points(b))
+        assert len(pieces) <= 2 * dimensions
+
+def test_box_set_volume_against_brute_force():
+    random = Random(13)
+    for _ in range(50):
+        boxes, expected = BoxSet(), set()
+        for _ in range(8):
+            box = random_box(random, 3)
+            if random.random() < 0.7:
+                boxes.add(box)
+                expected |= points(box)
+            else:
+                boxes.discard(box)
+                expected -= points(box)
+
+            assert boxes.volume() == len(expected)
+
+def test_range_map_splits_across_pieces():
+    # [10, 15) -> [100, 105) and [20, 25) -> [0, 5), everything else unchanged
+    ranges = RangeMap([(20, 0, 5), (10, 100, 5)])
+    assert ranges[12] == 102 and ranges[17] == 17 and ranges[24] == 4
+
+    assert list(ranges.map_interval(8, 27)) == [(8, 10), (100, 105), (15, 20), (0, 5), (25, 27)]
+    assert list(ranges.map_interval(12, 14)) == [(102, 104)]
+    assert list(ranges.map_interval(15, 20)) == [(15, 20)]
+    assert list(ranges.map_interval(5, 5)) == []
+
+def test_range_map_against_brute_force():
+    random = Random(14)
+    ranges = RangeMap([(0, 50, 4), (4, 30, 3), (10, -5, 6)])
+    for _ in range(200):
+        start = random.randrange(-5, 25)
+        end = start + random.randrange(0, 15)
+
+        images = list(ranges.map_interval(start, end))
+        assert sorted(value for image in images for value in range(*image)) == sorted(ranges[value] for value in range(start, end))
+        assert members(ranges.map_set(IntervalSet([(start, end)]))) == {ranges[value] for value in range(start, end)}
+
+def test_range_map_rejects_overlapping_sources():
+    with pytest.raises(ValueError):
+        RangeMap([(0, 10, 5), (3, 20, 2)])
@@ -0,0 +1,27 @@
+import subprocess
+import sys
+
+from aoc.solutions import ROOT
+
+CHECK = '''
+import sys
+from types import ModuleType
+from aoc.__main__ import parse_arguments
+parse_arguments(['run', '--no-cache'])
+loaded = [name for name in ('aoc.bench', 'aoc.cache', 'aoc.client', 'socket', 'json') if type(sys.modules.get(name)) is ModuleType]
+print(' '.join(loaded))
+'''
+
+def test_commands_defer_their_imports():
+    # A fresh interpreter, as whatever this one has imported already would hide eager imports
+    result = subprocess.run([sys.executable, '-c', CHECK], cwd=ROOT, capture_output=True, text=True, check=True)
+    assert result.stdout.split() == []
+
+def test_defaults_come_from_their_modules():
+    from aoc.__main__ import open_cache, parse_arguments
+    from aoc.cache import DEFAULT_LIMIT
+
+    args = parse_arguments(['serve'])
+    assert (args.socket, args.cache_limit) == (None, None)
+    assert open_cache(None).limit == DEFAULT_LIMIT
+    assert open_cache(3).limit == 3 * 2**20
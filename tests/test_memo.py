@@ -0,0 +1,96 @@
+from aoc.memo import MEMOS, Memo, estimate, memoize
+
+def counted(fn):
+    """ Wraps `fn` so each test can see which calls actually ran it. """
+    def wrapper(*args, **kwargs):
+        wrapper.calls.append(args)
+        return fn(*args, **kwargs)
+    wrapper.calls = []
+    return wrapper
+
+def test_unbounded_memo_caches_every_call():
+    square = counted(lambda n: n * n)
+    memo = memoize()(square)
+    assert [memo(n) for n in (1, 2, 1, 2, 3)] == [1, 4, 1, 4, 9]
+    assert square.calls == [(1,), (2,), (3,)]
+    info = memo.cache_info()
+    assert (info.hits, info.misses, info.evictions, info.entries, info.maxsize) == (2, 3, 0, 3, None)
+    assert info.bytes > 0 and info.hit_rate == 2 / 5
+
+def test_keyword_arguments_are_part_of_the_key():
+    memo = memoize()(lambda a, b=0: a - b)
+    assert memo(5, b=1) == 4 and memo(5, b=2) == 3 and memo(5) == 5
+    assert memo.cache_info().misses == 3
+
+def test_maxsize_evicts_least_recently_used():
+    identity = counted(lambda n: n)
+    memo = memoize(maxsize=2)(identity)
+    memo(1), memo(2), memo(1), memo(3)
+    # 1 was used more recently than 2, so 2 went
+    assert list(memo.cache) == [(1,), (3,)]
+    memo(1), memo(2)
+    assert identity.calls == [(1,), (2,), (3,), (2,)]
+    info = memo.cache_info()
+    assert (info.entries, info.evictions) == (2, 2)
+
+def test_max_bytes_bounds_the_estimated_size():
+    size = estimate((0,)) + estimate(0)
+    memo = memoize(max_bytes=3 * size)(lambda n: 0)
+    for n in range(10):
+        memo(n)
+        assert memo.cache_info().bytes <= 3 * size
+    assert list(memo.cache) == [(7,), (8,), (9,)]
+    assert memo.cache_info().evictions == 7
+
+def test_eviction_never_returns_a_stale_or_colliding_value():
+    # A narrow key and a tiny cache force constant eviction; every answer must still be the function's own
+    memo = memoize(key=lambda a, b: (a, b), maxsize=3)(lambda a, b: a * 100 + b)
+    for a in range(6):
+        for b in range(6):
+            assert memo(a, b) == a * 100 + b
+            assert memo(b, a) == b * 100 + a
+    assert all(value == a * 100 + b for (a, b), value in memo.cache.items())
+    assert len(memo.cache) <= 3
+
+def test_a_cached_none_is_a_hit():
+    nothing = counted(lambda n: None)
+    memo = memoize()(nothing)
+    assert memo(1) is None and memo(1) is None
+    assert len(nothing.calls) == 1 and memo.cache_info().hits == 1
+
+def test_a_none_key_skips_the_cache():
+    double = counted(lambda n: 2 * n)
+    memo = memoize(key=lambda n: None if n < 0 else n)(double)
+    assert memo(-1) == -2 and memo(-1) == -2 and memo(1) == 2 and memo(1) == 2
+    assert double.calls == [(-1,), (-1,), (1,)]
+    info = memo.cache_info()
+    assert (info.hits, info.misses, info.entries) == (1, 1, 1)
+
+def test_cache_clear_keeps_statistics():
+    memo = memoize(max_bytes=10_000)(lambda n: n)
+    memo(1), memo(1)
+    memo.cache_clear()
+    info = memo.cache_info()
+    assert (info.hits, info.misses, info.entries, info.bytes) == (1, 1, 0, 0)
+    memo(1)
+    assert memo.cache_info().misses == 2
+
+def test_methods_bind_their_instance():
+    class Scaled:
+        def __init__(self, factor):
+            self.factor = factor
+
+        @memoize()
+        def times(self, n):
+            return self.factor * n
+
+    two, three = Scaled(2), Scaled(3)
+    # The instance is part of the key, so two instances never share an entry
+    assert two.times(5) == 10 and three.times(5) == 15 and two.times(5) == 10
+    assert isinstance(Scaled.times, Memo)
+    assert Scaled.times.cache_info().hits == 1
+
+def test_memos_are_registered():
+    memo = memoize()(lambda: 1)
+    assert memo in MEMOS
+    assert memo.__name__ == '<lambda>'
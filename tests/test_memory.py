@@ -0,0 +1,51 @@
+from time import process_time
+from types import ModuleType
+
+import pytest
+
+from aoc.inputs import Input
+from aoc.memory import MemoryExceeded, MemoryMonitor, format_bytes, peak_rss, rss
+from aoc.runner import run
+from aoc.solutions import Solution
+
+MB = 2**20
+
+def hungry_day() -> ModuleType:
+    module = ModuleType('memory_test_day')
+    module.parse = lambda puzzle: None
+    module.part1 = lambda _: len(bytearray(20 * MB))
+
+    def part2(_):
+        # Keeps allocating (and burning CPU time, which paces the checks) until it's stopped
+        held, end = [], process_time() + 10
+        while process_time() < end:
+            held.append(bytearray(MB))
+            held[-1][::4096] = b'x' * len(range(0, MB, 4096))
+        return len(held)
+
+    module.part2 = part2
+    return module
+
+def test_records_each_stage():
+    monitor = MemoryMonitor()
+    run(Solution(2000, 1, hungry_day()), Input(b''), parts=['part1'], hooks=[monitor])
+    parse, part1 = monitor.usages
+    assert (parse.stage, part1.stage) == ('parse', 'part1')
+    assert part1.traced_peak >= 20 * MB > parse.traced_peak
+    assert part1.peak_rss >= rss() > 0 and peak_rss() >= part1.peak_rss
+    assert monitor.summary().splitlines()[2].split()[0] == 'part1'
+
+def test_stops_a_stage_over_its_limit():
+    limit = rss() + 50 * MB
+    monitor = MemoryMonitor(limit, top=3)
+    with pytest.raises(MemoryExceeded) as raised:
+        run(Solution(2000, 1, hungry_day()), Input(b''), parts=['part2'], hooks=[monitor])
+
+    exceeded = raised.value
+    assert (exceeded.name, exceeded.stage, exceeded.limit) == ('2000/day1', 'part2', limit)
+    assert exceeded.rss > limit and len(exceeded.sites) == 3
+    assert 'tests/test_memory.py' in exceeded.sites[0]
+    assert str(exceeded).startswith(f'2000/day1 part2 aborted: {format_bytes(exceeded.rss)} resident')
+    # The stage is still recorded, and stages within the limit run as usual
+    assert monitor.usages[-1].stage == 'part2'
+    run(Solution(2000, 1, hungry_day()), Input(b''), parts=['part1'], hooks=[MemoryMonitor(rss() + 100 * MB)])
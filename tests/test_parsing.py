@@ -0,0 +1,31 @@
+import pytest
+
+from aoc.parsing import fields, ints, records, separated, tokens
+
+def test_signs():
+    assert ints(b'Sensor at x=-3, y=18: closest beacon is at x=-2, y=-15') == [-3, 18, -2, -15]
+
+def test_dash_after_a_digit_separates():
+    assert ints(b'x=-3, y=4 2-4 a-5') == [-3, 4, 2, 4, -5]
+    assert ints(b'2-4,6-8\n10-12,-3--1') == [2, 4, 6, 8, 10, 12, -3, -1]
+
+def test_fast_path_and_fallback_agree():
+    # No ambiguous `-`, so this takes the `translate` path
+    assert separated(b'a-5 b=6') is not None
+    assert separated(b'2-4') is None
+    assert tokens(b'a-5 b=6') == [b'-5', b'6']
+    assert tokens(b'a-5 b=6 2-4') == [b'-5', b'6', b'2', b'4']
+
+def test_unsigned():
+    assert ints(b'x=-3, 2-4', signed=False) == [3, 2, 4]
+
+def test_fields():
+    assert fields(b'1-2 3-4\n5-6 7-8\n', 4) == [(1, 2, 3, 4), (5, 6, 7, 8)]
+    with pytest.raises(ValueError):
+        fields(b'1 2 3', 2)
+
+def test_records():
+    pytest.importorskip('numpy')
+    assert records(b'1 -2\n3 4\n', 2).tolist() == [[1, -2], [3, 4]]
+    assert records(b'1-2\n3-4\n', 2).tolist() == [[1, 2], [3, 4]]
+    assert records(b' \n', 2).shape == (0, 2)
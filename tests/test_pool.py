@@ -0,0 +1,36 @@
+import os
+from pathlib import Path
+
+import pytest
+
+from aoc import pool
+from aoc.pool import Outcome, load_durations, run_all, save_durations, schedule
+
+def crash_on_day_two(year, day, parts=None, cache=None):
+    # Dies the way an out-of-memory kill would, without raising anything the worker could catch
+    if day == 2:
+        os._exit(1)
+    return Outcome(year, day, None)
+
+def test_schedule_runs_unknown_and_slow_days_first():
+    durations = {'2021/day1': 0.5, '2021/day2': 3.0}
+    assert schedule([(2021, 1), (2021, 2), (2021, 3)], durations) == [(2021, 3), (2021, 2), (2021, 1)]
+
+def test_durations_round_trip(tmp_path: Path):
+    path = tmp_path / 'durations.json'
+    assert load_durations(path, tmp_path / 'missing.json') == {}
+    save_durations([Outcome(2021, 1, None, 'failed')], path)
+    assert load_durations(path, tmp_path / 'missing.json') == {}
+
+def test_exceptions_become_failed_outcomes(tmp_path: Path):
+    outcome = pool.solve(1999, 1)
+    assert outcome.report is None and 'Error' in outcome.error
+    [failed] = run_all([(1999, 1)], jobs=1, durations_path=tmp_path / 'durations.json')
+    assert (failed.year, failed.day, failed.report) == (1999, 1, None)
+
+def test_a_dead_worker_is_a_failed_outcome(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(pool, 'solve', crash_on_day_two)
+    outcomes = run_all([(2021, 1), (2021, 2), (2021, 3)], jobs=1, durations_path=tmp_path / 'durations.json')
+    assert [(outcome.year, outcome.day) for outcome in outcomes] == [(2021, 1), (2021, 2), (2021, 3)]
+    crashed = outcomes[1]
+    assert crashed.report is None and 'BrokenProcessPool' in crashed.error
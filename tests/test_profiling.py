@@ -0,0 +1,55 @@
+from pathlib import Path
+from time import process_time
+from types import ModuleType
+
+from aoc.inputs import Input
+from aoc.memo import memoize
+from aoc.profiling import Profiler, Sampler, location
+from aoc.runner import run
+from aoc.search import distances
+from aoc.solutions import ROOT, Solution
+
+def busy(seconds: float) -> int:
+    """ Burns CPU time so the sampler has something to catch. """
+    total, end = 0, process_time() + seconds
+    while process_time() < end:
+        total += sum(range(1000))
+    return total
+
+def profiled_day() -> ModuleType:
+    module = ModuleType('profiling_test_day')
+    # A fresh memo each time, as its statistics accumulate
+    square = memoize()(lambda n: n * n)
+    module.parse = lambda puzzle: [bytes(1000) for _ in range(100)]
+    module.part1 = lambda data: busy(0.1) + sum(square(n % 7) for n in range(50))
+    module.part2 = lambda data: distances([0], lambda node: [node + 1] if node < 20 else [], 21)[20]
+    return module
+
+def test_each_stage_gets_profiles_and_a_summary(tmp_path: Path):
+    profiler = Profiler(tmp_path / 'profiles', top=5)
+    report = run(Solution(2000, 1, profiled_day()), Input(b''), hooks=[profiler])
+    assert report.answers()[1].result == 20
+
+    for stage in ('parse', 'part1', 'part2'):
+        assert (tmp_path / 'profiles' / f'2000_day1_{stage}.prof').stat().st_size > 0
+        assert (tmp_path / 'profiles' / f'2000_day1_{stage}.folded').exists()
+
+    parse, part1, part2 = profiler.summaries
+    assert parse.startswith('2000/day1 parse: peak') and 'allocated at' in parse
+    assert 'memo profiled_day.<locals>.<lambda>: 43 hits, 7 misses' in part1
+    assert 'search expanded 21 nodes' in part2
+
+    # Collapsed stacks are `frame;frame;... count`, with the busy loop among them
+    folded = (tmp_path / 'profiles' / '2000_day1_part1.folded').read_text().splitlines()
+    assert folded and all(line.rsplit(' ', 1)[1].isdigit() for line in folded)
+    assert any('busy (' in line for line in folded)
+
+def test_sampler_collects_stacks():
+    sampler = Sampler(0.001)
+    with sampler.running():
+        busy(0.05)
+    assert sum(sampler.stacks.values()) > 0
+
+def test_location_is_relative_to_the_repository():
+    assert location(f'{ROOT}/aoc/grid.py') == 'aoc/grid.py'
+    assert location('/usr/lib/python3/heapq.py') == 'heapq.py'
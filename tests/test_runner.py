@@ -0,0 +1,82 @@
+import subprocess
+import sys
+from contextlib import contextmanager
+from types import ModuleType
+
+import pytest
+
+from aoc.bench import ENVIRONMENT
+from aoc.inputs import Input
+from aoc.runner import Report, Timing, format_report, run
+from aoc.solutions import Solution, discover, load
+
+# Quick days from each year, including one without a part 2
+QUICK = [(2021, 1), (2021, 10), (2021, 25), (2022, 1), (2022, 4), (2023, 1), (2024, 2)]
+
+def counting_day() -> ModuleType:
+    module = ModuleType('runner_test_day')
+    module.calls = []
+
+    def parse(puzzle):
+        module.calls.append('parse')
+        return puzzle.ints()
+
+    def part1(numbers):
+        module.calls.append('part1')
+        return sum(numbers)
+
+    def part2(numbers):
+        module.calls.append('part2')
+        return 'line one\nline two'
+
+    module.parse, module.part1, module.part2 = parse, part1, part2
+    return module
+
+@pytest.mark.parametrize('year, day', QUICK)
+def test_answers_match_running_main(year: int, day: int):
+    solution = load(year, day)
+    report = run(solution)
+    with open(solution.input_path, 'rb') as stdin:
+        printed = subprocess.run([sys.executable, 'main.py'], cwd=solution.directory, stdin=stdin, env=ENVIRONMENT, capture_output=True, check=True).stdout
+    assert [str(timing.result) for timing in report.answers()] == printed.decode().splitlines()
+
+def test_parses_once_for_every_part():
+    module = counting_day()
+    report = run(Solution(2000, 1, module), Input(b'1 2 3'))
+    assert module.calls == ['parse', 'part1', 'part2']
+    assert [timing.stage for timing in report.timings] == ['parse', 'part1', 'part2']
+    assert report.answers()[0].result == 6
+    assert report.wall == sum(timing.wall for timing in report.timings) and not report.cached
+
+def test_runs_only_the_requested_parts():
+    module = counting_day()
+    report = run(Solution(2000, 1, module), Input(b'4'), parts=['part2', 'part3'])
+    assert module.calls == ['parse', 'part2']
+    assert [timing.stage for timing in report.answers()] == ['part2']
+    assert load(2021, 25).parts() == ['part1']
+
+def test_hooks_wrap_each_stage():
+    entered = []
+
+    @contextmanager
+    def hook(solution, stage):
+        entered.append((solution.name, stage, 'start'))
+        yield
+        entered.append((solution.name, stage, 'end'))
+
+    run(Solution(2000, 1, counting_day()), Input(b'1'), hooks=[hook])
+    assert entered == [('2000/day1', stage, edge) for stage in ('parse', 'part1', 'part2') for edge in ('start', 'end')]
+
+def test_format_report():
+    report = Report('2000/day1', [Timing('parse', 0.5, 0.25), Timing('part1', 0.001, 0.001, 7, cached=True), Timing('part2', 0, 0, 'a\nb')])
+    lines = format_report(report).splitlines()
+    assert lines[:5] == ['2000/day1', '  part1: 7', '  part2: ', 'a', 'b']
+    assert lines[-3].endswith('(cached)') and lines[-1].split()[:2] == ['total', '0.5010s']
+
+def test_discover_and_load():
+    days = discover()
+    assert days == sorted(days) and (2021, 1) in days
+    assert discover(2021, 1) == [(2021, 1)] and discover(1999) == []
+    assert load(2021, 1).module is load(2021, 1).module
+    with pytest.raises(FileNotFoundError):
+        load(1999, 1)
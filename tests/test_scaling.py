@@ -0,0 +1,40 @@
+from math import isclose
+
+import pytest
+
+from aoc.scaling import NOISE_FLOOR, Fit, Measurement, curve, describe, fit, fits, format_curve, measure, scales
+from aoc.solutions import load
+
+def test_fit_recovers_power_laws():
+    for exponent in (0.5, 1, 2, 3):
+        found = fit([(scale, 0.01 * scale ** exponent) for scale in (1, 2, 4, 8, 16)])
+        assert isclose(found.exponent, exponent) and isclose(found.r_squared, 1)
+        assert isclose(found.predict(32), 0.01 * 32 ** exponent)
+        assert isclose(found.largest_scale(found.predict(10)), 10)
+
+def test_fit_ignores_noise_and_degenerate_points():
+    assert fit([(1, NOISE_FLOOR / 2), (2, 1.0)]) is None
+    assert fit([(2, 1.0), (2, 2.0)]) is None
+    assert fit([]) is None
+    assert Fit(0, 0, 1, 2).largest_scale(1) is None
+
+def test_describe():
+    assert [describe(k) for k in (0.1, 1.1, 1.4, 2.2, 4)] == ['O(1)', 'O(n)', 'O(n^1.5)', 'O(n^2)', 'O(n^3)']
+
+def test_scales():
+    assert list(scales(1, 2, 10)) == [1, 2, 4, 8]
+
+def test_fits_per_stage_and_total():
+    measurements = [Measurement(scale, 10, {'parse': 0.01 * scale, 'part1': 0.001 * scale ** 2}) for scale in (1, 2, 4)]
+    found = fits(measurements)
+    assert list(found) == ['parse', 'part1', 'total']
+    assert isclose(found['parse'].exponent, 1) and isclose(found['part1'].exponent, 2)
+    assert 1 < found['total'].exponent < 2
+    text = format_curve(load(2021, 1), measurements, 1)
+    assert text.startswith('2021/day1') and 'O(n^2)' in text
+
+def test_curve_stops_after_the_limit():
+    solution = load(2021, 1)
+    assert set(measure(solution, '1\n2\n3\n', minimum=0)) == {'parse', 'part1', 'part2'}
+    measured = list(curve(solution, scales(1, 2, 1000), limit=0))
+    assert len(measured) == 1 and measured[0].scale == 1 and measured[0].size > 0
@@ -0,0 +1,113 @@
+from random import Random
+
+import pytest
+
+from aoc.search import UNREACHED, Stats, astar, bfs, dial, dijkstra, distances
+
+def random_graph(random: Random, size: int, edges: int, max_weight: int) -> dict[int, list[tuple[int, int]]]:
+    graph = {node: [] for node in range(size)}
+    for _ in range(edges):
+        graph[random.randrange(size)].append((random.randrange(size), random.randint(0, max_weight)))
+    return graph
+
+def cheapest(graph: dict[int, list[tuple[int, int]]], starts: list[int]) -> list[float]:
+    """ Bellman-Ford: relax every edge until nothing changes. """
+    best = [float('inf')] * len(graph)
+    for start in starts:
+        best[start] = 0
+    changed = True
+    while changed:
+        changed = False
+        for node, edges in graph.items():
+            for neighbor, weight in edges:
+                if best[node] + weight < best[neighbor]:
+                    best[neighbor] = best[node] + weight
+                    changed = True
+    return best
+
+def cases(seed: int, max_weight: int):
+    """ Small random graphs, each with some starts and every possible target (reachable or not). """
+    random = Random(seed)
+    for _ in range(40):
+        size = random.randint(1, 12)
+        graph = random_graph(random, size, random.randint(0, 3 * size), max_weight)
+        starts = random.sample(range(size), random.randint(1, min(3, size)))
+        expected = cheapest(graph, starts)
+        for target in range(size):
+            answer = None if expected[target] == float('inf') else expected[target]
+            yield graph, starts, target, answer
+
+@pytest.mark.parametrize('size', [None, 'nodes'])
+def test_weighted_searches_agree(size):
+    for graph, starts, target, answer in cases(1, 4):
+        edges, goal = graph.__getitem__, target.__eq__
+        flat = len(graph) if size else None
+        assert dijkstra(starts, edges, goal, flat) == answer
+        assert astar(starts, edges, goal, lambda _: 0, flat) == answer
+        assert dial(starts, edges, goal, 4, flat) == answer
+
+def test_dial_with_zero_weight_edges():
+    for graph, starts, target, answer in cases(2, 1):
+        assert dial(starts, graph.__getitem__, target.__eq__, 1) == answer
+    # A chain of free edges is walked within a single bucket
+    chain = {node: [(node + 1, 0)] for node in range(5)} | {5: []}
+    assert dial([0], chain.__getitem__, (5).__eq__, 0) == 0
+
+def test_unweighted_searches_agree():
+    for graph, starts, target, answer in cases(3, 0):
+        neighbors = lambda node: [neighbor for neighbor, _ in graph[node]]
+        unit = {node: [(neighbor, 1) for neighbor, _ in edges] for node, edges in graph.items()}
+        expected = dijkstra(starts, unit.__getitem__, target.__eq__)
+        assert bfs(starts, neighbors, target.__eq__) == expected
+        assert bfs(starts, neighbors, target.__eq__, len(graph)) == expected
+        found = distances(starts, neighbors, len(graph))[target]
+        assert found == (UNREACHED if expected is None else expected)
+        assert dial(starts, unit.__getitem__, target.__eq__, 1) == expected
+
+def test_astar_with_an_admissible_heuristic():
+    # A grid where the Manhattan distance never overestimates costs of at least 1 per step
+    random = Random(4)
+    width, height = 8, 6
+    weights = [random.randint(1, 9) for _ in range(width * height)]
+    def edges(node):
+        y, x = divmod(node, width)
+        for nx, ny in ((x + 1, y), (x - 1, y), (x, y + 1), (x, y - 1)):
+            if 0 <= nx < width and 0 <= ny < height:
+                yield ny * width + nx, weights[ny * width + nx]
+    target = width * height - 1
+    heuristic = lambda node: (width - 1 - node % width) + (height - 1 - node // width)
+    expected = dijkstra([0], edges, target.__eq__)
+    assert astar([0], edges, target.__eq__, heuristic) == expected
+    assert dial([0], edges, target.__eq__, 9, width * height) == expected
+
+def test_multiple_sources_take_the_nearest():
+    line = {node: [(node + 1, 1)] for node in range(9)} | {9: []}
+    neighbors = lambda node: [neighbor for neighbor, _ in line[node]]
+    assert bfs([0, 6], neighbors, (9).__eq__) == 3
+    assert dijkstra([6, 0], line.__getitem__, (9).__eq__) == 3
+    assert dial([0, 6, 6], line.__getitem__, (9).__eq__, 1) == 3
+    assert list(distances([0, 6], neighbors, 10)) == [0, 1, 2, 3, 4, 5, 0, 1, 2, 3]
+
+def test_unreachable_target():
+    graph = {0: [(1, 2)], 1: [], 2: [(0, 1)]}
+    neighbors = lambda node: [neighbor for neighbor, _ in graph[node]]
+    assert bfs([0], neighbors, (2).__eq__) is None
+    assert dijkstra([0], graph.__getitem__, (2).__eq__) is None
+    assert dial([0], graph.__getitem__, (2).__eq__, 2) is None
+    assert distances([0], neighbors)[2] == UNREACHED
+
+def test_dial_rejects_heavy_edges():
+    with pytest.raises(ValueError):
+        dial([0], lambda node: [(1, 5)], (1).__eq__, 4)
+
+def test_stats_count_work():
+    stats = Stats()
+    line = {node: [node + 1] for node in range(4)} | {4: []}
+    assert bfs([0], line.__getitem__, (4).__eq__, stats=stats) == 4
+    assert (stats.expanded, stats.pushed) == (5, 5)
+
+@pytest.mark.parametrize('search', [lambda *args, **kwargs: dijkstra(*args, **kwargs), lambda *args, **kwargs: dial(*args[:3], 1, **kwargs)])
+def test_repeated_starts_are_expanded_once(search):
+    stats = Stats()
+    assert search([0, 0, 0], lambda node: [], (1).__eq__, stats=stats) is None
+    assert (stats.expanded, stats.pushed) == (1, 1)
@@ -0,0 +1,87 @@
+from io import BytesIO
+from random import Random
+
+import pytest
+
+from aoc.inputs import Input
+from aoc.runner import run
+from aoc.solutions import discover, load
+from aoc.streaming import consume, progress, read_chunks, split_lines
+
+TEXT = b'first line\r\nsecond\n\nfourth\r\nlast'
+LINES = [b'first line', b'second', b'', b'fourth', b'last']
+
+def chunked(data: bytes, size: int) -> list[bytes]:
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+@pytest.mark.parametrize('size', [1, 2, 3, 7, 11, 12, 100])
+def test_lines_split_across_chunks(size: int):
+    assert list(split_lines(chunked(TEXT, size))) == LINES
+
+@pytest.mark.parametrize('size', [1, 2, 5])
+def test_crlf_split_between_chunks(size: int):
+    # The \r and \n of one line ending can land in different chunks
+    assert list(split_lines(chunked(b'a\r\nb\r\n', size))) == [b'a', b'b']
+
+def test_final_newline_is_optional():
+    assert list(split_lines([b'a\nb\n'])) == list(split_lines([b'a\nb'])) == [b'a', b'b']
+    assert list(split_lines([b'a\r\nb\r'])) == [b'a', b'b']
+
+def test_empty_input():
+    assert list(split_lines([])) == list(split_lines([b''])) == []
+
+def test_matches_splitlines():
+    data = b'x\r\n\r\nyy\nzzz\r\n'
+    assert list(split_lines(chunked(data, 2))) == data.splitlines()
+
+def test_read_chunks():
+    assert list(read_chunks(BytesIO(b'abcdefg'), 3)) == [b'abc', b'def', b'g']
+
+class Lines:
+    def __init__(self):
+        self.lines = []
+
+    def feed(self, line):
+        self.lines.append(line)
+
+    def part1(self):
+        return len(self.lines)
+
+    def part2(self):
+        return None
+
+def test_consume_and_progress():
+    assert consume(Lines(), LINES).lines == LINES
+    assert list(progress(Lines(), LINES, 2)) == [2, 4, 5]
+    assert list(progress(Lines(), LINES[:4], 2)) == [2, 4]
+    assert list(progress(Lines(), [], 2)) == [0]
+
+STREAMING_DAYS = [(year, day) for year, day in discover() if load(year, day).consumer is not None]
+
+@pytest.mark.parametrize('year, day', STREAMING_DAYS)
+def test_streaming_matches_parsing_the_whole_input(year: int, day: int):
+    solution = load(year, day)
+    data = solution.input_path.read_bytes()
+    expected = run(solution, Input(data)).answers()
+
+    random = Random(year * 100 + day)
+    sizes = [random.randint(1, 4096) for _ in range(len(data) // 1000 + 1)]
+    chunks, start = [], 0
+    while start < len(data):
+        size = sizes[len(chunks) % len(sizes)]
+        chunks.append(data[start:start + size])
+        start += size
+
+    consumer = consume(solution.consumer(), split_lines(chunks))
+    assert [consumer.part1(), consumer.part2()] == [timing.result for timing in expected]
+
+@pytest.mark.parametrize('year, day', STREAMING_DAYS)
+def test_answers_so_far_match_the_lines_so_far(year: int, day: int):
+    solution = load(year, day)
+    lines = list(Input.open(solution.input_path).byte_lines())
+    # Stopping at a blank line keeps grouped inputs (e.g. 2022/day1's elves) whole
+    middle = next((n for n in range(len(lines) // 2, len(lines)) if not lines[n]), len(lines) // 2)
+
+    consumer = consume(solution.consumer(), lines[:middle])
+    prefix = run(solution, Input(b'\n'.join(lines[:middle]) + b'\n')).answers()
+    assert [consumer.part1(), consumer.part2()] == [timing.result for timing in prefix]
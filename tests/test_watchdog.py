@@ -0,0 +1,59 @@
+from io import StringIO
+from time import perf_counter, sleep
+from types import ModuleType
+
+import pytest
+
+from aoc.inputs import Input
+from aoc.progress import TRACKED, Progress, track
+from aoc.runner import run
+from aoc.solutions import Solution
+from aoc.watchdog import TimeExceeded, Watchdog
+
+def slow_day(seconds: float) -> ModuleType:
+    module = ModuleType('watchdog_test_day')
+    module.parse = lambda puzzle: sleep(0.05)
+
+    def part1(_):
+        steps = track('steps taken', 1000)
+        end = perf_counter() + seconds
+        while perf_counter() < end:
+            steps.done = min(steps.done + 1, 999)
+            sleep(0.001)
+        return steps.done
+
+    module.part1 = part1
+    return module
+
+def test_interrupts_a_day_over_its_budget():
+    output = StringIO()
+    with pytest.raises(TimeExceeded) as raised:
+        run(Solution(2000, 1, slow_day(5)), Input(b''), hooks=[Watchdog(budget=0.5, output=output)])
+
+    exceeded = raised.value
+    assert (exceeded.name, exceeded.stage, exceeded.budget) == ('2000/day1', 'part1', 0.5)
+    # The budget covers the whole day, parse included
+    assert 0.5 <= exceeded.elapsed < 2
+    assert any('steps taken' in line and '/1000' in line for line in exceeded.progress)
+    assert str(exceeded).startswith('2000/day1 part1 aborted after')
+    assert output.getvalue() == ''
+
+def test_reports_progress_periodically():
+    output = StringIO()
+    report = run(Solution(2000, 1, slow_day(0.4)), Input(b''), hooks=[Watchdog(every=0.1, output=output)])
+    assert report.answers()[0].result > 0
+    lines = output.getvalue().splitlines()
+    assert len(lines) >= 3
+    assert any(line.startswith('2000/day1 part1 after') and 'steps taken' in line for line in lines)
+
+def test_days_within_budget_finish():
+    report = run(Solution(2000, 1, slow_day(0.05)), Input(b''), hooks=[Watchdog(budget=5)])
+    assert report.answers()[0].result > 0
+
+def test_progress_counters():
+    steps = Progress('steps', 4)
+    steps.done = 1
+    assert str(steps).startswith('1/4 (25.0%) steps at')
+    assert str(Progress('nodes')).startswith('0 nodes at')
+    tracked = track('things')
+    assert tracked in TRACKED